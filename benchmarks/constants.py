@@ -0,0 +1,196 @@
+from pathlib import Path
+
+
+class CorpusConstants:
+    FIRST_SEASON_YEAR = 2016
+    MAX_TEAMS = 30
+    TEAMS = {
+        "ATL": "Atlanta Hawks",
+        "BOS": "Boston Celtics",
+        "BRK": "Brooklyn Nets",
+        "CHO": "Charlotte Hornets",
+        "CHI": "Chicago Bulls",
+        "CLE": "Cleveland Cavaliers",
+        "DAL": "Dallas Mavericks",
+        "DEN": "Denver Nuggets",
+        "DET": "Detroit Pistons",
+        "GSW": "Golden State Warriors",
+        "HOU": "Houston Rockets",
+        "IND": "Indiana Pacers",
+        "LAC": "Los Angeles Clippers",
+        "LAL": "Los Angeles Lakers",
+        "MEM": "Memphis Grizzlies",
+        "MIA": "Miami Heat",
+        "MIL": "Milwaukee Bucks",
+        "MIN": "Minnesota Timberwolves",
+        "NOP": "New Orleans Pelicans",
+        "NYK": "New York Knicks",
+        "OKC": "Oklahoma City Thunder",
+        "ORL": "Orlando Magic",
+        "PHI": "Philadelphia 76ers",
+        "PHO": "Phoenix Suns",
+        "POR": "Portland Trail Blazers",
+        "SAC": "Sacramento Kings",
+        "SAS": "San Antonio Spurs",
+        "TOR": "Toronto Raptors",
+        "UTA": "Utah Jazz",
+        "WAS": "Washington Wizards",
+    }
+    DIVISIONS = {
+        "E": ("Atlantic", "Central", "Southeast"),
+        "W": ("Northwest", "Pacific", "Southwest"),
+    }
+    CONFERENCES = {"E": "Eastern Conference", "W": "Western Conference"}
+    FIRST_NAMES = (
+        "Aaron",
+        "Anthony",
+        "Bam",
+        "Chris",
+        "Damian",
+        "De'Aaron",
+        "Giannis",
+        "Jalen",
+        "Jaylen",
+        "Jayson",
+        "Joel",
+        "Kevin",
+        "Kyrie",
+        "LaMelo",
+        "Luka",
+        "Nikola",
+        "Paolo",
+        "Shai",
+        "Tyrese",
+        "Zion",
+    )
+    LAST_NAMES = (
+        "Adebayo",
+        "Antetokounmpo",
+        "Ball",
+        "Banchero",
+        "Brown",
+        "Dončić",
+        "Durant",
+        "Edwards",
+        "Embiid",
+        "Fox",
+        "Gilgeous-Alexander",
+        "Gordon",
+        "Haliburton",
+        "Irving",
+        "Jokić",
+        "Lillard",
+        "Maxey",
+        "O'Neal",
+        "Tatum",
+        "Williamson",
+    )
+    POSITIONS = ("PG", "SG", "SF", "PF", "C")
+    COUNTRIES = ("us", "ca", "fr", "rs", "si", "gr", "au", "de")
+    COLLEGES = ("Duke", "Kentucky", "Kansas", "UCLA", "Gonzaga", "")
+    SHOOTING_HANDS = ("Right", "Left")
+    AWARDS = ("", "", "", "AS", "MVP-3,AS,NBA1", "DPOY-2")
+    # Headers that pandas deduplicates with numeric suffixes (`2P.1`)
+    # or names `Unnamed: N` are rendered as they are on the pages.
+    DUPLICATE_HEADER_PATTERN = r"\.\d+$"
+    UNNAMED_HEADER_PREFIX = "Unnamed:"
+
+
+class BenchmarkConstants:
+    LOGGER_NAME = "benchmarks.run_benchmarks"
+    BASE_FOLDER = Path(__file__).parent
+    RESULTS_FILEPATH = BASE_FOLDER.joinpath("results", "results.json")
+    REPEATS = 3
+    SEASONS = 3
+    TEAMS = 30
+    PLAYERS_PER_TEAM = 15
+    SEED = 42
+    WORKERS = (1, 2, 4)
+    GROUPS = (
+        "extractors",
+        "process_files",
+        "parquet",
+        "compression",
+        "collectors",
+        "startup",
+    )
+    REGRESSION_THRESHOLD = 0.1
+    # Settings of the Parquet writer the `compression` group compares
+    # by the size of the files and the times to write and read them.
+    # The settings override the configured options
+    # (`ParquetConstants.OPTIONS`).
+    KEY_COLUMNS = ["player", "player_id", "team", "year"]
+    COMPRESSION_SETTINGS = {
+        "none": {"compression": "none"},
+        "snappy": {"compression": "snappy"},
+        "zstd-1": {"compression": "zstd", "compression_level": 1},
+        "zstd-3": {"compression": "zstd", "compression_level": 3},
+        "zstd-9": {"compression": "zstd", "compression_level": 9},
+        "zstd-19": {"compression": "zstd", "compression_level": 19},
+        "zstd-3-no-dictionary": {
+            "compression": "zstd",
+            "compression_level": 3,
+            "use_dictionary": False,
+        },
+        "zstd-3-key-statistics": {
+            "compression": "zstd",
+            "compression_level": 3,
+            "write_statistics": KEY_COLUMNS,
+            "write_page_index": True,
+        },
+        "zstd-3-small-pages": {
+            "compression": "zstd",
+            "compression_level": 3,
+            "data_page_size": 64 * 1024,
+            "row_group_size": 64 * 1024,
+        },
+    }
+    # Stages of the service to run against the mock server, the
+    # extract stages produce the URLs the next collect stages fetch.
+    COLLECT_STAGES = (
+        "collect_seasons",
+        "extract_seasons",
+        "collect_leagues",
+        "extract_teams",
+        "collect_teams",
+        "extract_players",
+        "collect_players",
+    )
+    SERVICE_FILEPATH = BASE_FOLDER.parent.joinpath("src", "service.py")
+    # Startups of the service measured in a new interpreter each: the
+    # interpreter alone, the import of the service, and the objects of
+    # the stages an upload or an extraction creates.
+    STARTUP_SCENARIOS = {
+        "interpreter": "pass",
+        "import": "import service",
+        "upload_stage": (
+            "import service; "
+            "service.get_stage_graph(stages=['upload_extracted_seasons'])"
+            ".stages['upload_extracted_seasons'].kwargs['upl'].get()"
+        ),
+        "extract_stage": (
+            "import service; "
+            "service.get_stage_graph(stages=['extract_seasons'])"
+            ".stages['extract_seasons'].kwargs['extractor'].get()"
+        ),
+    }
+    # Maximum startup times (seconds) by the scenarios. A run fails if
+    # a median exceeds its budget.
+    STARTUP_BUDGETS = {"import": 0.4, "upload_stage": 0.6}
+
+
+class MockServerConstants:
+    LOGGER_NAME = "benchmarks.mock_server"
+    HOST = "127.0.0.1"
+    PORT = 8000
+    # URLs of the site and the corpus files they are served from. The
+    # corpus is laid out the same way the collectors save the pages, so
+    # a raw folder of a real run can be served as a recorded corpus.
+    ROUTES = (
+        (r"^/leagues/$", r"seasons/seasons.html"),
+        (r"^/leagues/NBA_(\d{4})\.html$", r"leagues/nba-\1.html"),
+        (r"^/teams/(\w+)/(\d{4})\.html$", r"teams/\1-\2.html"),
+        (r"^/players/\w/(\w+)\.html$", r"players/\1.html"),
+    )
+    SERVER_ERRORS = (500, 502, 503, 504)
+    RETRY_AFTER_SECONDS = 1
@@ -0,0 +1,729 @@
+import os
+import random
+import re
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+
+import pyarrow as pa
+
+from benchmarks.constants import CorpusConstants
+from common.constants import (
+    ConferenceConstants,
+    ConferenceStatsConstants,
+    LeagueConstants,
+    PlayerConstants,
+    SchemaConstants,
+    SeasonConstants,
+    TeamConstants,
+    TeamStatsConstants,
+)
+
+
+@dataclass
+class CorpusConfig:
+    """A class to represent the scale of the synthetic corpus.
+
+    :param seasons: A number of seasons (league pages).
+    :param teams: A number of teams per season (at most 30).
+    :param players_per_team: A number of players on each roster.
+    :param seed: A seed of the random generator, so the same config
+        always generates the same corpus.
+    """
+
+    seasons: int = 3
+    teams: int = 30
+    players_per_team: int = 15
+    seed: int = 42
+
+
+@dataclass
+class Player:
+    """A class to represent a synthetic player.
+
+    :param slug: Slug of the player (e.g. `jokicni01`).
+    :param name: Name of the player.
+    """
+
+    slug: str
+    name: str
+
+    @property
+    def href(self) -> str:
+        """Get a href of the player page.
+
+        :return: Href.
+        """
+        return f"/players/{self.slug[0]}/{self.slug}.html"
+
+
+@dataclass
+class CorpusStats:
+    """A class to represent what was generated.
+
+    :param files: A number of generated files by the folders.
+    :param bytes: A number of generated bytes by the folders.
+    """
+
+    files: dict[str, int] = field(default_factory=dict)
+    bytes: dict[str, int] = field(default_factory=dict)
+
+
+class CorpusGenerator:
+    """A class to generate a synthetic basketball-reference corpus.
+
+    The pages are laid out the same way the collectors save them
+    (`seasons/seasons.html`, `leagues/nba-2024.html`,
+    `teams/bos-2024.html`, `players/tatumja01.html`), so the extractors
+    can run on the corpus without any network access. Like the real
+    pages, the team pages keep most of the tables in HTML comments, and
+    the advanced, shooting, and play-by-play tables have two header
+    rows.
+
+    :param raw_folder: A folder to generate the pages in.
+    :param config: Scale of the corpus.
+    """
+
+    def __init__(self, raw_folder: Path, config: CorpusConfig) -> None:
+        """Construct all attributes for the `CorpusGenerator` object.
+
+        :param raw_folder: A folder to generate the pages in.
+        :param config: Scale of the corpus.
+        """
+        if not 0 < config.teams <= CorpusConstants.MAX_TEAMS:
+            raise ValueError(
+                f"A number of teams must be in a range "
+                f"[1, {CorpusConstants.MAX_TEAMS}], got `{config.teams}`."
+            )
+
+        self.raw_folder = raw_folder
+        self.config = config
+        self.random = random.Random(config.seed)
+        self.teams = list(CorpusConstants.TEAMS.items())[: config.teams]
+        self.years = [
+            CorpusConstants.FIRST_SEASON_YEAR + idx
+            for idx in range(config.seasons)
+        ]
+        self.players = self.get_players(
+            count=2 * config.teams * config.players_per_team
+        )
+        self.stats = CorpusStats()
+
+    def get_players(self, count: int) -> list[Player]:
+        """Get a pool of players with unique slugs. Some of the players
+        have the same names, as on the real pages.
+
+        :param count: A number of players.
+        :return: Players.
+        """
+        players = []
+        slugs_count: dict[str, int] = {}
+
+        for _ in range(count):
+            first_name = self.random.choice(CorpusConstants.FIRST_NAMES)
+            last_name = self.random.choice(CorpusConstants.LAST_NAMES)
+
+            base_slug = (
+                re.sub(r"[^a-z]", "", last_name.lower())[:5]
+                + (re.sub(r"[^a-z]", "", first_name.lower())[:2])
+            )
+            slugs_count[base_slug] = slugs_count.get(base_slug, 0) + 1
+
+            players.append(
+                Player(
+                    slug=f"{base_slug}{slugs_count[base_slug]:02d}",
+                    name=f"{first_name} {last_name}",
+                )
+            )
+
+        return players
+
+    @staticmethod
+    def get_header_label(column: str) -> str:
+        """Get a header label of the column as it's on the page.
+
+        Examples:
+
+            - `2P.1` -> `2P`.
+            - `Md..1` -> `Md.`.
+            - `Unnamed: 1` -> ``.
+
+        :param column: A column name as pandas reads it.
+        :return: Header label.
+        """
+        if column.startswith(CorpusConstants.UNNAMED_HEADER_PREFIX):
+            return ""
+
+        header_label = re.sub(
+            CorpusConstants.DUPLICATE_HEADER_PATTERN, "", column
+        )
+
+        return header_label
+
+    @staticmethod
+    def get_data_types(
+        columns_map: dict[str, str], *, schema: pa.Schema
+    ) -> list[pa.DataType | None]:
+        """Get data types of the columns from the schema of the
+        processed table, so the generated values can be cast to it.
+
+        :param columns_map: Map of column names.
+        :param schema: Arrow schema of the processed table.
+        :return: Data types of the columns (None if not in the schema).
+        """
+        data_types = [
+            schema.field(column).type if column in schema.names else None
+            for column in columns_map.values()
+        ]
+
+        return data_types
+
+    def get_cell(
+        self,
+        label: str,
+        *,
+        data_type: pa.DataType | None,
+        rank: int,
+        player: Player,
+    ) -> str:
+        """Get a value of the table cell by the header label and the
+        data type of the column.
+
+        :param label: A header label of the column.
+        :param data_type: A data type of the column.
+        :param rank: A rank of the row.
+        :param player: A player of the row.
+        :return: Cell value (HTML).
+        """
+        rnd = self.random
+
+        match label:
+            case "Rk":
+                return str(rank)
+            case "Player" | "":
+                return f'<a href="{player.href}">{player.name}</a>'
+            case "Pos":
+                return rnd.choice(CorpusConstants.POSITIONS)
+            case "Age":
+                return str(rnd.randint(19, 39))
+            case "No.":
+                return str(rnd.randint(0, 99))
+            case "Ht":
+                return f"{rnd.randint(5, 7)}-{rnd.randint(0, 11)}"
+            case "Wt":
+                return str(rnd.randint(160, 290))
+            case "Birth Date":
+                birth_date = date(1985, 1, 1) + timedelta(
+                    days=rnd.randint(0, 7000)
+                )
+
+                return birth_date.strftime("%B %-d, %Y")
+            case "Birth":
+                return rnd.choice(CorpusConstants.COUNTRIES)
+            case "Exp":
+                experience = rnd.randint(0, 18)
+
+                return "R" if experience == 0 else str(experience)
+            case "College":
+                return rnd.choice(CorpusConstants.COLLEGES)
+            case "Awards":
+                return rnd.choice(CorpusConstants.AWARDS)
+            case "Salary":
+                return f"${rnd.randint(1_000_000, 55_000_000):,}"
+            case _ if data_type and pa.types.is_integer(data_type):
+                return str(rnd.randint(0, 82))
+            case _ if label.endswith("%"):
+                return f"{rnd.random():.3f}".lstrip("0")
+            case _:
+                return f"{rnd.uniform(0, 40):.1f}"
+
+    def get_table(
+        self,
+        _id: str,
+        *,
+        columns_map: dict[str, str],
+        schema: pa.Schema,
+        players: list[Player],
+        is_two_row_header: bool = False,
+        footer: str | None = None,
+    ) -> str:
+        """Get an HTML table of the players stats.
+
+        :param _id: An ID of the table.
+        :param columns_map: Map of column names (the columns as pandas
+            reads them).
+        :param schema: Arrow schema of the processed table.
+        :param players: Players of the table rows.
+        :param is_two_row_header: Whether the table has an over header
+            row above the column labels.
+        :param footer: A label of the footer row (e.g. `Team Totals`).
+        :return: HTML table.
+        """
+        labels = [self.get_header_label(column) for column in columns_map]
+        data_types = self.get_data_types(columns_map, schema=schema)
+
+        over_header = (
+            f'<tr class="over_header"><th colspan="{len(labels)}"></th></tr>'
+            if is_two_row_header
+            else ""
+        )
+        header = "".join(f"<th>{label}</th>" for label in labels)
+
+        rows = []
+
+        for rank, player in enumerate(players, start=1):
+            cells = [
+                self.get_cell(
+                    label, data_type=data_type, rank=rank, player=player
+                )
+                for label, data_type in zip(labels, data_types, strict=True)
+            ]
+            rows.append(
+                "<tr>"
+                + "".join(f"<td>{cell}</td>" for cell in cells)
+                + "</tr>"
+            )
+
+        tfoot = ""
+
+        if footer:
+            footer_cells = "".join(
+                f"<td>{footer if label in ('Player', 'Team') else ''}</td>"
+                for label in labels
+            )
+            tfoot = f"<tfoot><tr>{footer_cells}</tr></tfoot>"
+
+        table = (
+            f'<table id="{_id}"><thead>{over_header}<tr>{header}</tr>'
+            f"</thead><tbody>{''.join(rows)}</tbody>{tfoot}</table>"
+        )
+
+        return table
+
+    def write_page(self, folder: str, *, filename: str, body: str) -> None:
+        """Write an HTML page and count it in the corpus stats.
+
+        :param folder: A folder of the page.
+        :param filename: A filename of the page.
+        :param body: Body of the page.
+        :return: None.
+        """
+        html_data = (
+            f'<!DOCTYPE html><html lang="en"><head><meta charset="utf-8">'
+            f"<title>{filename}</title></head><body>{body}</body></html>"
+        )
+        encoded_html_data = html_data.encode("utf-8")
+
+        with open(self.raw_folder.joinpath(folder, filename), mode="wb") as f:
+            f.write(encoded_html_data)
+
+        self.stats.files[folder] = self.stats.files.get(folder, 0) + 1
+        self.stats.bytes[folder] = self.stats.bytes.get(folder, 0) + len(
+            encoded_html_data
+        )
+
+    def write_seasons_page(self) -> None:
+        """Write the seasons page (a two-row header table).
+
+        :return: None.
+        """
+        columns = list(SeasonConstants.COLUMNS_MAP)
+        header = "".join(f"<th>{column}</th>" for column in columns)
+
+        rows = []
+
+        for year in reversed(self.years):
+            season = f"{year - 1}-{year % 100:02d}"
+            winners = "".join(
+                f"<td>{self.random.choice(self.players).name}</td>"
+                for _ in columns[3:]
+            )
+            rows.append(
+                f'<tr><th><a href="/leagues/NBA_{year}.html">{season}</a>'
+                f"</th><td>NBA</td><td>{self.teams[0][1]}</td>{winners}</tr>"
+            )
+
+        body = (
+            f'<table id="stats"><thead><tr class="over_header">'
+            f'<th colspan="{len(columns)}"></th></tr><tr>{header}</tr>'
+            f"</thead><tbody>{''.join(rows)}</tbody></table>"
+        )
+
+        self.write_page(
+            SeasonConstants.SEASONS_FOLDER, filename="seasons.html", body=body
+        )
+
+    def get_standings_table(
+        self, conference: str, *, teams: list[tuple[str, str]], year: int
+    ) -> tuple[str, str]:
+        """Get the conference and division standings tables.
+
+        :param conference: A conference (`E` or `W`).
+        :param teams: Teams of the conference.
+        :param year: A season year.
+        :return: Conference and division standings tables.
+        """
+        conference_label = CorpusConstants.CONFERENCES[conference]
+        labels = [
+            conference_label,
+            *list(ConferenceConstants.COLUMNS_MAP)[3:],
+        ]
+        header = "".join(f"<th>{label}</th>" for label in labels)
+
+        def get_row(team: str, name: str, rank: int) -> str:
+            wins = self.random.randint(15, 65)
+            playoff_sign = "*" if rank <= 8 else ""
+            games_behind = "—" if rank == 1 else f"{rank * 1.5:.1f}"
+
+            return (
+                f'<tr><th><a href="/teams/{team}/{year}.html">{name}</a>'
+                f"{playoff_sign}</th><td>{wins}</td><td>{82 - wins}</td>"
+                f"<td>{wins / 82:.3f}</td><td>{games_behind}</td>"
+                f"<td>{self.random.uniform(100, 125):.1f}</td>"
+                f"<td>{self.random.uniform(100, 125):.1f}</td>"
+                f"<td>{self.random.uniform(-10, 10):.2f}</td></tr>"
+            )
+
+        conference_rows = [
+            get_row(team, name, rank)
+            for rank, (team, name) in enumerate(teams, start=1)
+        ]
+
+        division_rows = []
+        divisions = CorpusConstants.DIVISIONS[conference]
+
+        for idx, division in enumerate(divisions):
+            division_rows.append(
+                f'<tr class="thead"><th colspan="{len(labels)}">'
+                f"{division} Division</th></tr>"
+            )
+            division_rows.extend(
+                get_row(team, name, rank)
+                for rank, (team, name) in enumerate(
+                    teams[idx :: len(divisions)], start=1
+                )
+            )
+
+        tables = tuple(
+            f'<table id="{_id}_standings_{conference}"><thead><tr>{header}'
+            f"</tr></thead><tbody>{''.join(rows)}</tbody></table>"
+            for _id, rows in (
+                ("confs", conference_rows),
+                ("divs", division_rows),
+            )
+        )
+
+        return tables
+
+    def get_league_stats_table(self, _id: str, *, year: int) -> str:
+        """Get a table of the teams (or opponents) stats of the league.
+
+        :param _id: An ID of the table.
+        :param year: A season year.
+        :return: HTML table.
+        """
+        is_advanced = _id == ConferenceStatsConstants.ADVANCED_STATS_TEAM_ID
+        is_shooting = _id.startswith("shooting-")
+
+        if is_advanced:
+            columns_map = ConferenceStatsConstants.ADVANCED_STATS_COLUMNS_MAP
+            schema = SchemaConstants.CONFERENCE_ADVANCED_STATS_SCHEMA
+        elif is_shooting:
+            columns_map = ConferenceStatsConstants.SHOOTING_STATS_COLUMNS_MAP
+            schema = SchemaConstants.CONFERENCE_SHOOTING_STATS_SCHEMA
+        else:
+            columns_map = ConferenceStatsConstants.STATS_COLUMNS_MAP
+            schema = SchemaConstants.CONFERENCE_STATS_SCHEMA
+
+        columns = list(columns_map)
+        data_types = self.get_data_types(columns_map, schema=schema)
+
+        # The advanced and shooting tables have empty spacer columns.
+        if is_advanced or is_shooting:
+            columns.insert(4, f"{CorpusConstants.UNNAMED_HEADER_PREFIX} 4")
+            data_types.insert(4, None)
+
+        labels = [self.get_header_label(column) for column in columns]
+        over_header = (
+            f'<tr class="over_header"><th colspan="{len(labels)}"></th></tr>'
+            if is_advanced or is_shooting
+            else ""
+        )
+        header = "".join(f"<th>{label}</th>" for label in labels)
+
+        rows = []
+
+        for rank, (team, name) in enumerate(self.teams, start=1):
+            cells = []
+
+            for label, column, data_type in zip(
+                labels, columns, data_types, strict=True
+            ):
+                if label == "Team":
+                    playoff_sign = "*" if rank <= 16 else ""
+                    cells.append(
+                        f'<a href="/teams/{team}/{year}.html">{name}</a>'
+                        f"{playoff_sign}"
+                    )
+                elif column.startswith(CorpusConstants.UNNAMED_HEADER_PREFIX):
+                    cells.append("")
+                elif label == "Arena":
+                    cells.append(f"{name} Arena")
+                else:
+                    cells.append(
+                        self.get_cell(
+                            label,
+                            data_type=data_type,
+                            rank=rank,
+                            player=self.players[0],
+                        )
+                    )
+
+            rows.append(
+                "<tr>"
+                + "".join(f"<td>{cell}</td>" for cell in cells)
+                + "</tr>"
+            )
+
+        footer = "".join(
+            f"<td>{'League Average' if label == 'Team' else ''}</td>"
+            for label in labels
+        )
+
+        table = (
+            f'<table id="{_id}"><thead>{over_header}<tr>{header}</tr>'
+            f"</thead><tbody>{''.join(rows)}</tbody>"
+            f"<tfoot><tr>{footer}</tr></tfoot></table>"
+        )
+
+        return table
+
+    def write_league_pages(self) -> None:
+        """Write the league pages (standings and league stats).
+
+        :return: None.
+        """
+        stats_ids = [
+            ConferenceStatsConstants.PER_GAME_STATS_TEAM_ID,
+            ConferenceStatsConstants.PER_GAME_STATS_OPPONENT_ID,
+            ConferenceStatsConstants.TOTAL_STATS_TEAM_ID,
+            ConferenceStatsConstants.TOTAL_STATS_OPPONENT_ID,
+            ConferenceStatsConstants.PER_100_POSSESSIONS_STATS_TEAM_ID,
+            ConferenceStatsConstants.PER_100_POSSESSIONS_STATS_OPPONENT_ID,
+            ConferenceStatsConstants.ADVANCED_STATS_TEAM_ID,
+            ConferenceStatsConstants.SHOOTING_STATS_TEAM_ID,
+            ConferenceStatsConstants.SHOOTING_STATS_OPPONENT_ID,
+        ]
+
+        for year in self.years:
+            eastern_teams = self.teams[::2]
+            western_teams = self.teams[1::2]
+
+            eastern_tables = self.get_standings_table(
+                "E", teams=eastern_teams, year=year
+            )
+            western_tables = self.get_standings_table(
+                "W", teams=western_teams, year=year
+            )
+
+            # The conference standings go first and the division
+            # standings second, as the extractor selects the tables
+            # by their indexes.
+            body = "".join(
+                [
+                    eastern_tables[0],
+                    western_tables[0],
+                    eastern_tables[1],
+                    western_tables[1],
+                    *(
+                        self.get_league_stats_table(_id, year=year)
+                        for _id in stats_ids
+                    ),
+                ]
+            )
+
+            self.write_page(
+                LeagueConstants.LEAGUES_FOLDER,
+                filename=f"nba-{year}.html",
+                body=body,
+            )
+
+    def write_team_pages(self) -> set[str]:
+        """Write the team pages. All tables but the roster are wrapped
+        in HTML comments, as on the real pages.
+
+        :return: Slugs of the players on the rosters.
+        """
+        tables = [
+            (
+                TeamStatsConstants.ROSTER_ID,
+                TeamStatsConstants.ROSTER_COLUMNS_MAP,
+                SchemaConstants.ROSTERS_SCHEMA,
+            ),
+            (
+                TeamStatsConstants.REGULAR_SEASON_PER_GAME_STATS_ID,
+                TeamStatsConstants.STATS_COLUMNS_MAP,
+                SchemaConstants.PER_GAME_STATS_SCHEMA,
+            ),
+            (
+                TeamStatsConstants.REGULAR_SEASON_TOTAL_STATS_ID,
+                TeamStatsConstants.TOTAL_STATS_COLUMNS_MAP,
+                SchemaConstants.TOTAL_STATS_SCHEMA,
+            ),
+            (
+                TeamStatsConstants.REGULAR_SEASON_PER_36_MINUTES_STATS_ID,
+                TeamStatsConstants.STATS_COLUMNS_MAP,
+                SchemaConstants.PER_36_MINUTES_STATS_SCHEMA,
+            ),
+            (
+                TeamStatsConstants.REGULAR_SEASON_PER_100_POSSESSIONS_STATS_ID,
+                TeamStatsConstants.PER_100_POSSESSIONS_STATS_COLUMNS_MAP,
+                SchemaConstants.PER_100_POSSESSIONS_STATS_SCHEMA,
+            ),
+            (
+                TeamStatsConstants.REGULAR_SEASON_ADVANCED_STATS_ID,
+                TeamStatsConstants.ADVANCED_STATS_COLUMNS_MAP,
+                SchemaConstants.ADVANCED_STATS_SCHEMA,
+            ),
+            (
+                TeamStatsConstants.REGULAR_SEASON_ADJUSTED_SHOOTING_STATS_ID,
+                TeamStatsConstants.ADJUSTED_SHOOTING_STATS_COLUMNS_MAP,
+                SchemaConstants.ADJUSTED_SHOOTING_STATS_SCHEMA,
+            ),
+            (
+                TeamStatsConstants.REGULAR_SEASON_SHOOTING_STATS_ID,
+                TeamStatsConstants.SHOOTING_STATS_COLUMNS_MAP,
+                SchemaConstants.SHOOTING_STATS_SCHEMA,
+            ),
+            (
+                TeamStatsConstants.REGULAR_SEASON_PLAY_BY_PLAY_STATS_ID,
+                TeamStatsConstants.PLAY_BY_PLAY_STATS_COLUMNS_MAP,
+                SchemaConstants.PLAY_BY_PLAY_STATS_SCHEMA,
+            ),
+        ]
+        two_row_header_ids = (
+            TeamStatsConstants.REGULAR_SEASON_ADJUSTED_SHOOTING_STATS_ID,
+            TeamStatsConstants.REGULAR_SEASON_SHOOTING_STATS_ID,
+            TeamStatsConstants.REGULAR_SEASON_PLAY_BY_PLAY_STATS_ID,
+        )
+
+        rostered_slugs = set()
+
+        for year in self.years:
+            for team, _ in self.teams:
+                roster = self.random.sample(
+                    self.players, k=self.config.players_per_team
+                )
+                rostered_slugs.update(player.slug for player in roster)
+
+                body = []
+
+                for _id, columns_map, schema in tables:
+                    is_two_row_header = _id.startswith(two_row_header_ids)
+                    variants = (
+                        [_id]
+                        if _id == TeamStatsConstants.ROSTER_ID
+                        else [_id, f"{_id}_post"]
+                    )
+
+                    for variant in variants:
+                        table = self.get_table(
+                            variant,
+                            columns_map=columns_map,
+                            schema=schema,
+                            players=roster,
+                            is_two_row_header=is_two_row_header,
+                            footer=(
+                                None
+                                if _id == TeamStatsConstants.ROSTER_ID
+                                else "Team Totals"
+                            ),
+                        )
+
+                        if _id != TeamStatsConstants.ROSTER_ID:
+                            table = f"<!--\n{table}\n-->"
+
+                        body.append(
+                            f'<div class="table_wrapper">{table}</div>'
+                        )
+
+                salaries = self.get_table(
+                    TeamStatsConstants.SALARIES_ID,
+                    columns_map=TeamStatsConstants.SALARIES_COLUMNS_MAP,
+                    schema=SchemaConstants.SALARIES_SCHEMA,
+                    players=roster,
+                )
+                body.append(f"<!--\n{salaries}\n-->")
+
+                self.write_page(
+                    TeamConstants.TEAMS_FOLDER,
+                    filename=f"{team.lower()}-{year}.html",
+                    body="".join(body),
+                )
+
+        return rostered_slugs
+
+    def write_player_pages(self, slugs: set[str]) -> None:
+        """Write the player pages (bio and career stats).
+
+        :param slugs: Slugs of the players to write the pages of.
+        :return: None.
+        """
+        for player in self.players:
+            if player.slug not in slugs:
+                continue
+
+            rnd = self.random
+            draft_year = rnd.randint(2000, 2020)
+            draft_pick = rnd.randint(1, 30)
+            draft_round = rnd.choice(("1st", "2nd"))
+            debut = date(draft_year, 10, 20).strftime("%B %-d, %Y")
+
+            meta = (
+                f'<div id="meta"><div><h1><span>{player.name}</span></h1>'
+                f"<p><strong>Position:</strong> Forward ▪ "
+                f"<strong>Shoots:</strong> "
+                f"{rnd.choice(CorpusConstants.SHOOTING_HANDS)}</p>"
+                f"<p><strong>Draft:</strong> <a>{self.teams[0][1]}</a>, "
+                f"{draft_round} round ({draft_pick}th pick, "
+                f"{draft_pick}th overall), <a>{draft_year} NBA Draft</a></p>"
+                f"<p><strong>High School:</strong> Central in Springfield, "
+                f"Illinois</p>"
+                f"<p><strong>NBA Debut:</strong> <a>{debut}</a></p>"
+                f"</div></div>"
+            )
+            career = self.get_table(
+                TeamStatsConstants.REGULAR_SEASON_PER_GAME_STATS_ID,
+                columns_map=TeamStatsConstants.STATS_COLUMNS_MAP,
+                schema=SchemaConstants.PER_GAME_STATS_SCHEMA,
+                players=[player] * len(self.years),
+                footer="Career",
+            )
+
+            self.write_page(
+                PlayerConstants.PLAYERS_FOLDER,
+                filename=f"{player.slug}.html",
+                body=f"{meta}<!--\n{career}\n-->",
+            )
+
+    def generate(self) -> CorpusStats:
+        """Generate the corpus.
+
+        :return: Stats of the generated corpus.
+        """
+        for folder in (
+            SeasonConstants.SEASONS_FOLDER,
+            LeagueConstants.LEAGUES_FOLDER,
+            TeamConstants.TEAMS_FOLDER,
+            PlayerConstants.PLAYERS_FOLDER,
+        ):
+            os.makedirs(self.raw_folder.joinpath(folder), exist_ok=True)
+
+        self.write_seasons_page()
+        self.write_league_pages()
+
+        rostered_slugs = self.write_team_pages()
+
+        self.write_player_pages(slugs=rostered_slugs)
+
+        return self.stats
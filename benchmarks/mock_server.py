@@ -0,0 +1,316 @@
+import argparse
+import functools
+import http.server
+import logging
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+
+from benchmarks.constants import BenchmarkConstants, MockServerConstants
+from benchmarks.corpus import CorpusConfig, CorpusGenerator
+from common.logger import init_logger
+
+init_logger(logger_name=MockServerConstants.LOGGER_NAME)
+logger = logging.getLogger(name=MockServerConstants.LOGGER_NAME)
+
+
+@dataclass
+class FaultConfig:
+    """A class to represent the faults the mock server injects.
+
+    :param latency_seconds: A delay before each response.
+    :param jitter_seconds: A maximum random delay added to the latency.
+    :param rate_limit_rate: A share of the requests answered with
+        `429` Too Many Requests.
+    :param server_error_rate: A share of the requests answered with a
+        `5xx` server error.
+    :param retry_after_seconds: A value of the `Retry-After` header of
+        the `429` responses.
+    :param seed: A seed of the random generator of the faults.
+    """
+
+    latency_seconds: float = 0.0
+    jitter_seconds: float = 0.0
+    rate_limit_rate: float = 0.0
+    server_error_rate: float = 0.0
+    retry_after_seconds: int = MockServerConstants.RETRY_AFTER_SECONDS
+    seed: int = BenchmarkConstants.SEED
+
+
+class MockHandler(http.server.SimpleHTTPRequestHandler):
+    """A class to serve the corpus under the URLs of the site and
+    inject the faults.
+
+    :param server_mock: The mock server the handler belongs to.
+    """
+
+    def __init__(self, *args, server_mock: "MockServer", **kwargs) -> None:
+        """Construct all attributes for the `MockHandler` object.
+
+        :param server_mock: The mock server the handler belongs to.
+        """
+        # The request is handled by the parent constructor, so the
+        # server must be set first.
+        self.server_mock = server_mock
+        super().__init__(*args, **kwargs)
+
+    def translate_path(self, path: str) -> str:
+        """Translate a URL path of the site to a corpus filepath.
+
+        :param path: A URL path (e.g. `/teams/BOS/2024.html`).
+        :return: A filepath (e.g. `<corpus>/teams/bos-2024.html`).
+        """
+        for pattern, filename in MockServerConstants.ROUTES:
+            if re.match(pattern, path):
+                filename = re.sub(pattern, filename, path).lower()
+
+                return os.path.join(self.directory, filename)
+
+        return os.path.join(self.directory, "missing")
+
+    def do_GET(self) -> None:
+        """Serve a page, or a fault instead of it.
+
+        :return: None.
+        """
+        delay, status_code = self.server_mock.get_fault()
+
+        time.sleep(delay)
+
+        if status_code is None:
+            super().do_GET()
+
+            return
+
+        self.send_response(status_code)
+
+        if status_code == 429:
+            self.send_header(
+                "Retry-After",
+                str(self.server_mock.faults.retry_after_seconds),
+            )
+
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_request(
+        self, code: int | str = "-", size: int | str = "-"
+    ) -> None:
+        """Count the responses by the status codes instead of logging
+        every request.
+
+        :param code: A status code of the response.
+        :param size: A size of the response.
+        :return: None.
+        """
+        self.server_mock.count(status_code=int(code))
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class MockServer:
+    """A class to serve a recorded or synthetic basketball-reference
+    corpus on a local HTTP server, so the collectors can run end to end
+    without the site (e.g. with `NBA_STATS_URL` pointing at the
+    server).
+
+    :param corpus_folder: A folder of the corpus, laid out the same way
+        the collectors save the pages.
+    :param faults: The faults to inject.
+    :param host: A host to listen on.
+    :param port: A port to listen on (any free port if `0`).
+    """
+
+    def __init__(
+        self,
+        corpus_folder: Path,
+        *,
+        faults: FaultConfig | None = None,
+        host: str = MockServerConstants.HOST,
+        port: int = 0,
+    ) -> None:
+        """Construct all attributes for the `MockServer` object.
+
+        :param corpus_folder: A folder of the corpus.
+        :param faults: The faults to inject (none if not specified).
+        :param host: A host to listen on.
+        :param port: A port to listen on (any free port if `0`).
+        """
+        self.faults = faults or FaultConfig()
+        self.status_codes: Counter[int] = Counter()
+        self._random = random.Random(self.faults.seed)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._server = http.server.ThreadingHTTPServer(
+            (host, port),
+            functools.partial(
+                MockHandler, server_mock=self, directory=str(corpus_folder)
+            ),
+        )
+
+    @property
+    def url(self) -> str:
+        """Get a base URL of the server.
+
+        :return: URL (e.g. `http://127.0.0.1:8000`).
+        """
+        host, port = self._server.server_address[:2]
+
+        return f"http://{host}:{port}"
+
+    def get_fault(self) -> tuple[float, int | None]:
+        """Get a delay and a status code of the fault for the next
+        request.
+
+        :return: A delay (seconds) and a status code of the fault, or
+            None if the page should be served.
+        """
+        with self._lock:
+            delay = self.faults.latency_seconds + self._random.uniform(
+                0, self.faults.jitter_seconds
+            )
+            value = self._random.random()
+            rate_limit_rate = self.faults.rate_limit_rate
+            server_error_rate = self.faults.server_error_rate
+
+            if value < rate_limit_rate:
+                return delay, 429
+
+            if value < rate_limit_rate + server_error_rate:
+                return delay, self._random.choice(
+                    MockServerConstants.SERVER_ERRORS
+                )
+
+        return delay, None
+
+    def count(self, status_code: int) -> None:
+        """Count a response by its status code.
+
+        :param status_code: A status code of the response.
+        :return: None.
+        """
+        with self._lock:
+            self.status_codes[status_code] += 1
+
+    def start(self) -> None:
+        """Start serving in a background thread.
+
+        :return: None.
+        """
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        )
+        self._thread.start()
+
+        logger.info(msg=f"Mock server has been started at `{self.url}`.")
+
+    def stop(self) -> None:
+        """Stop serving and close the server.
+
+        :return: None.
+        """
+        self._server.shutdown()
+        self._server.server_close()
+
+        if self._thread:
+            self._thread.join()
+
+        logger.info(
+            msg=f"Mock server has been stopped, responses by the status "
+            f"codes: {dict(sorted(self.status_codes.items()))}."
+        )
+
+    def __enter__(self) -> "MockServer":
+        self.start()
+
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+
+def get_args() -> argparse.Namespace:
+    """Get command line arguments.
+
+    :return: Arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Serve a basketball-reference corpus locally."
+    )
+    parser.add_argument(
+        "--corpus-folder",
+        type=Path,
+        help="A folder of a recorded corpus (e.g. a raw folder of a run). "
+        "A synthetic corpus is generated if not specified.",
+    )
+    parser.add_argument(
+        "--seasons", type=int, default=BenchmarkConstants.SEASONS
+    )
+    parser.add_argument("--teams", type=int, default=BenchmarkConstants.TEAMS)
+    parser.add_argument(
+        "--players-per-team",
+        type=int,
+        default=BenchmarkConstants.PLAYERS_PER_TEAM,
+    )
+    parser.add_argument("--seed", type=int, default=BenchmarkConstants.SEED)
+    parser.add_argument("--host", default=MockServerConstants.HOST)
+    parser.add_argument("--port", type=int, default=MockServerConstants.PORT)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--server-error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--retry-after",
+        type=int,
+        default=MockServerConstants.RETRY_AFTER_SECONDS,
+    )
+
+    args = parser.parse_args()
+
+    return args
+
+
+if __name__ == "__main__":
+    args = get_args()
+
+    faults = FaultConfig(
+        latency_seconds=args.latency,
+        jitter_seconds=args.jitter,
+        rate_limit_rate=args.rate_limit_rate,
+        server_error_rate=args.server_error_rate,
+        retry_after_seconds=args.retry_after,
+        seed=args.seed,
+    )
+
+    with tempfile.TemporaryDirectory() as temp_folder:
+        corpus_folder = args.corpus_folder
+
+        if corpus_folder is None:
+            corpus_folder = Path(temp_folder)
+
+            CorpusGenerator(
+                raw_folder=corpus_folder,
+                config=CorpusConfig(
+                    seasons=args.seasons,
+                    teams=args.teams,
+                    players_per_team=args.players_per_team,
+                    seed=args.seed,
+                ),
+            ).generate()
+
+        server = MockServer(
+            corpus_folder, faults=faults, host=args.host, port=args.port
+        )
+
+        with server:
+            try:
+                threading.Event().wait()
+            except KeyboardInterrupt:
+                pass
@@ -0,0 +1,852 @@
+import argparse
+import contextlib
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from dataclasses import asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from benchmarks.constants import BenchmarkConstants
+from benchmarks.corpus import CorpusConfig, CorpusGenerator, CorpusStats
+from benchmarks.mock_server import FaultConfig, MockServer
+from common.constants import (
+    BaseConstants,
+    LeagueConstants,
+    MetricsConstants,
+    PipelineConstants,
+    PlayerConstants,
+    SeasonConstants,
+    TeamConstants,
+    TeamStatsConstants,
+)
+from common.logger import init_logger
+from extractors.base_extractor import BaseExtractor
+from extractors.conferences.conference_extractor import ConferenceExtractor
+from extractors.conferences.conference_stats_extractor import (
+    ConferenceStatsExtractor,
+)
+from extractors.players.player_extractor import PlayerExtractor
+from extractors.players.player_stats_extractor import PlayerStatsExtractor
+from extractors.seasons.season_extractor import SeasonExtractor
+from extractors.teams.team_extractor import TeamExtractor
+from extractors.teams.team_stats_extractor import TeamStatsExtractor
+
+init_logger(logger_name=BenchmarkConstants.LOGGER_NAME)
+logger = logging.getLogger(name=BenchmarkConstants.LOGGER_NAME)
+
+# Extractors, their methods to benchmark, and a raw folder they read.
+EXTRACTORS = (
+    (
+        SeasonExtractor,
+        ("get_seasons_df", "get_seasons_urls"),
+        SeasonConstants.SEASONS_FOLDER,
+    ),
+    (
+        ConferenceExtractor,
+        ("update_conferences_df",),
+        LeagueConstants.LEAGUES_FOLDER,
+    ),
+    (
+        ConferenceStatsExtractor,
+        (
+            "get_per_game_teams_stats_df",
+            "get_per_game_opponents_stats_df",
+            "get_total_teams_stats_df",
+            "get_total_opponents_stats_df",
+            "get_per_100_possessions_teams_stats_df",
+            "get_per_100_possessions_opponents_stats_df",
+            "get_advanced_teams_stats_df",
+            "get_shooting_teams_stats_df",
+            "get_shooting_opponents_stats_df",
+        ),
+        LeagueConstants.LEAGUES_FOLDER,
+    ),
+    (TeamExtractor, ("get_teams_urls",), LeagueConstants.LEAGUES_FOLDER),
+    (
+        TeamStatsExtractor,
+        (
+            "get_rosters_df",
+            "get_regular_season_per_game_stats_df",
+            "get_playoffs_per_game_stats_df",
+            "get_regular_season_total_stats_df",
+            "get_playoffs_total_stats_df",
+            "get_regular_season_per_36_minutes_stats_df",
+            "get_playoffs_per_36_minutes_stats_df",
+            "get_regular_season_per_100_possessions_stats_df",
+            "get_playoffs_per_100_possessions_stats_df",
+            "get_regular_season_advanced_stats_df",
+            "get_playoffs_advanced_stats_df",
+            "get_regular_season_adjusted_shooting_stats_df",
+            "get_playoffs_adjusted_shooting_stats_df",
+            "get_regular_season_shooting_stats_df",
+            "get_playoffs_shooting_stats_df",
+            "get_regular_season_play_by_play_stats_df",
+            "get_playoffs_play_by_play_stats_df",
+            "get_salaries_df",
+        ),
+        TeamConstants.TEAMS_FOLDER,
+    ),
+    (PlayerExtractor, ("get_players_urls",), TeamConstants.TEAMS_FOLDER),
+    (
+        PlayerStatsExtractor,
+        ("get_players_stats_df",),
+        PlayerConstants.PLAYERS_FOLDER,
+    ),
+)
+
+
+@contextlib.contextmanager
+def patch_constants(**constants: tuple[type, Any]) -> Iterator[None]:
+    """Temporarily replace class-level constants.
+
+    :param constants: Names of the constants and their classes with
+        the values to set.
+    :return: None.
+    """
+    originals = {
+        name: (cls, getattr(cls, name)) for name, (cls, _) in constants.items()
+    }
+
+    try:
+        for name, (cls, value) in constants.items():
+            setattr(cls, name, value)
+
+        yield
+    finally:
+        for name, (cls, value) in originals.items():
+            setattr(cls, name, value)
+
+
+def redirect_raw_folder(raw_folder: Path) -> contextlib.AbstractContextManager:
+    """Point the extractors to the raw folder of the synthetic corpus.
+
+    :param raw_folder: A raw folder of the corpus.
+    :return: Context manager.
+    """
+    return patch_constants(
+        RAW_FOLDER=(BaseConstants, raw_folder),
+        RAW_FILEPATH=(
+            SeasonConstants,
+            raw_folder.joinpath(
+                SeasonConstants.SEASONS_FOLDER, "seasons.html"
+            ),
+        ),
+    )
+
+
+def measure(func: Callable, *, repeats: int) -> tuple[list[float], Any]:
+    """Measure wall time of the function.
+
+    :param func: A function to measure.
+    :param repeats: A number of runs.
+    :return: Timings (seconds) of each run and a result of the last run.
+    """
+    timings = []
+    result = None
+
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+
+    return timings, result
+
+
+def get_result(
+    group: str,
+    name: str,
+    *,
+    timings: list[float],
+    rows: int | None = None,
+    files: int | None = None,
+    bytes_count: int | None = None,
+    **extra: Any,
+) -> dict[str, Any]:
+    """Get a benchmark result with throughput based on the median time.
+
+    :param group: A group of the benchmark.
+    :param name: A name of the benchmark.
+    :param timings: Timings (seconds) of each run.
+    :param rows: A number of produced rows.
+    :param files: A number of processed files.
+    :param bytes_count: A number of read or written bytes.
+    :param extra: Other values to add to the result.
+    :return: Result.
+    """
+    median = statistics.median(timings)
+
+    result = {
+        "group": group,
+        "name": name,
+        "seconds": {
+            "min": min(timings),
+            "median": median,
+            "mean": statistics.fmean(timings),
+            "runs": timings,
+        },
+        "rows": rows,
+        "files": files,
+        "bytes": bytes_count,
+        "rows_per_second": rows / median if rows else None,
+        "files_per_second": files / median if files else None,
+        "megabytes_per_second": (
+            bytes_count / median / 1024**2 if bytes_count else None
+        ),
+        **extra,
+    }
+
+    logger.info(msg=f"`{group}/{name}` took {median:.3f}s (median).")
+
+    return result
+
+
+def benchmark_extractors(
+    corpus_stats: CorpusStats, *, repeats: int
+) -> tuple[list[dict[str, Any]], dict[str, pd.DataFrame]]:
+    """Benchmark every extractor on the corpus.
+
+    :param corpus_stats: Stats of the generated corpus.
+    :param repeats: A number of runs of each extractor.
+    :return: Results and the extracted tables by the benchmark names.
+    """
+    results = []
+    tables = {}
+
+    for extractor_cls, methods, folder in EXTRACTORS:
+        extractor = extractor_cls()
+
+        for method in methods:
+            name = f"{extractor_cls.__name__}.{method}"
+
+            timings, extracted = measure(
+                getattr(extractor, method), repeats=repeats
+            )
+
+            if isinstance(extracted, pd.DataFrame):
+                tables[name] = extracted
+
+            results.append(
+                get_result(
+                    "extractors",
+                    name,
+                    timings=timings,
+                    rows=len(extracted),
+                    files=corpus_stats.files.get(folder),
+                    bytes_count=corpus_stats.bytes.get(folder),
+                )
+            )
+
+    return results, tables
+
+
+def benchmark_process_files(
+    corpus_stats: CorpusStats, *, repeats: int, workers: list[int]
+) -> list[dict[str, Any]]:
+    """Benchmark how `process_files` scales with a number of workers.
+
+    :param corpus_stats: Stats of the generated corpus.
+    :param repeats: A number of runs for each number of workers.
+    :param workers: Numbers of workers to run with.
+    :return: Results.
+    """
+    extractor = TeamStatsExtractor()
+    teams_filepaths = extractor.get_teams_filepaths()
+
+    results = []
+    first_median = None
+
+    for max_workers in workers:
+        with patch_constants(MAX_WORKERS=(BaseConstants, max_workers)):
+            timings, stats_df = measure(
+                lambda: extractor.process_files(
+                    func=extractor.get_stats_df,
+                    filepaths=teams_filepaths,
+                    stats_id=(
+                        TeamStatsConstants.REGULAR_SEASON_PER_GAME_STATS_ID
+                    ),
+                    columns_map=TeamStatsConstants.STATS_COLUMNS_MAP,
+                ),
+                repeats=repeats,
+            )
+
+        # The speedup and efficiency are relative to the first number
+        # of workers (usually a single worker).
+        median = statistics.median(timings)
+        first_median = first_median or median
+        speedup = first_median / median
+
+        results.append(
+            get_result(
+                "process_files",
+                f"workers={max_workers}",
+                timings=timings,
+                rows=len(stats_df),
+                files=len(teams_filepaths),
+                bytes_count=corpus_stats.bytes.get(TeamConstants.TEAMS_FOLDER),
+                workers=max_workers,
+                speedup=speedup,
+                efficiency=speedup * workers[0] / max_workers,
+            )
+        )
+
+    return results
+
+
+def benchmark_parquet(
+    tables: dict[str, pd.DataFrame], *, repeats: int, folder: Path
+) -> list[dict[str, Any]]:
+    """Benchmark writing of the extracted tables to Parquet files.
+
+    :param tables: Extracted tables by their names.
+    :param repeats: A number of writes of each table.
+    :param folder: A folder to write the files to.
+    :return: Results.
+    """
+    results = []
+
+    for name, table_df in tables.items():
+        filepath = folder.joinpath(f"{name}.parquet")
+
+        timings, _ = measure(
+            lambda: BaseExtractor.save_table(table_df, filepath=filepath),
+            repeats=repeats,
+        )
+
+        results.append(
+            get_result(
+                "parquet",
+                name,
+                timings=timings,
+                rows=len(table_df),
+                files=1,
+                bytes_count=os.path.getsize(filepath),
+            )
+        )
+
+    return results
+
+
+def read_tables(folder: Path) -> dict[str, pd.DataFrame]:
+    """Read the processed tables of a run (e.g. synced from S3).
+
+    :param folder: A folder of the tables.
+    :return: Tables by their names.
+    """
+    tables = {
+        filepath.stem: pd.read_parquet(filepath, engine="pyarrow")
+        for filepath in sorted(folder.glob("*.parquet"))
+    }
+
+    return tables
+
+
+def benchmark_compression(
+    tables: dict[str, pd.DataFrame], *, repeats: int, folder: Path
+) -> list[dict[str, Any]]:
+    """Benchmark the settings of the Parquet writer: the size of the
+    files of all tables, and the times to write and read them.
+
+    :param tables: Tables by their names.
+    :param repeats: A number of writes and reads of each table.
+    :param folder: A folder to write the files to.
+    :return: Results.
+    """
+    results = []
+    rows = sum(len(table_df) for table_df in tables.values())
+
+    for setting, options in BenchmarkConstants.COMPRESSION_SETTINGS.items():
+        write_timings = [0.0] * repeats
+        read_timings = [0.0] * repeats
+        tables_bytes = {}
+
+        for name, table_df in tables.items():
+            filepath = folder.joinpath(f"{name}-{setting}.parquet")
+
+            timings, _ = measure(
+                lambda: BaseExtractor.save_table(
+                    table_df, filepath=filepath, options=options
+                ),
+                repeats=repeats,
+            )
+            write_timings = [
+                total + timing
+                for total, timing in zip(write_timings, timings, strict=True)
+            ]
+
+            timings, _ = measure(
+                lambda: pd.read_parquet(filepath, engine="pyarrow"),
+                repeats=repeats,
+            )
+            read_timings = [
+                total + timing
+                for total, timing in zip(read_timings, timings, strict=True)
+            ]
+
+            tables_bytes[name] = os.path.getsize(filepath)
+
+        for operation, timings in (
+            ("write", write_timings),
+            ("read", read_timings),
+        ):
+            results.append(
+                get_result(
+                    "compression",
+                    f"{setting}/{operation}",
+                    timings=timings,
+                    rows=rows,
+                    files=len(tables),
+                    bytes_count=sum(tables_bytes.values()),
+                    options=options,
+                    tables_bytes=tables_bytes,
+                )
+            )
+
+    return results
+
+
+def benchmark_collectors(
+    raw_folder: Path, *, repeats: int, faults: FaultConfig, folder: Path
+) -> list[dict[str, Any]]:
+    """Benchmark the collectors end to end: run the service against
+    the mock server that serves the corpus and time the collect stages
+    by the run reports.
+
+    :param raw_folder: A raw folder of the corpus to serve.
+    :param repeats: A number of runs of the service.
+    :param faults: The faults the server injects.
+    :param folder: A folder for the raw data and reports of the runs.
+    :return: Results.
+    """
+    stages_timings = defaultdict(list)
+    stages_counters = {}
+    timings = []
+
+    with MockServer(raw_folder, faults=faults) as server:
+        for idx in range(repeats):
+            run_folder = folder.joinpath(f"collectors-{idx}")
+            report_filepath = run_folder.joinpath("report.json")
+
+            env = {
+                **os.environ,
+                "NBA_STATS_URL": server.url,
+                "NBA_STATS_RAW_FOLDER": str(run_folder.joinpath("raw")),
+                "NBA_STATS_PROCESSED_FOLDER": str(
+                    run_folder.joinpath("processed")
+                ),
+                "NBA_STATS_TIME_SLEEP_SECONDS": "0",
+                MetricsConstants.REPORT_FILEPATH_ENV: str(report_filepath),
+            }
+
+            start = time.perf_counter()
+
+            subprocess.run(
+                [
+                    sys.executable,
+                    str(BenchmarkConstants.SERVICE_FILEPATH),
+                    "--stages",
+                    *BenchmarkConstants.COLLECT_STAGES,
+                    "--skip-uploads",
+                ],
+                check=True,
+                env=env,
+            )
+
+            timings.append(time.perf_counter() - start)
+
+            with open(report_filepath, mode="r", encoding="utf-8") as f:
+                report = json.load(f)
+
+            for stage in report["stages"]:
+                if stage["stage"].startswith("collect_"):
+                    stages_timings[stage["stage"]].append(
+                        stage["wall_seconds"]
+                    )
+                    stages_counters[stage["stage"]] = stage["counters"]
+
+    results = [
+        get_result(
+            "collectors",
+            name,
+            timings=stages_timings[name],
+            files=stages_counters[name]["pages_fetched"],
+            bytes_count=stages_counters[name]["bytes_fetched"],
+        )
+        for name in stages_timings
+    ]
+
+    results.append(
+        get_result(
+            "collectors",
+            "service",
+            timings=timings,
+            files=sum(
+                counters["pages_fetched"]
+                for counters in stages_counters.values()
+            ),
+            status_codes=dict(server.status_codes),
+        )
+    )
+
+    return results
+
+
+def benchmark_startup(*, repeats: int) -> list[dict[str, Any]]:
+    """Benchmark the startup of the service: each scenario runs in a new
+    interpreter, so the imports aren't cached.
+
+    :param repeats: A number of runs of each scenario.
+    :return: Results.
+    """
+    results = []
+
+    for name, code in BenchmarkConstants.STARTUP_SCENARIOS.items():
+        # The scenario reports the heavy modules it has imported.
+        code = (
+            f"{code}\nimport json, sys\nprint(json.dumps(sorted(set("
+            f"{list(PipelineConstants.LAZY_MODULES)}) & set(sys.modules))))"
+        )
+
+        timings, process = measure(
+            lambda: subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True,
+                check=True,
+                cwd=BenchmarkConstants.SERVICE_FILEPATH.parent,
+                text=True,
+            ),
+            repeats=repeats,
+        )
+
+        results.append(
+            get_result(
+                "startup",
+                name,
+                timings=timings,
+                modules=json.loads(process.stdout.splitlines()[-1]),
+                budget_seconds=BenchmarkConstants.STARTUP_BUDGETS.get(name),
+            )
+        )
+
+    return results
+
+
+def check_budgets(results: dict[str, Any]) -> list[str]:
+    """Check the median timings of the benchmarks with their budgets.
+
+    :param results: Current results.
+    :return: Names of the benchmarks over their budgets.
+    """
+    over_budget = [
+        f"{result['group']}/{result['name']}"
+        for result in results["results"]
+        if result.get("budget_seconds") is not None
+        and result["seconds"]["median"] > result["budget_seconds"]
+    ]
+
+    return over_budget
+
+
+def get_commit() -> str | None:
+    """Get a commit of the working tree, if it's a git repository.
+
+    :return: Commit hash.
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            cwd=BenchmarkConstants.BASE_FOLDER,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return commit
+
+
+def compare_results(
+    results: dict[str, Any], baseline: dict[str, Any], *, threshold: float
+) -> list[str]:
+    """Compare median timings with the baseline results.
+
+    :param results: Current results.
+    :param baseline: Baseline results (e.g. of the previous commit).
+    :param threshold: A relative slowdown (e.g. `0.1` for 10%) to treat
+        as a regression.
+    :return: Names of the benchmarks that regressed.
+    """
+    baseline_medians = {
+        f"{result['group']}/{result['name']}": result["seconds"]["median"]
+        for result in baseline["results"]
+    }
+
+    regressions = []
+
+    for result in results["results"]:
+        key = f"{result['group']}/{result['name']}"
+
+        if key not in baseline_medians:
+            continue
+
+        ratio = result["seconds"]["median"] / baseline_medians[key]
+
+        logger.info(msg=f"`{key}`: x{ratio:.2f} of the baseline time.")
+
+        if ratio > 1 + threshold:
+            regressions.append(key)
+
+    return regressions
+
+
+def run(
+    config: CorpusConfig,
+    *,
+    groups: list[str],
+    repeats: int,
+    workers: list[int],
+    corpus_folder: Path | None = None,
+    faults: FaultConfig | None = None,
+    tables_folder: Path | None = None,
+) -> dict[str, Any]:
+    """Generate the corpus and run the benchmarks on it.
+
+    :param config: Scale of the corpus.
+    :param groups: Groups of the benchmarks to run.
+    :param repeats: A number of runs of each benchmark.
+    :param workers: Numbers of workers for `process_files`.
+    :param corpus_folder: A folder to keep the corpus in. A temporary
+        folder is used (and removed) if not specified.
+    :param faults: The faults the mock server injects for the
+        collectors (none if not specified).
+    :param tables_folder: A folder of the processed tables of a run
+        to benchmark the compression on. The tables extracted from
+        the corpus are used if not specified.
+    :return: Results.
+    """
+    faults = faults or FaultConfig()
+
+    with tempfile.TemporaryDirectory() as temp_folder:
+        base_folder = corpus_folder or Path(temp_folder)
+        raw_folder = base_folder.joinpath("raw")
+        processed_folder = base_folder.joinpath("processed")
+
+        os.makedirs(processed_folder, exist_ok=True)
+
+        corpus_stats = CorpusGenerator(
+            raw_folder=raw_folder, config=config
+        ).generate()
+
+        logger.info(
+            msg=f"Corpus of {sum(corpus_stats.files.values())} pages "
+            f"({sum(corpus_stats.bytes.values()) / 1024**2:.1f} MB) "
+            f"has been generated."
+        )
+
+        results = []
+
+        with redirect_raw_folder(raw_folder=raw_folder):
+            # The extracted tables are also what the Parquet benchmarks
+            # write.
+            if (
+                "extractors" in groups
+                or "parquet" in groups
+                or ("compression" in groups and tables_folder is None)
+            ):
+                extractors_results, tables = benchmark_extractors(
+                    corpus_stats, repeats=repeats
+                )
+
+            if "extractors" in groups:
+                results.extend(extractors_results)
+
+            if "process_files" in groups:
+                results.extend(
+                    benchmark_process_files(
+                        corpus_stats, repeats=repeats, workers=workers
+                    )
+                )
+
+            if "parquet" in groups:
+                results.extend(
+                    benchmark_parquet(
+                        tables, repeats=repeats, folder=processed_folder
+                    )
+                )
+
+            if "compression" in groups:
+                results.extend(
+                    benchmark_compression(
+                        read_tables(tables_folder)
+                        if tables_folder is not None
+                        else tables,
+                        repeats=repeats,
+                        folder=processed_folder,
+                    )
+                )
+
+        if "startup" in groups:
+            results.extend(benchmark_startup(repeats=repeats))
+
+        if "collectors" in groups:
+            results.extend(
+                benchmark_collectors(
+                    raw_folder,
+                    repeats=repeats,
+                    faults=faults,
+                    folder=base_folder.joinpath("runs"),
+                )
+            )
+
+    report = {
+        "metadata": {
+            "created_at": datetime.now(tz=timezone.utc).isoformat(),
+            "commit": get_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "repeats": repeats,
+            "config": asdict(config),
+            "faults": asdict(faults),
+        },
+        "corpus": asdict(corpus_stats),
+        "results": results,
+    }
+
+    return report
+
+
+def get_args() -> argparse.Namespace:
+    """Get command line arguments.
+
+    :return: Arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark the extractors on a synthetic corpus."
+    )
+    parser.add_argument(
+        "--seasons", type=int, default=BenchmarkConstants.SEASONS
+    )
+    parser.add_argument("--teams", type=int, default=BenchmarkConstants.TEAMS)
+    parser.add_argument(
+        "--players-per-team",
+        type=int,
+        default=BenchmarkConstants.PLAYERS_PER_TEAM,
+    )
+    parser.add_argument("--seed", type=int, default=BenchmarkConstants.SEED)
+    parser.add_argument(
+        "--repeats", type=int, default=BenchmarkConstants.REPEATS
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=list(BenchmarkConstants.WORKERS),
+    )
+    parser.add_argument(
+        "--groups",
+        nargs="+",
+        choices=BenchmarkConstants.GROUPS,
+        default=list(BenchmarkConstants.GROUPS),
+    )
+    parser.add_argument(
+        "--corpus-folder",
+        type=Path,
+        help="A folder to keep the generated corpus in.",
+    )
+    parser.add_argument(
+        "--tables-folder",
+        type=Path,
+        help="A folder of the processed tables to benchmark the "
+        "compression on (the extracted tables if not specified).",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="A delay (seconds) of the mock server for the collectors.",
+    )
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--server-error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--output", type=Path, default=BenchmarkConstants.RESULTS_FILEPATH
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="Results to compare with (e.g. of the previous commit).",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=BenchmarkConstants.REGRESSION_THRESHOLD,
+    )
+
+    args = parser.parse_args()
+
+    return args
+
+
+if __name__ == "__main__":
+    args = get_args()
+
+    report = run(
+        CorpusConfig(
+            seasons=args.seasons,
+            teams=args.teams,
+            players_per_team=args.players_per_team,
+            seed=args.seed,
+        ),
+        groups=args.groups,
+        repeats=args.repeats,
+        workers=args.workers,
+        corpus_folder=args.corpus_folder,
+        faults=FaultConfig(
+            latency_seconds=args.latency,
+            jitter_seconds=args.jitter,
+            rate_limit_rate=args.rate_limit_rate,
+            server_error_rate=args.server_error_rate,
+            seed=args.seed,
+        ),
+        tables_folder=args.tables_folder,
+    )
+
+    os.makedirs(args.output.parent, exist_ok=True)
+
+    with open(args.output, mode="w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    logger.info(msg=f"Results have been saved to `{args.output}`.")
+
+    over_budget = check_budgets(report)
+
+    if over_budget:
+        logger.error(msg=f"Over the budget: {', '.join(over_budget)}.")
+
+        sys.exit(1)
+
+    if args.baseline:
+        with open(args.baseline, mode="r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+        regressions = compare_results(
+            report, baseline, threshold=args.threshold
+        )
+
+        if regressions:
+            logger.error(msg=f"Regressions: {', '.join(regressions)}.")
+
+            sys.exit(1)
@@ -1,14 +1,30 @@
+import concurrent.futures
+import contextvars
+import email.utils
 import json
 import logging
 import os
 import re
 import time
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timezone
 from pathlib import Path
 
 import requests
 
-from common.constants import BaseConstants, LoggerConstants, SeasonConstants
+from collectors.rate_controller import CrawlRateController
+from collectors.retry_policy import RetryPolicy
+from common import metrics
+from common.constants import (
+    BaseConstants,
+    LoggerConstants,
+    RawSegmentConstants,
+    RetryConstants,
+    SeasonConstants,
+)
 from common.logger import init_logger
+from common.raw_segments import SegmentWriter
+from common.url_registry import UrlRegistry
 
 init_logger(logger_name=LoggerConstants.BASE_COLLECTOR_LOGGER_NAME)
 logger = logging.getLogger(name=LoggerConstants.BASE_COLLECTOR_LOGGER_NAME)
@@ -18,71 +34,375 @@ class BaseCollector:
     """A base class to use for data collectors.
 
     :param encoding: The encoding of the data.
+    :param retry_policies: Retry policies by the status codes.
+    :param rate_controller: A controller that paces the requests.
+    :param url_registry: A registry of the fetched URLs.
     """
 
-    def __init__(self, encoding: str = "utf-8") -> None:
+    def __init__(
+        self,
+        encoding: str = "utf-8",
+        retry_policies: dict[int | None, RetryPolicy] | None = None,
+        rate_controller: CrawlRateController | None = None,
+        url_registry: UrlRegistry | None = None,
+    ) -> None:
         """Construct all necessary attributes for the `BaseCollector`
         object.
 
         :param encoding: The encoding of the data.
+        :param retry_policies: Retry policies by the status codes (the
+            default ones if not specified).
+        :param rate_controller: A controller that paces the requests.
+            It can be shared by the collectors of a run, so they keep
+            the rate the site tolerates.
+        :param url_registry: A registry of the fetched URLs. It can be
+            shared by the collectors of a run, so no page is fetched
+            twice.
         """
         self.encoding = encoding
+        self.retry_policies = retry_policies or RetryPolicy.get_policies()
+        self.rate_controller = rate_controller or CrawlRateController()
+        # An empty registry is falsy.
+        self.url_registry = (
+            url_registry if url_registry is not None else UrlRegistry()
+        )
+        self.dead_letters: list[dict] = []
+        self.segment_writers: dict[Path, SegmentWriter] = {}
+
+    def get_retry_policy(
+        self, e: requests.exceptions.RequestException
+    ) -> RetryPolicy | None:
+        """Get a retry policy for the failed request.
+
+        :param e: An error of the request.
+        :return: Retry policy, or None if the request isn't retried.
+        """
+        if e.response is not None:
+            return self.retry_policies.get(e.response.status_code)
+
+        if isinstance(
+            e,
+            (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+            ),
+        ):
+            return self.retry_policies.get(None)
+
+        return None
+
+    @staticmethod
+    def get_retry_after(response: requests.Response | None) -> float | None:
+        """Get a delay the site asks to wait from the `Retry-After`
+        header, given either in seconds or as an HTTP date.
+
+        :param response: A response of the failed request.
+        :return: Delay (seconds), or None if the header isn't set.
+        """
+        if response is None:
+            return None
+
+        retry_after = response.headers.get(RetryConstants.RETRY_AFTER_HEADER)
+
+        if not retry_after:
+            return None
+
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass
+
+        try:
+            retry_at = email.utils.parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+
+        return max(
+            (retry_at - datetime.now(tz=timezone.utc)).total_seconds(), 0.0
+        )
+
+    def add_dead_letter(
+        self,
+        url: str,
+        *,
+        e: requests.exceptions.RequestException,
+        attempts: int,
+    ) -> None:
+        """Add a URL that failed after all attempts to the dead letters.
+
+        :param url: A URL of the HTML data.
+        :param e: An error of the last attempt.
+        :param attempts: A number of attempts.
+        :return: None.
+        """
+        self.dead_letters.append(
+            {
+                "url": url,
+                "status_code": (
+                    e.response.status_code if e.response is not None else None
+                ),
+                "attempts": attempts,
+                "error": str(e),
+                "failed_at": datetime.now(tz=timezone.utc).isoformat(),
+            }
+        )
+
+        metrics.increment("dead_letters")
+
+    def save_dead_letters(self) -> None:
+        """Save the dead letters, merged with the ones of the previous
+        collectors of the run, so the failed URLs can be refetched
+        later. Nothing is saved if all URLs were fetched.
+
+        :return: None.
+        """
+        if not self.dead_letters:
+            return
+
+        filepath = RetryConstants.DEAD_LETTERS_FILEPATH
+
+        dead_letters = (
+            self.read_json(filepath=filepath) if filepath.exists() else []
+        )
+        dead_letters.extend(self.dead_letters)
+
+        os.makedirs(filepath.parent, exist_ok=True)
+
+        with open(filepath, mode="w", encoding=self.encoding) as f:
+            json.dump(dead_letters, f, indent=2)
+
+        logger.warning(
+            msg=f"{len(self.dead_letters)} URLs failed after all attempts "
+            f"and have been saved to `{filepath}`."
+        )
+
+        self.dead_letters = []
 
     def get_html_data(self, url: str) -> str | None:
         """Get an HTML data as a response from the specified source.
 
+        The rate limited requests (`429`), server errors (`5xx`), and
+        connection errors are retried with a jittered exponential
+        backoff that respects `Retry-After`. If a request still fails,
+        the URL is added to the dead letters.
+
         :param url: A URL of the HTML data.
-        :return: HTML data.
+        :return: HTML data, or None if it can't be retrieved.
         """
-        try:
-            response = requests.get(url=url)
-            response.raise_for_status()
-
-            # Don't use the `response.text` as it doesn't properly
-            # convert some special characters. For example, we want
-            # to get this: `N. Jokić` instead we get: `N. JokiÄ`.
-            html_data = response.content.decode(self.encoding)
-
-            # We need to specify a delay between the next response,
-            # otherwise we'll be blocked.
-            time.sleep(BaseConstants.TIME_SLEEP_SECONDS)
-
-            return html_data
-        except requests.exceptions.RequestException as e:
-            status_code = e.response.status_code
-
-            match status_code:
-                case 400:
-                    logger.error(
-                        msg=f"HTML data can't be retrieved due to "
-                        f"`{status_code}` Bad Request for `{url}`.",
-                    )
-                case 401 | 403:
-                    logger.error(
-                        f"HTML data can't be retrieved due to `{status_code}` "
-                        f"Authentication Error for `{url}`."
+        attempt = 0
+
+        while True:
+            attempt += 1
+
+            # The requests are paced by the controller instead of a
+            # fixed delay, otherwise we'll be blocked.
+            self.rate_controller.wait()
+
+            start = time.perf_counter()
+
+            try:
+                response = requests.get(
+                    url=url, timeout=RetryConstants.TIMEOUT_SECONDS
+                )
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                self.rate_controller.update(
+                    status_code=(
+                        e.response.status_code
+                        if e.response is not None
+                        else None
+                    ),
+                    latency_seconds=time.perf_counter() - start,
+                )
+
+                policy = self.get_retry_policy(e=e)
+
+                if policy is not None and attempt < policy.max_attempts:
+                    delay = policy.get_delay(
+                        attempt=attempt,
+                        retry_after=self.get_retry_after(response=e.response),
                     )
-                case 404:
-                    logger.error(
-                        f"HTML data isn't available due to `{status_code}` "
-                        f"Not Found for `{url}`."
+
+                    logger.warning(
+                        msg=f"Attempt {attempt} of {policy.max_attempts} "
+                        f"failed due to `{e}` for `{url}`, retrying in "
+                        f"{delay:.1f}s."
                     )
-                case _:
-                    logger.error(
-                        f"An unexpected error occurred while fetching HTML "
-                        f"data due to `{e}` for `{url}`."
+
+                    metrics.increment("retries")
+
+                    time.sleep(delay)
+
+                    continue
+
+                self.log_error(url=url, e=e)
+                self.add_dead_letter(url=url, e=e, attempts=attempt)
+
+                return None
+
+            self.rate_controller.update(
+                status_code=response.status_code,
+                latency_seconds=time.perf_counter() - start,
+            )
+
+            break
+
+        # Don't use the `response.text` as it doesn't properly
+        # convert some special characters. For example, we want
+        # to get this: `N. Jokić` instead we get: `N. JokiÄ`.
+        html_data = response.content.decode(self.encoding)
+
+        metrics.increment("pages_fetched")
+        metrics.increment("bytes_fetched", len(response.content))
+
+        return html_data
+
+    @staticmethod
+    def log_error(
+        url: str, *, e: requests.exceptions.RequestException
+    ) -> None:
+        """Log an error of the request that won't be retried.
+
+        :param url: A URL of the HTML data.
+        :param e: An error of the request.
+        :return: None.
+        """
+        status_code = (
+            e.response.status_code if e.response is not None else None
+        )
+
+        match status_code:
+            case 400:
+                logger.error(
+                    msg=f"HTML data can't be retrieved due to "
+                    f"`{status_code}` Bad Request for `{url}`.",
+                )
+            case 401 | 403:
+                logger.error(
+                    f"HTML data can't be retrieved due to `{status_code}` "
+                    f"Authentication Error for `{url}`."
+                )
+            case 404:
+                logger.error(
+                    f"HTML data isn't available due to `{status_code}` "
+                    f"Not Found for `{url}`."
+                )
+            case _:
+                logger.error(
+                    f"An unexpected error occurred while fetching HTML "
+                    f"data due to `{e}` for `{url}`."
+                )
+
+    def get_html_data_by_urls(
+        self, urls: Iterable[str]
+    ) -> Iterator[tuple[str, str | None]]:
+        """Get HTML data of the URLs concurrently, with as many requests
+        at the same time as the rate controller allows. The URLs of the
+        pages that are fetched already in the run (see `url_registry`)
+        are skipped.
+
+        :param urls: URLs of the HTML data.
+        :return: URLs and their HTML data (None if it can't be
+            retrieved), in the order the requests are completed.
+        """
+        urls = (url for url in urls if self.register_url(url=url))
+        running: dict[concurrent.futures.Future, str] = {}
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.rate_controller.max_concurrency,
+            thread_name_prefix="collector",
+        ) as executor:
+            while True:
+                while len(running) < self.rate_controller.concurrency:
+                    url = next(urls, None)
+
+                    if url is None:
+                        break
+
+                    # The requests run in the context of the stage, so
+                    # they are counted in its metrics.
+                    future = executor.submit(
+                        contextvars.copy_context().run,
+                        self.get_html_data,
+                        url,
                     )
+                    running[future] = url
+
+                if not running:
+                    break
+
+                done, _ = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+
+                for future in done:
+                    yield running.pop(future), future.result()
+
+    def register_url(self, url: str) -> bool:
+        """Register a URL before it's fetched.
+
+        :param url: A URL of the HTML data.
+        :return: True if the page isn't fetched yet in the run.
+            Otherwise, False.
+        """
+        if self.url_registry.register(url=url):
+            return True
+
+        logger.debug(msg=f"`{url}` has been fetched already, skipping.")
+
+        metrics.increment("duplicate_urls")
+
+        return False
 
     def save_html(self, html_data: str, *, filepath: Path) -> None:
-        """Save HTML data to the appropriate filepath.
+        """Save HTML data to the appropriate filepath, or append it to
+        the segments of the folder if they're enabled (see
+        `RawSegmentConstants`).
 
         :param html_data: HTML data from the response.
         :param filepath: A filepath to save the HTML data to.
         :return: None.
         """
+        if RawSegmentConstants.ENABLED:
+            data = html_data.encode(self.encoding)
+
+            self.get_segment_writer(folder=filepath.parent).write(
+                filepath.name, data=data
+            )
+
+            metrics.increment("files_written")
+            metrics.increment("bytes_written", len(data))
+
+            return
+
         with open(filepath, mode="w", encoding=self.encoding) as f:
             f.write(html_data)
 
+        metrics.increment("files_written")
+        metrics.increment("bytes_written", os.path.getsize(filepath))
+
+    def get_segment_writer(self, folder: Path) -> SegmentWriter:
+        """Get a writer of the segments of the folder.
+
+        :param folder: A folder of the segments.
+        :return: A segment writer.
+        """
+        if folder not in self.segment_writers:
+            self.segment_writers[folder] = SegmentWriter(folder=folder)
+
+        return self.segment_writers[folder]
+
+    def close_segment_writers(self) -> None:
+        """Flush and close the segments written by the collector, so
+        the extractors can read all pages.
+
+        :return: None.
+        """
+        for segment_writer in self.segment_writers.values():
+            segment_writer.close()
+
+        self.segment_writers = {}
+
     def read_json(self, filepath: Path) -> dict:
         """Read data from a JSON file.
 
@@ -0,0 +1,206 @@
+import hashlib
+import heapq
+import itertools
+import json
+import logging
+import os
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+from common import metrics
+from common.constants import CrawlFrontierConstants, LoggerConstants
+from common.logger import init_logger
+from common.raw_segments import SegmentReader
+
+init_logger(logger_name=LoggerConstants.CRAWL_FRONTIER_LOGGER_NAME)
+logger = logging.getLogger(name=LoggerConstants.CRAWL_FRONTIER_LOGGER_NAME)
+
+
+class CrawlFrontier:
+    """A class to order the URLs of a collector by priority and to
+    schedule the revisits of the historic pages.
+
+    The pages of the current season come first, then the pages that
+    changed recently, the pages never fetched, and the historic pages
+    due for a revisit, the newer seasons first within a priority. The
+    historic pages that were fetched within the revisit interval and
+    are saved already aren't fetched again. If the run has a deadline,
+    the URLs left when it passes are deferred to the next run, so the
+    most valuable pages are fetched first.
+
+    :param current_year: A year of the current season.
+    :param deadline: A deadline of the run (`time.monotonic`), or None
+        if the run isn't limited.
+    :param state_filepath: A filepath of the state of the crawl.
+    """
+
+    def __init__(
+        self,
+        current_year: int | None,
+        *,
+        deadline: float | None = None,
+        state_filepath: Path = CrawlFrontierConstants.STATE_FILEPATH,
+    ) -> None:
+        """Construct all attributes for the `CrawlFrontier` object.
+
+        :param current_year: A year of the current season.
+        :param deadline: A deadline of the run (`time.monotonic`), or
+            None if the run isn't limited.
+        :param state_filepath: A filepath of the state of the crawl.
+        """
+        self.current_year = current_year
+        self.deadline = deadline
+        self.state_filepath = state_filepath
+        self.state = self.read_state()
+        self.updated_urls: set[str] = set()
+        self._heap: list[tuple[int, int, int, str]] = []
+        self._order = itertools.count()
+
+    def read_state(self) -> dict[str, dict]:
+        """Read the state of the crawl: when the pages were fetched and
+        last changed, and digests of their HTML data.
+
+        :return: States of the pages by the URLs.
+        """
+        if not os.path.exists(self.state_filepath):
+            return {}
+
+        with open(self.state_filepath, mode="r", encoding="utf-8") as f:
+            state = json.load(f)
+
+        return state
+
+    def get_priority(self, url: str, *, year: int) -> int:
+        """Get a priority of the page.
+
+        :param url: A URL of the page.
+        :param year: A season year of the page (e.g. the last season of
+            the player).
+        :return: Priority (the lower, the sooner the page is fetched).
+        """
+        if year == self.current_year:
+            return CrawlFrontierConstants.CURRENT_SEASON_PRIORITY
+
+        page_state = self.state.get(url)
+
+        if page_state is None:
+            return CrawlFrontierConstants.NEW_PRIORITY
+
+        changed_at = page_state.get("changed_at")
+
+        if (
+            changed_at is not None
+            and time.time() - changed_at
+            < CrawlFrontierConstants.RECENTLY_CHANGED_DAYS * 86400
+        ):
+            return CrawlFrontierConstants.RECENTLY_CHANGED_PRIORITY
+
+        return CrawlFrontierConstants.HISTORIC_PRIORITY
+
+    def is_due(self, url: str, *, filepath: Path) -> bool:
+        """Check whether a historic page is due for a revisit.
+
+        :param url: A URL of the page.
+        :param filepath: A filepath the page is saved to.
+        :return: True if the page should be fetched. Otherwise, False.
+        """
+        if not SegmentReader.exists(filepath=filepath):
+            return True
+
+        fetched_at = self.state.get(url, {}).get("fetched_at")
+
+        return (
+            fetched_at is None
+            or time.time() - fetched_at
+            >= CrawlFrontierConstants.HISTORIC_REVISIT_DAYS * 86400
+        )
+
+    def add(self, url: str, *, year: int, filepath: Path) -> None:
+        """Add a URL to the frontier, unless it's a historic page that
+        isn't due for a revisit.
+
+        :param url: A URL of the page.
+        :param year: A season year of the page.
+        :param filepath: A filepath the page is saved to.
+        :return: None.
+        """
+        priority = self.get_priority(url=url, year=year)
+
+        if (
+            priority == CrawlFrontierConstants.HISTORIC_PRIORITY
+            and not self.is_due(url=url, filepath=filepath)
+        ):
+            metrics.increment("pages_skipped")
+
+            return
+
+        # The insertion order breaks the ties, so the URLs are never
+        # compared.
+        heapq.heappush(self._heap, (priority, -year, next(self._order), url))
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __iter__(self) -> Iterator[str]:
+        """Pop the URLs in the order of priority until the deadline.
+
+        :return: URLs.
+        """
+        while self._heap:
+            if self.deadline is not None and time.monotonic() >= self.deadline:
+                logger.warning(
+                    msg=f"The time budget of the crawl has been spent, "
+                    f"{len(self._heap)} pages have been deferred to the "
+                    f"next run."
+                )
+
+                metrics.increment("pages_deferred", len(self._heap))
+
+                self._heap.clear()
+
+                return
+
+            *_, url = heapq.heappop(self._heap)
+
+            yield url
+
+    def record(self, url: str, *, html_data: str) -> None:
+        """Record a fetched page, and whether it has changed since the
+        last fetch.
+
+        :param url: A URL of the page.
+        :param html_data: HTML data of the page.
+        :return: None.
+        """
+        digest = hashlib.sha256(html_data.encode("utf-8")).hexdigest()
+        now = time.time()
+
+        page_state = self.state.setdefault(url, {})
+
+        if page_state.get("digest") not in (None, digest):
+            page_state["changed_at"] = now
+
+        page_state["digest"] = digest
+        page_state["fetched_at"] = now
+
+        self.updated_urls.add(url)
+
+    def save(self) -> None:
+        """Save the states of the fetched pages, merged with the state
+        saved by the other collectors of the run.
+
+        :return: None.
+        """
+        if not self.updated_urls:
+            return
+
+        state = self.read_state()
+        state.update({url: self.state[url] for url in self.updated_urls})
+
+        os.makedirs(self.state_filepath.parent, exist_ok=True)
+
+        with open(self.state_filepath, mode="w", encoding="utf-8") as f:
+            json.dump(state, f)
+
+        self.updated_urls = set()
@@ -1,22 +1,37 @@
 from pathlib import Path
 
 from collectors.base_collector import BaseCollector
+from collectors.rate_controller import CrawlRateController
 from common.constants import BaseConstants, LeagueConstants, SeasonConstants
+from common.url_registry import UrlRegistry
 
 
 class LeagueCollector(BaseCollector):
     """A class to collect data for leagues.
 
     :param encoding: The encoding of the data.
+    :param rate_controller: A controller that paces the requests.
+    :param url_registry: A registry of the fetched URLs.
     """
 
-    def __init__(self, encoding: str = "utf-8") -> None:
+    def __init__(
+        self,
+        encoding: str = "utf-8",
+        rate_controller: CrawlRateController | None = None,
+        url_registry: UrlRegistry | None = None,
+    ) -> None:
         """Construct all necessary attributes for the `LeagueCollector`
         object.
 
         :param encoding: The encoding of the data.
+        :param rate_controller: A controller that paces the requests.
+        :param url_registry: A registry of the fetched URLs.
         """
-        super().__init__(encoding=encoding)
+        super().__init__(
+            encoding=encoding,
+            rate_controller=rate_controller,
+            url_registry=url_registry,
+        )
 
     @staticmethod
     def get_league_filepath(season_url: str) -> Path:
@@ -43,10 +58,17 @@ class LeagueCollector(BaseCollector):
             filepath=SeasonConstants.SEASONS_URLS_FILEPATH
         )
 
-        for season, season_url in seasons_urls.items():
-            league_html_data = self.get_html_data(url=season_url)
+        for season_url, league_html_data in self.get_html_data_by_urls(
+            urls=seasons_urls.values()
+        ):
             league_filepath = self.get_league_filepath(season_url=season_url)
 
+            if league_html_data is None:
+                continue
+
             self.save_html(
                 html_data=league_html_data, filepath=league_filepath
             )
+
+        self.close_segment_writers()
+        self.save_dead_letters()
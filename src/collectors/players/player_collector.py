@@ -1,23 +1,44 @@
 from pathlib import Path
 
 from collectors.base_collector import BaseCollector
+from collectors.crawl_frontier import CrawlFrontier
+from collectors.rate_controller import CrawlRateController
 from common.constants import BaseConstants, PlayerConstants
 from common.exceptions import HTMLExtensionError
+from common.url_registry import UrlRegistry
 
 
 class PlayerCollector(BaseCollector):
     """A class to collect data for players.
 
     :param encoding: The encoding of the data.
+    :param rate_controller: A controller that paces the requests.
+    :param url_registry: A registry of the fetched URLs.
+    :param deadline: A deadline of the crawl (`time.monotonic`).
     """
 
-    def __init__(self, encoding="utf-8") -> None:
+    def __init__(
+        self,
+        encoding="utf-8",
+        rate_controller: CrawlRateController | None = None,
+        url_registry: UrlRegistry | None = None,
+        deadline: float | None = None,
+    ) -> None:
         """Construct all necessary attributes for the `PlayerCollector`
         object.
 
         :param encoding: The encoding of the data.
+        :param rate_controller: A controller that paces the requests.
+        :param url_registry: A registry of the fetched URLs.
+        :param deadline: A deadline of the crawl (`time.monotonic`),
+            after which the pages left are deferred to the next run.
         """
-        super().__init__(encoding=encoding)
+        super().__init__(
+            encoding=encoding,
+            rate_controller=rate_controller,
+            url_registry=url_registry,
+        )
+        self.deadline = deadline
 
     @staticmethod
     def get_player_filepath(player_url: str) -> Path:
@@ -40,18 +61,46 @@ class PlayerCollector(BaseCollector):
         return player_filepath
 
     def get_players_html_data(self) -> None:
-        """Get HTML pages (data) of the players.
+        """Get HTML pages (data) of the players, the active players
+        first.
 
         :return: None.
         """
         players_urls = self.read_json(
             filepath=PlayerConstants.PLAYERS_URLS_FILEPATH
         )
+        players_seasons = (
+            self.read_json(filepath=PlayerConstants.PLAYERS_SEASONS_FILEPATH)
+            if PlayerConstants.PLAYERS_SEASONS_FILEPATH.exists()
+            else {}
+        )
+
+        # The players of the current season are active.
+        frontier = CrawlFrontier(
+            current_year=max(players_seasons.values(), default=None),
+            deadline=self.deadline,
+        )
 
-        for player_url in players_urls.values():
+        for player_slug, player_url in players_urls.items():
+            frontier.add(
+                url=player_url,
+                year=players_seasons.get(player_slug, 0),
+                filepath=self.get_player_filepath(player_url=player_url),
+            )
+
+        for player_url, player_html_data in self.get_html_data_by_urls(
+            urls=frontier
+        ):
             player_filepath = self.get_player_filepath(player_url=player_url)
-            player_html_data = self.get_html_data(url=player_url)
+
+            if player_html_data is None:
+                continue
 
             self.save_html(
                 html_data=player_html_data, filepath=player_filepath
             )
+            frontier.record(url=player_url, html_data=player_html_data)
+
+        frontier.save()
+        self.close_segment_writers()
+        self.save_dead_letters()
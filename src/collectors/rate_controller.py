@@ -0,0 +1,220 @@
+import logging
+import math
+import threading
+import time
+from collections import deque
+
+from common.constants import (
+    BaseConstants,
+    CrawlRateConstants,
+    LoggerConstants,
+)
+from common.logger import init_logger
+
+init_logger(logger_name=LoggerConstants.RATE_CONTROLLER_LOGGER_NAME)
+logger = logging.getLogger(name=LoggerConstants.RATE_CONTROLLER_LOGGER_NAME)
+
+
+class CrawlRateController:
+    """A class to pace the requests to the site by its feedback.
+
+    The rate (requests per second) and the number of concurrent
+    requests are raised additively while the site responds cleanly and
+    fast, and halved when it throttles (`429`), so the crawl runs at
+    the highest rate the site tolerates (AIMD). The controller is
+    thread-safe and can be shared by the collectors of a run.
+
+    :param initial_rate: A rate to start with (`1 / TIME_SLEEP_SECONDS`
+        if not specified, unlimited if the delay is `0`).
+    :param min_rate: A minimum rate to lower the rate to.
+    :param max_rate: A maximum rate to raise the rate to.
+    :param max_concurrency: A maximum number of concurrent requests.
+    """
+
+    def __init__(
+        self,
+        initial_rate: float | None = None,
+        min_rate: float = CrawlRateConstants.MIN_REQUESTS_PER_SECOND,
+        max_rate: float = CrawlRateConstants.MAX_REQUESTS_PER_SECOND,
+        max_concurrency: int = CrawlRateConstants.MAX_CONCURRENCY,
+    ) -> None:
+        """Construct all attributes for the `CrawlRateController`
+        object.
+
+        :param initial_rate: A rate to start with.
+        :param min_rate: A minimum rate to lower the rate to (e.g.
+            `math.inf` to never pace the requests).
+        :param max_rate: A maximum rate to raise the rate to.
+        :param max_concurrency: A maximum number of concurrent
+            requests.
+        """
+        self.rate = initial_rate or self.get_initial_rate()
+        # The rate is never raised above the one it started with, if
+        # that's higher (e.g. unlimited for a local server).
+        self.max_rate = max(max_rate, self.rate)
+        self.min_rate = min_rate
+        self.max_concurrency = max_concurrency
+        self.concurrency = 1
+        self.latency_seconds: float | None = None
+        self._clean_responses = 0
+        self._next_start = 0.0
+        self._last_decrease = 0.0
+        self._starts: deque[float] = deque(
+            maxlen=CrawlRateConstants.RATE_WINDOW
+        )
+        self._responses = 0
+        self._throttled_responses = 0
+        self._last_log = time.monotonic()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_initial_rate() -> float:
+        """Get a rate of the fixed delay between the requests.
+
+        :return: Rate (requests per second).
+        """
+        if BaseConstants.TIME_SLEEP_SECONDS > 0:
+            return 1 / BaseConstants.TIME_SLEEP_SECONDS
+
+        return math.inf
+
+    def get_effective_rate(self) -> float | None:
+        """Get a rate of the last requests.
+
+        :return: Rate (requests per second), or None if there are too
+            few requests to measure it.
+        """
+        if len(self._starts) < 2:
+            return None
+
+        elapsed = self._starts[-1] - self._starts[0]
+
+        if elapsed <= 0:
+            return None
+
+        return (len(self._starts) - 1) / elapsed
+
+    def wait(self) -> None:
+        """Wait until the next request can be started.
+
+        :return: None.
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+
+            self._next_start = start + 1 / self.rate
+            self._starts.append(start)
+
+        if start > now:
+            time.sleep(start - now)
+
+    def increase(self) -> None:
+        """Raise the rate and the number of concurrent requests
+        additively.
+
+        :return: None.
+        """
+        self.rate = min(
+            self.rate + CrawlRateConstants.ADDITIVE_INCREASE, self.max_rate
+        )
+        self.concurrency = min(self.concurrency + 1, self.max_concurrency)
+        self._clean_responses = 0
+
+    def decrease(self) -> None:
+        """Halve the rate and the number of concurrent requests. The
+        rate is halved from the effective one, if it's lower (e.g. the
+        rate is unlimited).
+
+        :return: None.
+        """
+        rate = min(self.rate, self.get_effective_rate() or math.inf)
+
+        # Nothing is known about an unlimited rate without requests.
+        if math.isinf(rate):
+            rate = CrawlRateConstants.MAX_REQUESTS_PER_SECOND
+
+        self.rate = max(
+            rate * CrawlRateConstants.MULTIPLICATIVE_DECREASE, self.min_rate
+        )
+        self.concurrency = max(self.concurrency // 2, 1)
+        self._clean_responses = 0
+        self._last_decrease = time.monotonic()
+
+        logger.warning(
+            msg=f"The site throttles the requests, the rate has been "
+            f"lowered to {self.rate:.2f} requests/s (concurrency "
+            f"{self.concurrency})."
+        )
+
+    def update(
+        self, status_code: int | None, *, latency_seconds: float
+    ) -> None:
+        """Update the rate by a response of the site.
+
+        :param status_code: A status code of the response, or None if
+            the request failed without a response.
+        :param latency_seconds: Latency of the response.
+        :return: None.
+        """
+        with self._lock:
+            self.latency_seconds = (
+                latency_seconds
+                if self.latency_seconds is None
+                else CrawlRateConstants.LATENCY_SMOOTHING * latency_seconds
+                + (1 - CrawlRateConstants.LATENCY_SMOOTHING)
+                * self.latency_seconds
+            )
+            self._responses += 1
+
+            if status_code == 429:
+                self._throttled_responses += 1
+
+                # The responses of the requests sent before the rate
+                # was lowered are throttled too, so the rate is lowered
+                # once per round trip.
+                if (
+                    time.monotonic() - self._last_decrease
+                    > self.latency_seconds
+                ):
+                    self.decrease()
+            elif (
+                status_code is not None
+                and status_code < 500
+                and latency_seconds <= CrawlRateConstants.MAX_LATENCY_SECONDS
+            ):
+                self._clean_responses += 1
+
+                if (
+                    self._clean_responses
+                    >= CrawlRateConstants.INCREASE_AFTER_RESPONSES
+                ):
+                    self.increase()
+            else:
+                self._clean_responses = 0
+
+            self.log_rate()
+
+    def log_rate(self) -> None:
+        """Log the effective rate since the last log, once per the log
+        interval.
+
+        :return: None.
+        """
+        now = time.monotonic()
+        elapsed = now - self._last_log
+
+        if elapsed < CrawlRateConstants.LOG_INTERVAL_SECONDS:
+            return
+
+        logger.info(
+            msg=f"Crawl rate: {self._responses / elapsed:.2f} requests/s "
+            f"(limit {self.rate:.2f} requests/s, concurrency "
+            f"{self.concurrency}, {self._throttled_responses} of "
+            f"{self._responses} responses throttled, latency "
+            f"{self.latency_seconds:.2f}s)."
+        )
+
+        self._responses = 0
+        self._throttled_responses = 0
+        self._last_log = now
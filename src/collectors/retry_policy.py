@@ -0,0 +1,59 @@
+import random
+from dataclasses import dataclass
+
+from common.constants import RetryConstants
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """A class to represent how the requests that failed with a status
+    code are retried.
+
+    :param max_attempts: A maximum number of attempts (including the
+        first one).
+    :param base_delay_seconds: A delay of the first retry, which is
+        doubled for each next retry.
+    :param max_delay_seconds: A maximum delay of the backoff.
+    """
+
+    max_attempts: int
+    base_delay_seconds: float
+    max_delay_seconds: float
+
+    @classmethod
+    def get_policies(cls) -> dict[int | None, "RetryPolicy"]:
+        """Get the default retry policies by the status codes.
+
+        :return: Retry policies.
+        """
+        policies = {
+            status_code: cls(**policy)
+            for status_code, policy in RetryConstants.POLICIES.items()
+        }
+
+        return policies
+
+    def get_delay(
+        self, attempt: int, *, retry_after: float | None = None
+    ) -> float:
+        """Get a delay before the next attempt. The backoff is jittered
+        (a random delay up to the exponential one), so the retries of
+        the concurrent tasks don't hit the site at the same time. If
+        the site sets `Retry-After`, the delay is at least that long.
+
+        :param attempt: A number of the failed attempt (from 1).
+        :param retry_after: A delay (seconds) the site asks to wait.
+        :return: Delay (seconds).
+        """
+        backoff = min(
+            self.base_delay_seconds * 2 ** (attempt - 1),
+            self.max_delay_seconds,
+        )
+        delay = random.uniform(0, backoff)
+
+        if retry_after is not None:
+            delay = max(
+                delay, min(retry_after, RetryConstants.MAX_RETRY_AFTER_SECONDS)
+            )
+
+        return delay
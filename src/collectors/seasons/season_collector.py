@@ -1,4 +1,5 @@
 from collectors.base_collector import BaseCollector
+from collectors.rate_controller import CrawlRateController
 
 
 class SeasonCollector(BaseCollector):
@@ -6,14 +7,21 @@ class SeasonCollector(BaseCollector):
 
     :param url: A URL of the appropriate season.
     :param encoding: The encoding of the data.
+    :param rate_controller: A controller that paces the requests.
     """
 
-    def __init__(self, url: str, encoding: str = "utf-8") -> None:
+    def __init__(
+        self,
+        url: str,
+        encoding: str = "utf-8",
+        rate_controller: CrawlRateController | None = None,
+    ) -> None:
         """Construct all necessary attributes for the `SeasonCollector`
         object.
 
         :param url: A URL of the appropriate season.
         :param encoding: The encoding of the data.
+        :param rate_controller: A controller that paces the requests.
         """
-        super().__init__(encoding=encoding)
+        super().__init__(encoding=encoding, rate_controller=rate_controller)
         self.url = url
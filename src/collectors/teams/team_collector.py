@@ -1,23 +1,44 @@
 from pathlib import Path
 
 from collectors.base_collector import BaseCollector
+from collectors.crawl_frontier import CrawlFrontier
+from collectors.rate_controller import CrawlRateController
 from common.constants import BaseConstants, TeamConstants
 from common.exceptions import HTMLExtensionError, SeasonYearError
+from common.url_registry import UrlRegistry
 
 
 class TeamCollector(BaseCollector):
     """A class to collect data for teams.
 
     :param encoding: The encoding of the data.
+    :param rate_controller: A controller that paces the requests.
+    :param url_registry: A registry of the fetched URLs.
+    :param deadline: A deadline of the crawl (`time.monotonic`).
     """
 
-    def __init__(self, encoding: str = "utf-8") -> None:
+    def __init__(
+        self,
+        encoding: str = "utf-8",
+        rate_controller: CrawlRateController | None = None,
+        url_registry: UrlRegistry | None = None,
+        deadline: float | None = None,
+    ) -> None:
         """Construct all necessary attributes for the `TeamCollector`
         object.
 
         :param encoding: The encoding of the data.
+        :param rate_controller: A controller that paces the requests.
+        :param url_registry: A registry of the fetched URLs.
+        :param deadline: A deadline of the crawl (`time.monotonic`),
+            after which the pages left are deferred to the next run.
         """
-        super().__init__(encoding=encoding)
+        super().__init__(
+            encoding=encoding,
+            rate_controller=rate_controller,
+            url_registry=url_registry,
+        )
+        self.deadline = deadline
 
     def extract_filename(self, team_url: str) -> str:
         """Extract a team filename from the specified URL.
@@ -60,18 +81,40 @@ class TeamCollector(BaseCollector):
         return team_filepath
 
     def get_teams_html_data(self) -> None:
-        """Get HTML pages (data) of the teams for the seasons.
+        """Get HTML pages (data) of the teams for the seasons, the
+        current season first.
 
         :return: None.
         """
         teams_urls = self.read_json(filepath=TeamConstants.RAW_FILEPATH)
 
-        for season_year, urls in teams_urls.items():
-            for team_url in urls:
-                team_html_data = self.get_html_data(url=team_url)
+        frontier = CrawlFrontier(
+            current_year=max(map(int, teams_urls), default=None),
+            deadline=self.deadline,
+        )
+
+        for season_year, season_teams_urls in teams_urls.items():
+            for team_url in season_teams_urls:
                 team_filename = self.extract_filename(team_url=team_url)
-                team_filepath = self.get_team_filepath(filename=team_filename)
 
-                self.save_html(
-                    html_data=team_html_data, filepath=team_filepath
+                frontier.add(
+                    url=team_url,
+                    year=int(season_year),
+                    filepath=self.get_team_filepath(filename=team_filename),
                 )
+
+        for team_url, team_html_data in self.get_html_data_by_urls(
+            urls=frontier
+        ):
+            team_filename = self.extract_filename(team_url=team_url)
+            team_filepath = self.get_team_filepath(filename=team_filename)
+
+            if team_html_data is None:
+                continue
+
+            self.save_html(html_data=team_html_data, filepath=team_filepath)
+            frontier.record(url=team_url, html_data=team_html_data)
+
+        frontier.save()
+        self.close_segment_writers()
+        self.save_dead_letters()
@@ -1,14 +1,36 @@
+import os
+import re
+from collections.abc import Iterable
 from pathlib import Path
 
+import pyarrow as pa
+
 
 class BaseConstants:
-    URL = "https://www.basketball-reference.com"
+    # The URL, folders, and delay can be overridden, e.g. to run the
+    # pipeline against a local server.
+    URL = os.getenv("NBA_STATS_URL", "https://www.basketball-reference.com")
     BASE_FOLDER = Path(__file__).parents[1]
-    RAW_FOLDER = BASE_FOLDER.joinpath("raw")
-    PROCESSED_FOLDER = BASE_FOLDER.joinpath("processed")
+    RAW_FOLDER = Path(
+        os.getenv("NBA_STATS_RAW_FOLDER", BASE_FOLDER.joinpath("raw"))
+    )
+    PROCESSED_FOLDER = Path(
+        os.getenv(
+            "NBA_STATS_PROCESSED_FOLDER", BASE_FOLDER.joinpath("processed")
+        )
+    )
+    # Reports of the run (e.g. the URLs that failed), which are
+    # uploaded once the stages that write them are completed.
+    REPORTS_FOLDER = RAW_FOLDER.joinpath("reports")
     RAW_FILE_EXTENSION = "html"
-    TIME_SLEEP_SECONDS = 3
+    TIME_SLEEP_SECONDS = float(os.getenv("NBA_STATS_TIME_SLEEP_SECONDS", 3))
     MAX_WORKERS = 4
+    # The worker processes are started by a fork server, as forking a
+    # parent that runs the stages in threads may deadlock them.
+    MP_START_METHOD = "forkserver"
+    # Modules the fork server imports once, so the workers of each
+    # pool don't import them again.
+    MP_PRELOAD_MODULES = ["extractors.base_extractor"]
     S3_BUCKET = "nba-data-stats"
 
 
@@ -28,6 +50,8 @@ class LoggerConstants:
     TEAM_COLLECTOR_LOGGER_NAME = (
         f"{COLLECTORS_LOGGER_NAME}.teams.team_collector"
     )
+    RATE_CONTROLLER_LOGGER_NAME = f"{COLLECTORS_LOGGER_NAME}.rate_controller"
+    CRAWL_FRONTIER_LOGGER_NAME = f"{COLLECTORS_LOGGER_NAME}.crawl_frontier"
     BASE_EXTRACTOR_LOGGER_NAME = f"{EXTRACTORS_LOGGER_NAME}.base_extractor"
     CONFERENCE_EXTRACTOR_LOGGER_NAME = (
         f"{EXTRACTORS_LOGGER_NAME}.conferences.conference_extractor"
@@ -41,6 +65,15 @@ class LoggerConstants:
     PLAYER_STATS_EXTRACTOR_LOGGER_NAME = (
         f"{EXTRACTORS_LOGGER_NAME}.players.player_stats_extractor"
     )
+    PLAYER_CAREER_STATS_EXTRACTOR_LOGGER_NAME = (
+        f"{EXTRACTORS_LOGGER_NAME}.players.player_career_stats_extractor"
+    )
+    PLAYER_SEASON_EXTRACTOR_LOGGER_NAME = (
+        f"{EXTRACTORS_LOGGER_NAME}.players.player_season_extractor"
+    )
+    PLAYER_LEADERBOARD_EXTRACTOR_LOGGER_NAME = (
+        f"{EXTRACTORS_LOGGER_NAME}.players.player_leaderboard_extractor"
+    )
     SEASON_EXTRACTOR_LOGGER_NAME = (
         f"{EXTRACTORS_LOGGER_NAME}.seasons.season_extractor"
     )
@@ -50,15 +83,377 @@ class LoggerConstants:
     TEAM_STATS_EXTRACTOR_LOGGER_NAME = (
         f"{EXTRACTORS_LOGGER_NAME}.teams.team_stats_extractor"
     )
+    TABLE_VALIDATOR_LOGGER_NAME = f"{EXTRACTORS_LOGGER_NAME}.table_validator"
     UPLOADER_LOGGER_NAME = "src.uploader.uploader"
+    QUERY_ENGINE_LOGGER_NAME = "src.query.query_engine"
+    PLAYER_INDEX_LOGGER_NAME = "src.query.player_index"
+    METRICS_LOGGER_NAME = "src.common.metrics"
+    STAGE_EXECUTOR_LOGGER_NAME = "src.pipeline.stage_executor"
+    SHARD_MERGER_LOGGER_NAME = "src.pipeline.shard_merger"
     SERVICE_LOGGER_NAME = "src.service"
 
 
+class MetricsConstants:
+    REPORT_FILEPATH_ENV = "METRICS_REPORT_FILEPATH"
+    PROMETHEUS_TEXTFILE_ENV = "METRICS_PROMETHEUS_TEXTFILE"
+    EMF_NAMESPACE_ENV = "METRICS_EMF_NAMESPACE"
+    REPORT_FILEPATH = BaseConstants.BASE_FOLDER.joinpath(
+        "reports", "run-report.json"
+    )
+    PROMETHEUS_PREFIX = "nba_stats"
+    EMF_UNITS = {
+        "wall_seconds": "Seconds",
+        "cpu_seconds": "Seconds",
+        "peak_rss_bytes": "Bytes",
+        "children_peak_rss_bytes": "Bytes",
+        "bytes_fetched": "Bytes",
+        "bytes_read": "Bytes",
+        "bytes_written": "Bytes",
+        "bytes_uploaded": "Bytes",
+    }
+    # Writing `5` to `clear_refs` resets the peak RSS (`VmHWM`).
+    CLEAR_REFS_FILEPATH = "/proc/self/clear_refs"
+    RESET_PEAK_RSS_VALUE = "5"
+    PROC_STATUS_FILEPATH = "/proc/self/status"
+    PEAK_RSS_FIELD = "VmHWM:"
+    # What the resource metrics of the stages measure, as the stages
+    # run concurrently in the threads of a single process.
+    SCOPES = {
+        "cpu_seconds": (
+            "The thread that runs the stage and its tasks in the worker "
+            "processes."
+        ),
+        "peak_rss_bytes": (
+            "The process. If the stage overlapped with other stages, it's "
+            "shared by them."
+        ),
+        "children_peak_rss_bytes": "The largest worker process so far.",
+    }
+
+
+class PipelineConstants:
+    CPU = "cpu"
+    NETWORK = "network"
+    UPLOAD = "upload"
+    # Amounts of the resources the stages may use at the same time.
+    # Pages are fetched one at a time to respect the rate limit of
+    # basketball-reference.com.
+    BUDGETS = {
+        CPU: os.cpu_count() or BaseConstants.MAX_WORKERS,
+        NETWORK: 1,
+        UPLOAD: 2,
+    }
+    # The budgets can be overridden, e.g. `PIPELINE_CPU_BUDGET=8`.
+    BUDGET_ENV_PREFIX = "PIPELINE_"
+    # Stages that only run once all shards are completed.
+    MERGE_STAGES = (
+        "extract_players_career_stats",
+        "upload_extracted_players_career_stats",
+        "extract_players_leaderboards",
+        "upload_extracted_players_leaderboards",
+        "extract_players_seasons",
+        "upload_extracted_players_seasons",
+        "build_players_index",
+        "upload_players_index",
+    )
+    # Suffix of the partial tables of a shard, e.g.
+    # `rosters.shard-0-of-4.parquet`.
+    SHARD_SUFFIX_PATTERN = r"^(.+)\.shard-(\d+)-of-(\d+)$"
+    # A temporary column of the shard the rows of a partial table come
+    # from.
+    SHARD_COLUMN = "_shard"
+    # Modules the service doesn't import at the start, only the stages
+    # that use them do.
+    LAZY_MODULES = ("pandas", "bs4", "lxml", "requests", "boto3")
+    # Stages that can be selected to run. The base folders are always
+    # created, and the processed data is always downloaded (except for
+    # the shards).
+    STAGES = (
+        "collect_seasons",
+        "upload_collected_seasons",
+        "extract_seasons",
+        "upload_extracted_seasons",
+        "collect_leagues",
+        "upload_collected_leagues",
+        "extract_conferences",
+        "upload_extracted_conferences",
+        "extract_conferences_stats",
+        "upload_extracted_conferences_stats",
+        "extract_teams",
+        "upload_extracted_teams",
+        "collect_teams",
+        "upload_collected_teams",
+        "extract_teams_stats",
+        "upload_extracted_teams_stats",
+        "extract_players",
+        "upload_extracted_players",
+        "collect_players",
+        "upload_collected_players",
+        "extract_players_stats",
+        "upload_extracted_players_stats",
+        "extract_players_career_stats",
+        "upload_extracted_players_career_stats",
+        "extract_players_leaderboards",
+        "upload_extracted_players_leaderboards",
+        "extract_players_seasons",
+        "upload_extracted_players_seasons",
+        "build_players_index",
+        "upload_players_index",
+    )
+
+
+class RetryConstants:
+    # Retry policies by the status codes of the responses: a number of
+    # attempts and a base and maximum delay (seconds) of the jittered
+    # exponential backoff. `None` is for the connection errors and
+    # timeouts. Other errors (e.g. `404` Not Found) aren't retried.
+    RATE_LIMIT_POLICY = {
+        "max_attempts": 6,
+        "base_delay_seconds": 5.0,
+        "max_delay_seconds": 120.0,
+    }
+    SERVER_ERROR_POLICY = {
+        "max_attempts": 4,
+        "base_delay_seconds": 2.0,
+        "max_delay_seconds": 30.0,
+    }
+    POLICIES = {
+        429: RATE_LIMIT_POLICY,
+        500: SERVER_ERROR_POLICY,
+        502: SERVER_ERROR_POLICY,
+        503: SERVER_ERROR_POLICY,
+        504: SERVER_ERROR_POLICY,
+        None: SERVER_ERROR_POLICY,
+    }
+    RETRY_AFTER_HEADER = "Retry-After"
+    # The `Retry-After` delay is respected up to this value, so a single
+    # page can't stall the run for hours.
+    MAX_RETRY_AFTER_SECONDS = 600.0
+    TIMEOUT_SECONDS = 30
+    # URLs that failed after all attempts, to refetch them later.
+    DEAD_LETTERS_FILEPATH = BaseConstants.REPORTS_FOLDER.joinpath(
+        "dead-letters.json"
+    )
+
+
+class CrawlRateConstants:
+    # The crawl starts at the fixed delay (`TIME_SLEEP_SECONDS`) and
+    # adapts to the responses of the site (AIMD): the rate and the
+    # number of concurrent requests are raised additively after a number
+    # of clean responses and halved when the site throttles. By default,
+    # the rate isn't raised above 20 requests per minute (the rate of
+    # the default delay), as the site blocks faster crawls, and the
+    # requests aren't concurrent, like the budget of the network stages.
+    # Both can be raised, e.g. for a local server.
+    MAX_REQUESTS_PER_SECOND = float(
+        os.getenv("NBA_STATS_MAX_REQUESTS_PER_SECOND", 1 / 3)
+    )
+    MIN_REQUESTS_PER_SECOND = 1 / 60
+    MAX_CONCURRENCY = int(os.getenv("NBA_STATS_MAX_CONCURRENCY", 1))
+    ADDITIVE_INCREASE = 0.05
+    MULTIPLICATIVE_DECREASE = 0.5
+    INCREASE_AFTER_RESPONSES = 10
+    # Slower responses are a sign of an overloaded site, so the rate
+    # isn't raised after them.
+    MAX_LATENCY_SECONDS = 5.0
+    LATENCY_SMOOTHING = 0.2
+    # A number of the last requests to measure the effective rate by.
+    RATE_WINDOW = 20
+    LOG_INTERVAL_SECONDS = 30.0
+
+
+class UrlRegistryConstants:
+    # The site serves the same pages over both schemes.
+    EQUIVALENT_SCHEMES = ("http", "https")
+    CANONICAL_SCHEME = "https"
+    DEFAULT_PORTS = ("80", "443")
+
+
+class RawSegmentConstants:
+    # The collectors can append the pages to a few segment files with an
+    # index instead of writing a file per page, which is bound by the
+    # file system metadata with tens of thousands of pages (e.g. on a
+    # network volume). The extractors read both layouts.
+    ENABLED = os.getenv("NBA_STATS_RAW_SEGMENTS", "0") == "1"
+    SEGMENT_FILENAME = "segment-{number:05d}.pages"
+    SEGMENT_PATTERN = r"^segment-\d{5}\.pages$"
+    INDEX_FILENAME = "segments-index.json"
+    # Suffixes of the segments and their index, which are uploaded with
+    # the pages.
+    UPLOAD_SUFFIXES = (".pages", INDEX_FILENAME)
+    # A new segment is started once the current one exceeds the size.
+    MAX_SEGMENT_BYTES = 256 * 1024**2
+    # The pages are flushed (and the index saved) once per a number of
+    # pages, and synced to the disk only if `NBA_STATS_RAW_FSYNC=1`, as
+    # the pages can be collected again.
+    FLUSH_PAGES = int(os.getenv("NBA_STATS_RAW_FLUSH_PAGES", 100))
+    FSYNC = os.getenv("NBA_STATS_RAW_FSYNC", "0") == "1"
+
+
+class DocumentCacheConstants:
+    # The parsed pages are kept per process, so the tables of a page
+    # looked up by the next passes of an extractor (e.g. a pass per
+    # stats table) are only searched for. A parsed page takes about ten
+    # times its size, so the cache is bounded.
+    MAX_DOCUMENTS = int(os.getenv("NBA_STATS_DOCUMENT_CACHE_SIZE", 32))
+    # Counters of the cache by the counters of the stages.
+    COUNTERS = {
+        "hits": "document_cache_hits",
+        "misses": "document_cache_misses",
+        "evictions": "document_cache_evictions",
+    }
+
+
+class TableCacheConstants:
+    # The tables extracted from each page can be kept on the disk (opt-
+    # in, `NBA_STATS_TABLE_CACHE=1`), so changing the renames, casts, or
+    # derived columns only re-runs them on the cached tables instead of
+    # parsing the pages again.
+    ENABLED = os.getenv("NBA_STATS_TABLE_CACHE", "0") == "1"
+    FOLDER = Path(
+        os.getenv(
+            "NBA_STATS_TABLE_CACHE_FOLDER",
+            BaseConstants.BASE_FOLDER.joinpath("cache", "tables"),
+        )
+    )
+    # A version of the parsing of the tables (the documents and
+    # `get_table_df_by_id`). Raise it when the parsing changes, so the
+    # cached tables are extracted again.
+    PARSER_VERSION = 1
+    TABLE_FILENAME = "{digest}-{key}.arrow"
+    # The columns of the (text, link) cells are stored as two columns.
+    LINK_SUFFIX = ":link"
+    COLUMNS_METADATA_KEY = b"columns"
+    LINKS_METADATA_KEY = b"links"
+    COUNTERS = {
+        "hits": "table_cache_hits",
+        "misses": "table_cache_misses",
+    }
+
+
+class ParquetConstants:
+    # Options of the writer of the processed tables. The codec is one
+    # of `snappy`, `zstd`, `gzip`, `brotli`, `lz4`, or `none`, and the
+    # level (e.g. 1-22 of `zstd`) is the default of the codec if not
+    # set (`snappy` has no levels).
+    COMPRESSION = os.getenv("NBA_STATS_PARQUET_COMPRESSION", "snappy")
+    COMPRESSION_LEVEL = (
+        int(os.environ["NBA_STATS_PARQUET_COMPRESSION_LEVEL"])
+        if os.getenv("NBA_STATS_PARQUET_COMPRESSION_LEVEL")
+        else None
+    )
+    # Sizes of the pages (bytes) and row groups (rows). A reader skips
+    # a page or a row group whose statistics don't match a filter.
+    DATA_PAGE_SIZE = int(
+        os.getenv("NBA_STATS_PARQUET_DATA_PAGE_SIZE", 1024**2)
+    )
+    ROW_GROUP_SIZE = int(
+        os.getenv("NBA_STATS_PARQUET_ROW_GROUP_SIZE", 1024**2)
+    )
+    # Comma-separated columns to encode by dictionaries, and to write
+    # the statistics (min, max, and nulls) of. All columns if not set.
+    DICTIONARY_COLUMNS = os.getenv("NBA_STATS_PARQUET_DICTIONARY_COLUMNS")
+    STATISTICS_COLUMNS = os.getenv("NBA_STATS_PARQUET_STATISTICS_COLUMNS")
+    # The page index keeps the statistics of each page in the footer,
+    # so the readers (e.g. Athena) skip the pages without reading them.
+    WRITE_PAGE_INDEX = os.getenv("NBA_STATS_PARQUET_PAGE_INDEX", "0") == "1"
+    OPTIONS = {
+        "compression": COMPRESSION,
+        "compression_level": COMPRESSION_LEVEL,
+        "data_page_size": DATA_PAGE_SIZE,
+        "row_group_size": ROW_GROUP_SIZE,
+        "use_dictionary": (
+            DICTIONARY_COLUMNS.split(",") if DICTIONARY_COLUMNS else True
+        ),
+        "write_statistics": (
+            STATISTICS_COLUMNS.split(",") if STATISTICS_COLUMNS else True
+        ),
+        "write_page_index": WRITE_PAGE_INDEX,
+    }
+
+
+class ValidationConstants:
+    # The rows of the tables extracted from the pages are indexed by
+    # their pages (e.g. `teams/bos-2025.html`), so the rows of a bad
+    # page are found without reading the pages again.
+    SOURCE = "source"
+    # The pages that fail the checks are moved out of the raw folder
+    # (and their rows aren't saved, so the stored rows of the pages are
+    # kept), so they're fetched again by the next run. If disabled
+    # (`NBA_STATS_QUARANTINE=0`), the checks are only reported.
+    QUARANTINE = os.getenv("NBA_STATS_QUARANTINE", "1") == "1"
+    QUARANTINE_FOLDER = BaseConstants.RAW_FOLDER.joinpath("quarantine")
+    # The report lists the failed checks and the quarantined pages of
+    # each table, and it's uploaded with the other reports of the run.
+    REPORT_FILEPATH = BaseConstants.REPORTS_FOLDER.joinpath(
+        "validation-report.json"
+    )
+    # Ranges of the values (inclusive, None is unbounded). A page with
+    # a value out of its range is quarantined.
+    RANGES = {
+        "year": (1946, 2100),
+        "age": (15, 50),
+        # Inches.
+        "height": (60, 96),
+        "weight": (100, 400),
+        "games": (0, 100),
+        "wins": (0, 100),
+        "losses": (0, 100),
+        "minutes_played": (0, None),
+        "salary": (0, None),
+    }
+    # Maximum ratios of the missing values of a page, e.g. the values
+    # that can't be cast. A page with more is quarantined.
+    MAX_NULL_RATIOS = {
+        "team": 0.0,
+        "season": 0.0,
+        "year": 0.0,
+        "player": 0.5,
+        "games": 0.5,
+    }
+    # A season is incomplete if it has fewer rows per team than the
+    # ratio of the median of the seasons.
+    MIN_SEASON_ROWS_RATIO = 0.5
+
+
+class CrawlFrontierConstants:
+    # Priorities of the pages, the lower the sooner the page is fetched,
+    # so a run stopped by the time budget has the most valuable and
+    # freshest pages: the current season (and its active players), the
+    # pages that changed recently, the pages never fetched, and the
+    # historic pages due for a revisit.
+    CURRENT_SEASON_PRIORITY = 0
+    RECENTLY_CHANGED_PRIORITY = 1
+    NEW_PRIORITY = 2
+    HISTORIC_PRIORITY = 3
+    RECENTLY_CHANGED_DAYS = 30
+    # The pages of the past seasons rarely change, so they aren't
+    # fetched again within the interval if they're saved already.
+    HISTORIC_REVISIT_DAYS = 90
+    # A time budget of the collectors of a run, unlimited if not set.
+    # The pages that aren't fetched in time are deferred to the next
+    # run.
+    BUDGET_SECONDS = (
+        float(os.environ["NBA_STATS_CRAWL_BUDGET_SECONDS"])
+        if os.getenv("NBA_STATS_CRAWL_BUDGET_SECONDS")
+        else None
+    )
+    # When the pages were fetched and last changed, by the URLs. The
+    # raw folder of a task is empty, so the state is kept with the
+    # processed data, which is downloaded at the start of a run.
+    STATE_FOLDER = "crawl"
+    STATE_FILEPATH = BaseConstants.PROCESSED_FOLDER.joinpath(
+        STATE_FOLDER, "crawl-state.json"
+    )
+
+
 class SeasonConstants:
     URL = f"{BaseConstants.URL}/leagues/"
     LEAGUE_TO_SELECT = "NBA"
     SEASON_YEAR_PATTERN = r"^(?:19\d{2}|20\d{2}|2100)$"
     SEASON_HREF_PATTERN = r"^/leagues/NBA_\d{4}\.html$"
+    # Stems of the league and team files (e.g. `nba-2025`, `bos-2025`).
+    SEASON_FILENAME_PATTERN = r"^.+-(\d{4})$"
     SEASONS_FOLDER = "seasons"
     COLUMNS_MAP = {
         "Season": "season",
@@ -100,15 +495,6 @@ class ConferenceConstants:
         "PA/G": "opponent_points_per_game",
         "SRS": "simple_rating_system",
     }
-    DATA_TYPES_MAP = {
-        "wins": int,
-        "losses": int,
-        "wins_loss_percentage": float,
-        "games_behind": float,
-        "points_per_game": float,
-        "opponent_points_per_game": float,
-        "simple_rating_system": float,
-    }
     PROCESSED_FILEPATH = BaseConstants.PROCESSED_FOLDER.joinpath(
         CONFERENCES_FOLDER, "conferences.parquet"
     )
@@ -216,9 +602,6 @@ class ConferenceStatsConstants:
         "Att.": "heave_attempts",
         "Md..2": "heaves_made",
     }
-    STATS_DATA_TYPES_MAP = {"rank": int}
-    ADVANCED_STATS_DATA_TYPES_MAP = {"rank": int, "wins": int, "losses": int}
-    SHOOTING_STATS_DATA_TYPES_MAP = {"rank": int}
     CONFERENCES_STATS_FOLDER = "conferences_stats"
     PROCESSED_FILEPATHS = [
         BaseConstants.PROCESSED_FOLDER.joinpath(
@@ -264,6 +647,15 @@ class TeamConstants:
 
 
 class TeamStatsConstants:
+    # Markers of the HTML comments, some of the tables are in.
+    COMMENT_PATTERN = re.compile(rb"<!--|-->")
+    # Heights of the rosters are in feet and inches (e.g. `6-11`), and
+    # birth dates are e.g. `March 2, 1995`. The parsed birth dates of
+    # the saved rosters are read back as ISO dates when they're merged.
+    HEIGHT_SEPARATOR = "-"
+    INCHES_PER_FOOT = 12
+    BIRTH_DATE_FORMAT = "%B %d, %Y"
+    ISO_DATE_FORMAT = "%Y-%m-%d"
     ADJUSTED_SHOOTING_STATS_HEADER = 1
     ROSTER_ID = "roster"
     REGULAR_SEASON_PER_GAME_STATS_ID = "per_game_stats"
@@ -513,7 +905,6 @@ class TeamStatsConstants:
         "Salary": "salary",
     }
     TEAMS_STATS_FOLDER = "teams_stats"
-    ROSTER_DATA_TYPES_MAP = {"uniform_number": str, "years_experience": str}
     PROCESSED_FILEPATHS = [
         BaseConstants.PROCESSED_FOLDER.joinpath(
             TEAMS_STATS_FOLDER, "rosters.parquet"
@@ -576,10 +967,19 @@ class TeamStatsConstants:
 
 class PlayerConstants:
     PLAYER_HREF_SELECTOR = "a[href^='/players/']"
+    # A slug of the player is a stable identifier used by basketball
+    # reference, e.g. `/players/j/jokicni01.html` -> `jokicni01`.
+    PLAYER_SLUG_PATTERN = r"/players/[a-z]/([^/]+)\.html$"
+    PLAYER_ID_DIGEST_SIZE = 8
     PLAYERS_FOLDER = "players"
     PLAYERS_URLS_FILEPATH = BaseConstants.RAW_FOLDER.joinpath(
         PLAYERS_FOLDER, "players-urls.json"
     )
+    # The last season of each player, to fetch the active players
+    # first.
+    PLAYERS_SEASONS_FILEPATH = BaseConstants.RAW_FOLDER.joinpath(
+        PLAYERS_FOLDER, "players-seasons.json"
+    )
 
 
 class PlayerStatsConstants:
@@ -593,6 +993,8 @@ class PlayerStatsConstants:
     STEP = 2
     DRAFT_PATTERN = r"\d+"
     PLAYER_STATS_COLUMNS = [
+        "player_id",
+        "player_slug",
         "player",
         "shooting_hand",
         "high_schools",
@@ -607,3 +1009,793 @@ class PlayerStatsConstants:
     PLAYERS_STATS_FILEPATH = BaseConstants.PROCESSED_FOLDER.joinpath(
         PLAYERS_STATS_FOLDER, "players-stats.parquet"
     )
+
+
+class PlayerCareerStatsConstants:
+    PLAYERS_CAREER_STATS_FOLDER = "players_career_stats"
+    PLAYERS_CAREER_STATS_FILEPATH = BaseConstants.PROCESSED_FOLDER.joinpath(
+        PLAYERS_CAREER_STATS_FOLDER, "players-career-stats.parquet"
+    )
+    # The per-season tables of the teams stats the careers are
+    # aggregated from, by the season types.
+    TOTAL_STATS_FILEPATHS = {
+        "regular_season": BaseConstants.PROCESSED_FOLDER.joinpath(
+            TeamStatsConstants.TEAMS_STATS_FOLDER,
+            "regular-season-total-stats.parquet",
+        ),
+        "playoffs": BaseConstants.PROCESSED_FOLDER.joinpath(
+            TeamStatsConstants.TEAMS_STATS_FOLDER,
+            "playoffs-total-stats.parquet",
+        ),
+    }
+    ADVANCED_STATS_FILEPATHS = {
+        "regular_season": BaseConstants.PROCESSED_FOLDER.joinpath(
+            TeamStatsConstants.TEAMS_STATS_FOLDER,
+            "regular-season-advanced-stats.parquet",
+        ),
+        "playoffs": BaseConstants.PROCESSED_FOLDER.joinpath(
+            TeamStatsConstants.TEAMS_STATS_FOLDER,
+            "playoffs-advanced-stats.parquet",
+        ),
+    }
+    # Columns of a player and the season of the per-season rows.
+    PLAYER_COLUMNS = ["player_id", "player", "player_slug", "team", "year"]
+    # Totals summed over the seasons and teams (a player traded within
+    # a season has a row per team).
+    TOTAL_COLUMNS = [
+        "games",
+        "games_started",
+        "minutes_played",
+        "field_goals",
+        "field_goal_attempts",
+        "3_point_field_goals",
+        "3_point_field_goal_attempts",
+        "2_point_field_goals",
+        "2_point_field_goal_attempts",
+        "free_throws",
+        "free_throw_attempts",
+        "offensive_rebounds",
+        "defensive_rebounds",
+        "total_rebounds",
+        "assists",
+        "steals",
+        "blocks",
+        "turnovers",
+        "personal_fouls",
+        "points",
+        "triple_doubles",
+    ]
+    # Percentages of the career totals by their made and attempted
+    # totals.
+    PERCENTAGE_COLUMNS = {
+        "field_goal_percentage": ("field_goals", "field_goal_attempts"),
+        "3_point_field_goal_percentage": (
+            "3_point_field_goals",
+            "3_point_field_goal_attempts",
+        ),
+        "2_point_field_goal_percentage": (
+            "2_point_field_goals",
+            "2_point_field_goal_attempts",
+        ),
+        "free_throw_percentage": ("free_throws", "free_throw_attempts"),
+    }
+    # Per-game averages of the career totals.
+    PER_GAME_COLUMNS = {
+        "minutes_played": "minutes_played_per_game",
+        "points": "points_per_game",
+        "total_rebounds": "total_rebounds_per_game",
+        "assists": "assists_per_game",
+        "steals": "steals_per_game",
+        "blocks": "blocks_per_game",
+        "turnovers": "turnovers_per_game",
+    }
+    # Advanced stats summed over the seasons and teams.
+    ADVANCED_TOTAL_COLUMNS = [
+        "offensive_win_shares",
+        "defensive_win_shares",
+        "win_shares",
+        "value_over_replacement_player",
+    ]
+    # Advanced rates averaged over the seasons and teams, weighted by
+    # the minutes played.
+    ADVANCED_RATE_COLUMNS = [
+        "player_efficiency_rating",
+        "usage_percentage",
+        "offensive_box_plus_minus",
+        "defensive_box_plus_minus",
+        "box_plus_minus",
+    ]
+    # Columns of the careers, besides the stats.
+    CAREER_COLUMNS = [
+        "player_id",
+        "player",
+        "player_slug",
+        "season_type",
+        "first_year",
+        "last_year",
+        "seasons",
+        "teams",
+    ]
+    KEY = "player_id"
+
+
+class PlayerLeaderboardConstants:
+    PLAYERS_LEADERBOARDS_FOLDER = "players_leaderboards"
+    PLAYERS_LEADERBOARDS_FILEPATH = BaseConstants.PROCESSED_FOLDER.joinpath(
+        PLAYERS_LEADERBOARDS_FOLDER, "players-leaderboards.parquet"
+    )
+    # Number of the leaders of each season and stat.
+    SIZE = int(os.getenv("NBA_STATS_LEADERBOARD_SIZE", 10))
+    # Totals of the leaderboards, summed over the teams of the players
+    # traded within a season.
+    TOTAL_STATS = [
+        "points",
+        "total_rebounds",
+        "assists",
+        "steals",
+        "blocks",
+        "3_point_field_goals",
+        "minutes_played",
+    ]
+    # Per-game averages of the leaderboards by their totals.
+    PER_GAME_STATS = {
+        "points": "points_per_game",
+        "total_rebounds": "total_rebounds_per_game",
+        "assists": "assists_per_game",
+        "steals": "steals_per_game",
+        "blocks": "blocks_per_game",
+    }
+    # Advanced stats of the leaderboards, summed over the teams.
+    ADVANCED_STATS = ["win_shares", "value_over_replacement_player"]
+    # The players qualify for the per-game leaderboards if they played
+    # at least this fraction of the most games played in the season.
+    MIN_GAMES_FRACTION = 0.5
+    # Suffix of the number of the teams of the players traded within a
+    # season, e.g. `2TM`.
+    TEAMS_SUFFIX = "TM"
+    COLUMNS = [
+        "season_type",
+        "stat",
+        "year",
+        "rank",
+        "player_id",
+        "player",
+        "player_slug",
+        "team",
+        "value",
+    ]
+    # The leaders of a season type and stat are stored together, so a
+    # leaderboard is read from a contiguous run of rows.
+    SORT_COLUMNS = ["season_type", "stat", "year", "rank"]
+
+
+class PlayerSeasonConstants:
+    PLAYERS_SEASONS_FOLDER = "players_seasons"
+    # The fact table is a folder with a file per season (e.g.
+    # `players-seasons-2025.parquet`), queried as `players_seasons`.
+    PLAYERS_SEASONS_FOLDER_PATH = BaseConstants.PROCESSED_FOLDER.joinpath(
+        PLAYERS_SEASONS_FOLDER
+    )
+    PARTITION_FILENAME = "players-seasons-{year}.parquet"
+    PARTITION_PATTERN = re.compile(r"players-seasons-(\d+)\.parquet")
+    KEYS = ["player_id", "year", "team"]
+    # An integer code of the teams the tables are joined by instead of
+    # the team (dictionaries of the team differ between tables).
+    TEAM_CODE = "team_code"
+    ROSTERS_FILEPATH = BaseConstants.PROCESSED_FOLDER.joinpath(
+        TeamStatsConstants.TEAMS_STATS_FOLDER, "rosters.parquet"
+    )
+    PER_GAME_STATS_FILEPATH = BaseConstants.PROCESSED_FOLDER.joinpath(
+        TeamStatsConstants.TEAMS_STATS_FOLDER,
+        "regular-season-per-game-stats.parquet",
+    )
+    ADVANCED_STATS_FILEPATH = BaseConstants.PROCESSED_FOLDER.joinpath(
+        TeamStatsConstants.TEAMS_STATS_FOLDER,
+        "regular-season-advanced-stats.parquet",
+    )
+    SALARIES_FILEPATH = BaseConstants.PROCESSED_FOLDER.joinpath(
+        TeamStatsConstants.TEAMS_STATS_FOLDER, "salaries.parquet"
+    )
+    ROSTERS_COLUMNS_MAP = {
+        column: column
+        for column in [
+            "player",
+            "player_slug",
+            "season",
+            "uniform_number",
+            "position",
+            "height",
+            "weight",
+            "birth_date",
+            "country_of_birth",
+            "years_experience",
+            "college",
+        ]
+    }
+    # The averages are renamed (e.g. `points_per_game`), as the
+    # advanced stats have the season totals of the same columns.
+    PER_GAME_STATS_COLUMNS_MAP = {
+        "age": "age",
+        "games": "games",
+        "games_started": "games_started",
+        **{
+            column: f"{column}_per_game"
+            for column in [
+                "minutes_played",
+                "field_goals",
+                "field_goal_attempts",
+                "3_point_field_goals",
+                "3_point_field_goal_attempts",
+                "2_point_field_goals",
+                "2_point_field_goal_attempts",
+                "free_throws",
+                "free_throw_attempts",
+                "offensive_rebounds",
+                "defensive_rebounds",
+                "total_rebounds",
+                "assists",
+                "steals",
+                "blocks",
+                "turnovers",
+                "personal_fouls",
+                "points",
+            ]
+        },
+        "field_goal_percentage": "field_goal_percentage",
+        "3_point_field_goal_percentage": "3_point_field_goal_percentage",
+        "2_point_field_goal_percentage": "2_point_field_goal_percentage",
+        "effective_field_goal_percentage": "effective_field_goal_percentage",
+        "free_throw_percentage": "free_throw_percentage",
+        "awards": "awards",
+    }
+    ADVANCED_STATS_COLUMNS_MAP = {
+        column: column
+        for column in [
+            "minutes_played",
+            "player_efficiency_rating",
+            "true_shooting_percentage",
+            "3_point_attempt_rate",
+            "free_throw_attempt_rate",
+            "offensive_rebound_percentage",
+            "defensive_rebound_percentage",
+            "total_rebound_percentage",
+            "assist_percentage",
+            "steal_percentage",
+            "block_percentage",
+            "turnovers_percentage",
+            "usage_percentage",
+            "offensive_win_shares",
+            "defensive_win_shares",
+            "win_shares",
+            "win_shares_per_48_minutes",
+            "offensive_box_plus_minus",
+            "defensive_box_plus_minus",
+            "box_plus_minus",
+            "value_over_replacement_player",
+        ]
+    }
+    SALARIES_COLUMNS_MAP = {"salary": "salary"}
+    # Columns of the joined tables by their filepaths. The rows of the
+    # rosters are kept, and the rows of the other tables are joined to
+    # them by the keys.
+    COLUMNS_MAPS = {
+        ROSTERS_FILEPATH: ROSTERS_COLUMNS_MAP,
+        PER_GAME_STATS_FILEPATH: PER_GAME_STATS_COLUMNS_MAP,
+        ADVANCED_STATS_FILEPATH: ADVANCED_STATS_COLUMNS_MAP,
+        SALARIES_FILEPATH: SALARIES_COLUMNS_MAP,
+    }
+
+
+def build_schema(
+    columns: Iterable[str],
+    *,
+    data_types: dict[str, pa.DataType],
+    default_data_type: pa.DataType,
+) -> pa.Schema:
+    """Build an Arrow schema for the specified columns.
+
+    :param columns: Columns of the table (duplicates are ignored).
+    :param data_types: Data types of the columns that don't use the
+        default data type.
+    :param default_data_type: A data type of the remaining columns.
+    :return: Arrow schema.
+    """
+    schema = pa.schema(
+        [
+            pa.field(column, data_types.get(column, default_data_type))
+            for column in dict.fromkeys(columns)
+        ]
+    )
+
+    return schema
+
+
+def build_joined_schema(
+    keys: Iterable[str], *, tables: Iterable[tuple[pa.Schema, dict]]
+) -> pa.Schema:
+    """Build an Arrow schema of a table joined from other tables, with
+    the data types of the joined columns.
+
+    :param keys: Columns the tables are joined by (their data types are
+        taken from the first table).
+    :param tables: Schemas of the joined tables and their columns by
+        the columns of the joined table.
+    :return: Arrow schema.
+    """
+    tables = list(tables)
+    fields = [tables[0][0].field(key) for key in keys]
+
+    for schema, columns_map in tables:
+        fields.extend(
+            schema.field(column).with_name(joined_column)
+            for column, joined_column in columns_map.items()
+        )
+
+    return pa.schema(fields)
+
+
+class SchemaConstants:
+    # Repeated strings (teams, seasons, positions, etc.) are stored
+    # as dictionaries (`category` in pandas).
+    DICTIONARY = pa.dictionary(pa.int32(), pa.string())
+    # Characters to remove before casting text to numbers, e.g.
+    # `$1,234,567` -> `1234567` or `45%` -> `45`.
+    NUMERIC_CLEANUP_PATTERN = r"[$,%]"
+    SEASONS_SCHEMA = build_schema(
+        SeasonConstants.COLUMNS_MAP.values(),
+        data_types={"league": DICTIONARY, "champion": DICTIONARY},
+        default_data_type=pa.string(),
+    )
+    CONFERENCES_SCHEMA = build_schema(
+        [
+            *ConferenceConstants.COLUMNS_MAP.values(),
+            "conference",
+            "division",
+            "season",
+            "league",
+            "year",
+            "is_playoff_team",
+        ],
+        data_types={
+            "team": DICTIONARY,
+            "wins": pa.int16(),
+            "losses": pa.int16(),
+            "conference": DICTIONARY,
+            "division": DICTIONARY,
+            "season": DICTIONARY,
+            "league": DICTIONARY,
+            "year": pa.int16(),
+            "is_playoff_team": pa.bool_(),
+        },
+        default_data_type=pa.float32(),
+    )
+    CONFERENCE_STATS_DATA_TYPES = {
+        "rank": pa.int16(),
+        "team": DICTIONARY,
+        "games": pa.int16(),
+        "season": DICTIONARY,
+        "league": DICTIONARY,
+        "year": pa.int16(),
+        "is_playoff_team": pa.bool_(),
+        "is_team_stats": pa.bool_(),
+    }
+    CONFERENCE_STATS_EXTRA_COLUMNS = [
+        "season",
+        "league",
+        "year",
+        "is_playoff_team",
+        "is_team_stats",
+    ]
+    CONFERENCE_STATS_SCHEMA = build_schema(
+        [
+            *ConferenceStatsConstants.STATS_COLUMNS_MAP.values(),
+            *CONFERENCE_STATS_EXTRA_COLUMNS,
+        ],
+        data_types=CONFERENCE_STATS_DATA_TYPES,
+        default_data_type=pa.float32(),
+    )
+    CONFERENCE_ADVANCED_STATS_SCHEMA = build_schema(
+        [
+            *ConferenceStatsConstants.ADVANCED_STATS_COLUMNS_MAP.values(),
+            *CONFERENCE_STATS_EXTRA_COLUMNS,
+        ],
+        data_types={
+            **CONFERENCE_STATS_DATA_TYPES,
+            "wins": pa.int16(),
+            "losses": pa.int16(),
+            "pythagorean_wins": pa.int16(),
+            "pythagorean_losses": pa.int16(),
+            "arena": DICTIONARY,
+            "attendance": pa.int32(),
+            "attendance_per_game": pa.int32(),
+        },
+        default_data_type=pa.float32(),
+    )
+    CONFERENCE_SHOOTING_STATS_SCHEMA = build_schema(
+        [
+            *ConferenceStatsConstants.SHOOTING_STATS_COLUMNS_MAP.values(),
+            *CONFERENCE_STATS_EXTRA_COLUMNS,
+        ],
+        data_types={
+            **CONFERENCE_STATS_DATA_TYPES,
+            "minutes_played": pa.int32(),
+            "field_goal_dunk": pa.int16(),
+            "heave_attempts": pa.int16(),
+            "heaves_made": pa.int16(),
+        },
+        default_data_type=pa.float32(),
+    )
+    TEAM_STATS_DATA_TYPES = {
+        "rank": pa.int16(),
+        "player": pa.string(),
+        "player_id": pa.int64(),
+        "player_slug": DICTIONARY,
+        "age": pa.int8(),
+        "position": DICTIONARY,
+        "games": pa.int16(),
+        "games_started": pa.int16(),
+        "awards": DICTIONARY,
+        "team": DICTIONARY,
+        "season": DICTIONARY,
+        "year": pa.int16(),
+    }
+    TEAM_STATS_EXTRA_COLUMNS = [
+        "player_id",
+        "player_slug",
+        "team",
+        "season",
+        "year",
+    ]
+    # Total counts of a player within a season fit into `int16`
+    # (e.g. the most points ever scored in a season is 4029).
+    TOTAL_STATS_INT_COLUMNS = [
+        "minutes_played",
+        "field_goals",
+        "field_goal_attempts",
+        "3_point_field_goals",
+        "3_point_field_goal_attempts",
+        "2_point_field_goals",
+        "2_point_field_goal_attempts",
+        "free_throws",
+        "free_throw_attempts",
+        "offensive_rebounds",
+        "defensive_rebounds",
+        "total_rebounds",
+        "assists",
+        "steals",
+        "blocks",
+        "turnovers",
+        "personal_fouls",
+        "points",
+        "triple_doubles",
+    ]
+    ROSTERS_SCHEMA = build_schema(
+        [
+            *TeamStatsConstants.ROSTER_COLUMNS_MAP.values(),
+            *TEAM_STATS_EXTRA_COLUMNS,
+        ],
+        data_types={
+            **TEAM_STATS_DATA_TYPES,
+            # Inches.
+            "height": pa.int8(),
+            "weight": pa.int16(),
+            "birth_date": pa.date32(),
+            "country_of_birth": DICTIONARY,
+            "years_experience": DICTIONARY,
+        },
+        default_data_type=pa.string(),
+    )
+    PER_GAME_STATS_SCHEMA = build_schema(
+        [
+            *TeamStatsConstants.STATS_COLUMNS_MAP.values(),
+            *TEAM_STATS_EXTRA_COLUMNS,
+        ],
+        data_types=TEAM_STATS_DATA_TYPES,
+        default_data_type=pa.float32(),
+    )
+    PER_36_MINUTES_STATS_SCHEMA = build_schema(
+        [
+            *TeamStatsConstants.STATS_COLUMNS_MAP.values(),
+            *TEAM_STATS_EXTRA_COLUMNS,
+        ],
+        data_types={**TEAM_STATS_DATA_TYPES, "minutes_played": pa.int16()},
+        default_data_type=pa.float32(),
+    )
+    TOTAL_STATS_SCHEMA = build_schema(
+        [
+            *TeamStatsConstants.TOTAL_STATS_COLUMNS_MAP.values(),
+            *TEAM_STATS_EXTRA_COLUMNS,
+        ],
+        data_types={
+            **TEAM_STATS_DATA_TYPES,
+            **dict.fromkeys(TOTAL_STATS_INT_COLUMNS, pa.int16()),
+        },
+        default_data_type=pa.float32(),
+    )
+    PER_100_POSSESSIONS_STATS_SCHEMA = build_schema(
+        [
+            *TeamStatsConstants.PER_100_POSSESSIONS_STATS_COLUMNS_MAP.values(),
+            *TEAM_STATS_EXTRA_COLUMNS,
+        ],
+        data_types={**TEAM_STATS_DATA_TYPES, "minutes_played": pa.int16()},
+        default_data_type=pa.float32(),
+    )
+    ADVANCED_STATS_SCHEMA = build_schema(
+        [
+            *TeamStatsConstants.ADVANCED_STATS_COLUMNS_MAP.values(),
+            *TEAM_STATS_EXTRA_COLUMNS,
+        ],
+        data_types={**TEAM_STATS_DATA_TYPES, "minutes_played": pa.int16()},
+        default_data_type=pa.float32(),
+    )
+    ADJUSTED_SHOOTING_STATS_SCHEMA = build_schema(
+        [
+            *TeamStatsConstants.ADJUSTED_SHOOTING_STATS_COLUMNS_MAP.values(),
+            *TEAM_STATS_EXTRA_COLUMNS,
+        ],
+        data_types={**TEAM_STATS_DATA_TYPES, "minutes_played": pa.int16()},
+        default_data_type=pa.float32(),
+    )
+    SHOOTING_STATS_SCHEMA = build_schema(
+        [
+            *TeamStatsConstants.SHOOTING_STATS_COLUMNS_MAP.values(),
+            *TEAM_STATS_EXTRA_COLUMNS,
+        ],
+        data_types={
+            **TEAM_STATS_DATA_TYPES,
+            "minutes_played": pa.int16(),
+            "number_of_made_dunk_attempts": pa.int16(),
+            "heave_attempts": pa.int16(),
+            "heaves_made": pa.int16(),
+        },
+        default_data_type=pa.float32(),
+    )
+    PLAY_BY_PLAY_STATS_SCHEMA = build_schema(
+        [
+            *TeamStatsConstants.PLAY_BY_PLAY_STATS_COLUMNS_MAP.values(),
+            *TEAM_STATS_EXTRA_COLUMNS,
+        ],
+        data_types={
+            **TEAM_STATS_DATA_TYPES,
+            "minutes_played": pa.int16(),
+            "turnovers_by_bad_pass": pa.int16(),
+            "lost_ball_turnovers": pa.int16(),
+            "shooting_fouls": pa.int16(),
+            "offensive_fouls": pa.int16(),
+            "shooting_fouls_drawn": pa.int16(),
+            "offensive_fouls_drawn": pa.int16(),
+            "point_generated_by_assists": pa.int16(),
+            "fouled_field_goals": pa.int16(),
+            "blocked_field_goal_attempts": pa.int16(),
+        },
+        default_data_type=pa.float32(),
+    )
+    SALARIES_SCHEMA = build_schema(
+        [
+            *TeamStatsConstants.SALARIES_COLUMNS_MAP.values(),
+            *TEAM_STATS_EXTRA_COLUMNS,
+        ],
+        data_types={
+            **TEAM_STATS_DATA_TYPES,
+            "salary": pa.int32(),
+        },
+        default_data_type=pa.string(),
+    )
+    PLAYERS_STATS_SCHEMA = build_schema(
+        PlayerStatsConstants.PLAYER_STATS_COLUMNS,
+        data_types={
+            "player_id": pa.int64(),
+            "shooting_hand": DICTIONARY,
+            "picked_team": DICTIONARY,
+            "draft_round": pa.int8(),
+            "draft_pick": pa.int16(),
+            "overall_draft_pick": pa.int16(),
+            "draft_year": pa.int16(),
+            "nba_debut": pa.date32(),
+        },
+        default_data_type=pa.string(),
+    )
+    PLAYERS_CAREER_STATS_SCHEMA = build_schema(
+        [
+            *PlayerCareerStatsConstants.CAREER_COLUMNS,
+            *PlayerCareerStatsConstants.TOTAL_COLUMNS,
+            *PlayerCareerStatsConstants.PERCENTAGE_COLUMNS,
+            "effective_field_goal_percentage",
+            "true_shooting_percentage",
+            *PlayerCareerStatsConstants.PER_GAME_COLUMNS.values(),
+            *PlayerCareerStatsConstants.ADVANCED_TOTAL_COLUMNS,
+            "win_shares_per_48_minutes",
+            *PlayerCareerStatsConstants.ADVANCED_RATE_COLUMNS,
+        ],
+        data_types={
+            "player_id": pa.int64(),
+            "player": pa.string(),
+            "player_slug": DICTIONARY,
+            "season_type": DICTIONARY,
+            "first_year": pa.int16(),
+            "last_year": pa.int16(),
+            "seasons": pa.int16(),
+            "teams": pa.int16(),
+            # Career totals exceed `int16` (e.g. 38652 points).
+            **dict.fromkeys(
+                PlayerCareerStatsConstants.TOTAL_COLUMNS, pa.int32()
+            ),
+        },
+        default_data_type=pa.float32(),
+    )
+    PLAYERS_LEADERBOARDS_SCHEMA = build_schema(
+        PlayerLeaderboardConstants.COLUMNS,
+        data_types={
+            "season_type": DICTIONARY,
+            "stat": DICTIONARY,
+            "year": pa.int16(),
+            "rank": pa.int16(),
+            "player_id": pa.int64(),
+            "player": pa.string(),
+            "player_slug": DICTIONARY,
+            "team": DICTIONARY,
+        },
+        default_data_type=pa.float32(),
+    )
+    PLAYERS_SEASONS_SCHEMA = build_joined_schema(
+        PlayerSeasonConstants.KEYS,
+        tables=[
+            (ROSTERS_SCHEMA, PlayerSeasonConstants.ROSTERS_COLUMNS_MAP),
+            (
+                PER_GAME_STATS_SCHEMA,
+                PlayerSeasonConstants.PER_GAME_STATS_COLUMNS_MAP,
+            ),
+            (
+                ADVANCED_STATS_SCHEMA,
+                PlayerSeasonConstants.ADVANCED_STATS_COLUMNS_MAP,
+            ),
+            (SALARIES_SCHEMA, PlayerSeasonConstants.SALARIES_COLUMNS_MAP),
+        ],
+    )
+    # A registry of the schemas by the filepaths of processed tables.
+    SCHEMAS = {
+        SeasonConstants.PROCESSED_FILEPATH: SEASONS_SCHEMA,
+        ConferenceConstants.PROCESSED_FILEPATH: CONFERENCES_SCHEMA,
+        **dict(
+            zip(
+                ConferenceStatsConstants.PROCESSED_FILEPATHS,
+                [
+                    CONFERENCE_STATS_SCHEMA,
+                    CONFERENCE_STATS_SCHEMA,
+                    CONFERENCE_STATS_SCHEMA,
+                    CONFERENCE_STATS_SCHEMA,
+                    CONFERENCE_STATS_SCHEMA,
+                    CONFERENCE_STATS_SCHEMA,
+                    CONFERENCE_ADVANCED_STATS_SCHEMA,
+                    CONFERENCE_SHOOTING_STATS_SCHEMA,
+                    CONFERENCE_SHOOTING_STATS_SCHEMA,
+                ],
+                strict=True,
+            )
+        ),
+        **dict(
+            zip(
+                TeamStatsConstants.PROCESSED_FILEPATHS,
+                [
+                    ROSTERS_SCHEMA,
+                    PER_GAME_STATS_SCHEMA,
+                    PER_GAME_STATS_SCHEMA,
+                    TOTAL_STATS_SCHEMA,
+                    TOTAL_STATS_SCHEMA,
+                    PER_36_MINUTES_STATS_SCHEMA,
+                    PER_36_MINUTES_STATS_SCHEMA,
+                    PER_100_POSSESSIONS_STATS_SCHEMA,
+                    PER_100_POSSESSIONS_STATS_SCHEMA,
+                    ADVANCED_STATS_SCHEMA,
+                    ADVANCED_STATS_SCHEMA,
+                    ADJUSTED_SHOOTING_STATS_SCHEMA,
+                    ADJUSTED_SHOOTING_STATS_SCHEMA,
+                    SHOOTING_STATS_SCHEMA,
+                    SHOOTING_STATS_SCHEMA,
+                    PLAY_BY_PLAY_STATS_SCHEMA,
+                    PLAY_BY_PLAY_STATS_SCHEMA,
+                    SALARIES_SCHEMA,
+                ],
+                strict=True,
+            )
+        ),
+        PlayerStatsConstants.PLAYERS_STATS_FILEPATH: PLAYERS_STATS_SCHEMA,
+        PlayerCareerStatsConstants.PLAYERS_CAREER_STATS_FILEPATH: (
+            PLAYERS_CAREER_STATS_SCHEMA
+        ),
+        PlayerLeaderboardConstants.PLAYERS_LEADERBOARDS_FILEPATH: (
+            PLAYERS_LEADERBOARDS_SCHEMA
+        ),
+        PlayerSeasonConstants.PLAYERS_SEASONS_FOLDER_PATH: (
+            PLAYERS_SEASONS_SCHEMA
+        ),
+    }
+    # Columns of the rows an extraction replaces in the existing table:
+    # the rows of a page (e.g. a team season) for the tables of the
+    # pages, so the rows of the pages that aren't extracted (e.g.
+    # deferred by the time budget of the crawl) are kept, and the rows
+    # of a year or player for the derived tables.
+    MERGE_KEYS = {
+        SeasonConstants.PROCESSED_FILEPATH: ("season",),
+        ConferenceConstants.PROCESSED_FILEPATH: ("league", "year"),
+        **dict.fromkeys(
+            ConferenceStatsConstants.PROCESSED_FILEPATHS, ("league", "year")
+        ),
+        **dict.fromkeys(
+            TeamStatsConstants.PROCESSED_FILEPATHS, ("team", "year")
+        ),
+        PlayerStatsConstants.PLAYERS_STATS_FILEPATH: ("player_id",),
+        PlayerCareerStatsConstants.PLAYERS_CAREER_STATS_FILEPATH: (
+            PlayerCareerStatsConstants.KEY,
+        ),
+        PlayerLeaderboardConstants.PLAYERS_LEADERBOARDS_FILEPATH: ("year",),
+    }
+
+
+class QueryConstants:
+    # Names of the processed tables (e.g. `rosters`) and their
+    # filepaths relative to the processed folder.
+    TABLES = {
+        filepath.stem: filepath.relative_to(BaseConstants.PROCESSED_FOLDER)
+        for filepath in SchemaConstants.SCHEMAS
+    }
+    PLAYER_SEASON_TEAM_KEYS = ("player_id", "year", "team")
+
+
+class PlayerIndexConstants:
+    PLAYERS_INDEX_FOLDER = "players_index"
+    INDEX_TABLE = "players-index"
+    ARROW_FILE_EXTENSION = "arrow"
+    BIO_TABLE = "players-stats"
+    ROSTERS_TABLE = "rosters"
+    # Tables with a `player` column are indexed, except for the fact
+    # table, whose rows are joined from the indexed tables.
+    INDEXED_TABLES = [
+        filepath.stem
+        for filepath, schema in SchemaConstants.SCHEMAS.items()
+        if "player" in schema.names
+        and filepath != PlayerSeasonConstants.PLAYERS_SEASONS_FOLDER_PATH
+    ]
+
+
+class StageInputsConstants:
+    # Raw inputs of the stages by the stages that produce them (a
+    # folder of the HTML pages, or a file). The raw data isn't
+    # downloaded from S3, so the inputs of a stage whose upstream stage
+    # isn't selected must exist already (e.g. from a previous local
+    # run).
+    RAW_INPUTS = {
+        "extract_seasons": {"collect_seasons": SeasonConstants.RAW_FILEPATH},
+        "collect_leagues": {
+            "extract_seasons": SeasonConstants.SEASONS_URLS_FILEPATH
+        },
+        **{
+            stage: {
+                "collect_leagues": BaseConstants.RAW_FOLDER.joinpath(
+                    LeagueConstants.LEAGUES_FOLDER
+                )
+            }
+            for stage in (
+                "extract_conferences",
+                "extract_conferences_stats",
+                "extract_teams",
+            )
+        },
+        "collect_teams": {"extract_teams": TeamConstants.RAW_FILEPATH},
+        **{
+            stage: {
+                "collect_teams": BaseConstants.RAW_FOLDER.joinpath(
+                    TeamConstants.TEAMS_FOLDER
+                )
+            }
+            for stage in ("extract_teams_stats", "extract_players")
+        },
+        "collect_players": {
+            "extract_players": PlayerConstants.PLAYERS_URLS_FILEPATH
+        },
+        "extract_players_stats": {
+            "collect_players": BaseConstants.RAW_FOLDER.joinpath(
+                PlayerConstants.PLAYERS_FOLDER
+            )
+        },
+    }
@@ -32,6 +32,17 @@ class HTMLExtensionError(Exception):
         )
 
 
+class HTMLDataError(Exception):
+    """
+    An error that will occur if the HTML data can't be retrieved, even
+    after all retries.
+    """
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        super().__init__(f"HTML data can't be retrieved from `{self.url}`.")
+
+
 class FileProcessingError(Exception):
     """An error that will occur if the file can't be processed."""
 
@@ -42,3 +53,54 @@ class FileProcessingError(Exception):
             f"An error occurred while processing file `{self.filename}`: "
             f"{self.e}."
         )
+
+
+class MergeKeyError(Exception):
+    """
+    An error that will occur if the extracted rows can't be merged with
+    the existing table, as the table doesn't have the merge key (e.g. a
+    table saved before the column was added).
+    """
+
+    def __init__(self, filename: str, key: str) -> None:
+        self.filename = filename
+        self.key = key
+        super().__init__(
+            f"`{self.filename}` predates the `{self.key}` column, so the "
+            f"extracted rows can't be merged with it. Run all years to "
+            f"rebuild the table."
+        )
+
+
+class StageGraphError(Exception):
+    """
+    An error that will occur if the stage graph is invalid, e.g. a stage
+    depends on an unknown stage or the dependencies have a cycle.
+    """
+
+
+class StageError(Exception):
+    """An error that will occur if a stage of the pipeline fails."""
+
+    def __init__(self, stage: str, e: Exception) -> None:
+        self.stage = stage
+        self.e = e
+        super().__init__(f"`{self.stage}` stage failed: {self.e}.")
+
+
+class MissingInputsError(Exception):
+    """
+    An error that will occur if the raw inputs of the selected stages
+    don't exist, as the stages that produce them aren't selected.
+    """
+
+    def __init__(self, inputs: dict[str, list[str]]) -> None:
+        self.inputs = inputs
+        missing_inputs = "; ".join(
+            f"`{stage}` needs {', '.join(f'`{path}`' for path in paths)}"
+            for stage, paths in self.inputs.items()
+        )
+        super().__init__(
+            f"Raw inputs of the selected stages don't exist: "
+            f"{missing_inputs}. Select the stages that produce them too."
+        )
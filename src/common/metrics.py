@@ -0,0 +1,485 @@
+import contextlib
+import functools
+import json
+import logging
+import os
+import resource
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from common.constants import LoggerConstants, MetricsConstants
+from common.logger import init_logger
+
+init_logger(logger_name=LoggerConstants.METRICS_LOGGER_NAME)
+logger = logging.getLogger(name=LoggerConstants.METRICS_LOGGER_NAME)
+
+
+@dataclass
+class StageCounters:
+    """A class to represent the counters of a stage. The counters are
+    incremented by the collectors, extractors, and uploader while the
+    stage is running.
+
+    :param pages_fetched: A number of fetched HTML pages.
+    :param bytes_fetched: A number of fetched bytes.
+    :param retries: A number of retried requests.
+    :param dead_letters: A number of URLs that failed after all
+        attempts.
+    :param duplicate_urls: A number of URLs of the pages fetched
+        already in the run.
+    :param pages_skipped: A number of historic pages that aren't due
+        for a revisit.
+    :param pages_deferred: A number of pages deferred to the next run
+        by the time budget.
+    :param files_read: A number of read files.
+    :param bytes_read: A number of read bytes.
+    :param document_cache_hits: A number of pages found parsed in the
+        cache.
+    :param document_cache_misses: A number of pages parsed.
+    :param document_cache_evictions: A number of parsed pages evicted
+        from the cache.
+    :param table_cache_hits: A number of tables read from the table
+        cache instead of the pages.
+    :param table_cache_misses: A number of tables extracted from the
+        pages and saved to the table cache.
+    :param files_written: A number of written files.
+    :param bytes_written: A number of written bytes.
+    :param rows: A number of rows of the saved tables.
+    :param files_quarantined: A number of pages that failed the checks
+        of the extracted tables (see `TableValidator`).
+    :param rows_quarantined: A number of rows of these pages.
+    :param files_uploaded: A number of files uploaded to S3.
+    :param bytes_uploaded: A number of bytes uploaded to S3.
+    """
+
+    pages_fetched: int = 0
+    bytes_fetched: int = 0
+    retries: int = 0
+    dead_letters: int = 0
+    duplicate_urls: int = 0
+    pages_skipped: int = 0
+    pages_deferred: int = 0
+    files_read: int = 0
+    bytes_read: int = 0
+    document_cache_hits: int = 0
+    document_cache_misses: int = 0
+    document_cache_evictions: int = 0
+    table_cache_hits: int = 0
+    table_cache_misses: int = 0
+    files_written: int = 0
+    bytes_written: int = 0
+    rows: int = 0
+    files_quarantined: int = 0
+    rows_quarantined: int = 0
+    files_uploaded: int = 0
+    bytes_uploaded: int = 0
+
+
+@dataclass
+class StageMetrics:
+    """A class to represent the metrics of a stage.
+
+    :param stage: A name of the stage (e.g. `collect_seasons`).
+    :param status: A status of the stage (`running`, `succeeded`, or
+        `failed`).
+    :param started_at: A time the stage was started at (ISO 8601).
+    :param wall_seconds: Wall time of the stage.
+    :param cpu_seconds: CPU time (user and system) of the thread that
+        runs the stage and of its tasks in the worker processes. The
+        stages run concurrently, so the CPU time of the process can't
+        be attributed to them.
+    :param workers_cpu_seconds: CPU time of the tasks of the stage in
+        the worker processes (included in `cpu_seconds`).
+    :param peak_rss_bytes: Peak resident set size of the process during
+        the stage (since the start of the process if it can't be reset).
+        It's shared by the stages that ran at the same time.
+    :param children_peak_rss_bytes: Peak resident set size of the
+        largest worker process so far (including the workers that ran
+        the tasks of the stage).
+    :param overlapped: Whether other stages ran at the same time, so
+        the peak RSS isn't of the stage only.
+    :param counters: Counters of the stage.
+    :param error: An error of the failed stage.
+    """
+
+    stage: str
+    status: str = "running"
+    started_at: str = ""
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    workers_cpu_seconds: float = 0.0
+    peak_rss_bytes: int = 0
+    children_peak_rss_bytes: int = 0
+    overlapped: bool = False
+    counters: StageCounters = field(default_factory=StageCounters)
+    error: str | None = None
+
+
+_current_stage: ContextVar[StageMetrics | None] = ContextVar(
+    "current_stage", default=None
+)
+_lock = threading.Lock()
+
+
+def increment(counter: str, value: int = 1) -> None:
+    """Increment a counter of the current stage. Nothing happens if no
+    stage is running (e.g. the code is used outside `service.py`).
+
+    :param counter: A name of the counter (e.g. `pages_fetched`).
+    :param value: A value to increment the counter by.
+    :return: None.
+    """
+    stage_metrics = _current_stage.get()
+
+    if stage_metrics is None:
+        return
+
+    with _lock:
+        counters = stage_metrics.counters
+        setattr(counters, counter, getattr(counters, counter) + value)
+
+
+def add_workers_usage(cpu_seconds: float, peak_rss_bytes: int) -> None:
+    """Add the resource usage of a task that ran in a worker process
+    to the current stage. The worker processes are kept for the whole
+    run, so their usage isn't in `RUSAGE_CHILDREN` and is reported by
+    the tasks instead.
+
+    :param cpu_seconds: CPU time of the task.
+    :param peak_rss_bytes: Peak resident set size of the worker.
+    :return: None.
+    """
+    stage_metrics = _current_stage.get()
+
+    if stage_metrics is None:
+        return
+
+    with _lock:
+        stage_metrics.workers_cpu_seconds += cpu_seconds
+        stage_metrics.children_peak_rss_bytes = max(
+            stage_metrics.children_peak_rss_bytes, peak_rss_bytes
+        )
+
+
+def get_process_usage() -> tuple[float, int]:
+    """Get CPU time and peak resident set size of the process.
+
+    :return: CPU time and peak resident set size.
+    """
+    # `ru_maxrss` is in kilobytes on Linux and in bytes on macOS.
+    multiplier = 1 if sys.platform == "darwin" else 1024
+
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+
+    return usage.ru_utime + usage.ru_stime, usage.ru_maxrss * multiplier
+
+
+def get_cpu_seconds() -> float:
+    """Get CPU time of the current thread.
+
+    :return: CPU time.
+    """
+    return time.thread_time()
+
+
+def reset_peak_rss() -> bool:
+    """Reset the peak resident set size of the process, so it can be
+    measured for each stage (Linux only).
+
+    :return: True if the peak was reset. Otherwise, False.
+    """
+    try:
+        with open(MetricsConstants.CLEAR_REFS_FILEPATH, mode="w") as f:
+            f.write(MetricsConstants.RESET_PEAK_RSS_VALUE)
+    except OSError:
+        return False
+
+    return True
+
+
+def get_peak_rss_bytes() -> tuple[int, int]:
+    """Get the peak resident set size of the process and its largest
+    child process.
+
+    :return: Peak resident set size of the process and its children.
+    """
+    # `ru_maxrss` is in kilobytes on Linux and in bytes on macOS.
+    multiplier = 1 if sys.platform == "darwin" else 1024
+
+    peak_rss_bytes = (
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * multiplier
+    )
+    children_peak_rss_bytes = (
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * multiplier
+    )
+
+    # The peak since the last reset is only available in `/proc`.
+    with contextlib.suppress(OSError, ValueError):
+        with open(MetricsConstants.PROC_STATUS_FILEPATH, mode="r") as f:
+            for line in f:
+                if line.startswith(MetricsConstants.PEAK_RSS_FIELD):
+                    peak_rss_bytes = int(line.split()[1]) * 1024
+
+    return peak_rss_bytes, children_peak_rss_bytes
+
+
+class MetricsRecorder:
+    """A class to record metrics of the stages of a run and report
+    them as JSON, Prometheus textfile, or CloudWatch embedded metric
+    format (EMF).
+    """
+
+    def __init__(self) -> None:
+        """Construct all attributes for the `MetricsRecorder` object."""
+        self.started_at = datetime.now(tz=timezone.utc)
+        self._start = time.perf_counter()
+        self.stages: list[StageMetrics] = []
+        self._running: list[StageMetrics] = []
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[StageMetrics]:
+        """Record metrics of the stage that runs in the context.
+
+        :param name: A name of the stage.
+        :return: Metrics of the stage.
+        """
+        stage_metrics = StageMetrics(
+            stage=name,
+            started_at=datetime.now(tz=timezone.utc).isoformat(),
+        )
+
+        with _lock:
+            self.stages.append(stage_metrics)
+
+            for running_stage_metrics in self._running:
+                running_stage_metrics.overlapped = True
+                stage_metrics.overlapped = True
+
+            # The peak RSS is of the process, so resetting it would
+            # also reset the peak of the running stages.
+            if not self._running:
+                reset_peak_rss()
+
+            self._running.append(stage_metrics)
+
+        start = time.perf_counter()
+        start_cpu_seconds = get_cpu_seconds()
+        token = _current_stage.set(stage_metrics)
+
+        try:
+            yield stage_metrics
+
+            stage_metrics.status = "succeeded"
+        except Exception as e:
+            stage_metrics.status = "failed"
+            stage_metrics.error = repr(e)
+
+            raise
+        finally:
+            _current_stage.reset(token)
+
+            with _lock:
+                self._running = [
+                    running_stage_metrics
+                    for running_stage_metrics in self._running
+                    if running_stage_metrics is not stage_metrics
+                ]
+
+            stage_metrics.wall_seconds = time.perf_counter() - start
+            stage_metrics.cpu_seconds = (
+                get_cpu_seconds()
+                - start_cpu_seconds
+                + stage_metrics.workers_cpu_seconds
+            )
+            (
+                stage_metrics.peak_rss_bytes,
+                children_peak_rss_bytes,
+            ) = get_peak_rss_bytes()
+            stage_metrics.children_peak_rss_bytes = max(
+                stage_metrics.children_peak_rss_bytes, children_peak_rss_bytes
+            )
+
+            logger.info(
+                msg=f"`{name}` stage {stage_metrics.status} in "
+                f"{stage_metrics.wall_seconds:.2f}s (CPU "
+                f"{stage_metrics.cpu_seconds:.2f}s, peak RSS "
+                f"{stage_metrics.peak_rss_bytes / 1024**2:.0f} MB)."
+            )
+
+    def track(self, func: Callable) -> Callable:
+        """Decorate a stage function to record its metrics under the
+        name of the function.
+
+        :param func: A stage function.
+        :return: Decorated function.
+        """
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            with self.stage(name=func.__name__):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    def get_report(self) -> dict[str, Any]:
+        """Get a report of the run.
+
+        :return: Report.
+        """
+        totals = {
+            counter.name: sum(
+                getattr(stage_metrics.counters, counter.name)
+                for stage_metrics in self.stages
+            )
+            for counter in fields(StageCounters)
+        }
+
+        is_failed = any(
+            stage_metrics.status == "failed" for stage_metrics in self.stages
+        )
+
+        report = {
+            "started_at": self.started_at.isoformat(),
+            "completed_at": datetime.now(tz=timezone.utc).isoformat(),
+            "wall_seconds": time.perf_counter() - self._start,
+            "status": "failed" if is_failed else "succeeded",
+            "totals": totals,
+            "scopes": MetricsConstants.SCOPES,
+            "stages": [asdict(stage_metrics) for stage_metrics in self.stages],
+        }
+
+        return report
+
+    def save_report(self, filepath: Path) -> None:
+        """Save a JSON report of the run.
+
+        :param filepath: A filepath to save the report to.
+        :return: None.
+        """
+        os.makedirs(filepath.parent, exist_ok=True)
+
+        with open(filepath, mode="w", encoding="utf-8") as f:
+            json.dump(self.get_report(), f, indent=2)
+
+        logger.info(msg=f"Run report has been saved to `{filepath}`.")
+
+    def get_stage_values(self, stage_metrics: StageMetrics) -> dict[str, Any]:
+        """Get all numeric values of the stage by their metric names.
+
+        :param stage_metrics: Metrics of the stage.
+        :return: Values by the metric names.
+        """
+        values = {
+            "wall_seconds": stage_metrics.wall_seconds,
+            "cpu_seconds": stage_metrics.cpu_seconds,
+            "peak_rss_bytes": stage_metrics.peak_rss_bytes,
+            "children_peak_rss_bytes": stage_metrics.children_peak_rss_bytes,
+            **asdict(stage_metrics.counters),
+        }
+
+        return values
+
+    def write_prometheus_textfile(self, filepath: Path) -> None:
+        """Write the metrics of the stages to a Prometheus textfile
+        (for the node exporter textfile collector). The file is
+        replaced atomically, so a partial file is never scraped.
+
+        :param filepath: A filepath of the textfile (`*.prom`).
+        :return: None.
+        """
+        prefix = MetricsConstants.PROMETHEUS_PREFIX
+
+        lines = []
+
+        for metric in self.get_stage_values(StageMetrics(stage="")):
+            lines.append(f"# TYPE {prefix}_stage_{metric} gauge")
+
+            for stage_metrics in self.stages:
+                value = self.get_stage_values(stage_metrics)[metric]
+
+                lines.append(
+                    f'{prefix}_stage_{metric}{{stage="{stage_metrics.stage}",'
+                    f'status="{stage_metrics.status}"}} {value}'
+                )
+
+        os.makedirs(filepath.parent, exist_ok=True)
+
+        temp_filepath = filepath.with_name(f".{filepath.name}.tmp")
+
+        with open(temp_filepath, mode="w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+        os.replace(temp_filepath, filepath)
+
+        logger.info(msg=f"Prometheus textfile has been saved to `{filepath}`.")
+
+    def emit_emf(self, namespace: str) -> None:
+        """Print the metrics of the stages to the standard output in
+        CloudWatch embedded metric format, one event per stage. The
+        events are turned into metrics when the output is shipped to
+        CloudWatch Logs (e.g. by the `awslogs` driver of ECS).
+
+        :param namespace: A CloudWatch namespace of the metrics.
+        :return: None.
+        """
+        for stage_metrics in self.stages:
+            values = self.get_stage_values(stage_metrics)
+
+            event = {
+                "_aws": {
+                    "Timestamp": int(time.time() * 1000),
+                    "CloudWatchMetrics": [
+                        {
+                            "Namespace": namespace,
+                            "Dimensions": [["Stage"]],
+                            "Metrics": [
+                                {
+                                    "Name": metric,
+                                    "Unit": MetricsConstants.EMF_UNITS.get(
+                                        metric, "Count"
+                                    ),
+                                }
+                                for metric in values
+                            ],
+                        }
+                    ],
+                },
+                "Stage": stage_metrics.stage,
+                "Status": stage_metrics.status,
+                **values,
+            }
+
+            # The logger isn't used, as each event must be a JSON line.
+            sys.stdout.write(json.dumps(event) + "\n")
+
+        sys.stdout.flush()
+
+    def report(self) -> None:
+        """Save the JSON report of the run and, if configured by the
+        environment variables, the Prometheus textfile and EMF events.
+
+        :return: None.
+        """
+        self.save_report(
+            filepath=Path(
+                os.getenv(
+                    MetricsConstants.REPORT_FILEPATH_ENV,
+                    MetricsConstants.REPORT_FILEPATH,
+                )
+            )
+        )
+
+        if prometheus_filepath := os.getenv(
+            MetricsConstants.PROMETHEUS_TEXTFILE_ENV
+        ):
+            self.write_prometheus_textfile(filepath=Path(prometheus_filepath))
+
+        if namespace := os.getenv(MetricsConstants.EMF_NAMESPACE_ENV):
+            self.emit_emf(namespace=namespace)
@@ -0,0 +1,328 @@
+import contextlib
+import json
+import mmap
+import os
+import re
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import BinaryIO
+
+from common.constants import RawSegmentConstants
+
+
+def read_index(folder: Path) -> dict[str, list]:
+    """Read an index of the segments of the folder.
+
+    :param folder: A folder of the segments.
+    :return: A segment, an offset, and a length of each page by the
+        page filenames (empty if the folder has no segments).
+    """
+    index_filepath = folder.joinpath(RawSegmentConstants.INDEX_FILENAME)
+
+    if not os.path.exists(index_filepath):
+        return {}
+
+    with open(index_filepath, mode="r", encoding="utf-8") as f:
+        index = json.load(f)
+
+    return index
+
+
+def is_segment_file(filename: str) -> bool:
+    """Check whether a file is a segment or an index of the segments.
+
+    :param filename: A filename to check.
+    :return: True if the file belongs to the segments. Otherwise,
+        False.
+    """
+    return filename == RawSegmentConstants.INDEX_FILENAME or bool(
+        re.fullmatch(RawSegmentConstants.SEGMENT_PATTERN, filename)
+    )
+
+
+class SegmentWriter:
+    """A class to append the raw pages of a folder to segment files,
+    each page after a header line with its filename and length, and to
+    keep an index of the pages, so a few large files are written
+    instead of a file per page. The segments are append-only: a page
+    written again is appended, and the index points to the latest copy.
+
+    :param folder: A folder of the segments.
+    :param max_segment_bytes: A size to start a new segment at.
+    :param flush_pages: A number of pages to flush the segment and save
+        the index after.
+    :param fsync: Whether to sync the flushed segment and index to the
+        disk.
+    """
+
+    def __init__(
+        self,
+        folder: Path,
+        *,
+        max_segment_bytes: int = RawSegmentConstants.MAX_SEGMENT_BYTES,
+        flush_pages: int = RawSegmentConstants.FLUSH_PAGES,
+        fsync: bool = RawSegmentConstants.FSYNC,
+    ) -> None:
+        """Construct all attributes for the `SegmentWriter` object.
+
+        :param folder: A folder of the segments.
+        :param max_segment_bytes: A size to start a new segment at.
+        :param flush_pages: A number of pages to flush the segment and
+            save the index after.
+        :param fsync: Whether to sync the flushed segment and index to
+            the disk.
+        """
+        self.folder = folder
+        self.max_segment_bytes = max_segment_bytes
+        self.flush_pages = flush_pages
+        self.fsync = fsync
+        self.index = read_index(folder=folder)
+        self._segment: str | None = None
+        self._file: BinaryIO | None = None
+        self._pending_pages = 0
+        self._lock = threading.Lock()
+
+    def open_segment(self) -> None:
+        """Open a new segment after the existing ones (e.g. of the
+        previous runs).
+
+        :return: None.
+        """
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+
+        number = sum(
+            bool(re.fullmatch(RawSegmentConstants.SEGMENT_PATTERN, filename))
+            for filename in os.listdir(self.folder)
+        )
+
+        self._segment = RawSegmentConstants.SEGMENT_FILENAME.format(
+            number=number
+        )
+        self._file = open(self.folder.joinpath(self._segment), mode="ab")
+
+    def write(self, filename: str, *, data: bytes) -> None:
+        """Append a page to the current segment.
+
+        :param filename: A filename of the page (e.g. `bos-2025.html`).
+        :param data: Data of the page.
+        :return: None.
+        """
+        header = json.dumps({"filename": filename, "length": len(data)})
+
+        with self._lock:
+            if (
+                self._file is None
+                or self._file.tell() >= self.max_segment_bytes
+            ):
+                self.open_segment()
+
+            self._file.write(header.encode("utf-8") + b"\n")
+
+            offset = self._file.tell()
+
+            self._file.write(data + b"\n")
+
+            self.index[filename] = [self._segment, offset, len(data)]
+            self._pending_pages += 1
+
+            if self._pending_pages >= self.flush_pages:
+                self.flush()
+
+    def flush(self) -> None:
+        """Flush the current segment and save the index, so the pages
+        written so far can be read.
+
+        :return: None.
+        """
+        if self._file is None or not self._pending_pages:
+            return
+
+        self._file.flush()
+
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+        index_filepath = self.folder.joinpath(
+            RawSegmentConstants.INDEX_FILENAME
+        )
+        temp_filepath = index_filepath.with_suffix(".tmp")
+
+        with open(temp_filepath, mode="w", encoding="utf-8") as f:
+            json.dump(self.index, f)
+
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+        # The index is replaced at once, so the readers never see a
+        # partial one.
+        os.replace(temp_filepath, index_filepath)
+
+        self._pending_pages = 0
+
+    def close(self) -> None:
+        """Flush and close the current segment.
+
+        :return: None.
+        """
+        with self._lock:
+            if self._file is None:
+                return
+
+            self.flush()
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "SegmentWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class SegmentReader:
+    """A class to read the raw pages of a folder from its segments.
+
+    :param folder: A folder of the segments.
+    """
+
+    # Readers by the folders and the modification times of their
+    # indexes, so each process reads an index once.
+    _readers: dict[tuple[Path, float], "SegmentReader"] = {}
+    _readers_lock = threading.Lock()
+
+    def __init__(self, folder: Path) -> None:
+        """Construct all attributes for the `SegmentReader` object.
+
+        :param folder: A folder of the segments.
+        """
+        self.folder = folder
+        self.index = read_index(folder=folder)
+
+    @classmethod
+    def get(cls, folder: Path) -> "SegmentReader | None":
+        """Get a reader of the folder, if it has segments.
+
+        :param folder: A folder of the segments.
+        :return: A reader, or None if the folder has no segments.
+        """
+        index_filepath = folder.joinpath(RawSegmentConstants.INDEX_FILENAME)
+
+        try:
+            modified_at = os.path.getmtime(index_filepath)
+        except OSError:
+            return None
+
+        key = (folder, modified_at)
+
+        with cls._readers_lock:
+            if key not in cls._readers:
+                cls._readers = {
+                    reader_key: reader
+                    for reader_key, reader in cls._readers.items()
+                    if reader_key[0] != folder
+                }
+                cls._readers[key] = cls(folder=folder)
+
+            return cls._readers[key]
+
+    @classmethod
+    def exists(cls, filepath: Path) -> bool:
+        """Check whether a page is saved, either as a file or in the
+        segments of its folder.
+
+        :param filepath: A filepath of the page.
+        :return: True if the page is saved. Otherwise, False.
+        """
+        if os.path.exists(filepath):
+            return True
+
+        reader = cls.get(folder=filepath.parent)
+
+        return reader is not None and filepath.name in reader.index
+
+    @classmethod
+    def get_size(cls, filepath: Path) -> int:
+        """Get a size of a page, either of its file or in the segments
+        of its folder.
+
+        :param filepath: A filepath of the page.
+        :return: Size (bytes).
+        """
+        if os.path.exists(filepath):
+            return os.path.getsize(filepath)
+
+        *_, length = cls.get(folder=filepath.parent).index[filepath.name]
+
+        return length
+
+    def get_filenames(self) -> list[str]:
+        """Get filenames of the pages in the order they're stored, so
+        they're read sequentially.
+
+        :return: Filenames.
+        """
+        filenames = sorted(
+            self.index, key=lambda filename: self.index[filename][:2]
+        )
+
+        return filenames
+
+    def read(self, filename: str) -> bytes:
+        """Read a page.
+
+        :param filename: A filename of the page.
+        :return: Data of the page.
+        """
+        segment, offset, length = self.index[filename]
+
+        with open(self.folder.joinpath(segment), mode="rb") as f:
+            f.seek(offset)
+            data = f.read(length)
+
+        return data
+
+    @contextlib.contextmanager
+    def map(self, filename: str) -> Iterator[memoryview]:
+        """Map a page of the segments to the memory, so it's read from
+        the page cache, shared by the processes, without a copy.
+
+        :param filename: A filename of the page.
+        :return: A buffer of the page, valid until the context exits.
+        """
+        segment, offset, length = self.index[filename]
+
+        with (
+            open(self.folder.joinpath(segment), mode="rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+            memoryview(mm) as segment_view,
+            segment_view[offset : offset + length] as page_view,
+        ):
+            yield page_view
+
+    def __iter__(self) -> Iterator[tuple[str, bytes]]:
+        """Read the pages of the segments sequentially, skipping the
+        copies of the pages that were written again.
+
+        :return: Filenames and data of the pages.
+        """
+        segments = sorted({segment for segment, *_ in self.index.values()})
+
+        for segment in segments:
+            with open(self.folder.joinpath(segment), mode="rb") as f:
+                while header := f.readline():
+                    page = json.loads(header)
+                    offset = f.tell()
+                    data = f.read(page["length"])
+
+                    f.read(1)
+
+                    if self.index.get(page["filename"]) == [
+                        segment,
+                        offset,
+                        page["length"],
+                    ]:
+                        yield page["filename"], data
@@ -0,0 +1,77 @@
+import threading
+from urllib.parse import urlsplit, urlunsplit
+
+from common.constants import UrlRegistryConstants
+
+
+class UrlRegistry:
+    """A class to register the URLs of a crawl by their canonical form,
+    so the same page is fetched and saved once, even if the collectors
+    or the pages refer to it differently (e.g. `http://` and
+    `https://`, a different case, or a trailing fragment). The registry
+    is thread-safe and can be shared by the collectors of a run.
+    """
+
+    def __init__(self) -> None:
+        """Construct all attributes for the `UrlRegistry` object."""
+        self._urls: set[str] = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def canonicalize(url: str) -> str:
+        """Get a canonical form of the URL.
+
+        Examples:
+
+            - `http://WWW.site.com:80/teams/LAL/1998.html` ->
+              `https://www.site.com/teams/lal/1998.html`.
+            - `https://.../leagues/NBA_2025.html#confs` ->
+              `https://.../leagues/nba_2025.html`.
+            - `https://.../leagues/` -> `https://.../leagues`.
+
+        :param url: A URL to canonicalize.
+        :return: Canonical URL.
+        """
+        parts = urlsplit(url.strip())
+        scheme = parts.scheme.lower()
+
+        if scheme in UrlRegistryConstants.EQUIVALENT_SCHEMES:
+            scheme = UrlRegistryConstants.CANONICAL_SCHEME
+
+        netloc = parts.netloc.lower()
+        host, _, port = netloc.rpartition(":")
+
+        if host and port in UrlRegistryConstants.DEFAULT_PORTS:
+            netloc = host
+
+        # The paths of the site are case-insensitive.
+        path = "/".join(
+            segment for segment in parts.path.lower().split("/") if segment
+        )
+
+        # The query and the fragment don't change the page.
+        canonical_url = urlunsplit((scheme, netloc, f"/{path}", "", ""))
+
+        return canonical_url
+
+    def register(self, url: str) -> bool:
+        """Register a URL, unless the same page is registered already.
+
+        :param url: A URL to register.
+        :return: True if the URL is new. Otherwise, False.
+        """
+        canonical_url = self.canonicalize(url=url)
+
+        with self._lock:
+            if canonical_url in self._urls:
+                return False
+
+            self._urls.add(canonical_url)
+
+        return True
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+    def __contains__(self, url: str) -> bool:
+        return self.canonicalize(url=url) in self._urls
@@ -1,52 +1,216 @@
 import concurrent.futures
+import contextlib
+import hashlib
 import io
 import json
+import logging
+import mmap
+import multiprocessing
 import os
+import re
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Callable
+from typing import Any, Callable, Iterator
 
 import bs4
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 from pandas import Series
 
-from common.constants import BaseConstants
-from common.exceptions import FileProcessingError
+from common import metrics
+from common.constants import (
+    BaseConstants,
+    LoggerConstants,
+    ParquetConstants,
+    PlayerConstants,
+    SchemaConstants,
+    SeasonConstants,
+    ValidationConstants,
+)
+from common.exceptions import FileProcessingError, MergeKeyError
+from common.logger import init_logger
+from common.raw_segments import SegmentReader, is_segment_file
+from extractors.document_cache import DocumentCache
+from extractors.table_cache import TableCache
+from extractors.table_validator import TableValidator
+
+init_logger(logger_name=LoggerConstants.BASE_EXTRACTOR_LOGGER_NAME)
+logger = logging.getLogger(name=LoggerConstants.BASE_EXTRACTOR_LOGGER_NAME)
+
+
+def run_with_usage(
+    func: Callable, filepath: Path, **kwargs
+) -> tuple[pd.DataFrame, float, int, dict[str, int]]:
+    """Run the function in a worker process and measure the CPU time
+    it takes, as the workers are kept for the whole run and their usage
+    isn't reported to the parent process otherwise.
+
+    :param func: A function to extract data from HTML data.
+    :param filepath: A filepath to extract data from.
+    :return: Extracted dataframe, CPU time, peak resident set size of
+        the worker, and counters of its caches.
+    """
+    start_cpu_seconds, _ = metrics.get_process_usage()
+    start_counters = BaseExtractor.get_cache_counters()
+
+    df = func(filepath, **kwargs)
+
+    cpu_seconds, peak_rss_bytes = metrics.get_process_usage()
+    counters = {
+        counter: value - start_counters[counter]
+        for counter, value in BaseExtractor.get_cache_counters().items()
+    }
+
+    return df, cpu_seconds - start_cpu_seconds, peak_rss_bytes, counters
 
 
 class BaseExtractor:
     """A base class to use for data extractors.
 
     :param header: An index of the table columns.
+    :param years: Season years to extract (all years if not specified).
     """
 
-    def __init__(self, header: int = None) -> None:
+    _executor: concurrent.futures.ProcessPoolExecutor | None = None
+    _executor_workers = 0
+    _executor_lock = threading.Lock()
+    # Parsed pages of the process (each worker process has its own).
+    document_cache = DocumentCache()
+    table_cache = TableCache()
+    table_validator = TableValidator()
+    # A variant of the parsed pages, if an extractor parses them
+    # differently (see `parse_document`).
+    document_variant = ""
+
+    def __init__(
+        self, header: int = None, years: set[int] | None = None
+    ) -> None:
         """Construct all attributes for the `BaseExtractor` object.
 
         :param header: An index of the table columns.
+        :param years: Season years to extract (all years if not
+            specified).
         """
         self.header = header
+        self.years = years
 
     @staticmethod
     def read_html(filepath: Path) -> str:
-        """Read an HTML data from the specified filepath.
+        """Read an HTML data from the specified filepath, or from the
+        segments of its folder if the page isn't saved as a file.
 
         :param filepath: Filepath to save the HTML data to.
         :return: HTML data.
         """
+        reader = (
+            SegmentReader.get(folder=filepath.parent)
+            if not os.path.exists(filepath)
+            else None
+        )
+
+        if reader is not None and filepath.name in reader.index:
+            data = reader.read(filename=filepath.name)
+
+            metrics.increment("files_read")
+            metrics.increment("bytes_read", len(data))
+
+            return data.decode("utf-8")
+
         with open(filepath, mode="r", encoding="utf-8") as f:
             html_data = f.read()
 
+        metrics.increment("files_read")
+        metrics.increment("bytes_read", os.path.getsize(filepath))
+
         return html_data
 
     @staticmethod
-    def get_soup(html_data: str) -> bs4.BeautifulSoup:
+    @contextlib.contextmanager
+    def map_html(filepath: Path) -> Iterator[mmap.mmap | memoryview]:
+        """Map an HTML data of the specified filepath (or of the
+        segments of its folder) to the memory. The bytes are parsed
+        from the page cache, shared by the worker processes, without
+        reading and decoding them into a string first.
+
+        :param filepath: Filepath of the HTML data.
+        :return: A buffer of the HTML data, valid until the context
+            exits.
+        """
+        if not os.path.exists(filepath):
+            reader = SegmentReader.get(folder=filepath.parent)
+
+            if reader is not None and filepath.name in reader.index:
+                with reader.map(filename=filepath.name) as buffer:
+                    metrics.increment("files_read")
+                    metrics.increment("bytes_read", len(buffer))
+
+                    yield buffer
+
+                return
+
+        with open(filepath, mode="rb") as f:
+            size = os.fstat(f.fileno()).st_size
+
+            metrics.increment("files_read")
+            metrics.increment("bytes_read", size)
+
+            # An empty file can't be mapped.
+            if not size:
+                yield memoryview(b"")
+
+                return
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                yield buffer
+
+    @staticmethod
+    def get_soup(
+        html_data: str | bytes | mmap.mmap | memoryview,
+    ) -> bs4.BeautifulSoup:
         """Get a BeautifulSoup object from the HTML data.
 
-        :param html_data: HTML data.
+        :param html_data: HTML data, either decoded or UTF-8 bytes (e.g.
+            a buffer of `map_html`).
         :return: A BeautifulSoup object.
         """
-        soup = bs4.BeautifulSoup(html_data, features="lxml")
+        if isinstance(html_data, str):
+            return bs4.BeautifulSoup(html_data, features="lxml")
+
+        # BeautifulSoup reads a mapped file, but not a view of it.
+        if isinstance(html_data, memoryview):
+            html_data = html_data.tobytes()
+
+        soup = bs4.BeautifulSoup(
+            html_data, features="lxml", from_encoding="utf-8"
+        )
+
+        return soup
+
+    def parse_document(self, filepath: Path) -> bs4.BeautifulSoup:
+        """Parse a page of the specified filepath.
+
+        :param filepath: Filepath of the HTML data.
+        :return: A parsed page.
+        """
+        with self.map_html(filepath=filepath) as html_data:
+            soup = self.get_soup(html_data=html_data)
+
+        return soup
+
+    def get_document(self, filepath: Path) -> bs4.BeautifulSoup:
+        """Get a parsed page of the specified filepath from the document
+        cache, or parse it if it isn't there.
+
+        :param filepath: Filepath of the HTML data.
+        :return: A parsed page, shared by the lookups of the process.
+        """
+        soup = self.document_cache.get(
+            filepath=filepath,
+            parse=lambda: self.parse_document(filepath=filepath),
+            variant=self.document_variant,
+        )
 
         return soup
 
@@ -57,9 +221,9 @@ class BaseExtractor:
         :param index: Index of the table.
         :return: A table as a dataframe.
         """
-        table = pd.read_html(filepath, header=self.header, encoding="utf-8")[
-            index
-        ]
+        html_data = self.read_html(filepath=filepath)
+
+        table = pd.read_html(io.StringIO(html_data), header=self.header)[index]
 
         return table
 
@@ -78,17 +242,227 @@ class BaseExtractor:
         return table_df
 
     @staticmethod
-    def save_table(table_df: pd.DataFrame, *, filepath: Path) -> None:
+    def cast_column(column: Series, *, data_type: pa.DataType) -> Series:
+        """Cast a column to the pandas data type that corresponds to
+        the specified Arrow data type.
+
+        Numeric values that are stored as text (e.g. `$1,234,567` or
+        `45%`) are cleaned up, and values that can't be converted are
+        replaced with missing values.
+
+        :param column: A column to cast.
+        :param data_type: An Arrow data type of the column.
+        :return: Cast column.
+        """
+        if pa.types.is_integer(data_type) or pa.types.is_floating(data_type):
+            if not pd.api.types.is_numeric_dtype(column):
+                column = column.astype("string").str.replace(
+                    SchemaConstants.NUMERIC_CLEANUP_PATTERN, "", regex=True
+                )
+
+            column = pd.to_numeric(column, errors="coerce")
+
+        if pa.types.is_dictionary(data_type):
+            return column.astype("category")
+
+        if pa.types.is_integer(data_type):
+            # The values that don't fit the type (e.g. of a broken page)
+            # are replaced with missing values instead of failing the
+            # cast.
+            info = np.iinfo(f"int{data_type.bit_width}")
+            invalid = column.notna() & (
+                ~column.between(info.min, info.max) | (column % 1 != 0)
+            )
+
+            if invalid.any():
+                column = column.mask(invalid)
+
+            return column.astype(f"Int{data_type.bit_width}")
+
+        if pa.types.is_floating(data_type):
+            return column.astype(f"float{data_type.bit_width}")
+
+        if pa.types.is_boolean(data_type):
+            return column.astype("boolean")
+
+        if pa.types.is_string(data_type):
+            return column.astype("string")
+
+        return column.astype(pd.ArrowDtype(data_type))
+
+    def cast_table(
+        self, table_df: pd.DataFrame, *, schema: pa.Schema
+    ) -> pd.DataFrame:
+        """Cast columns of the table to the specified schema. Columns
+        that aren't in the schema keep their data types.
+
+        :param table_df: A table to cast.
+        :param schema: Arrow schema of the table.
+        :return: Cast table.
+        """
+        columns = {
+            field.name: self.cast_column(
+                table_df[field.name], data_type=field.type
+            )
+            for field in schema
+            if field.name in table_df.columns
+        }
+
+        table_df = table_df.assign(**columns)
+
+        return table_df
+
+    @staticmethod
+    def read_table(
+        filepath: Path,
+        *,
+        columns: list[str],
+        filters: list[tuple] | None = None,
+    ) -> pd.DataFrame:
+        """Read the columns of a processed table (e.g. to derive another
+        table from it).
+
+        :param filepath: A filepath of the table.
+        :param columns: Columns to read.
+        :param filters: Filters of the rows to read (e.g. `[("year",
+            "in", [2025])]`).
+        :return: A table (empty if it doesn't exist).
+        """
+        if not os.path.exists(filepath):
+            logger.warning(
+                msg=f"`{filepath.name}` doesn't exist, so it isn't read."
+            )
+
+            return pd.DataFrame(columns=columns)
+
+        table_df = pd.read_parquet(
+            filepath, engine="pyarrow", columns=columns, filters=filters
+        )
+
+        metrics.increment("files_read")
+        metrics.increment("bytes_read", os.path.getsize(filepath))
+
+        return table_df
+
+    @staticmethod
+    def save_table(
+        table_df: pd.DataFrame,
+        *,
+        filepath: Path,
+        options: dict[str, Any] | None = None,
+    ) -> None:
         """Save a table to the specified filepath.
 
         :param table_df: A table to save.
         :param filepath: A filepath to save the table to.
+        :param options: Options of the Parquet writer (e.g. the
+            codec) to use instead of the configured ones
+            (`ParquetConstants.OPTIONS`).
         :return: None.
         """
         table_df.to_parquet(
-            filepath, engine="pyarrow", compression="snappy", index=False
+            filepath,
+            engine="pyarrow",
+            index=False,
+            **{**ParquetConstants.OPTIONS, **(options or {})},
+        )
+
+        metrics.increment("rows", len(table_df))
+        metrics.increment("files_written")
+        metrics.increment("bytes_written", os.path.getsize(filepath))
+
+    def validate_table(
+        self, table_df: pd.DataFrame, *, filepath: Path
+    ) -> pd.DataFrame:
+        """Validate an extracted table before it's saved, and drop the
+        rows of the pages that fail the checks (see `TableValidator`).
+
+        :param table_df: A table to validate.
+        :param filepath: A filepath of the table.
+        :return: Validated table.
+        """
+        table_df = self.table_validator.validate(
+            table_df,
+            name=filepath.stem,
+            schema=SchemaConstants.SCHEMAS[filepath],
+            years=self.years,
+        )
+
+        return table_df
+
+    def replace_rows(
+        self, table_df: pd.DataFrame, *, filepath: Path
+    ) -> pd.DataFrame:
+        """Replace the rows of the existing table with the rows of the
+        table that have the same keys (see
+        `SchemaConstants.MERGE_KEYS`).
+
+        :param table_df: A table with the new rows.
+        :param filepath: A filepath of the existing table.
+        :raises MergeKeyError: If the existing table doesn't have a
+            key (e.g. a table saved before the column was added), as
+            its rows can't be matched.
+        :return: Merged table.
+        """
+        keys = list(SchemaConstants.MERGE_KEYS[filepath])
+        existing_df = pd.read_parquet(filepath, engine="pyarrow")
+
+        for key in keys:
+            if key not in existing_df.columns:
+                raise MergeKeyError(filename=filepath.name, key=key)
+
+        # E.g. an empty table of the stats that no page has doesn't
+        # have the keys, so no rows are replaced.
+        if set(keys) <= set(table_df.columns):
+            replaced_rows = pd.MultiIndex.from_frame(existing_df[keys]).isin(
+                pd.MultiIndex.from_frame(table_df[keys])
+            )
+            existing_df = existing_df[~replaced_rows]
+
+        merged_df = pd.concat([existing_df, table_df], ignore_index=True)
+
+        # The categories of the tables differ, so the concatenated
+        # columns are cast back to the schema.
+        merged_df = self.cast_table(
+            table_df=merged_df, schema=SchemaConstants.SCHEMAS[filepath]
         )
 
+        return merged_df
+
+    def merge_table(
+        self, table_df: pd.DataFrame, *, filepath: Path
+    ) -> pd.DataFrame:
+        """Merge an extracted table with the existing table, so only the
+        rows of the extracted pages (or years, players) are replaced,
+        and the rows of the pages that weren't extracted (e.g. of the
+        other years, or deferred by the time budget of the crawl) are
+        kept. Nothing is merged if the table doesn't exist yet.
+
+        :param table_df: An extracted table.
+        :param filepath: A filepath of the existing table.
+        :raises MergeKeyError: If the existing table doesn't have a
+            key, and only some of the years are extracted.
+        :return: Merged table.
+        """
+        if not os.path.exists(filepath):
+            return table_df
+
+        try:
+            merged_df = self.replace_rows(table_df=table_df, filepath=filepath)
+        except MergeKeyError as e:
+            # All years are extracted, so the table is rebuilt.
+            if self.years is not None:
+                raise
+
+            logger.warning(
+                msg=f"`{filepath.name}` predates the `{e.key}` column, so "
+                f"it's rebuilt from the extracted rows."
+            )
+
+            merged_df = table_df
+
+        return merged_df
+
     @staticmethod
     def save_json(json_data: dict, *, filepath: Path) -> None:
         """Save JSON data to the specified filepath.
@@ -100,6 +474,9 @@ class BaseExtractor:
         with open(filepath, mode="w", encoding="utf-8") as f:
             json.dump(json_data, f)
 
+        metrics.increment("files_written")
+        metrics.increment("bytes_written", os.path.getsize(filepath))
+
     @staticmethod
     def make_base_folder(base_path: Path, folder: str) -> None:
         """Create the base folder.
@@ -182,30 +559,122 @@ class BaseExtractor:
         return df
 
     @staticmethod
-    def get_filepaths(base_folder: Path) -> list[Path]:
+    def get_filepaths(
+        base_folder: Path, *, years: set[int] | None = None
+    ) -> list[Path]:
         """Get all files in the specified folder.
 
         :param base_folder: Base folder.
+        :param years: Season years of the files to get (e.g.
+            `nba-2025.html` or `bos-2025.html` for 2025). All files are
+            returned if not specified.
         :return: Filepaths.
         """
         filepaths = [
             base_folder.joinpath(filename)
             for filename in os.listdir(base_folder)
+            if not is_segment_file(filename=filename)
         ]
 
+        reader = SegmentReader.get(folder=base_folder)
+
+        # The pages of the segments are listed in the order they're
+        # stored, so they're read sequentially.
+        if reader is not None:
+            filenames = {filepath.name for filepath in filepaths}
+
+            filepaths.extend(
+                base_folder.joinpath(filename)
+                for filename in reader.get_filenames()
+                if filename not in filenames
+            )
+
+        if years is not None:
+            pattern = re.compile(SeasonConstants.SEASON_FILENAME_PATTERN)
+
+            filepaths = [
+                filepath
+                for filepath in filepaths
+                if (match := pattern.fullmatch(filepath.stem))
+                and int(match.group(1)) in years
+            ]
+
         return filepaths
 
+    def get_table_df(
+        self,
+        filepath: Path,
+        *,
+        _id: str,
+        header: int,
+        extract_links: str | None = None,
+    ) -> pd.DataFrame:
+        """Get a table of the page by its tag ID as a dataframe from the
+        table cache, or extract it from the parsed page and cache it.
+
+        :param filepath: Filepath of the HTML data.
+        :param _id: An ID of the table.
+        :param header: An index of the table headers.
+        :param extract_links: A table section (e.g. `body`) whose cells
+            are extracted as (text, link) tuples.
+        :return: A table of stats.
+        """
+        if not self.table_cache.enabled:
+            return self.get_table_df_by_id(
+                soup=self.get_document(filepath=filepath),
+                _id=_id,
+                header=header,
+                extract_links=extract_links,
+            )
+
+        digest = self.table_cache.get_digest(
+            filepath=filepath,
+            version=self.document_cache.get_version(filepath=filepath),
+        )
+        table_filepath = self.table_cache.get_filepath(
+            digest=digest,
+            _id=_id,
+            header=header,
+            extract_links=extract_links,
+            variant=self.document_variant,
+        )
+
+        table_df = self.table_cache.read(filepath=table_filepath)
+
+        if table_df is not None:
+            self.table_cache.count(counter="hits")
+
+            return table_df
+
+        table_df = self.get_table_df_by_id(
+            soup=self.get_document(filepath=filepath),
+            _id=_id,
+            header=header,
+            extract_links=extract_links,
+        )
+
+        self.table_cache.write(table_df=table_df, filepath=table_filepath)
+        self.table_cache.count(counter="misses")
+
+        return table_df
+
+    @staticmethod
     def get_table_df_by_id(
-        self, html_data: str, *, _id: str, header: int
+        soup: bs4.BeautifulSoup,
+        *,
+        _id: str,
+        header: int,
+        extract_links: str | None = None,
     ) -> pd.DataFrame:
         """Get a table by its tag ID as a dataframe.
 
-        :param html_data: HTML data.
+        :param soup: A parsed page (e.g. of `get_document`).
         :param _id: An ID of the table.
         :param header: An index of the table headers.
+        :param extract_links: A table section (e.g. `body`) whose cells
+            are extracted as (text, link) tuples.
         :return: A table of stats.
         """
-        soup = self.get_soup(html_data=html_data)
         selector = f"table[id='{_id}']"
 
         table = soup.select_one(selector=selector)
@@ -217,10 +686,139 @@ class BaseExtractor:
 
         io_table = io.StringIO(str(table))
 
-        table_df = pd.read_html(io_table, header=header, encoding="utf-8")[0]
+        table_df = pd.read_html(
+            io_table,
+            header=header,
+            encoding="utf-8",
+            extract_links=extract_links,
+        )[0]
+
+        return table_df
+
+    @staticmethod
+    def extract_player_slug(href: str | None) -> str | None:
+        """Extract a slug of the player from the specified href value.
+
+        Examples:
+
+            - `/players/j/jokicni01.html` -> `jokicni01`.
+            - `https://.../players/t/tatumja01.html` -> `tatumja01`.
+            - `/teams/BOS/2024.html` -> None.
+
+        :param href: Player href.
+        :return: Slug of the player.
+        """
+        if not href:
+            return None
+
+        match = re.search(PlayerConstants.PLAYER_SLUG_PATTERN, href)
+
+        if not match:
+            return None
+
+        return match.group(1)
+
+    @staticmethod
+    def get_player_id(player_slug: str | None) -> int | None:
+        """Get a player ID from the slug of the player. The ID is a
+        stable 64-bit hash of the slug, so it's the same across runs
+        and tables.
+
+        :param player_slug: Slug of the player.
+        :return: Player ID.
+        """
+        if not player_slug:
+            return None
+
+        digest = hashlib.blake2b(
+            player_slug.encode("utf-8"),
+            digest_size=PlayerConstants.PLAYER_ID_DIGEST_SIZE,
+        ).digest()
+
+        player_id = int.from_bytes(digest, byteorder="big", signed=True)
+
+        return player_id
+
+    def split_links(
+        self, table_df: pd.DataFrame, *, column: str = "player"
+    ) -> pd.DataFrame:
+        """Split (text, link) tuples of the table cells into texts, and
+        add the slugs and IDs of the players from the links of the
+        specified column.
+
+        :param table_df: A table extracted with links.
+        :param column: A column with the links to the players.
+        :return: A table with texts and the players slugs and IDs.
+        """
+        # Some seasons don't have certain stats, so the table is empty.
+        if column not in table_df.columns:
+            return table_df
+
+        links = table_df[column].map(
+            lambda value: value[1] if isinstance(value, tuple) else None
+        )
+
+        table_df = table_df.map(
+            lambda value: value[0] if isinstance(value, tuple) else value
+        ).replace({"": None})
+
+        table_df["player_slug"] = links.map(self.extract_player_slug)
+        # The IDs are built as a nullable array directly, as mapping
+        # with missing values goes through float64 and loses precision.
+        table_df["player_id"] = pd.array(
+            [self.get_player_id(slug) for slug in table_df["player_slug"]],
+            dtype="Int64",
+        )
 
         return table_df
 
+    @staticmethod
+    def get_cache_counters() -> dict[str, int]:
+        """Get the counters of the caches of the process.
+
+        :return: Counters by the counters of the stages.
+        """
+        counters = {
+            **BaseExtractor.document_cache.get_counters(),
+            **BaseExtractor.table_cache.get_counters(),
+        }
+
+        return counters
+
+    @staticmethod
+    def get_executor() -> concurrent.futures.ProcessPoolExecutor:
+        """Get a pool of the worker processes shared by all extractors.
+        The pool is created once (or again if a number of the workers
+        changes), as starting the workers and importing pandas in them
+        takes about a second for each pool.
+
+        :return: A pool of the worker processes.
+        """
+        with BaseExtractor._executor_lock:
+            if (
+                BaseExtractor._executor is None
+                or BaseExtractor._executor_workers != BaseConstants.MAX_WORKERS
+            ):
+                if BaseExtractor._executor is not None:
+                    BaseExtractor._executor.shutdown()
+
+                mp_context = multiprocessing.get_context(
+                    BaseConstants.MP_START_METHOD
+                )
+                mp_context.set_forkserver_preload(
+                    BaseConstants.MP_PRELOAD_MODULES
+                )
+
+                BaseExtractor._executor = (
+                    concurrent.futures.ProcessPoolExecutor(
+                        max_workers=BaseConstants.MAX_WORKERS,
+                        mp_context=mp_context,
+                    )
+                )
+                BaseExtractor._executor_workers = BaseConstants.MAX_WORKERS
+
+            return BaseExtractor._executor
+
     @staticmethod
     def process_files(
         func: Callable, filepaths: list[Path], **kwargs
@@ -233,27 +831,63 @@ class BaseExtractor:
         :return: Concatenated dataframe.
         """
         dfs = []
+        sources = []
+
+        executor = BaseExtractor.get_executor()
+
+        futures = {}
+
+        for filepath in filepaths:
+            future = executor.submit(run_with_usage, func, filepath, **kwargs)
+
+            futures[future] = filepath
 
-        with concurrent.futures.ProcessPoolExecutor(
-            max_workers=BaseConstants.MAX_WORKERS
-        ) as executor:
-            futures = {}
+        for future in concurrent.futures.as_completed(futures):
+            filepath = futures.get(future)
 
-            for filepath in filepaths:
-                future = executor.submit(func, filepath, **kwargs)
+            try:
+                df, cpu_seconds, peak_rss_bytes, counters = future.result()
 
-                futures[future] = filepath
+                dfs.append(df)
+                sources.append(f"{filepath.parent.name}/{filepath.name}")
+            except Exception as e:
+                for pending_future in futures:
+                    pending_future.cancel()
 
-            for future in concurrent.futures.as_completed(futures):
-                filepath = futures.get(future)
+                # A pool whose worker died can't be used anymore.
+                if isinstance(e, concurrent.futures.BrokenExecutor):
+                    with BaseExtractor._executor_lock:
+                        BaseExtractor._executor = None
 
-                try:
-                    df = future.result()
+                raise FileProcessingError(filename=filepath.name, e=e)
 
-                    dfs.append(df)
-                except Exception as e:
-                    raise FileProcessingError(filename=filepath.name, e=e)
+            # The files are read by the worker processes, whose
+            # counters aren't shared, so they're counted here.
+            metrics.increment("files_read")
+            metrics.increment(
+                "bytes_read", SegmentReader.get_size(filepath=filepath)
+            )
+            metrics.add_workers_usage(
+                cpu_seconds=cpu_seconds, peak_rss_bytes=peak_rss_bytes
+            )
+
+            for counter, value in counters.items():
+                metrics.increment(counter, value)
+
+        # E.g. a shard whose years have no files.
+        if not dfs:
+            return pd.DataFrame()
 
         concat_df = pd.concat(dfs)
+        # The rows are indexed by their pages (e.g.
+        # `teams/bos-2025.html`), so the rows of a bad page are found
+        # without reading the pages again (see `validate_table`).
+        concat_df.index = pd.CategoricalIndex(
+            pd.Categorical.from_codes(
+                np.repeat(np.arange(len(dfs)), [len(df) for df in dfs]),
+                categories=sources,
+            ),
+            name=ValidationConstants.SOURCE,
+        )
 
         return concat_df
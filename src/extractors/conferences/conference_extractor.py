@@ -7,6 +7,7 @@ from common.constants import (
     BaseConstants,
     ConferenceConstants,
     LeagueConstants,
+    SchemaConstants,
 )
 from extractors.base_extractor import BaseExtractor
 
@@ -15,18 +16,21 @@ class ConferenceExtractor(BaseExtractor):
     """A class to extract data for conferences.
 
     :param header: An index of the table columns.
+    :param years: Season years to extract (all years if not specified).
     """
 
     EASTERN_CONFERENCE = "Eastern"
     WESTERN_CONFERENCE = "Western"
 
-    def __init__(self, header: int = 0) -> None:
+    def __init__(self, header: int = 0, years: set[int] | None = None) -> None:
         """Construct all attributes for the `ConferenceExtractor`
         object.
 
         :param header: An index of the table columns.
+        :param years: Season years to extract (all years if not
+            specified).
         """
-        super().__init__(header=header)
+        super().__init__(header=header, years=years)
 
     @staticmethod
     def add_division(row: pd.Series) -> str | float:
@@ -167,7 +171,9 @@ class ConferenceExtractor(BaseExtractor):
             LeagueConstants.LEAGUES_FOLDER
         )
 
-        leagues_filepaths = self.get_filepaths(base_folder=base_folder)
+        leagues_filepaths = self.get_filepaths(
+            base_folder=base_folder, years=self.years
+        )
 
         conferences_dfs = []
 
@@ -231,11 +237,8 @@ class ConferenceExtractor(BaseExtractor):
             "games_behind"
         ].str.replace("—", "0")
 
-        conferences_df = conferences_df.astype(
-            dtype=ConferenceConstants.DATA_TYPES_MAP
-        )
-        conferences_df["games_behind"] = conferences_df["games_behind"].astype(
-            dtype=int
+        conferences_df = self.cast_table(
+            table_df=conferences_df, schema=SchemaConstants.CONFERENCES_SCHEMA
         )
 
         return conferences_df
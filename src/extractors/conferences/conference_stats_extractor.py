@@ -4,6 +4,7 @@ from common.constants import (
     BaseConstants,
     ConferenceStatsConstants,
     LeagueConstants,
+    SchemaConstants,
 )
 from extractors.base_extractor import BaseExtractor
 
@@ -12,15 +13,18 @@ class ConferenceStatsExtractor(BaseExtractor):
     """A class to extract data for conferences stats.
 
     :param header: An index of the table columns.
+    :param years: Season years to extract (all years if not specified).
     """
 
-    def __init__(self, header: int = 0) -> None:
+    def __init__(self, header: int = 0, years: set[int] | None = None) -> None:
         """Construct all attributes for the `ConferenceStatsExtractor`
         object.
 
         :param header: An index of the table columns.
+        :param years: Season years to extract (all years if not
+            specified).
         """
-        super().__init__(header=header)
+        super().__init__(header=header, years=years)
 
     @staticmethod
     def remove_empty_columns(df: pd.DataFrame) -> pd.DataFrame:
@@ -56,12 +60,13 @@ class ConferenceStatsExtractor(BaseExtractor):
             LeagueConstants.LEAGUES_FOLDER
         )
 
-        leagues_filepaths = self.get_filepaths(base_folder=base_folder)
+        leagues_filepaths = self.get_filepaths(
+            base_folder=base_folder, years=self.years
+        )
 
         stats_dfs = []
 
         for league_filepath in leagues_filepaths:
-            html_data = self.read_html(filepath=league_filepath)
             season, league = self.extract_season_league(
                 filepath=league_filepath
             )
@@ -80,8 +85,9 @@ class ConferenceStatsExtractor(BaseExtractor):
                     ConferenceStatsConstants.ADVANCED_SHOOTING_STATS_HEADER
                 )
 
-            table_df = self.get_table_df_by_id(
-                html_data=html_data,
+            # The page is parsed once for all stats tables.
+            table_df = self.get_table_df(
+                filepath=league_filepath,
                 _id=stats_id,
                 header=header,
             )
@@ -131,8 +137,9 @@ class ConferenceStatsExtractor(BaseExtractor):
             is_teams_stats=ConferenceStatsConstants.TEAM_STATS,
         )
 
-        per_game_teams_stats_df = per_game_teams_stats_df.astype(
-            dtype=ConferenceStatsConstants.STATS_DATA_TYPES_MAP
+        per_game_teams_stats_df = self.cast_table(
+            table_df=per_game_teams_stats_df,
+            schema=SchemaConstants.CONFERENCE_STATS_SCHEMA,
         )
 
         return per_game_teams_stats_df
@@ -148,8 +155,9 @@ class ConferenceStatsExtractor(BaseExtractor):
             is_teams_stats=ConferenceStatsConstants.OPPONENT_STATS,
         )
 
-        per_game_opponents_stats_df = per_game_opponents_stats_df.astype(
-            dtype=ConferenceStatsConstants.STATS_DATA_TYPES_MAP
+        per_game_opponents_stats_df = self.cast_table(
+            table_df=per_game_opponents_stats_df,
+            schema=SchemaConstants.CONFERENCE_STATS_SCHEMA,
         )
 
         return per_game_opponents_stats_df
@@ -165,8 +173,9 @@ class ConferenceStatsExtractor(BaseExtractor):
             is_teams_stats=ConferenceStatsConstants.TEAM_STATS,
         )
 
-        total_teams_stats_df = total_teams_stats_df.astype(
-            dtype=ConferenceStatsConstants.STATS_DATA_TYPES_MAP
+        total_teams_stats_df = self.cast_table(
+            table_df=total_teams_stats_df,
+            schema=SchemaConstants.CONFERENCE_STATS_SCHEMA,
         )
 
         return total_teams_stats_df
@@ -181,8 +190,9 @@ class ConferenceStatsExtractor(BaseExtractor):
             columns_map=ConferenceStatsConstants.STATS_COLUMNS_MAP,
             is_teams_stats=ConferenceStatsConstants.OPPONENT_STATS,
         )
-        total_opponents_stats_df = total_opponents_stats_df.astype(
-            dtype=ConferenceStatsConstants.STATS_DATA_TYPES_MAP
+        total_opponents_stats_df = self.cast_table(
+            table_df=total_opponents_stats_df,
+            schema=SchemaConstants.CONFERENCE_STATS_SCHEMA,
         )
 
         return total_opponents_stats_df
@@ -198,10 +208,9 @@ class ConferenceStatsExtractor(BaseExtractor):
             is_teams_stats=ConferenceStatsConstants.TEAM_STATS,
         )
 
-        per_100_possessions_teams_stats_df = (
-            per_100_possessions_teams_stats_df.astype(
-                dtype=ConferenceStatsConstants.STATS_DATA_TYPES_MAP
-            )
+        per_100_possessions_teams_stats_df = self.cast_table(
+            table_df=per_100_possessions_teams_stats_df,
+            schema=SchemaConstants.CONFERENCE_STATS_SCHEMA,
         )
 
         return per_100_possessions_teams_stats_df
@@ -217,10 +226,9 @@ class ConferenceStatsExtractor(BaseExtractor):
             is_teams_stats=ConferenceStatsConstants.OPPONENT_STATS,
         )
 
-        per_100_possessions_opponents_stats_df = (
-            per_100_possessions_opponents_stats_df.astype(
-                dtype=ConferenceStatsConstants.STATS_DATA_TYPES_MAP
-            )
+        per_100_possessions_opponents_stats_df = self.cast_table(
+            table_df=per_100_possessions_opponents_stats_df,
+            schema=SchemaConstants.CONFERENCE_STATS_SCHEMA,
         )
 
         return per_100_possessions_opponents_stats_df
@@ -236,8 +244,9 @@ class ConferenceStatsExtractor(BaseExtractor):
             is_teams_stats=ConferenceStatsConstants.TEAM_STATS,
         )
 
-        advanced_teams_stats_df = advanced_teams_stats_df.astype(
-            dtype=ConferenceStatsConstants.ADVANCED_STATS_DATA_TYPES_MAP
+        advanced_teams_stats_df = self.cast_table(
+            table_df=advanced_teams_stats_df,
+            schema=SchemaConstants.CONFERENCE_ADVANCED_STATS_SCHEMA,
         )
 
         return advanced_teams_stats_df
@@ -253,8 +262,9 @@ class ConferenceStatsExtractor(BaseExtractor):
             is_teams_stats=ConferenceStatsConstants.TEAM_STATS,
         )
 
-        shooting_teams_stats_df = shooting_teams_stats_df.astype(
-            dtype=ConferenceStatsConstants.SHOOTING_STATS_DATA_TYPES_MAP
+        shooting_teams_stats_df = self.cast_table(
+            table_df=shooting_teams_stats_df,
+            schema=SchemaConstants.CONFERENCE_SHOOTING_STATS_SCHEMA,
         )
 
         return shooting_teams_stats_df
@@ -270,8 +280,9 @@ class ConferenceStatsExtractor(BaseExtractor):
             is_teams_stats=ConferenceStatsConstants.OPPONENT_STATS,
         )
 
-        shooting_opponents_stats_df = shooting_opponents_stats_df.astype(
-            dtype=ConferenceStatsConstants.STATS_DATA_TYPES_MAP
+        shooting_opponents_stats_df = self.cast_table(
+            table_df=shooting_opponents_stats_df,
+            schema=SchemaConstants.CONFERENCE_SHOOTING_STATS_SCHEMA,
         )
 
         return shooting_opponents_stats_df
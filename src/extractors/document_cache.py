@@ -0,0 +1,137 @@
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+
+import bs4
+
+from common import metrics
+from common.constants import DocumentCacheConstants
+from common.raw_segments import SegmentReader
+
+
+class DocumentCache:
+    """A class to keep the parsed pages of a process, so the tables of
+    a page looked up again (e.g. a table per pass of an extractor) cost
+    only a search of the parsed tree. The pages are keyed by their
+    filepaths and versions (a modification time and size of the file,
+    or a location of the page in the segments), so a page saved again
+    is parsed again. The least recently used pages are evicted once
+    the cache is full.
+
+    :param max_documents: A maximum number of the parsed pages to keep
+        (nothing is kept if `0`).
+    """
+
+    def __init__(
+        self, max_documents: int = DocumentCacheConstants.MAX_DOCUMENTS
+    ) -> None:
+        """Construct all attributes for the `DocumentCache` object.
+
+        :param max_documents: A maximum number of the parsed pages to
+            keep.
+        """
+        self.max_documents = max_documents
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._documents: OrderedDict[tuple, bs4.BeautifulSoup] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_version(filepath: Path) -> tuple | None:
+        """Get a version of a page, either of its file or in the
+        segments of its folder.
+
+        :param filepath: A filepath of the page.
+        :return: A version of the page, or None if it isn't saved.
+        """
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            reader = SegmentReader.get(folder=filepath.parent)
+
+            if reader is None or filepath.name not in reader.index:
+                return None
+
+            return tuple(reader.index[filepath.name])
+
+        return stat.st_mtime_ns, stat.st_size
+
+    def get(
+        self,
+        filepath: Path,
+        *,
+        parse: Callable[[], bs4.BeautifulSoup],
+        variant: str = "",
+    ) -> bs4.BeautifulSoup:
+        """Get a parsed page from the cache, or parse and keep it.
+
+        :param filepath: A filepath of the page.
+        :param parse: A function to parse the page on a miss.
+        :param variant: A variant of the parsed page, if the page is
+            parsed differently (e.g. `uncommented`).
+        :return: A parsed page. It's shared, so it mustn't be modified.
+        """
+        key = (filepath, variant, self.get_version(filepath=filepath))
+
+        with self._lock:
+            soup = self._documents.get(key)
+
+            if soup is not None:
+                self._documents.move_to_end(key)
+                self.count(counter="hits")
+
+                return soup
+
+        soup = parse()
+
+        with self._lock:
+            self.count(counter="misses")
+
+            if self.max_documents <= 0:
+                return soup
+
+            self._documents[key] = soup
+
+            while len(self._documents) > self.max_documents:
+                self._documents.popitem(last=False)
+                self.count(counter="evictions")
+
+        return soup
+
+    def count(self, counter: str) -> None:
+        """Increment a counter of the cache and of the current stage.
+
+        :param counter: A name of the counter (e.g. `hits`).
+        :return: None.
+        """
+        setattr(self, counter, getattr(self, counter) + 1)
+
+        metrics.increment(DocumentCacheConstants.COUNTERS[counter])
+
+    def get_counters(self) -> dict[str, int]:
+        """Get the counters of the cache by the counters of the stages.
+
+        :return: Counters (e.g. `{"document_cache_hits": 17, ...}`).
+        """
+        counters = {
+            stage_counter: getattr(self, counter)
+            for counter, stage_counter in (
+                DocumentCacheConstants.COUNTERS.items()
+            )
+        }
+
+        return counters
+
+    def clear(self) -> None:
+        """Remove all parsed pages from the cache.
+
+        :return: None.
+        """
+        with self._lock:
+            self._documents.clear()
+
+    def __len__(self) -> int:
+        return len(self._documents)
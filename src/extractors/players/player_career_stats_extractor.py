@@ -0,0 +1,230 @@
+import numpy as np
+import pandas as pd
+
+from common.constants import PlayerCareerStatsConstants, SchemaConstants
+from extractors.base_extractor import BaseExtractor
+
+
+class PlayerCareerStatsExtractor(BaseExtractor):
+    """A class to aggregate the per-season stats of the teams stats
+    into the career stats of the players (a row per player and season
+    type), summed over the seasons and the teams of the players traded
+    within a season.
+
+    :param years: Season years whose stats have changed. Only the
+        careers of the players of these seasons are aggregated again
+        (all players if not specified).
+    """
+
+    def __init__(self, years: set[int] | None = None) -> None:
+        """Construct all attributes for the `PlayerCareerStatsExtractor`
+        object.
+
+        :param years: Season years whose stats have changed (all years
+            if not specified).
+        """
+        super().__init__(years=years)
+
+    def get_players_ids(self) -> list[int] | None:
+        """Get IDs of the players with stats in the changed seasons.
+
+        :return: Players IDs, or None if all seasons have changed.
+        """
+        if self.years is None:
+            return None
+
+        players_ids = set()
+        filepaths = PlayerCareerStatsConstants.TOTAL_STATS_FILEPATHS
+
+        for filepath in filepaths.values():
+            stats_df = self.read_table(
+                filepath,
+                columns=[PlayerCareerStatsConstants.KEY],
+                filters=[("year", "in", sorted(self.years))],
+            )
+
+            players_ids.update(
+                stats_df[PlayerCareerStatsConstants.KEY].dropna().tolist()
+            )
+
+        return sorted(players_ids)
+
+    @staticmethod
+    def get_weighted_means(
+        stats_df: pd.DataFrame, *, codes: np.ndarray, weights: pd.Series
+    ) -> pd.DataFrame:
+        """Get means of the columns by the keys, weighted by the
+        specified weights (the missing values are skipped).
+
+        :param stats_df: Values to average.
+        :param codes: Keys of the rows.
+        :param weights: Weights of the rows (e.g. minutes played).
+        :return: Weighted means by the keys.
+        """
+        values = stats_df.to_numpy(dtype="float64", na_value=np.nan)
+        weights = weights.to_numpy(dtype="float64", na_value=0.0)[:, None]
+        present = ~np.isnan(values)
+
+        weighted_sums = pd.DataFrame(
+            np.where(present, values * weights, 0.0)
+        ).groupby(codes, sort=False)
+        weights_sums = pd.DataFrame(np.where(present, weights, 0.0)).groupby(
+            codes, sort=False
+        )
+
+        means = weighted_sums.sum() / weights_sums.sum().replace(0.0, np.nan)
+        means.columns = stats_df.columns
+
+        return means
+
+    def aggregate_stats(
+        self, totals_df: pd.DataFrame, *, advanced_df: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Aggregate the per-season stats of a season type into the
+        career stats. The rows are grouped by compact integer codes of
+        the players IDs, and each aggregation runs over whole columns.
+
+        :param totals_df: Per-season total stats.
+        :param advanced_df: Per-season advanced stats.
+        :return: Career stats by the players.
+        """
+        key = PlayerCareerStatsConstants.KEY
+
+        # The rows without the players (e.g. team totals) are skipped,
+        # and the latest season of each player comes last.
+        totals_df = totals_df[totals_df[key].notna()].sort_values(
+            "year", kind="stable"
+        )
+        codes, players_ids = pd.factorize(totals_df[key])
+
+        totals = (
+            totals_df[PlayerCareerStatsConstants.TOTAL_COLUMNS]
+            .astype("float64")
+            .groupby(codes, sort=False)
+            .sum()
+        )
+        seasons = totals_df.groupby(codes, sort=False)
+
+        career_df = pd.DataFrame(
+            {
+                key: players_ids,
+                "player": seasons["player"].last(),
+                "player_slug": seasons["player_slug"].last().astype("string"),
+                "first_year": seasons["year"].min(),
+                "last_year": seasons["year"].max(),
+                "seasons": seasons["year"].nunique(),
+                "teams": seasons["team"].nunique(),
+            }
+        ).join(totals)
+
+        percentage_columns = PlayerCareerStatsConstants.PERCENTAGE_COLUMNS
+
+        for column, (made, attempts) in percentage_columns.items():
+            career_df[column] = career_df[made] / career_df[attempts].replace(
+                0.0, np.nan
+            )
+
+        career_df["effective_field_goal_percentage"] = (
+            career_df["field_goals"] + 0.5 * career_df["3_point_field_goals"]
+        ) / career_df["field_goal_attempts"].replace(0.0, np.nan)
+        career_df["true_shooting_percentage"] = career_df["points"] / (
+            2
+            * (
+                career_df["field_goal_attempts"]
+                + 0.44 * career_df["free_throw_attempts"]
+            )
+        ).replace(0.0, np.nan)
+
+        games = career_df["games"].replace(0.0, np.nan)
+        per_game_columns = PlayerCareerStatsConstants.PER_GAME_COLUMNS
+
+        for column, per_game_column in per_game_columns.items():
+            career_df[per_game_column] = career_df[column] / games
+
+        # The advanced stats are grouped by the codes of the totals, the
+        # rows of the other players are skipped.
+        advanced_codes = pd.Index(players_ids).get_indexer(advanced_df[key])
+        advanced_df = advanced_df[advanced_codes >= 0]
+        advanced_codes = advanced_codes[advanced_codes >= 0]
+
+        advanced_totals = (
+            advanced_df[PlayerCareerStatsConstants.ADVANCED_TOTAL_COLUMNS]
+            .astype("float64")
+            .groupby(advanced_codes, sort=False)
+            .sum()
+        )
+        advanced_rates = self.get_weighted_means(
+            advanced_df[PlayerCareerStatsConstants.ADVANCED_RATE_COLUMNS],
+            codes=advanced_codes,
+            weights=advanced_df["minutes_played"],
+        )
+
+        career_df = career_df.join(advanced_totals).join(advanced_rates)
+        career_df["win_shares_per_48_minutes"] = (
+            48
+            * career_df["win_shares"]
+            / career_df["minutes_played"].replace(0.0, np.nan)
+        )
+
+        return career_df.reset_index(drop=True)
+
+    def get_players_career_stats_df(self) -> pd.DataFrame:
+        """Get a players career stats dataframe of the regular seasons
+        and playoffs.
+
+        :return: Players career stats dataframe.
+        """
+        players_ids = self.get_players_ids()
+        filters = (
+            [(PlayerCareerStatsConstants.KEY, "in", players_ids)]
+            if players_ids is not None
+            else None
+        )
+
+        careers_dfs = []
+        totals_filepaths = PlayerCareerStatsConstants.TOTAL_STATS_FILEPATHS
+        advanced_filepaths = (
+            PlayerCareerStatsConstants.ADVANCED_STATS_FILEPATHS
+        )
+
+        for season_type, totals_filepath in totals_filepaths.items():
+            totals_df = self.read_table(
+                totals_filepath,
+                columns=[
+                    *PlayerCareerStatsConstants.PLAYER_COLUMNS,
+                    *PlayerCareerStatsConstants.TOTAL_COLUMNS,
+                ],
+                filters=filters,
+            )
+            advanced_df = self.read_table(
+                advanced_filepaths[season_type],
+                columns=[
+                    PlayerCareerStatsConstants.KEY,
+                    "minutes_played",
+                    *PlayerCareerStatsConstants.ADVANCED_TOTAL_COLUMNS,
+                    *PlayerCareerStatsConstants.ADVANCED_RATE_COLUMNS,
+                ],
+                filters=filters,
+            )
+
+            career_df = self.aggregate_stats(
+                totals_df=totals_df, advanced_df=advanced_df
+            )
+            career_df["season_type"] = season_type
+
+            if not career_df.empty:
+                careers_dfs.append(career_df)
+
+        names = SchemaConstants.PLAYERS_CAREER_STATS_SCHEMA.names
+        careers_df = (
+            pd.concat(careers_dfs, ignore_index=True)[names]
+            if careers_dfs
+            else pd.DataFrame(columns=names)
+        )
+
+        careers_df = self.cast_table(
+            table_df=careers_df,
+            schema=SchemaConstants.PLAYERS_CAREER_STATS_SCHEMA,
+        )
+
+        return careers_df
@@ -1,6 +1,12 @@
+import re
 from string import digits, punctuation, whitespace
 
-from common.constants import BaseConstants, PlayerConstants, TeamConstants
+from common.constants import (
+    BaseConstants,
+    PlayerConstants,
+    SeasonConstants,
+    TeamConstants,
+)
 from extractors.base_extractor import BaseExtractor
 
 
@@ -8,14 +14,18 @@ class PlayerExtractor(BaseExtractor):
     """A class to extract data for players.
 
     :param header: An index of the table columns.
+    :param years: Season years to extract (all years if not specified).
     """
 
-    def __init__(self, header: int = 0) -> None:
+    def __init__(self, header: int = 0, years: set[int] | None = None) -> None:
         """Construct all attributes for the `PlayerExtractor` object.
 
         :param header: An index of the table columns.
+        :param years: Season years to extract (all years if not
+            specified).
         """
-        super().__init__(header=header)
+        super().__init__(header=header, years=years)
+        self.players_seasons: dict[str, int] = {}
 
     @staticmethod
     def is_player(*, player: str) -> bool:
@@ -37,8 +47,13 @@ class PlayerExtractor(BaseExtractor):
 
         return is_true
 
-    def get_players_urls(self) -> dict[str, set[str]]:
-        """Get URLs of the players.
+    def get_players_urls(self) -> dict[str, str]:
+        """Get URLs of the players by the slugs of the players. The
+        last season of each player is collected too (see
+        `players_seasons`), so the active players are fetched first.
+
+        The players are identified by the slugs (e.g. `jokicni01`),
+        as different players can have the same name.
 
         :return: URLs.
         """
@@ -46,22 +61,31 @@ class PlayerExtractor(BaseExtractor):
             TeamConstants.TEAMS_FOLDER
         )
 
-        filepaths = self.get_filepaths(base_folder=base_folder)
+        filepaths = self.get_filepaths(
+            base_folder=base_folder, years=self.years
+        )
 
         players_urls = {}
 
+        pattern = re.compile(SeasonConstants.SEASON_FILENAME_PATTERN)
+
         for filepath in filepaths:
-            html_data = self.read_html(filepath=filepath)
-            soup = self.get_soup(html_data=html_data)
+            match = pattern.fullmatch(filepath.stem)
+
+            # E.g. `teams.json`.
+            if filepath.suffix != ".html" or not match:
+                continue
+
+            season_year = int(match.group(1))
+            with self.map_html(filepath=filepath) as html_data:
+                soup = self.get_soup(html_data=html_data)
 
             for tag in soup.select(
                 selector=PlayerConstants.PLAYER_HREF_SELECTOR
             ):
                 player = tag.text.strip()
 
-                if not self.is_player(player=player) or players_urls.get(
-                    player
-                ):
+                if not self.is_player(player=player):
                     continue
 
                 href = tag.attrs.get("href")
@@ -69,8 +93,21 @@ class PlayerExtractor(BaseExtractor):
                 if not href.endswith(BaseConstants.RAW_FILE_EXTENSION):
                     continue
 
+                player_slug = self.extract_player_slug(href=href)
+
+                if not player_slug:
+                    continue
+
+                self.players_seasons[player_slug] = max(
+                    self.players_seasons.get(player_slug, season_year),
+                    season_year,
+                )
+
+                if player_slug in players_urls:
+                    continue
+
                 player_url = BaseConstants.URL + href
 
-                players_urls[player] = player_url
+                players_urls[player_slug] = player_url
 
         return players_urls
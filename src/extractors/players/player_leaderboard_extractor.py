@@ -0,0 +1,218 @@
+import numpy as np
+import pandas as pd
+
+from common.constants import (
+    PlayerCareerStatsConstants,
+    PlayerLeaderboardConstants,
+    SchemaConstants,
+)
+from extractors.base_extractor import BaseExtractor
+
+
+class PlayerLeaderboardExtractor(BaseExtractor):
+    """A class to materialize the leaderboards of the players (the top
+    players of each season and stat) from the per-season stats of the
+    teams stats, so the leaders are read instead of sorting the whole
+    tables.
+
+    :param years: Season years whose leaderboards are materialized
+        (all years if not specified).
+    :param size: Number of the leaders of each season and stat.
+    """
+
+    def __init__(
+        self,
+        years: set[int] | None = None,
+        size: int = PlayerLeaderboardConstants.SIZE,
+    ) -> None:
+        """Construct all attributes for the `PlayerLeaderboardExtractor`
+        object.
+
+        :param years: Season years whose leaderboards are materialized
+            (all years if not specified).
+        :param size: Number of the leaders of each season and stat.
+        """
+        super().__init__(years=years)
+
+        self.size = size
+
+    @staticmethod
+    def get_top_rows(
+        values: np.ndarray, *, codes: np.ndarray, size: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Get the rows of the highest values of each group and their
+        ranks. The values are laid out in a row of a matrix per group,
+        so the top values of all groups are selected by one partial
+        sort, and only they are sorted. The missing values are skipped,
+        and the equal values share a rank.
+
+        :param values: Values to rank.
+        :param codes: Codes of the groups of the values (from 0).
+        :param size: Number of the top values of each group.
+        :return: Rows of the top values, ordered by the groups and
+            the ranks, and their ranks.
+        """
+        if not len(values):
+            return np.empty(0, dtype="int64"), np.empty(0, dtype="int64")
+
+        # Positions of the values in the rows of their groups.
+        positions = pd.Series(codes).groupby(codes).cumcount().to_numpy()
+        shape = (codes.max() + 1, positions.max() + 1)
+        size = min(size, shape[1])
+
+        matrix = np.full(shape, -np.inf)
+        matrix[codes, positions] = np.where(np.isnan(values), -np.inf, values)
+        rows = np.full(shape, -1)
+        rows[codes, positions] = np.arange(len(values))
+
+        top = np.argpartition(-matrix, size - 1, axis=1)[:, :size]
+        top_values = np.take_along_axis(matrix, top, axis=1)
+        order = np.argsort(-top_values, axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1)
+        top_values = np.take_along_axis(top_values, order, axis=1)
+
+        # A value equal to the previous one keeps its rank (e.g. `1, 2,
+        # 2, 4`).
+        starts = np.ones(top_values.shape, dtype=bool)
+        starts[:, 1:] = top_values[:, 1:] != top_values[:, :-1]
+        ranks = (
+            np.maximum.accumulate(np.where(starts, np.arange(size), 0), axis=1)
+            + 1
+        )
+
+        present = np.isfinite(top_values)
+
+        return np.take_along_axis(rows, top, axis=1)[present], ranks[present]
+
+    def get_seasons_df(self, season_type: str) -> pd.DataFrame:
+        """Get the stats of the players by the seasons, summed over the
+        teams of the players traded within a season.
+
+        :param season_type: A season type (e.g. `playoffs`).
+        :return: Stats of the players by the seasons.
+        """
+        filters = (
+            [("year", "in", sorted(self.years))]
+            if self.years is not None
+            else None
+        )
+        keys = ["year", "player_id"]
+
+        totals_df = self.read_table(
+            PlayerCareerStatsConstants.TOTAL_STATS_FILEPATHS[season_type],
+            columns=[
+                *PlayerCareerStatsConstants.PLAYER_COLUMNS,
+                "games",
+                *PlayerLeaderboardConstants.TOTAL_STATS,
+            ],
+            filters=filters,
+        )
+        advanced_df = self.read_table(
+            PlayerCareerStatsConstants.ADVANCED_STATS_FILEPATHS[season_type],
+            columns=[*keys, *PlayerLeaderboardConstants.ADVANCED_STATS],
+            filters=filters,
+        )
+
+        # The rows without the players (e.g. team totals) are skipped.
+        totals_df = totals_df[totals_df["player_id"].notna()]
+        advanced_df = advanced_df[advanced_df["player_id"].notna()]
+
+        stats = ["games", *PlayerLeaderboardConstants.TOTAL_STATS]
+        seasons = totals_df.groupby(keys, sort=False)
+
+        seasons_df = seasons[stats].sum().astype("float64")
+        seasons_df["player"] = seasons["player"].last()
+        seasons_df["player_slug"] = seasons["player_slug"].last()
+
+        teams = seasons["team"].nunique()
+        seasons_df["team"] = (
+            seasons["team"]
+            .last()
+            .astype("string")
+            .where(
+                teams <= 1,
+                teams.astype("string")
+                + PlayerLeaderboardConstants.TEAMS_SUFFIX,
+            )
+        )
+
+        seasons_df = seasons_df.join(
+            advanced_df.groupby(keys, sort=False)[
+                PlayerLeaderboardConstants.ADVANCED_STATS
+            ]
+            .sum()
+            .astype("float64")
+        ).reset_index()
+
+        # The averages of the players with few games aren't ranked.
+        qualified = seasons_df["games"] >= (
+            PlayerLeaderboardConstants.MIN_GAMES_FRACTION
+            * seasons_df.groupby("year")["games"].transform("max")
+        )
+        games = seasons_df["games"].where(qualified).replace(0.0, np.nan)
+        per_game_stats = PlayerLeaderboardConstants.PER_GAME_STATS
+
+        for stat, per_game_stat in per_game_stats.items():
+            seasons_df[per_game_stat] = seasons_df[stat] / games
+
+        return seasons_df
+
+    def get_leaderboards_df(self, season_type: str) -> pd.DataFrame:
+        """Get the leaderboards of the seasons of a season type.
+
+        :param season_type: A season type (e.g. `playoffs`).
+        :return: Leaderboards of the season type.
+        """
+        seasons_df = self.get_seasons_df(season_type=season_type)
+        codes, _ = pd.factorize(seasons_df["year"])
+
+        stats = [
+            *PlayerLeaderboardConstants.TOTAL_STATS,
+            *PlayerLeaderboardConstants.PER_GAME_STATS.values(),
+            *PlayerLeaderboardConstants.ADVANCED_STATS,
+        ]
+        leaderboards_dfs = []
+
+        for stat in stats:
+            values = seasons_df[stat].to_numpy("float64", na_value=np.nan)
+            rows, ranks = self.get_top_rows(
+                values, codes=codes, size=self.size
+            )
+
+            leaderboard_df = seasons_df.iloc[rows][
+                ["year", "player_id", "player", "player_slug", "team"]
+            ].assign(season_type=season_type, stat=stat)
+            leaderboard_df["rank"] = ranks
+            leaderboard_df["value"] = values[rows]
+
+            leaderboards_dfs.append(leaderboard_df)
+
+        return pd.concat(leaderboards_dfs, ignore_index=True)
+
+    def get_players_leaderboards_df(self) -> pd.DataFrame:
+        """Get a players leaderboards dataframe of the regular seasons
+        and playoffs.
+
+        :return: Players leaderboards dataframe.
+        """
+        leaderboards_dfs = []
+
+        for season_type in PlayerCareerStatsConstants.TOTAL_STATS_FILEPATHS:
+            leaderboards_df = self.get_leaderboards_df(season_type=season_type)
+
+            if not leaderboards_df.empty:
+                leaderboards_dfs.append(leaderboards_df)
+
+        names = SchemaConstants.PLAYERS_LEADERBOARDS_SCHEMA.names
+        leaderboards_df = (
+            pd.concat(leaderboards_dfs, ignore_index=True)[names]
+            if leaderboards_dfs
+            else pd.DataFrame(columns=names)
+        )
+
+        leaderboards_df = self.cast_table(
+            table_df=leaderboards_df,
+            schema=SchemaConstants.PLAYERS_LEADERBOARDS_SCHEMA,
+        )
+
+        return leaderboards_df
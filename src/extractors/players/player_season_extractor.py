@@ -0,0 +1,199 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from common import metrics
+from common.constants import (
+    ParquetConstants,
+    PlayerSeasonConstants,
+    SchemaConstants,
+)
+from extractors.base_extractor import BaseExtractor
+
+
+class PlayerSeasonExtractor(BaseExtractor):
+    """A class to build the fact table of the players seasons, a wide
+    row per player, team, and season with the roster, per-game stats,
+    advanced stats, and salary of the player. The table is saved with
+    a file per season, so a season is read (or built again) without
+    the others.
+
+    :param years: Season years whose rows are built (all years if not
+        specified).
+    """
+
+    def __init__(self, years: set[int] | None = None) -> None:
+        """Construct all attributes for the `PlayerSeasonExtractor`
+        object.
+
+        :param years: Season years whose rows are built (all years if
+            not specified).
+        """
+        super().__init__(years=years)
+        # Files of the seasons that have no rows anymore, to delete
+        # them from S3 too.
+        self.deleted_filepaths: list[Path] = []
+
+    def read_arrow_table(
+        self, filepath: Path, *, columns: list[str]
+    ) -> pa.Table | None:
+        """Read the rows of the players of a processed table.
+
+        :param filepath: A filepath of the table.
+        :param columns: Columns to read.
+        :return: Arrow table, or None if it doesn't exist.
+        """
+        if not os.path.exists(filepath):
+            return None
+
+        filters = (
+            [("year", "in", sorted(self.years))]
+            if self.years is not None
+            else None
+        )
+        arrow_table = pq.read_table(filepath, columns=columns, filters=filters)
+
+        metrics.increment("files_read")
+        metrics.increment("bytes_read", os.path.getsize(filepath))
+
+        # The rows without the players (e.g. team totals) are skipped.
+        return arrow_table.filter(pc.is_valid(arrow_table["player_id"]))
+
+    @staticmethod
+    def add_team_codes(arrow_tables: list[pa.Table]) -> list[pa.Table]:
+        """Replace the teams of the tables with integer codes shared by
+        the tables, as the dictionaries of the teams differ between the
+        tables.
+
+        :param arrow_tables: Tables with the `team` column.
+        :return: Tables with the `team_code` column instead.
+        """
+        teams = [
+            arrow_table["team"].cast(pa.string())
+            for arrow_table in arrow_tables
+        ]
+        value_set = pc.unique(
+            pa.chunked_array(
+                [chunk for team in teams for chunk in team.chunks],
+                type=pa.string(),
+            )
+        )
+
+        coded_tables = [
+            arrow_table.drop_columns(["team"]).append_column(
+                PlayerSeasonConstants.TEAM_CODE,
+                pc.index_in(team, value_set=value_set),
+            )
+            for arrow_table, team in zip(arrow_tables, teams, strict=True)
+        ]
+
+        return coded_tables
+
+    def get_players_seasons_table(self) -> pa.Table | None:
+        """Get the fact table of the players seasons. The per-game
+        stats, advanced stats, and salaries are joined to the rosters
+        by hash joins on the players IDs, years, and team codes.
+
+        :return: Fact table, or None if the rosters don't exist.
+        """
+        keys = PlayerSeasonConstants.KEYS
+        columns_maps = PlayerSeasonConstants.COLUMNS_MAPS
+        arrow_tables = []
+
+        for filepath, columns_map in columns_maps.items():
+            arrow_table = self.read_arrow_table(
+                filepath, columns=[*keys, *columns_map]
+            )
+
+            if arrow_table is not None:
+                arrow_tables.append(
+                    arrow_table.rename_columns([*keys, *columns_map.values()])
+                )
+            elif filepath == PlayerSeasonConstants.ROSTERS_FILEPATH:
+                return None
+
+        # The teams of the rosters are kept for the joined rows.
+        teams = arrow_tables[0]["team"]
+        arrow_tables = self.add_team_codes(arrow_tables)
+        join_keys = [*keys[:-1], PlayerSeasonConstants.TEAM_CODE]
+
+        players_seasons_table = arrow_tables[0].append_column("team", teams)
+
+        for arrow_table in arrow_tables[1:]:
+            players_seasons_table = players_seasons_table.join(
+                arrow_table, keys=join_keys, join_type="left outer"
+            )
+
+        players_seasons_table = players_seasons_table.sort_by(
+            [
+                ("year", "ascending"),
+                (PlayerSeasonConstants.TEAM_CODE, "ascending"),
+            ]
+        )
+
+        # The columns of the missing tables are nulls.
+        schema = SchemaConstants.PLAYERS_SEASONS_SCHEMA
+        columns = [
+            players_seasons_table[field.name].cast(field.type)
+            if field.name in players_seasons_table.column_names
+            else pa.nulls(len(players_seasons_table), type=field.type)
+            for field in schema
+        ]
+
+        return pa.Table.from_arrays(columns, schema=schema)
+
+    def save_partitions(self, players_seasons_table: pa.Table | None) -> None:
+        """Save the fact table with a file per season, sorted by the
+        years. The files of the built seasons that have no rows anymore
+        are deleted (and kept in `deleted_filepaths`).
+
+        :param players_seasons_table: Fact table.
+        :return: None.
+        """
+        folder = PlayerSeasonConstants.PLAYERS_SEASONS_FOLDER_PATH
+
+        os.makedirs(folder, exist_ok=True)
+
+        saved_filenames = set()
+
+        if players_seasons_table is not None:
+            years = players_seasons_table["year"].to_numpy()
+            # Each season is a contiguous slice of the sorted rows.
+            partition_years, starts = np.unique(years, return_index=True)
+            ends = [*starts[1:], len(years)]
+
+            for year, start, end in zip(
+                partition_years, starts, ends, strict=True
+            ):
+                filename = PlayerSeasonConstants.PARTITION_FILENAME.format(
+                    year=year
+                )
+                filepath = folder.joinpath(filename)
+
+                pq.write_table(
+                    players_seasons_table.slice(start, end - start),
+                    filepath,
+                    **ParquetConstants.OPTIONS,
+                )
+
+                saved_filenames.add(filename)
+
+                metrics.increment("rows", int(end - start))
+                metrics.increment("files_written")
+                metrics.increment("bytes_written", os.path.getsize(filepath))
+
+        for filename in os.listdir(folder):
+            match = PlayerSeasonConstants.PARTITION_PATTERN.fullmatch(filename)
+
+            if (
+                match
+                and filename not in saved_filenames
+                and (self.years is None or int(match[1]) in self.years)
+            ):
+                os.remove(folder.joinpath(filename))
+
+                self.deleted_filepaths.append(folder.joinpath(filename))
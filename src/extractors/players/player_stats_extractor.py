@@ -10,6 +10,7 @@ from common.constants import (
     BaseConstants,
     PlayerConstants,
     PlayerStatsConstants,
+    SchemaConstants,
 )
 from extractors.base_extractor import BaseExtractor
 
@@ -39,15 +40,18 @@ class PlayerStatsExtractor(BaseExtractor):
     """A class to extract data for players stats.
 
     :param header: An index of the table columns.
+    :param years: Season years to extract (all years if not specified).
     """
 
-    def __init__(self, header: int = 0) -> None:
+    def __init__(self, header: int = 0, years: set[int] | None = None) -> None:
         """Construct all attributes for the `PlayerStatsExtractor`
         object.
 
         :param header: An index of the table columns.
+        :param years: Season years to extract (all years if not
+            specified).
         """
-        super().__init__(header=header)
+        super().__init__(header=header, years=years)
 
     def get_players_filepaths(self) -> list[Path]:
         """Get filepaths of the players.
@@ -274,8 +278,13 @@ class PlayerStatsExtractor(BaseExtractor):
         :param player_filepath: Path the player file.
         :return: Stats dataframe.
         """
-        html_data = self.read_html(filepath=player_filepath)
-        soup = self.get_soup(html_data=html_data)
+        with self.map_html(filepath=player_filepath) as html_data:
+            soup = self.get_soup(html_data=html_data)
+
+        # The player's file is named by the slug of the player,
+        # e.g. `jokicni01.html`.
+        player_slug = player_filepath.stem
+        player_id = self.get_player_id(player_slug=player_slug)
 
         player = self.get_player(soup=soup)
         shooting_hand = self.get_shooting_hand(soup=soup)
@@ -292,6 +301,8 @@ class PlayerStatsExtractor(BaseExtractor):
 
         data = [
             [
+                player_id,
+                player_slug,
                 player,
                 shooting_hand,
                 high_schools,
@@ -323,4 +334,9 @@ class PlayerStatsExtractor(BaseExtractor):
             filepaths=players_filepaths,
         )
 
+        players_stats_df = self.cast_table(
+            table_df=players_stats_df,
+            schema=SchemaConstants.PLAYERS_STATS_SCHEMA,
+        )
+
         return players_stats_df
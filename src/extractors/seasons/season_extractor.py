@@ -2,7 +2,7 @@ import re
 
 import pandas as pd
 
-from common.constants import BaseConstants, SeasonConstants
+from common.constants import BaseConstants, SchemaConstants, SeasonConstants
 from common.exceptions import SeasonYearError
 from extractors.base_extractor import BaseExtractor
 
@@ -12,15 +12,20 @@ class SeasonExtractor(BaseExtractor):
 
     :param header: An index of the table columns.
     :param index: An index of the table to extract data from.
+    :param years: Season years to extract (all years if not specified).
     """
 
-    def __init__(self, header: int = 1, index: int = 0) -> None:
+    def __init__(
+        self, header: int = 1, index: int = 0, years: set[int] | None = None
+    ) -> None:
         """Construct all attributes for the `SeasonExtractor` object.
 
         :param header: An index of the table columns.
         :param index: An index of the table to extract data from.
+        :param years: Season years to extract (all years if not
+            specified).
         """
-        super().__init__(header=header)
+        super().__init__(header=header, years=years)
         self.index = index
 
     def get_seasons_df(self) -> pd.DataFrame:
@@ -45,6 +50,10 @@ class SeasonExtractor(BaseExtractor):
             & (seasons_df["rookie_of_the_year"].notnull())
         ]
 
+        seasons_df = self.cast_table(
+            table_df=seasons_df, schema=SchemaConstants.SEASONS_SCHEMA
+        )
+
         return seasons_df
 
     def get_filtered_seasons(self) -> list[str]:
@@ -84,12 +93,13 @@ class SeasonExtractor(BaseExtractor):
             raise SeasonYearError(year_txt=year_txt)
 
     def get_seasons_urls(self) -> dict[str, str]:
-        """Get URLs of all seasons.
+        """Get URLs of all seasons (or of the seasons of the specified
+        years only).
 
         :return: URLs.
         """
-        html_data = self.read_html(filepath=SeasonConstants.RAW_FILEPATH)
-        soup = self.get_soup(html_data=html_data)
+        with self.map_html(filepath=SeasonConstants.RAW_FILEPATH) as html_data:
+            soup = self.get_soup(html_data=html_data)
 
         filtered_seasons = self.get_filtered_seasons()
 
@@ -103,7 +113,15 @@ class SeasonExtractor(BaseExtractor):
             href = tag.attrs.get("href")
             season = self.extract_season(href=href)
 
-            if season in filtered_seasons:
-                seasons_urls[season] = BaseConstants.URL + href
+            if season not in filtered_seasons:
+                continue
+
+            if (
+                self.years is not None
+                and self.get_season_year(season=season) not in self.years
+            ):
+                continue
+
+            seasons_urls[season] = BaseConstants.URL + href
 
         return seasons_urls
@@ -0,0 +1,239 @@
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+from common import metrics
+from common.constants import TableCacheConstants
+from common.raw_segments import SegmentReader
+
+
+class TableCache:
+    """A class to keep the tables extracted from the pages on the disk
+    in Arrow IPC files, so the tables are read from the cache instead
+    of parsing the pages again (e.g. after a column map is changed).
+    The tables are keyed by a hash of the page, the table ID and its
+    parsing options, the parser version, and the pandas version, so
+    only a changed page or parser extracts the table again.
+
+    :param folder: A folder of the cached tables.
+    :param enabled: Whether the tables are cached.
+    """
+
+    def __init__(
+        self,
+        folder: Path = TableCacheConstants.FOLDER,
+        *,
+        enabled: bool = TableCacheConstants.ENABLED,
+    ) -> None:
+        """Construct all attributes for the `TableCache` object.
+
+        :param folder: A folder of the cached tables.
+        :param enabled: Whether the tables are cached.
+        """
+        self.folder = folder
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        # Hashes of the pages by their filepaths and versions, so a page
+        # is hashed once for all of its tables.
+        self._digests: dict[tuple, str] = {}
+        self._lock = threading.Lock()
+
+    def get_digest(self, filepath: Path, *, version: tuple) -> str:
+        """Get a hash of a page, either of its file or in the segments
+        of its folder.
+
+        :param filepath: A filepath of the page.
+        :param version: A version of the page (e.g. its modification
+            time and size).
+        :return: SHA-256 hash of the page.
+        """
+        key = (filepath, version)
+
+        with self._lock:
+            digest = self._digests.get(key)
+
+        if digest is not None:
+            return digest
+
+        if os.path.exists(filepath):
+            with open(filepath, mode="rb") as f:
+                digest = hashlib.file_digest(f, "sha256").hexdigest()
+        else:
+            reader = SegmentReader.get(folder=filepath.parent)
+
+            with reader.map(filename=filepath.name) as buffer:
+                digest = hashlib.sha256(buffer).hexdigest()
+
+        with self._lock:
+            self._digests[key] = digest
+
+        return digest
+
+    def get_filepath(self, digest: str, **options) -> Path:
+        """Get a filepath of a cached table.
+
+        :param digest: A hash of the page.
+        :param options: An ID and parsing options of the table.
+        :return: Filepath of the table.
+        """
+        key = json.dumps(
+            {
+                **options,
+                "parser_version": TableCacheConstants.PARSER_VERSION,
+                "pandas_version": pd.__version__,
+            },
+            sort_keys=True,
+        )
+
+        filename = TableCacheConstants.TABLE_FILENAME.format(
+            digest=digest,
+            key=hashlib.sha256(key.encode("utf-8")).hexdigest()[:16],
+        )
+
+        return self.folder.joinpath(digest[:2], filename)
+
+    @staticmethod
+    def encode(table_df: pd.DataFrame) -> pa.Table:
+        """Encode an extracted table to an Arrow table. The columns are
+        stored by their positions, as their names aren't unique or
+        strings, and the (text, link) cells as a column of texts and
+        a column of links.
+
+        :param table_df: An extracted table.
+        :raises pa.ArrowException: If a column can't be stored.
+        :return: Arrow table.
+        """
+        arrays = {}
+        links = []
+
+        for idx, (_, column) in enumerate(table_df.items()):
+            if len(column) and all(
+                isinstance(value, tuple) for value in column
+            ):
+                texts, hrefs = zip(*column, strict=True)
+
+                arrays[str(idx)] = pa.array(texts, type=pa.string())
+                arrays[f"{idx}{TableCacheConstants.LINK_SUFFIX}"] = pa.array(
+                    hrefs, type=pa.string()
+                )
+                links.append(idx)
+            else:
+                arrays[str(idx)] = pa.array(column, from_pandas=True)
+
+        table = pa.table(arrays).replace_schema_metadata(
+            {
+                TableCacheConstants.COLUMNS_METADATA_KEY: json.dumps(
+                    list(table_df.columns)
+                ),
+                TableCacheConstants.LINKS_METADATA_KEY: json.dumps(links),
+            }
+        )
+
+        return table
+
+    @staticmethod
+    def decode(table: pa.Table) -> pd.DataFrame:
+        """Decode an Arrow table of `encode` to the extracted table.
+
+        :param table: Arrow table.
+        :return: Extracted table.
+        """
+        metadata = table.schema.metadata
+        names = json.loads(metadata[TableCacheConstants.COLUMNS_METADATA_KEY])
+        links = set(
+            json.loads(metadata[TableCacheConstants.LINKS_METADATA_KEY])
+        )
+
+        columns = {}
+
+        for idx in range(len(names)):
+            values = table.column(str(idx)).to_pandas()
+
+            if idx in links:
+                hrefs = table.column(
+                    f"{idx}{TableCacheConstants.LINK_SUFFIX}"
+                ).to_pylist()
+                values = pd.Series(
+                    list(zip(values.tolist(), hrefs, strict=True)),
+                    dtype="object",
+                )
+
+            columns[idx] = values
+
+        table_df = pd.DataFrame(columns, index=pd.RangeIndex(table.num_rows))
+        # The names of the multi-level columns are stored as lists.
+        table_df.columns = [
+            tuple(name) if isinstance(name, list) else name for name in names
+        ]
+
+        return table_df
+
+    def read(self, filepath: Path) -> pd.DataFrame | None:
+        """Read a cached table.
+
+        :param filepath: Filepath of the table.
+        :return: Extracted table, or None if it isn't cached.
+        """
+        try:
+            with pa.memory_map(str(filepath), "r") as source:
+                table = pa.ipc.open_file(source).read_all()
+        except (FileNotFoundError, pa.ArrowInvalid):
+            return None
+
+        return self.decode(table=table)
+
+    def write(self, table_df: pd.DataFrame, *, filepath: Path) -> None:
+        """Write a table to the cache. The tables whose columns can't
+        be stored (e.g. mixed values) aren't cached.
+
+        :param table_df: Extracted table.
+        :param filepath: Filepath of the table.
+        :return: None.
+        """
+        try:
+            table = self.encode(table_df=table_df)
+        except (pa.ArrowException, TypeError, ValueError):
+            return
+
+        os.makedirs(filepath.parent, exist_ok=True)
+
+        temp_filepath = filepath.with_suffix(f".{os.getpid()}.tmp")
+
+        with pa.OSFile(str(temp_filepath), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+        # The table is replaced at once, so the concurrent readers
+        # never see a partial one.
+        os.replace(temp_filepath, filepath)
+
+    def count(self, counter: str) -> None:
+        """Increment a counter of the cache and of the current stage.
+
+        :param counter: A name of the counter (e.g. `hits`).
+        :return: None.
+        """
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+        metrics.increment(TableCacheConstants.COUNTERS[counter])
+
+    def get_counters(self) -> dict[str, int]:
+        """Get the counters of the cache by the counters of the stages.
+
+        :return: Counters (e.g. `{"table_cache_hits": 17, ...}`).
+        """
+        counters = {
+            stage_counter: getattr(self, counter)
+            for counter, stage_counter in (
+                TableCacheConstants.COUNTERS.items()
+            )
+        }
+
+        return counters
@@ -0,0 +1,339 @@
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from common import metrics
+from common.constants import (
+    BaseConstants,
+    LoggerConstants,
+    SeasonConstants,
+    ValidationConstants,
+)
+from common.logger import init_logger
+
+init_logger(logger_name=LoggerConstants.TABLE_VALIDATOR_LOGGER_NAME)
+logger = logging.getLogger(name=LoggerConstants.TABLE_VALIDATOR_LOGGER_NAME)
+
+
+class TableValidator:
+    """A class to check the extracted tables before they're saved: the
+    data types of the schema, the ranges of the values, the ratios of
+    the missing values of each page, and the seasons of the seasons
+    table. The checks are run on whole columns, and the pages that
+    fail them are quarantined by the index of the rows (see
+    `ValidationConstants.SOURCE`), without reading the pages again.
+
+    :param quarantine_folder: A folder to move the bad pages to.
+    :param report_filepath: A filepath of the report of the checks.
+    :param quarantine: Whether the bad pages are quarantined.
+    """
+
+    def __init__(
+        self,
+        quarantine_folder: Path = ValidationConstants.QUARANTINE_FOLDER,
+        *,
+        report_filepath: Path = ValidationConstants.REPORT_FILEPATH,
+        quarantine: bool = ValidationConstants.QUARANTINE,
+    ) -> None:
+        """Construct all attributes for the `TableValidator` object.
+
+        :param quarantine_folder: A folder to move the bad pages to.
+        :param report_filepath: A filepath of the report of the checks.
+        :param quarantine: Whether the bad pages are quarantined.
+        """
+        self.quarantine_folder = quarantine_folder
+        self.report_filepath = report_filepath
+        self.quarantine = quarantine
+        # Reports of the tables validated in the run by their names.
+        self.reports: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_mismatched_columns(
+        table_df: pd.DataFrame, *, schema: pa.Schema
+    ) -> dict[str, str]:
+        """Get the columns of the schema that are missing from the table
+        or have another data type (e.g. the columns that aren't cast).
+
+        :param table_df: A table to check.
+        :param schema: Arrow schema of the table.
+        :return: Data types of the mismatched columns by their names.
+        """
+        # The data types are inferred from the dtypes of the columns.
+        types = pa.Schema.from_pandas(table_df.head(0), preserve_index=False)
+        mismatched_columns = {}
+
+        for field in schema:
+            if field.name not in types.names:
+                mismatched_columns[field.name] = "missing"
+
+                continue
+
+            data_type = types.field(field.name).type
+            matches = (
+                pa.types.is_dictionary(data_type)
+                if pa.types.is_dictionary(field.type)
+                else data_type == field.type
+            )
+
+            if not matches:
+                mismatched_columns[field.name] = str(data_type)
+
+        return mismatched_columns
+
+    @staticmethod
+    def get_out_of_range_rows(table_df: pd.DataFrame) -> pd.DataFrame:
+        """Get the rows whose values are out of their ranges (see
+        `ValidationConstants.RANGES`).
+
+        :param table_df: A table to check.
+        :return: Masks of the rows by the checked columns.
+        """
+        masks = {}
+
+        for column, (low, high) in ValidationConstants.RANGES.items():
+            if column not in table_df.columns:
+                continue
+
+            values = table_df[column].to_numpy("float64", na_value=np.nan)
+            # The missing values are compared as False.
+            mask = np.zeros(len(values), dtype=bool)
+
+            if low is not None:
+                mask |= values < low
+
+            if high is not None:
+                mask |= values > high
+
+            masks[column] = mask
+
+        return pd.DataFrame(masks, index=table_df.index)
+
+    @staticmethod
+    def get_null_ratios(table_df: pd.DataFrame) -> pd.DataFrame:
+        """Get the ratios of the missing values of each page (see
+        `ValidationConstants.MAX_NULL_RATIOS`).
+
+        :param table_df: A table to check, indexed by the pages.
+        :return: Ratios of the missing values by the pages and columns.
+        """
+        columns = [
+            column
+            for column in ValidationConstants.MAX_NULL_RATIOS
+            if column in table_df.columns
+        ]
+
+        null_ratios = (
+            table_df[columns].isna().groupby(level=0, observed=True).mean()
+        )
+
+        return null_ratios
+
+    @staticmethod
+    def read_seasons_years() -> np.ndarray | None:
+        """Read the years of the seasons of the seasons table.
+
+        :return: Years, or None if the table doesn't exist.
+        """
+        if not os.path.exists(SeasonConstants.PROCESSED_FILEPATH):
+            return None
+
+        seasons = pd.read_parquet(
+            SeasonConstants.PROCESSED_FILEPATH,
+            engine="pyarrow",
+            columns=["season"],
+        )["season"].astype("string")
+
+        # E.g. `2024-25` -> `2025`.
+        years = pd.to_numeric(seasons.str[:4], errors="coerce") + 1
+
+        return years.dropna().astype("int64").unique()
+
+    def check_seasons(
+        self, table_df: pd.DataFrame, *, years: set[int] | None
+    ) -> dict[str, list[int]]:
+        """Check whether the table has the rows of the seasons of the
+        seasons table, and whether a season has much fewer rows per
+        team than the others (e.g. of the pages that failed to be
+        fetched).
+
+        :param table_df: A table to check.
+        :param years: Season years of the table (all years if not
+            specified).
+        :return: Missing and incomplete years.
+        """
+        seasons_years = self.read_seasons_years()
+
+        if seasons_years is None:
+            return {}
+
+        # An empty table (e.g. of the stats that no page has) has no
+        # columns.
+        table_years = (
+            table_df["year"].astype("float64")
+            if "year" in table_df.columns
+            else pd.Series(dtype="float64")
+        )
+
+        if years is not None:
+            expected_years = seasons_years[np.isin(seasons_years, list(years))]
+        elif table_years.notna().any():
+            # The tables of some stats start at later seasons.
+            expected_years = seasons_years[seasons_years >= table_years.min()]
+        else:
+            expected_years = seasons_years
+
+        missing_years = np.setdiff1d(expected_years, table_years.dropna())
+        incomplete_years = []
+
+        if "team" in table_df.columns and table_years.notna().any():
+            seasons = table_df.groupby(table_years, observed=True)
+            rows_per_team = seasons.size() / seasons["team"].nunique()
+            incomplete_years = rows_per_team.index[
+                rows_per_team
+                < ValidationConstants.MIN_SEASON_ROWS_RATIO
+                * rows_per_team.median()
+            ]
+
+        return {
+            "missing_years": [int(year) for year in missing_years],
+            "incomplete_years": [int(year) for year in incomplete_years],
+        }
+
+    def quarantine_sources(self, sources: list[str]) -> None:
+        """Move the pages to the quarantine folder, so they're fetched
+        again by the next run. The pages in the segments (see
+        `RawSegmentConstants`) are kept, as they can't be removed.
+
+        :param sources: Pages relative to the raw folder (e.g.
+            `teams/bos-2025.html`).
+        :return: None.
+        """
+        for source in sources:
+            filepath = BaseConstants.RAW_FOLDER.joinpath(source)
+
+            if not os.path.exists(filepath):
+                continue
+
+            quarantine_filepath = self.quarantine_folder.joinpath(source)
+
+            os.makedirs(quarantine_filepath.parent, exist_ok=True)
+            os.replace(filepath, quarantine_filepath)
+
+    def save_report(self, name: str, *, report: dict) -> None:
+        """Save the report of a table with the reports of the other
+        tables validated in the run.
+
+        :param name: A name of the table.
+        :param report: A report of the checks of the table.
+        :return: None.
+        """
+        with self._lock:
+            self.reports[name] = report
+
+            os.makedirs(self.report_filepath.parent, exist_ok=True)
+
+            with open(self.report_filepath, mode="w", encoding="utf-8") as f:
+                json.dump(self.reports, f, indent=2)
+
+    def validate(
+        self,
+        table_df: pd.DataFrame,
+        *,
+        name: str,
+        schema: pa.Schema,
+        years: set[int] | None = None,
+    ) -> pd.DataFrame:
+        """Validate a table, and quarantine the pages that fail the
+        checks of their rows (the ranges and missing values). The
+        checks of the whole table (the schema and seasons) are only
+        reported.
+
+        :param table_df: A table to validate.
+        :param name: A name of the table (e.g. `rosters`).
+        :param schema: Arrow schema of the table.
+        :param years: Season years of the table (all years if not
+            specified).
+        :return: Table without the rows of the quarantined pages.
+        """
+        out_of_range_df = self.get_out_of_range_rows(table_df)
+        bad_sources = []
+        null_ratios = {}
+
+        # Only the tables of `process_files` are indexed by the pages.
+        if table_df.index.name == ValidationConstants.SOURCE:
+            null_ratios_df = self.get_null_ratios(table_df)
+            max_null_ratios = pd.Series(ValidationConstants.MAX_NULL_RATIOS)
+            out_of_range = out_of_range_df.any(axis=1).to_numpy()
+            too_many_nulls = null_ratios_df.gt(
+                max_null_ratios[null_ratios_df.columns]
+            ).any(axis=1)
+
+            bad_sources = sorted(
+                {
+                    *table_df.index[out_of_range].unique(),
+                    *null_ratios_df.index[too_many_nulls],
+                }
+            )
+            null_ratios = null_ratios_df.max().round(3).to_dict()
+
+        report = {
+            "rows": len(table_df),
+            "mismatched_columns": self.get_mismatched_columns(
+                table_df, schema=schema
+            ),
+            "out_of_range": {
+                column: int(count)
+                for column, count in out_of_range_df.sum().items()
+                if count
+            },
+            "max_null_ratios": {
+                column: ratio for column, ratio in null_ratios.items() if ratio
+            },
+            **(
+                self.check_seasons(table_df, years=years)
+                if "year" in schema.names
+                else {}
+            ),
+            "failed_sources": bad_sources,
+            "quarantined_rows": 0,
+        }
+
+        if self.quarantine and bad_sources:
+            bad_rows = table_df.index.isin(bad_sources)
+            table_df = table_df[~bad_rows]
+
+            self.quarantine_sources(sources=bad_sources)
+
+            report["quarantined_rows"] = int(bad_rows.sum())
+
+            metrics.increment("files_quarantined", len(bad_sources))
+            metrics.increment("rows_quarantined", int(bad_rows.sum()))
+
+        # Only the failed checks are kept, so the report is compact.
+        report = {
+            check: value
+            for check, value in report.items()
+            if value or check == "rows"
+        }
+
+        if len(report) > 1:
+            failed_checks = ", ".join(
+                check for check in report if check != "rows"
+            )
+
+            logger.warning(
+                msg=f"`{name}` has failed the checks ({failed_checks}), "
+                f"{len(bad_sources)} pages have failed. See "
+                f"`{self.report_filepath.name}` for details."
+            )
+
+        self.save_report(name, report=report)
+
+        return table_df
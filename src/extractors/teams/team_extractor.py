@@ -1,6 +1,7 @@
 import bs4
 
 from common.constants import BaseConstants, TeamConstants, LeagueConstants
+from common.url_registry import UrlRegistry
 from extractors.base_extractor import BaseExtractor
 
 
@@ -9,15 +10,20 @@ class TeamExtractor(BaseExtractor):
 
     :param header: An index of the table columns.
     :param index: An index of the table to extract data from.
+    :param years: Season years to extract (all years if not specified).
     """
 
-    def __init__(self, header: int = 1, index: int = 0) -> None:
+    def __init__(
+        self, header: int = 1, index: int = 0, years: set[int] | None = None
+    ) -> None:
         """Construct all attributes for the `TeamExtractor` object.
 
         :param header: An index of the table columns.
         :param index: An index of the table to extract data from.
+        :param years: Season years to extract (all years if not
+            specified).
         """
-        super().__init__(header=header)
+        super().__init__(header=header, years=years)
         self.index = index
 
     @staticmethod
@@ -29,10 +35,18 @@ class TeamExtractor(BaseExtractor):
         :param selector: CSS selector of the search value.
         :return: URLs of the teams.
         """
-        season_teams_urls = [
-            BaseConstants.URL + href.attrs.get("href")
-            for href in soup.select(selector=selector)
-        ]
+        teams_urls = {}
+
+        # The same team can be linked from several tables of the page,
+        # so the URLs are kept once by their canonical form.
+        for href in soup.select(selector=selector):
+            team_url = BaseConstants.URL + href.attrs.get("href")
+
+            teams_urls.setdefault(
+                UrlRegistry.canonicalize(url=team_url), team_url
+            )
+
+        season_teams_urls = list(teams_urls.values())
 
         return season_teams_urls
 
@@ -45,7 +59,9 @@ class TeamExtractor(BaseExtractor):
             LeagueConstants.LEAGUES_FOLDER
         )
 
-        filepaths = self.get_filepaths(base_folder=base_folder)
+        filepaths = self.get_filepaths(
+            base_folder=base_folder, years=self.years
+        )
 
         teams_urls = {}
 
@@ -53,8 +69,8 @@ class TeamExtractor(BaseExtractor):
             season, _ = self.extract_season_league(filepath=filepath)
             season_year = self.get_season_year(season=season)
 
-            html_data = self.read_html(filepath=filepath)
-            soup = self.get_soup(html_data=html_data)
+            with self.map_html(filepath=filepath) as html_data:
+                soup = self.get_soup(html_data=html_data)
 
             season_teams_urls = self.get_season_teams_urls(
                 soup=soup, selector=TeamConstants.TEAM_HREF_SELECTOR
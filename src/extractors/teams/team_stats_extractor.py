@@ -1,8 +1,16 @@
+import re
 from pathlib import Path
 
+import bs4
 import pandas as pd
-
-from common.constants import BaseConstants, TeamConstants, TeamStatsConstants
+import pyarrow as pa
+
+from common.constants import (
+    BaseConstants,
+    SchemaConstants,
+    TeamConstants,
+    TeamStatsConstants,
+)
 from extractors.base_extractor import BaseExtractor
 
 
@@ -10,14 +18,19 @@ class TeamStatsExtractor(BaseExtractor):
     """A class to extract data for teams stats.
 
     :param header: An index of the table columns.
+    :param years: Season years to extract (all years if not specified).
     """
 
-    def __init__(self, header: int = 0) -> None:
+    document_variant = "uncommented"
+
+    def __init__(self, header: int = 0, years: set[int] | None = None) -> None:
         """Construct all attributes for the `TeamStatsExtractor` object.
 
         :param header: An index of the table columns.
+        :param years: Season years to extract (all years if not
+            specified).
         """
-        super().__init__(header=header)
+        super().__init__(header=header, years=years)
 
     @staticmethod
     def extract_team_year(filename: str) -> tuple[str, str]:
@@ -46,7 +59,9 @@ class TeamStatsExtractor(BaseExtractor):
             TeamConstants.TEAMS_FOLDER
         )
 
-        filepaths = self.get_filepaths(base_folder=base_folder)
+        filepaths = self.get_filepaths(
+            base_folder=base_folder, years=self.years
+        )
 
         teams_filepaths = [
             team_filepath
@@ -56,6 +71,92 @@ class TeamStatsExtractor(BaseExtractor):
 
         return teams_filepaths
 
+    def parse_document(self, filepath: Path) -> bs4.BeautifulSoup:
+        """Parse a page of the specified filepath without the comment
+        markers.
+
+        :param filepath: Filepath of the HTML data.
+        :return: A parsed page.
+        """
+        # Some of the tables we want to get from the HTML data are
+        # in the comments. We need to remove them to get the data. The
+        # markers are removed from the mapped bytes in one pass, so the
+        # page is copied once and isn't decoded before parsing.
+        with self.map_html(filepath=filepath) as buffer:
+            html_data = re.sub(TeamStatsConstants.COMMENT_PATTERN, b"", buffer)
+
+        soup = self.get_soup(html_data=html_data)
+
+        return soup
+
+    @staticmethod
+    def parse_heights(heights: pd.Series) -> pd.Series:
+        """Parse heights in feet and inches to inches. The heights are
+        split by whole columns, and the heights in inches already (e.g.
+        of the merged rosters) are kept.
+
+        Examples:
+
+            - `6-11` -> `83`.
+            - `7-0` -> `84`.
+
+        :param heights: Heights to parse.
+        :return: Heights in inches.
+        """
+        parts = heights.astype("string").str.partition(
+            TeamStatsConstants.HEIGHT_SEPARATOR
+        )
+        feet = pd.to_numeric(parts[0], errors="coerce")
+        inches = pd.to_numeric(parts[2], errors="coerce")
+
+        heights = (feet * TeamStatsConstants.INCHES_PER_FOOT + inches).where(
+            parts[1] == TeamStatsConstants.HEIGHT_SEPARATOR, feet
+        )
+
+        return heights
+
+    @staticmethod
+    def parse_birth_dates(birth_dates: pd.Series) -> pd.Series:
+        """Parse birth dates (e.g. `March 2, 1995`) with the format of
+        the pages, or as ISO dates (e.g. of the merged rosters).
+
+        :param birth_dates: Birth dates to parse.
+        :return: Birth dates.
+        """
+        birth_dates = birth_dates.astype("string")
+
+        parsed_birth_dates = pd.to_datetime(
+            birth_dates,
+            format=TeamStatsConstants.BIRTH_DATE_FORMAT,
+            errors="coerce",
+        ).fillna(
+            pd.to_datetime(
+                birth_dates,
+                format=TeamStatsConstants.ISO_DATE_FORMAT,
+                errors="coerce",
+            )
+        )
+
+        return parsed_birth_dates
+
+    def cast_table(
+        self, table_df: pd.DataFrame, *, schema: pa.Schema
+    ) -> pd.DataFrame:
+        """Cast columns of the table to the specified schema. The
+        heights and birth dates of the rosters are parsed first.
+
+        :param table_df: A table to cast.
+        :param schema: Arrow schema of the table.
+        :return: Cast table.
+        """
+        if schema is SchemaConstants.ROSTERS_SCHEMA:
+            table_df = table_df.assign(
+                height=self.parse_heights(table_df["height"]),
+                birth_date=self.parse_birth_dates(table_df["birth_date"]),
+            )
+
+        return super().cast_table(table_df=table_df, schema=schema)
+
     def get_stats_df(
         self,
         team_filepath: Path,
@@ -72,14 +173,6 @@ class TeamStatsExtractor(BaseExtractor):
         """
         team_filename = team_filepath.name
 
-        # Some of the tables we want to get from the HTML data are
-        # in the comments. We need to remove them to get the data.
-        html_data = (
-            self.read_html(filepath=team_filepath)
-            .replace("<!--", "")
-            .replace("-->", "")
-        )
-
         team, season_year = self.extract_team_year(filename=team_filename)
         season = self.get_season(year_txt=season_year)
 
@@ -97,10 +190,15 @@ class TeamStatsExtractor(BaseExtractor):
         ):
             header = TeamStatsConstants.ADJUSTED_SHOOTING_STATS_HEADER
 
-        stats_df = self.get_table_df_by_id(
-            html_data=html_data,
+        # The links are extracted to identify the players by their
+        # slugs instead of names, which aren't unique. The page is
+        # parsed once for all stats tables (if it's kept in the cache
+        # of the worker until the next table).
+        stats_df = self.get_table_df(
+            filepath=team_filepath,
             _id=stats_id,
             header=header,
+            extract_links="body",
         )
 
         stats_df = self.rename_columns(
@@ -108,6 +206,8 @@ class TeamStatsExtractor(BaseExtractor):
             columns_map=columns_map,
         )
 
+        stats_df = self.split_links(table_df=stats_df)
+
         # At the end of each table we have the average stats for
         # all players. We don't want to have that row and will
         # filter it out. There is no `rank` column in the `roster`
@@ -135,8 +235,8 @@ class TeamStatsExtractor(BaseExtractor):
             columns_map=TeamStatsConstants.ROSTER_COLUMNS_MAP,
         )
 
-        rosters_df = rosters_df.astype(
-            dtype=TeamStatsConstants.ROSTER_DATA_TYPES_MAP
+        rosters_df = self.cast_table(
+            table_df=rosters_df, schema=SchemaConstants.ROSTERS_SCHEMA
         )
 
         return rosters_df
@@ -155,6 +255,11 @@ class TeamStatsExtractor(BaseExtractor):
             columns_map=TeamStatsConstants.STATS_COLUMNS_MAP,
         )
 
+        regular_season_per_game_stats_df = self.cast_table(
+            table_df=regular_season_per_game_stats_df,
+            schema=SchemaConstants.PER_GAME_STATS_SCHEMA,
+        )
+
         return regular_season_per_game_stats_df
 
     def get_playoffs_per_game_stats_df(self) -> pd.DataFrame:
@@ -171,6 +276,11 @@ class TeamStatsExtractor(BaseExtractor):
             filepaths=teams_filepaths,
         )
 
+        playoffs_per_game_stats_df = self.cast_table(
+            table_df=playoffs_per_game_stats_df,
+            schema=SchemaConstants.PER_GAME_STATS_SCHEMA,
+        )
+
         return playoffs_per_game_stats_df
 
     def get_regular_season_total_stats_df(self) -> pd.DataFrame:
@@ -187,6 +297,11 @@ class TeamStatsExtractor(BaseExtractor):
             filepaths=teams_filepaths,
         )
 
+        regular_season_total_stats_df = self.cast_table(
+            table_df=regular_season_total_stats_df,
+            schema=SchemaConstants.TOTAL_STATS_SCHEMA,
+        )
+
         return regular_season_total_stats_df
 
     def get_playoffs_total_stats_df(self) -> pd.DataFrame:
@@ -203,6 +318,11 @@ class TeamStatsExtractor(BaseExtractor):
             filepaths=teams_filepaths,
         )
 
+        playoffs_total_stats_df = self.cast_table(
+            table_df=playoffs_total_stats_df,
+            schema=SchemaConstants.TOTAL_STATS_SCHEMA,
+        )
+
         return playoffs_total_stats_df
 
     def get_regular_season_per_36_minutes_stats_df(self) -> pd.DataFrame:
@@ -219,6 +339,11 @@ class TeamStatsExtractor(BaseExtractor):
             filepaths=teams_filepaths,
         )
 
+        regular_season_per_36_minutes_stats_df = self.cast_table(
+            table_df=regular_season_per_36_minutes_stats_df,
+            schema=SchemaConstants.PER_36_MINUTES_STATS_SCHEMA,
+        )
+
         return regular_season_per_36_minutes_stats_df
 
     def get_playoffs_per_36_minutes_stats_df(self) -> pd.DataFrame:
@@ -235,6 +360,11 @@ class TeamStatsExtractor(BaseExtractor):
             filepaths=teams_filepaths,
         )
 
+        playoffs_per_36_minutes_stats_df = self.cast_table(
+            table_df=playoffs_per_36_minutes_stats_df,
+            schema=SchemaConstants.PER_36_MINUTES_STATS_SCHEMA,
+        )
+
         return playoffs_per_36_minutes_stats_df
 
     def get_regular_season_per_100_possessions_stats_df(self) -> pd.DataFrame:
@@ -251,6 +381,11 @@ class TeamStatsExtractor(BaseExtractor):
             filepaths=teams_filepaths,
         )
 
+        regular_season_per_100_possessions_stats_df = self.cast_table(
+            table_df=regular_season_per_100_possessions_stats_df,
+            schema=SchemaConstants.PER_100_POSSESSIONS_STATS_SCHEMA,
+        )
+
         return regular_season_per_100_possessions_stats_df
 
     def get_playoffs_per_100_possessions_stats_df(self) -> pd.DataFrame:
@@ -267,6 +402,11 @@ class TeamStatsExtractor(BaseExtractor):
             filepaths=teams_filepaths,
         )
 
+        playoffs_per_100_possessions_stats_df = self.cast_table(
+            table_df=playoffs_per_100_possessions_stats_df,
+            schema=SchemaConstants.PER_100_POSSESSIONS_STATS_SCHEMA,
+        )
+
         return playoffs_per_100_possessions_stats_df
 
     def get_regular_season_advanced_stats_df(self) -> pd.DataFrame:
@@ -283,6 +423,11 @@ class TeamStatsExtractor(BaseExtractor):
             filepaths=teams_filepaths,
         )
 
+        regular_season_advanced_stats_df = self.cast_table(
+            table_df=regular_season_advanced_stats_df,
+            schema=SchemaConstants.ADVANCED_STATS_SCHEMA,
+        )
+
         return regular_season_advanced_stats_df
 
     def get_playoffs_advanced_stats_df(self) -> pd.DataFrame:
@@ -299,6 +444,11 @@ class TeamStatsExtractor(BaseExtractor):
             filepaths=teams_filepaths,
         )
 
+        playoffs_advanced_stats_df = self.cast_table(
+            table_df=playoffs_advanced_stats_df,
+            schema=SchemaConstants.ADVANCED_STATS_SCHEMA,
+        )
+
         return playoffs_advanced_stats_df
 
     def get_regular_season_adjusted_shooting_stats_df(self) -> pd.DataFrame:
@@ -315,6 +465,11 @@ class TeamStatsExtractor(BaseExtractor):
             filepaths=teams_filepaths,
         )
 
+        regular_season_adjusted_shooting_stats_df = self.cast_table(
+            table_df=regular_season_adjusted_shooting_stats_df,
+            schema=SchemaConstants.ADJUSTED_SHOOTING_STATS_SCHEMA,
+        )
+
         return regular_season_adjusted_shooting_stats_df
 
     def get_playoffs_adjusted_shooting_stats_df(self) -> pd.DataFrame:
@@ -331,6 +486,11 @@ class TeamStatsExtractor(BaseExtractor):
             filepaths=teams_filepaths,
         )
 
+        playoffs_adjusted_shooting_stats_df = self.cast_table(
+            table_df=playoffs_adjusted_shooting_stats_df,
+            schema=SchemaConstants.ADJUSTED_SHOOTING_STATS_SCHEMA,
+        )
+
         return playoffs_adjusted_shooting_stats_df
 
     def get_regular_season_shooting_stats_df(self) -> pd.DataFrame:
@@ -347,6 +507,11 @@ class TeamStatsExtractor(BaseExtractor):
             filepaths=teams_filepaths,
         )
 
+        regular_season_shooting_stats_df = self.cast_table(
+            table_df=regular_season_shooting_stats_df,
+            schema=SchemaConstants.SHOOTING_STATS_SCHEMA,
+        )
+
         return regular_season_shooting_stats_df
 
     def get_playoffs_shooting_stats_df(self) -> pd.DataFrame:
@@ -363,6 +528,11 @@ class TeamStatsExtractor(BaseExtractor):
             filepaths=teams_filepaths,
         )
 
+        playoffs_season_shooing_stats_df = self.cast_table(
+            table_df=playoffs_season_shooing_stats_df,
+            schema=SchemaConstants.SHOOTING_STATS_SCHEMA,
+        )
+
         return playoffs_season_shooing_stats_df
 
     def get_regular_season_play_by_play_stats_df(self) -> pd.DataFrame:
@@ -379,6 +549,11 @@ class TeamStatsExtractor(BaseExtractor):
             filepaths=teams_filepaths,
         )
 
+        regular_season_play_by_play_stats_df = self.cast_table(
+            table_df=regular_season_play_by_play_stats_df,
+            schema=SchemaConstants.PLAY_BY_PLAY_STATS_SCHEMA,
+        )
+
         return regular_season_play_by_play_stats_df
 
     def get_playoffs_play_by_play_stats_df(self) -> pd.DataFrame:
@@ -395,6 +570,11 @@ class TeamStatsExtractor(BaseExtractor):
             filepaths=teams_filepaths,
         )
 
+        playoffs_season_play_by_play_stats_df = self.cast_table(
+            table_df=playoffs_season_play_by_play_stats_df,
+            schema=SchemaConstants.PLAY_BY_PLAY_STATS_SCHEMA,
+        )
+
         return playoffs_season_play_by_play_stats_df
 
     def get_salaries_df(self) -> pd.DataFrame:
@@ -411,4 +591,8 @@ class TeamStatsExtractor(BaseExtractor):
             filepaths=teams_filepaths,
         )
 
+        salaries_df = self.cast_table(
+            table_df=salaries_df, schema=SchemaConstants.SALARIES_SCHEMA
+        )
+
         return salaries_df
@@ -0,0 +1,63 @@
+import importlib
+import threading
+from typing import Any
+
+
+class Lazy:
+    """A class to represent an object of the stages (e.g. a collector)
+    that is created when a stage uses it first. Its module is imported
+    only then, so a run doesn't import pandas, bs4, or boto3 for the
+    stages that aren't selected. The object is created once and shared
+    by the stages it's passed to.
+
+    :param path: A path of the class (e.g.
+        `uploader.uploader.Uploader`).
+    :param kwargs: Keyword arguments to create the object with. Lazy
+        arguments are created first.
+    """
+
+    def __init__(self, path: str, **kwargs: Any) -> None:
+        """Construct all attributes for the `Lazy` object.
+
+        :param path: A path of the class.
+        :param kwargs: Keyword arguments to create the object with.
+        """
+        self.path = path
+        self.kwargs = kwargs
+        self._obj = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def resolve(value: Any) -> Any:
+        """Get the object of a lazy value, or the value itself.
+
+        :param value: A value (e.g. a stage argument).
+        :return: Object.
+        """
+        if isinstance(value, Lazy):
+            return value.get()
+
+        return value
+
+    def get(self) -> Any:
+        """Get the object, creating it first if needed.
+
+        :return: Object.
+        """
+        # The stages run in threads, so the object is created once.
+        with self._lock:
+            if self._obj is None:
+                module_name, _, class_name = self.path.rpartition(".")
+                cls = getattr(importlib.import_module(module_name), class_name)
+
+                self._obj = cls(
+                    **{
+                        name: self.resolve(value)
+                        for name, value in self.kwargs.items()
+                    }
+                )
+
+            return self._obj
+
+    def __repr__(self) -> str:
+        return f"Lazy({self.path!r})"
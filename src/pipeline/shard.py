@@ -0,0 +1,121 @@
+import argparse
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+from common.constants import PipelineConstants
+
+
+@dataclass(frozen=True)
+class Shard:
+    """A class to represent a shard of a run that is split across
+    several tasks. Each shard collects and extracts some of the season
+    years and saves partial tables, which are merged once all shards
+    are completed.
+
+    The shards get consecutive years, so the careers of the players
+    rarely span several shards.
+
+    :param index: An index of the shard (from 0).
+    :param count: A number of the shards.
+    """
+
+    index: int
+    count: int
+
+    def __post_init__(self) -> None:
+        """Validate the shard.
+
+        :raises ValueError: If the index or count is invalid.
+        :return: None.
+        """
+        if not 0 <= self.index < self.count:
+            raise ValueError(
+                f"An index of the shard must be in a range "
+                f"[0, {self.count}), got `{self.index}`."
+            )
+
+    @classmethod
+    def parse(cls, value: str) -> "Shard":
+        """Parse a shard from the command line (e.g. `0/4`).
+
+        :param value: A value to parse.
+        :raises argparse.ArgumentTypeError: If the value is invalid.
+        :return: A shard.
+        """
+        try:
+            index, count = value.split("/")
+
+            return cls(index=int(index), count=int(count))
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Invalid shard: `{value}`.")
+
+    @property
+    def suffix(self) -> str:
+        """Get a suffix of the partial tables of the shard.
+
+        :return: Suffix (e.g. `shard-0-of-4`).
+        """
+        return f"shard-{self.index}-of-{self.count}"
+
+    def get_filepath(self, filepath: Path) -> Path:
+        """Get a filepath of the partial table of the shard.
+
+        Examples:
+
+            - `rosters.parquet` -> `rosters.shard-0-of-4.parquet`.
+
+        :param filepath: A filepath of the table.
+        :return: A filepath of the partial table.
+        """
+        shard_filepath = filepath.with_name(
+            f"{filepath.stem}.{self.suffix}{filepath.suffix}"
+        )
+
+        return shard_filepath
+
+    def get_years(self, years: set[int]) -> set[int]:
+        """Get the season years of the shard.
+
+        :param years: Season years of the run.
+        :return: Season years of the shard.
+        """
+        sorted_years = sorted(years)
+
+        # The first shards get one more year if the years can't be
+        # split evenly.
+        size, remainder = divmod(len(sorted_years), self.count)
+        start = self.index * size + min(self.index, remainder)
+        end = start + size + (self.index < remainder)
+
+        return set(sorted_years[start:end])
+
+    @staticmethod
+    def get_table_filepath(filepath: Path) -> Path | None:
+        """Get a filepath of the table the partial table belongs to.
+
+        :param filepath: A filepath of the partial table.
+        :return: A filepath of the table, or None if the file isn't a
+            partial table.
+        """
+        match = re.fullmatch(
+            PipelineConstants.SHARD_SUFFIX_PATTERN, filepath.stem
+        )
+
+        if not match:
+            return None
+
+        return filepath.with_name(f"{match.group(1)}{filepath.suffix}")
+
+    @staticmethod
+    def get_index(filepath: Path) -> int:
+        """Get an index of the shard of the partial table.
+
+        :param filepath: A filepath of the partial table.
+        :return: Index (e.g. `10` of `rosters.shard-10-of-12.parquet`).
+        """
+        match = re.fullmatch(
+            PipelineConstants.SHARD_SUFFIX_PATTERN, filepath.stem
+        )
+
+        return int(match.group(2))
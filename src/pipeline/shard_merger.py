@@ -0,0 +1,121 @@
+import logging
+import os
+from collections import defaultdict
+from pathlib import Path
+
+import pandas as pd
+
+from common.constants import (
+    BaseConstants,
+    LoggerConstants,
+    PipelineConstants,
+    SchemaConstants,
+)
+from common.logger import init_logger
+from extractors.base_extractor import BaseExtractor
+from pipeline.shard import Shard
+
+init_logger(logger_name=LoggerConstants.SHARD_MERGER_LOGGER_NAME)
+logger = logging.getLogger(name=LoggerConstants.SHARD_MERGER_LOGGER_NAME)
+
+
+class ShardMerger(BaseExtractor):
+    """A class to merge the partial tables of the shards into the
+    processed tables.
+    """
+
+    def __init__(self) -> None:
+        """Construct all attributes for the `ShardMerger` object."""
+        super().__init__()
+        self.merged_filepaths: list[Path] = []
+
+    @staticmethod
+    def get_shards_filepaths() -> dict[Path, list[Path]]:
+        """Get filepaths of the partial tables by the tables, in the
+        order of the shards (e.g. `shard-2` before `shard-10`).
+
+        :return: Filepaths of the partial tables.
+        """
+        shards_filepaths = defaultdict(list)
+
+        for filepath in sorted(
+            BaseConstants.PROCESSED_FOLDER.glob("*/*.parquet")
+        ):
+            table_filepath = Shard.get_table_filepath(filepath=filepath)
+
+            if table_filepath:
+                shards_filepaths[table_filepath].append(filepath)
+
+        for filepaths in shards_filepaths.values():
+            filepaths.sort(key=Shard.get_index)
+
+        return shards_filepaths
+
+    def merge_shards(
+        self, table_filepath: Path, *, filepaths: list[Path]
+    ) -> pd.DataFrame:
+        """Merge the partial tables of the shards with the existing
+        table. The rows that several shards extracted (e.g. of the
+        players whose careers span several shards) are kept once, from
+        the last of the shards, by the keys of the table (see
+        `SchemaConstants.MERGE_KEYS`, the extracted values may differ
+        between the shards, e.g. a career that's updated in between).
+
+        :param table_filepath: A filepath of the table.
+        :param filepaths: Filepaths of the partial tables.
+        :return: Merged table.
+        """
+        keys = list(SchemaConstants.MERGE_KEYS[table_filepath])
+        shards_dfs = [
+            pd.read_parquet(filepath, engine="pyarrow")
+            for filepath in filepaths
+        ]
+        table_df = pd.concat(
+            [
+                shard_df.assign(**{PipelineConstants.SHARD_COLUMN: idx})
+                for idx, shard_df in enumerate(shards_dfs)
+            ],
+            ignore_index=True,
+        )
+
+        # All rows of a key come from the last shard that extracted it.
+        last_shards = table_df.groupby(keys, dropna=False, observed=True)[
+            PipelineConstants.SHARD_COLUMN
+        ].transform("max")
+        table_df = table_df.loc[
+            table_df[PipelineConstants.SHARD_COLUMN] == last_shards
+        ].drop(columns=PipelineConstants.SHARD_COLUMN)
+        table_df = table_df.reset_index(drop=True)
+
+        if os.path.exists(table_filepath):
+            return self.replace_rows(
+                table_df=table_df, filepath=table_filepath
+            )
+
+        table_df = self.cast_table(
+            table_df=table_df, schema=SchemaConstants.SCHEMAS[table_filepath]
+        )
+
+        return table_df
+
+    def merge(self) -> None:
+        """Merge the partial tables of all shards and remove them.
+
+        :return: None.
+        """
+        for table_filepath, filepaths in self.get_shards_filepaths().items():
+            table_df = self.merge_shards(
+                table_filepath=table_filepath, filepaths=filepaths
+            )
+
+            self.save_table(table_df=table_df, filepath=table_filepath)
+
+            for filepath in filepaths:
+                os.remove(filepath)
+
+            self.merged_filepaths.extend(filepaths)
+
+            logger.info(
+                msg=f"{len(filepaths)} shards of `{table_filepath.name}` "
+                f"have been merged."
+            )
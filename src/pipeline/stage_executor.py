@@ -0,0 +1,188 @@
+import concurrent.futures
+import logging
+import os
+import time
+
+from common.constants import LoggerConstants, PipelineConstants
+from common.exceptions import StageError
+from common.logger import init_logger
+from pipeline.stage_graph import Stage, StageGraph
+
+init_logger(logger_name=LoggerConstants.STAGE_EXECUTOR_LOGGER_NAME)
+logger = logging.getLogger(name=LoggerConstants.STAGE_EXECUTOR_LOGGER_NAME)
+
+
+class StageExecutor:
+    """A class to run the stages of the graph concurrently.
+
+    A stage is started as soon as all its dependencies are completed
+    and there are enough resources (e.g. CPU cores, network
+    connections) for it within the budgets. The stages run in threads,
+    as they mostly wait for the network, S3, or their worker processes.
+    If a stage fails, no other stages are started, and the error is
+    raised once the running stages are completed.
+
+    :param graph: A graph of the stages to run.
+    :param budgets: Amounts of the resources available to the stages
+        at the same time (e.g. `{"cpu": 4, "network": 1}`).
+    """
+
+    def __init__(
+        self, graph: StageGraph, budgets: dict[str, int] | None = None
+    ) -> None:
+        """Construct all attributes for the `StageExecutor` object.
+
+        :param graph: A graph of the stages to run.
+        :param budgets: Amounts of the resources available to the
+            stages at the same time. The budgets from the environment
+            variables (e.g. `PIPELINE_CPU_BUDGET`) or the defaults are
+            used if not specified.
+        """
+        self.graph = graph
+        self.budgets = budgets or self.get_budgets()
+        self.durations: dict[str, float] = {}
+
+    @staticmethod
+    def get_budgets() -> dict[str, int]:
+        """Get the budgets of the resources from the environment
+        variables or the defaults.
+
+        :return: Budgets by the resources.
+        """
+        budgets = {
+            resource: int(
+                os.getenv(
+                    f"{PipelineConstants.BUDGET_ENV_PREFIX}"
+                    f"{resource.upper()}_BUDGET",
+                    budget,
+                )
+            )
+            for resource, budget in PipelineConstants.BUDGETS.items()
+        }
+
+        return budgets
+
+    def get_demand(self, stage: Stage) -> dict[str, int]:
+        """Get amounts of the resources the stage needs to start. The
+        demand is limited by the budgets, so a stage that needs more
+        than the budget still runs (alone).
+
+        :param stage: A stage to get the demand of.
+        :return: Amounts of the resources.
+        """
+        demand = {
+            resource: min(amount, self.budgets.get(resource, amount))
+            for resource, amount in stage.resources.items()
+        }
+
+        return demand
+
+    def can_start(self, stage: Stage, *, used: dict[str, int]) -> bool:
+        """Check whether there are enough resources to start the stage.
+
+        :param stage: A stage to check.
+        :param used: Amounts of the resources used by the running
+            stages.
+        :return: True if the stage can be started. Otherwise, False.
+        """
+        is_true = all(
+            used.get(resource, 0) + amount
+            <= self.budgets.get(resource, amount)
+            for resource, amount in self.get_demand(stage).items()
+        )
+
+        return is_true
+
+    def run_stage(self, stage: Stage) -> float:
+        """Run the stage and measure its duration.
+
+        :param stage: A stage to run.
+        :return: Duration (seconds) of the stage.
+        """
+        start = time.perf_counter()
+
+        stage.run()
+
+        return time.perf_counter() - start
+
+    def run(self) -> None:
+        """Run all stages of the graph.
+
+        :raises StageGraphError: If the graph is invalid.
+        :raises StageError: If a stage fails.
+        :return: None.
+        """
+        order = self.graph.get_order()
+
+        pending = list(order)
+        completed: set[str] = set()
+        used: dict[str, int] = {}
+        running: dict[concurrent.futures.Future, Stage] = {}
+        error: StageError | None = None
+
+        start = time.perf_counter()
+
+        max_workers = max(len(order), 1)
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="stage"
+        ) as executor:
+            while pending or running:
+                if error is None:
+                    # The stages are started in the topological order,
+                    # so the upstream stages take the resources first.
+                    for name in list(pending):
+                        stage = self.graph.stages[name]
+
+                        if not set(stage.dependencies) <= completed:
+                            continue
+
+                        if not self.can_start(stage, used=used):
+                            continue
+
+                        for resource, amount in self.get_demand(stage).items():
+                            used[resource] = used.get(resource, 0) + amount
+
+                        pending.remove(name)
+                        running[executor.submit(self.run_stage, stage)] = stage
+
+                        logger.info(msg=f"`{name}` stage has been started.")
+
+                if not running:
+                    break
+
+                done, _ = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+
+                for future in done:
+                    stage = running.pop(future)
+
+                    for resource, amount in self.get_demand(stage).items():
+                        used[resource] -= amount
+
+                    try:
+                        self.durations[stage.name] = future.result()
+                    except Exception as e:
+                        logger.error(msg=f"`{stage.name}` stage has failed.")
+
+                        error = error or StageError(stage=stage.name, e=e)
+
+                        continue
+
+                    completed.add(stage.name)
+
+        if error:
+            raise error
+
+        wall_seconds = time.perf_counter() - start
+        critical_path, critical_path_seconds = self.graph.get_critical_path(
+            durations=self.durations
+        )
+
+        logger.info(
+            msg=f"All stages have been completed in {wall_seconds:.1f}s "
+            f"(the sum of the stages is {sum(self.durations.values()):.1f}s, "
+            f"the critical path is {critical_path_seconds:.1f}s: "
+            f"{' -> '.join(critical_path)})."
+        )
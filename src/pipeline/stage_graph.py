@@ -0,0 +1,235 @@
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable
+
+from common.exceptions import StageGraphError
+from pipeline.lazy import Lazy
+
+
+@dataclass(frozen=True)
+class Stage:
+    """A class to represent a stage of the pipeline.
+
+    :param name: A name of the stage (e.g. `collect_seasons`).
+    :param func: A function of the stage.
+    :param kwargs: Keyword arguments to call the function with. Lazy
+        arguments are created when the stage is run.
+    :param dependencies: Names of the stages that must be completed
+        before the stage can be started.
+    :param resources: Amounts of the resources (e.g. `cpu`, `network`,
+        `upload`) the stage uses while running.
+    """
+
+    name: str
+    func: Callable
+    kwargs: dict[str, Any] = field(default_factory=dict)
+    dependencies: tuple[str, ...] = ()
+    resources: dict[str, int] = field(default_factory=dict)
+
+    def run(self) -> None:
+        """Run the stage.
+
+        :return: None.
+        """
+        self.func(
+            **{
+                name: Lazy.resolve(value)
+                for name, value in self.kwargs.items()
+            }
+        )
+
+
+class StageGraph:
+    """A class to represent the stages of the pipeline and the
+    dependencies between them as a directed acyclic graph (DAG).
+    """
+
+    def __init__(self) -> None:
+        """Construct all attributes for the `StageGraph` object."""
+        self.stages: dict[str, Stage] = {}
+
+    def add(
+        self,
+        func: Callable,
+        *,
+        dependencies: tuple[Callable, ...] = (),
+        resources: dict[str, int] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Add a stage to the graph. The stage is named after its
+        function.
+
+        :param func: A function of the stage.
+        :param dependencies: Functions of the stages that must be
+            completed before the stage can be started.
+        :param resources: Amounts of the resources the stage uses.
+        :param kwargs: Keyword arguments to call the function with.
+        :raises StageGraphError: If the stage is already in the graph.
+        :return: None.
+        """
+        name = func.__name__
+
+        if name in self.stages:
+            raise StageGraphError(f"`{name}` stage is already in the graph.")
+
+        self.stages[name] = Stage(
+            name=name,
+            func=func,
+            kwargs=kwargs,
+            dependencies=tuple(
+                dependency.__name__ for dependency in dependencies
+            ),
+            resources=resources or {},
+        )
+
+    def get_selected_dependencies(
+        self, name: str, *, names: set[str]
+    ) -> tuple[str, ...]:
+        """Get the nearest selected stages the stage depends on, either
+        directly or through the stages that aren't selected.
+
+        :param name: A name of the stage.
+        :param names: Names of the selected stages.
+        :return: Names of the dependencies.
+        """
+        dependencies = []
+
+        for dependency in self.stages[name].dependencies:
+            if dependency in names:
+                dependencies.append(dependency)
+            else:
+                dependencies.extend(
+                    self.get_selected_dependencies(dependency, names=names)
+                )
+
+        return tuple(dict.fromkeys(dependencies))
+
+    def select(self, names: set[str]) -> "StageGraph":
+        """Get a graph of the selected stages only. The stages that
+        aren't selected are skipped, as their outputs are expected to
+        exist already (e.g. from a previous run), but the order of the
+        selected stages is kept.
+
+        :param names: Names of the stages to select.
+        :raises StageGraphError: If a stage isn't in the graph or the
+            graph is invalid.
+        :return: A graph of the selected stages.
+        """
+        unknown_stages = sorted(names - set(self.stages))
+
+        if unknown_stages:
+            raise StageGraphError(
+                f"Unknown stages: {', '.join(unknown_stages)}."
+            )
+
+        # The graph is validated, so the dependencies can be followed.
+        self.get_order()
+
+        graph = StageGraph()
+
+        for name, stage in self.stages.items():
+            if name not in names:
+                continue
+
+            graph.stages[name] = replace(
+                stage,
+                dependencies=self.get_selected_dependencies(name, names=names),
+            )
+
+        return graph
+
+    def get_dependents(self) -> dict[str, list[str]]:
+        """Get names of the stages that depend on each stage.
+
+        :return: Dependents by the stage names.
+        """
+        dependents = {name: [] for name in self.stages}
+
+        for stage in self.stages.values():
+            for dependency in stage.dependencies:
+                dependents[dependency].append(stage.name)
+
+        return dependents
+
+    def get_order(self) -> list[str]:
+        """Get names of the stages in a topological order (each stage
+        comes after its dependencies, the order of addition is kept
+        otherwise).
+
+        :raises StageGraphError: If a dependency isn't in the graph or
+            the dependencies have a cycle.
+        :return: Names of the stages.
+        """
+        for stage in self.stages.values():
+            for dependency in stage.dependencies:
+                if dependency not in self.stages:
+                    raise StageGraphError(
+                        f"`{stage.name}` stage depends on unknown "
+                        f"`{dependency}` stage."
+                    )
+
+        dependents = self.get_dependents()
+        in_degrees = {
+            name: len(stage.dependencies)
+            for name, stage in self.stages.items()
+        }
+
+        ready = [name for name, degree in in_degrees.items() if degree == 0]
+        order = []
+
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+
+            for dependent in dependents[name]:
+                in_degrees[dependent] -= 1
+
+                if in_degrees[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(order) != len(self.stages):
+            cyclic_stages = sorted(set(self.stages) - set(order))
+
+            raise StageGraphError(
+                f"Dependencies of the stages have a cycle: "
+                f"{', '.join(cyclic_stages)}."
+            )
+
+        return order
+
+    def get_critical_path(
+        self, durations: dict[str, float]
+    ) -> tuple[list[str], float]:
+        """Get the longest chain of dependent stages by their
+        durations. It's the shortest possible wall time of the run.
+
+        :param durations: Durations (seconds) of the stages.
+        :return: Names of the stages of the path and its duration.
+        """
+        finish_times: dict[str, float] = {}
+        previous_stages: dict[str, str | None] = {}
+
+        for name in self.get_order():
+            dependencies = self.stages[name].dependencies
+
+            previous_stage = max(
+                dependencies,
+                key=lambda dependency: finish_times[dependency],
+                default=None,
+            )
+            start_time = (
+                finish_times[previous_stage] if previous_stage else 0.0
+            )
+
+            finish_times[name] = start_time + durations.get(name, 0.0)
+            previous_stages[name] = previous_stage
+
+        if not finish_times:
+            return [], 0.0
+
+        last_stage = max(finish_times, key=finish_times.get)
+        path = [last_stage]
+
+        while previous_stages[path[-1]]:
+            path.append(previous_stages[path[-1]])
+
+        return path[::-1], finish_times[last_stage]
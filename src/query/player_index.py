@@ -0,0 +1,293 @@
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from common import metrics
+from common.constants import (
+    BaseConstants,
+    LoggerConstants,
+    PlayerIndexConstants,
+    QueryConstants,
+)
+from common.logger import init_logger
+
+init_logger(logger_name=LoggerConstants.PLAYER_INDEX_LOGGER_NAME)
+logger = logging.getLogger(name=LoggerConstants.PLAYER_INDEX_LOGGER_NAME)
+
+
+@dataclass
+class PlayerProfile:
+    """A class to represent everything about a player.
+
+    :param bio: Bio of the player (from the `players-stats` table).
+    :param rosters: Roster history of the player.
+    :param stats: Per-season stats of the player by the table names.
+    """
+
+    bio: pd.DataFrame = field(default_factory=pd.DataFrame)
+    rosters: pd.DataFrame = field(default_factory=pd.DataFrame)
+    stats: dict[str, pd.DataFrame] = field(default_factory=dict)
+
+
+class PlayerIndex:
+    """A class to build and look up an index of the players.
+
+    The index maps a normalized player name and a player ID to row
+    offsets in each processed table with a `player` column. The
+    indexed tables are stored as Arrow IPC files next to the index, so
+    the lookups are served from memory-mapped files without reading
+    the Parquet files.
+
+    :param base_folder: A folder with the processed tables.
+    """
+
+    def __init__(
+        self, base_folder: Path = BaseConstants.PROCESSED_FOLDER
+    ) -> None:
+        """Construct all attributes for the `PlayerIndex` object.
+
+        :param base_folder: A folder with the processed tables.
+        """
+        self.base_folder = base_folder
+        self.index_folder = base_folder.joinpath(
+            PlayerIndexConstants.PLAYERS_INDEX_FOLDER
+        )
+        self._tables: dict[str, pa.Table] = {}
+
+    @staticmethod
+    def normalize_players(players: pd.Series) -> pd.Series:
+        """Normalize player names, i.e. remove accents and punctuation,
+        lower the case, and collapse whitespaces.
+
+        Examples:
+
+            - `Nikola Jokić` -> `nikola jokic`.
+            - `Shaquille O'Neal` -> `shaquille oneal`.
+            - `  Gary Payton II ` -> `gary payton ii`.
+
+        :param players: Player names to normalize.
+        :return: Normalized player names.
+        """
+        normalized_players = (
+            players.astype("string")
+            .str.normalize("NFKD")
+            .str.encode("ascii", errors="ignore")
+            .str.decode("ascii")
+            .str.lower()
+            .str.replace(r"[^a-z0-9\s]", "", regex=True)
+            .str.split()
+            .str.join(" ")
+        )
+
+        return normalized_players
+
+    def normalize_player(self, player: str) -> str:
+        """Normalize a player name.
+
+        :param player: A player name to normalize.
+        :return: Normalized player name.
+        """
+        normalized_player = self.normalize_players(pd.Series([player]))[0]
+
+        return normalized_player
+
+    def get_table_filepath(self, table: str) -> Path:
+        """Get a filepath of the Arrow IPC file of the indexed table.
+
+        :param table: A name of the table.
+        :return: Filepath.
+        """
+        table_filepath = self.index_folder.joinpath(
+            f"{table}.{PlayerIndexConstants.ARROW_FILE_EXTENSION}"
+        )
+
+        return table_filepath
+
+    @staticmethod
+    def write_arrow_file(arrow_table: pa.Table, *, filepath: Path) -> None:
+        """Write a table to an Arrow IPC file.
+
+        :param arrow_table: A table to write.
+        :param filepath: A filepath to write the table to.
+        :return: None.
+        """
+        with pa.OSFile(str(filepath), mode="wb") as sink:
+            with pa.ipc.new_file(sink, schema=arrow_table.schema) as writer:
+                writer.write_table(arrow_table)
+
+        metrics.increment("rows", arrow_table.num_rows)
+        metrics.increment("files_written")
+        metrics.increment("bytes_written", os.path.getsize(filepath))
+
+    @staticmethod
+    def read_arrow_file(filepath: Path) -> pa.Table:
+        """Read a table from the memory-mapped Arrow IPC file. The
+        data isn't copied, but read from the page cache on access.
+
+        :param filepath: A filepath to read the table from.
+        :return: Arrow table.
+        """
+        with pa.memory_map(str(filepath), "r") as source:
+            arrow_table = pa.ipc.open_file(source).read_all()
+
+        return arrow_table
+
+    @staticmethod
+    def get_offsets_df(keys: pd.Series, *, column: str) -> pd.DataFrame:
+        """Get row offsets of the specified keys.
+
+        :param keys: Keys of the rows (e.g. normalized player names).
+        :param column: A column name of the keys.
+        :return: Offsets by the keys.
+        """
+        offsets = keys.groupby(keys, sort=True).indices
+
+        offsets_df = pd.DataFrame(
+            {
+                column: list(offsets.keys()),
+                "offsets": [
+                    key_offsets.astype("int32")
+                    for key_offsets in offsets.values()
+                ],
+            }
+        )
+
+        return offsets_df
+
+    def get_table_index_df(
+        self, arrow_table: pa.Table, *, table: str
+    ) -> pd.DataFrame:
+        """Get row offsets of the players in the table by the
+        normalized player names and (if available) the player IDs.
+
+        :param arrow_table: A table to index.
+        :param table: A name of the table.
+        :return: Index of the table.
+        """
+        players = self.normalize_players(
+            arrow_table.column("player").to_pandas()
+        )
+
+        offsets_dfs = [self.get_offsets_df(players, column="key")]
+
+        if "player_id" in arrow_table.column_names:
+            players_ids = arrow_table.column("player_id").to_pandas()
+
+            offsets_dfs.append(
+                self.get_offsets_df(players_ids, column="player_id")
+            )
+
+        table_index_df = pd.concat(offsets_dfs, ignore_index=True)
+
+        table_index_df["player_id"] = table_index_df.get(
+            "player_id", pd.Series(dtype="Int64")
+        ).astype("Int64")
+        table_index_df["table"] = table
+
+        return table_index_df
+
+    def build(self) -> None:
+        """Build the index of the players from the processed tables
+        and store it with the indexed tables as Arrow IPC files.
+
+        :return: None.
+        """
+        os.makedirs(self.index_folder, exist_ok=True)
+
+        index_dfs = []
+
+        for table in PlayerIndexConstants.INDEXED_TABLES:
+            filepath = self.base_folder.joinpath(QueryConstants.TABLES[table])
+
+            if not filepath.exists():
+                continue
+
+            arrow_table = pq.read_table(filepath)
+
+            self.write_arrow_file(
+                arrow_table, filepath=self.get_table_filepath(table=table)
+            )
+
+            index_dfs.append(self.get_table_index_df(arrow_table, table=table))
+
+            logger.info(msg=f"`{table}` table has been indexed.")
+
+        index_df = pd.concat(index_dfs, ignore_index=True)
+
+        index_table = pa.Table.from_pandas(index_df, preserve_index=False)
+
+        self.write_arrow_file(
+            index_table,
+            filepath=self.get_table_filepath(
+                table=PlayerIndexConstants.INDEX_TABLE
+            ),
+        )
+
+        self._tables.clear()
+
+    def get_table(self, table: str) -> pa.Table:
+        """Get the memory-mapped indexed table (or the index itself).
+
+        :param table: A name of the table.
+        :return: Arrow table.
+        """
+        if table not in self._tables:
+            self._tables[table] = self.read_arrow_file(
+                filepath=self.get_table_filepath(table=table)
+            )
+
+        return self._tables[table]
+
+    def get_offsets(self, player: str | int) -> dict[str, list[int]]:
+        """Get row offsets of the player in each indexed table.
+
+        :param player: A player name (it doesn't have to be
+            normalized) or a player ID.
+        :return: Row offsets by the table names.
+        """
+        index_table = self.get_table(table=PlayerIndexConstants.INDEX_TABLE)
+
+        if isinstance(player, int):
+            mask = pc.equal(index_table["player_id"], player)
+        else:
+            mask = pc.equal(index_table["key"], self.normalize_player(player))
+
+        player_index_table = index_table.filter(mask)
+
+        offsets = dict(
+            zip(
+                player_index_table["table"].to_pylist(),
+                player_index_table["offsets"].to_pylist(),
+                strict=True,
+            )
+        )
+
+        return offsets
+
+    def lookup(self, player: str | int) -> PlayerProfile:
+        """Look up bio, roster history, and per-season stats of the
+        player.
+
+        :param player: A player name (it doesn't have to be
+            normalized) or a player ID.
+        :return: Profile of the player.
+        """
+        profile = PlayerProfile()
+
+        for table, offsets in self.get_offsets(player=player).items():
+            rows_df = self.get_table(table=table).take(offsets).to_pandas()
+
+            if table == PlayerIndexConstants.BIO_TABLE:
+                profile.bio = rows_df
+            elif table == PlayerIndexConstants.ROSTERS_TABLE:
+                profile.rosters = rows_df
+            else:
+                profile.stats[table] = rows_df
+
+        return profile
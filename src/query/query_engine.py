@@ -0,0 +1,229 @@
+import logging
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+from common.constants import BaseConstants, LoggerConstants, QueryConstants
+from common.logger import init_logger
+
+init_logger(logger_name=LoggerConstants.QUERY_ENGINE_LOGGER_NAME)
+logger = logging.getLogger(name=LoggerConstants.QUERY_ENGINE_LOGGER_NAME)
+
+
+class QueryEngine:
+    """A class to query the processed tables (Parquet files).
+
+    Every processed table is registered as a lazily scanned dataset,
+    so only the requested columns and the row groups that match the
+    filters are read from the files.
+
+    :param base_folder: A folder with the processed tables.
+    """
+
+    def __init__(
+        self, base_folder: Path = BaseConstants.PROCESSED_FOLDER
+    ) -> None:
+        """Construct all attributes for the `QueryEngine` object.
+
+        :param base_folder: A folder with the processed tables.
+        """
+        self.base_folder = base_folder
+        self._datasets: dict[str, ds.Dataset] = {}
+
+    def get_tables(self) -> list[str]:
+        """Get names of the processed tables that are available.
+
+        :return: Names of the tables.
+        """
+        tables = [
+            table
+            for table, filepath in QueryConstants.TABLES.items()
+            if self.base_folder.joinpath(filepath).exists()
+        ]
+
+        return tables
+
+    def get_dataset(self, table: str) -> ds.Dataset:
+        """Get a dataset of the specified table. The dataset is
+        registered on the first access and only its metadata is read.
+
+        :param table: A name of the table (e.g. `rosters`).
+        :raises KeyError: If the table is unknown.
+        :return: Dataset of the table.
+        """
+        if table not in self._datasets:
+            filepath = self.base_folder.joinpath(QueryConstants.TABLES[table])
+
+            self._datasets[table] = ds.dataset(filepath, format="parquet")
+
+            logger.info(msg=f"`{table}` table has been registered.")
+
+        return self._datasets[table]
+
+    @staticmethod
+    def get_filter(**conditions: Any) -> pc.Expression | None:
+        """Get a filter expression from the specified conditions.
+
+        Examples:
+
+            - `team="BOS"` -> `team == "BOS"`.
+            - `year=[2023, 2024]` -> `year in [2023, 2024]`.
+
+        :param conditions: Column names and their values. A list, tuple
+            or set of values means any of the values.
+        :return: Filter expression or None if there are no conditions.
+        """
+        expression = None
+
+        for column, value in conditions.items():
+            if isinstance(value, (list, tuple, set)):
+                condition = pc.field(column).isin(list(value))
+            else:
+                condition = pc.field(column) == value
+
+            expression = (
+                condition if expression is None else expression & condition
+            )
+
+        return expression
+
+    def scan(
+        self,
+        table: str,
+        *,
+        columns: list[str] | None = None,
+        filter_expression: pc.Expression | None = None,
+    ) -> pa.Table:
+        """Scan the specified table with projection and predicate
+        pushdown.
+
+        :param table: A name of the table.
+        :param columns: Columns to read. All columns if not specified.
+        :param filter_expression: A filter expression to apply.
+        :return: Arrow table.
+        """
+        dataset = self.get_dataset(table=table)
+
+        arrow_table = dataset.to_table(
+            columns=columns, filter=filter_expression
+        )
+
+        return arrow_table
+
+    def lookup(
+        self,
+        table: str,
+        *,
+        columns: list[str] | None = None,
+        **conditions: Any,
+    ) -> pd.DataFrame:
+        """Look up rows of the specified table that meet the
+        conditions.
+
+        Examples:
+
+            - `lookup("rosters", player="Jayson Tatum")`.
+            - `lookup("salaries", columns=["player", "salary"],
+              team="BOS", year=2024)`.
+
+        :param table: A name of the table.
+        :param columns: Columns to read. All columns if not specified.
+        :param conditions: Column names and their values to filter by.
+        :return: Rows that meet the conditions.
+        """
+        arrow_table = self.scan(
+            table=table,
+            columns=columns,
+            filter_expression=self.get_filter(**conditions),
+        )
+
+        lookup_df = arrow_table.to_pandas()
+
+        return lookup_df
+
+    @staticmethod
+    def decode_dictionaries(
+        arrow_table: pa.Table, *, columns: tuple[str, ...]
+    ) -> pa.Table:
+        """Decode dictionary columns, as dictionaries of the same
+        column differ between tables and can't be used as join keys.
+
+        :param arrow_table: A table to decode columns of.
+        :param columns: Columns to decode.
+        :return: A table with decoded columns.
+        """
+        for column in columns:
+            idx = arrow_table.schema.get_field_index(column)
+            data_type = arrow_table.schema.field(idx).type
+
+            if pa.types.is_dictionary(data_type):
+                arrow_table = arrow_table.set_column(
+                    idx,
+                    column,
+                    arrow_table.column(column).cast(data_type.value_type),
+                )
+
+        return arrow_table
+
+    def join(
+        self,
+        left_table: str,
+        right_table: str,
+        *,
+        left_columns: list[str],
+        right_columns: list[str],
+        keys: tuple[str, ...] = QueryConstants.PLAYER_SEASON_TEAM_KEYS,
+        join_type: str = "inner",
+        right_suffix: str = "_right",
+        **conditions: Any,
+    ) -> pd.DataFrame:
+        """Join two tables by the keys (player ID, year, and team by
+        default). Only the key columns and the requested columns are
+        read, and the conditions are pushed down to both tables.
+
+        Examples:
+
+            - `join("rosters", "salaries", left_columns=["height"],
+              right_columns=["salary"], year=2024)`.
+
+        :param left_table: A name of the left table.
+        :param right_table: A name of the right table.
+        :param left_columns: Columns to read from the left table.
+        :param right_columns: Columns to read from the right table.
+        :param keys: Columns to join by.
+        :param join_type: A type of the join (e.g. `inner`,
+            `left outer`).
+        :param right_suffix: A suffix of the right table columns that
+            have the same names as the left table columns.
+        :param conditions: Key columns and their values to filter by.
+        :return: Joined table.
+        """
+        filter_expression = self.get_filter(**conditions)
+
+        left_arrow_table, right_arrow_table = (
+            self.decode_dictionaries(
+                self.scan(
+                    table=table,
+                    columns=[*keys, *columns],
+                    filter_expression=filter_expression,
+                ),
+                columns=keys,
+            )
+            for table, columns in (
+                (left_table, left_columns),
+                (right_table, right_columns),
+            )
+        )
+
+        joined_df = left_arrow_table.join(
+            right_arrow_table,
+            keys=list(keys),
+            join_type=join_type,
+            right_suffix=right_suffix,
+        ).to_pandas()
+
+        return joined_df
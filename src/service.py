@@ -1,37 +1,84 @@
+from __future__ import annotations
+
+import argparse
 import logging
+import os
+import sys
+import time
+from typing import TYPE_CHECKING
 
-from collectors.leagues.league_collector import LeagueCollector
-from collectors.players.player_collector import PlayerCollector
-from collectors.seasons.season_collector import SeasonCollector
-from collectors.teams.team_collector import TeamCollector
+from collectors.rate_controller import CrawlRateController
 from common.constants import (
     BaseConstants,
     ConferenceConstants,
     ConferenceStatsConstants,
+    CrawlFrontierConstants,
     LeagueConstants,
     LoggerConstants,
+    PipelineConstants,
+    PlayerCareerStatsConstants,
     PlayerConstants,
+    PlayerIndexConstants,
+    PlayerLeaderboardConstants,
+    PlayerSeasonConstants,
     PlayerStatsConstants,
+    RawSegmentConstants,
     SeasonConstants,
+    StageInputsConstants,
     TeamConstants,
     TeamStatsConstants,
 )
+from common.exceptions import HTMLDataError, MissingInputsError
 from common.logger import init_logger
-from extractors.conferences.conference_extractor import ConferenceExtractor
-from extractors.conferences.conference_stats_extractor import (
-    ConferenceStatsExtractor,
-)
-from extractors.players.player_extractor import PlayerExtractor
-from extractors.players.player_stats_extractor import PlayerStatsExtractor
-from extractors.seasons.season_extractor import SeasonExtractor
-from extractors.teams.team_extractor import TeamExtractor
-from extractors.teams.team_stats_extractor import TeamStatsExtractor
-from uploader.uploader import Uploader
-
-
+from common.metrics import MetricsRecorder
+from common.url_registry import UrlRegistry
+from pipeline.lazy import Lazy
+from pipeline.shard import Shard
+from pipeline.stage_executor import StageExecutor
+from pipeline.stage_graph import StageGraph
+
+# The collectors, extractors, and uploader import pandas, bs4, lxml,
+# requests, or boto3, so they're imported by the stages that use them
+# (see `Lazy`) instead of at the start of each run.
+if TYPE_CHECKING:
+    from collectors.leagues.league_collector import LeagueCollector
+    from collectors.players.player_collector import PlayerCollector
+    from collectors.seasons.season_collector import SeasonCollector
+    from collectors.teams.team_collector import TeamCollector
+    from extractors.conferences.conference_extractor import (
+        ConferenceExtractor,
+    )
+    from extractors.conferences.conference_stats_extractor import (
+        ConferenceStatsExtractor,
+    )
+    from extractors.players.player_career_stats_extractor import (
+        PlayerCareerStatsExtractor,
+    )
+    from extractors.players.player_extractor import PlayerExtractor
+    from extractors.players.player_leaderboard_extractor import (
+        PlayerLeaderboardExtractor,
+    )
+    from extractors.players.player_season_extractor import (
+        PlayerSeasonExtractor,
+    )
+    from extractors.players.player_stats_extractor import (
+        PlayerStatsExtractor,
+    )
+    from extractors.seasons.season_extractor import SeasonExtractor
+    from extractors.teams.team_extractor import TeamExtractor
+    from extractors.teams.team_stats_extractor import TeamStatsExtractor
+    from pipeline.shard_merger import ShardMerger
+    from query.player_index import PlayerIndex
+    from uploader.uploader import Uploader
+
+metrics_recorder = MetricsRecorder()
+
+
+@metrics_recorder.track
 def create_base_folders(upl: Uploader) -> None:
     """Create `raw` and `processed` folders to store source and
-    processed data, respectively.
+    processed data, respectively, and a folder of the reports of the
+    run.
 
     :param upl: An uploader that initiates the uploading
         process.
@@ -44,10 +91,42 @@ def create_base_folders(upl: Uploader) -> None:
 
     upl.make_base_folder(base_folder=BaseConstants.RAW_FOLDER)
     upl.make_base_folder(base_folder=BaseConstants.PROCESSED_FOLDER)
+    upl.make_base_folder(base_folder=BaseConstants.REPORTS_FOLDER)
+    upl.make_base_folder(
+        base_folder=BaseConstants.PROCESSED_FOLDER.joinpath(
+            CrawlFrontierConstants.STATE_FOLDER
+        )
+    )
 
     logger.info(msg="Creation of the base folder has been completed.")
 
 
+@metrics_recorder.track
+def download_processed_data(upl: Uploader) -> None:
+    """Download the processed data from an S3 bucket, so the
+    extracted tables are merged with the rows of the other years and
+    pages, and the crawl continues from its state.
+
+    :param upl: An uploader that initiates the downloading
+        process.
+    :return: None.
+    """
+    init_logger(logger_name=LoggerConstants.UPLOADER_LOGGER_NAME)
+    logger = logging.getLogger(name=LoggerConstants.UPLOADER_LOGGER_NAME)
+
+    logger.info(
+        msg="Downloading processed data from an S3 bucket has been started."
+    )
+
+    upl.download_files_from_s3(base_folder=BaseConstants.PROCESSED_FOLDER)
+
+    logger.info(
+        msg="Downloading processed data from an S3 bucket has been "
+        "completed."
+    )
+
+
+@metrics_recorder.track
 def collect_seasons(collector: SeasonCollector) -> None:
     """Collect the seasons data and save it to the appropriate
     filepath.
@@ -67,13 +146,21 @@ def collect_seasons(collector: SeasonCollector) -> None:
 
     html_data = collector.get_html_data(collector.url)
 
+    # The other stages can't run without the seasons.
+    if html_data is None:
+        collector.save_dead_letters()
+
+        raise HTMLDataError(url=collector.url)
+
     collector.save_html(
         html_data=html_data, filepath=SeasonConstants.RAW_FILEPATH
     )
+    collector.close_segment_writers()
 
     logger.info(msg="Data collection of seasons has been completed.")
 
 
+@metrics_recorder.track
 def upload_collected_seasons(upl: Uploader) -> None:
     """Upload collected seasons data to an S3 bucket.
 
@@ -95,7 +182,7 @@ def upload_collected_seasons(upl: Uploader) -> None:
 
     upl.upload_files_to_s3(
         base_folder=base_folder,
-        extensions=(".html",),
+        extensions=(".html", *RawSegmentConstants.UPLOAD_SUFFIXES),
     )
 
     logger.info(
@@ -104,12 +191,16 @@ def upload_collected_seasons(upl: Uploader) -> None:
     )
 
 
-def extract_seasons(extractor: SeasonExtractor) -> None:
+@metrics_recorder.track
+def extract_seasons(
+    extractor: SeasonExtractor, shard: Shard | None = None
+) -> None:
     """Extract the seasons data and save it to the appropriate
     filepath.
 
     :param extractor: An extractor that initiates the extraction
         process.
+    :param shard: A shard of the run to save partial tables for.
     :return: None.
     """
     init_logger(logger_name=LoggerConstants.SEASON_EXTRACTOR_LOGGER_NAME)
@@ -127,9 +218,15 @@ def extract_seasons(extractor: SeasonExtractor) -> None:
     seasons_df = extractor.get_seasons_df()
     seasons_urls = extractor.get_seasons_urls()
 
-    extractor.save_table(
-        table_df=seasons_df, filepath=SeasonConstants.PROCESSED_FILEPATH
+    seasons_filepath = SeasonConstants.PROCESSED_FILEPATH
+    seasons_df = extractor.validate_table(
+        table_df=seasons_df, filepath=seasons_filepath
     )
+
+    if shard:
+        seasons_filepath = shard.get_filepath(filepath=seasons_filepath)
+
+    extractor.save_table(table_df=seasons_df, filepath=seasons_filepath)
     extractor.save_json(
         json_data=seasons_urls,
         filepath=SeasonConstants.SEASONS_URLS_FILEPATH,
@@ -138,6 +235,7 @@ def extract_seasons(extractor: SeasonExtractor) -> None:
     logger.info(msg="Data extraction of seasons has been completed.")
 
 
+@metrics_recorder.track
 def upload_extracted_seasons(upl: Uploader) -> None:
     """Upload extracted seasons data to an S3 bucket.
 
@@ -175,6 +273,7 @@ def upload_extracted_seasons(upl: Uploader) -> None:
     )
 
 
+@metrics_recorder.track
 def collect_leagues(collector: LeagueCollector) -> None:
     """Collect the leagues data and save it to the appropriate
     filepath.
@@ -197,6 +296,7 @@ def collect_leagues(collector: LeagueCollector) -> None:
     logger.info(msg="Data collection of leagues has been completed.")
 
 
+@metrics_recorder.track
 def upload_collected_leagues(upl: Uploader) -> None:
     """Upload collected leagues data to an S3 bucket.
 
@@ -218,7 +318,7 @@ def upload_collected_leagues(upl: Uploader) -> None:
 
     upl.upload_files_to_s3(
         base_folder=base_folder,
-        extensions=(".html",),
+        extensions=(".html", *RawSegmentConstants.UPLOAD_SUFFIXES),
     )
 
     logger.info(
@@ -227,12 +327,16 @@ def upload_collected_leagues(upl: Uploader) -> None:
     )
 
 
-def extract_conferences(extractor: ConferenceExtractor) -> None:
+@metrics_recorder.track
+def extract_conferences(
+    extractor: ConferenceExtractor, shard: Shard | None = None
+) -> None:
     """Extract the conferences data and save it to the appropriate
     filepath.
 
     :param extractor: An extractor that initiates the extraction
         process.
+    :param shard: A shard of the run to save partial tables for.
     :return: None.
     """
     init_logger(logger_name=LoggerConstants.CONFERENCE_EXTRACTOR_LOGGER_NAME)
@@ -248,15 +352,29 @@ def extract_conferences(extractor: ConferenceExtractor) -> None:
     )
 
     conferences_df = extractor.update_conferences_df()
+    conferences_filepath = ConferenceConstants.PROCESSED_FILEPATH
+    conferences_df = extractor.validate_table(
+        table_df=conferences_df, filepath=conferences_filepath
+    )
+
+    if shard:
+        conferences_filepath = shard.get_filepath(
+            filepath=conferences_filepath
+        )
+    else:
+        conferences_df = extractor.merge_table(
+            table_df=conferences_df, filepath=conferences_filepath
+        )
 
     extractor.save_table(
         table_df=conferences_df,
-        filepath=ConferenceConstants.PROCESSED_FILEPATH,
+        filepath=conferences_filepath,
     )
 
     logger.info(msg="Data extraction of conferences has been completed.")
 
 
+@metrics_recorder.track
 def upload_extracted_conferences(upl: Uploader) -> None:
     """Upload collected seasons data to an S3 bucket.
 
@@ -287,12 +405,16 @@ def upload_extracted_conferences(upl: Uploader) -> None:
     )
 
 
-def extract_conferences_stats(extractor: ConferenceStatsExtractor) -> None:
+@metrics_recorder.track
+def extract_conferences_stats(
+    extractor: ConferenceStatsExtractor, shard: Shard | None = None
+) -> None:
     """Extract the conferences stats data and save it to the
     appropriate filepath.
 
     :param extractor: An extractor that initiates the extraction
         process.
+    :param shard: A shard of the run to save partial tables for.
     :return: None.
     """
     init_logger(
@@ -326,6 +448,17 @@ def extract_conferences_stats(extractor: ConferenceStatsExtractor) -> None:
         ConferenceStatsConstants.PROCESSED_FILEPATHS,
         strict=True,
     ):
+        stats_df = extractor.validate_table(
+            table_df=stats_df, filepath=stats_filepath
+        )
+
+        if shard:
+            stats_filepath = shard.get_filepath(filepath=stats_filepath)
+        else:
+            stats_df = extractor.merge_table(
+                table_df=stats_df, filepath=stats_filepath
+            )
+
         extractor.save_table(
             table_df=stats_df,
             filepath=stats_filepath,
@@ -334,6 +467,7 @@ def extract_conferences_stats(extractor: ConferenceStatsExtractor) -> None:
     logger.info(msg="Data extraction of conferences stats has been completed.")
 
 
+@metrics_recorder.track
 def upload_extracted_conferences_stats(upl: Uploader) -> None:
     """Upload extracted conferences stats data to an S3 bucket.
 
@@ -364,6 +498,7 @@ def upload_extracted_conferences_stats(upl: Uploader) -> None:
     )
 
 
+@metrics_recorder.track
 def extract_teams(extractor: TeamExtractor) -> None:
     """Extract the teams data and save it to the appropriate
     filepath.
@@ -391,6 +526,7 @@ def extract_teams(extractor: TeamExtractor) -> None:
     logger.info(msg="Data extraction of teams has been completed.")
 
 
+@metrics_recorder.track
 def upload_extracted_teams(upl: Uploader) -> None:
     """Upload extracted teams data to an S3 bucket.
 
@@ -419,6 +555,7 @@ def upload_extracted_teams(upl: Uploader) -> None:
     )
 
 
+@metrics_recorder.track
 def collect_teams(collector: TeamCollector) -> None:
     """Collect the teams data and save it to the appropriate
     filepath.
@@ -437,6 +574,7 @@ def collect_teams(collector: TeamCollector) -> None:
     logger.info(msg="Data collection of teams has been completed.")
 
 
+@metrics_recorder.track
 def upload_collected_teams(upl: Uploader) -> None:
     """Upload collected teams data to an S3 bucket.
 
@@ -456,7 +594,7 @@ def upload_collected_teams(upl: Uploader) -> None:
 
     upl.upload_files_to_s3(
         base_folder=base_folder,
-        extensions=(".html",),
+        extensions=(".html", *RawSegmentConstants.UPLOAD_SUFFIXES),
     )
 
     logger.info(
@@ -465,12 +603,16 @@ def upload_collected_teams(upl: Uploader) -> None:
     )
 
 
-def extract_teams_stats(extractor: TeamStatsExtractor) -> None:
+@metrics_recorder.track
+def extract_teams_stats(
+    extractor: TeamStatsExtractor, shard: Shard | None = None
+) -> None:
     """Extract the teams stats data and save it to the appropriate
     filepath.
 
     :param extractor: An extractor that initiates the extraction
         process.
+    :param shard: A shard of the run to save partial tables for.
     :return: None.
     """
     init_logger(logger_name=LoggerConstants.TEAM_STATS_EXTRACTOR_LOGGER_NAME)
@@ -511,6 +653,17 @@ def extract_teams_stats(extractor: TeamStatsExtractor) -> None:
         TeamStatsConstants.PROCESSED_FILEPATHS,
         strict=True,
     ):
+        stats_df = extractor.validate_table(
+            table_df=stats_df, filepath=stats_filepath
+        )
+
+        if shard:
+            stats_filepath = shard.get_filepath(filepath=stats_filepath)
+        else:
+            stats_df = extractor.merge_table(
+                table_df=stats_df, filepath=stats_filepath
+            )
+
         extractor.save_table(
             table_df=stats_df,
             filepath=stats_filepath,
@@ -519,6 +672,7 @@ def extract_teams_stats(extractor: TeamStatsExtractor) -> None:
     logger.info(msg="Data collection of teams stats has been completed.")
 
 
+@metrics_recorder.track
 def upload_extracted_teams_stats(upl: Uploader) -> None:
     """Upload extracted teams stats data to an S3 bucket.
 
@@ -549,6 +703,7 @@ def upload_extracted_teams_stats(upl: Uploader) -> None:
     )
 
 
+@metrics_recorder.track
 def extract_players(extractor: PlayerExtractor) -> None:
     """Extract the players data and save it to the appropriate
     filepath.
@@ -575,10 +730,15 @@ def extract_players(extractor: PlayerExtractor) -> None:
         json_data=players_urls,
         filepath=PlayerConstants.PLAYERS_URLS_FILEPATH,
     )
+    extractor.save_json(
+        json_data=extractor.players_seasons,
+        filepath=PlayerConstants.PLAYERS_SEASONS_FILEPATH,
+    )
 
     logger.info(msg="Data extraction of players has been completed.")
 
 
+@metrics_recorder.track
 def upload_extracted_players(upl: Uploader) -> None:
     """Upload extracted players data to an S3 bucket.
 
@@ -609,6 +769,7 @@ def upload_extracted_players(upl: Uploader) -> None:
     )
 
 
+@metrics_recorder.track
 def collect_players(collector: PlayerCollector) -> None:
     """Collect the players data and save it to the appropriate
     filepath.
@@ -629,6 +790,7 @@ def collect_players(collector: PlayerCollector) -> None:
     logger.info(msg="Data collection of players has been completed.")
 
 
+@metrics_recorder.track
 def upload_collected_players(upl: Uploader) -> None:
     """Upload collected players data to an S3 bucket.
 
@@ -650,7 +812,7 @@ def upload_collected_players(upl: Uploader) -> None:
 
     upl.upload_files_to_s3(
         base_folder=base_folder,
-        extensions=(".html",),
+        extensions=(".html", *RawSegmentConstants.UPLOAD_SUFFIXES),
     )
 
     logger.info(
@@ -659,12 +821,16 @@ def upload_collected_players(upl: Uploader) -> None:
     )
 
 
-def extract_players_stats(extractor: PlayerStatsExtractor) -> None:
+@metrics_recorder.track
+def extract_players_stats(
+    extractor: PlayerStatsExtractor, shard: Shard | None = None
+) -> None:
     """Extract the players stats data and save it to the appropriate
     filepath.
 
     :param extractor: An extractor that initiates the extraction
         process.
+    :param shard: A shard of the run to save partial tables for.
     :return: None.
     """
     init_logger(logger_name=LoggerConstants.PLAYER_STATS_EXTRACTOR_LOGGER_NAME)
@@ -680,15 +846,30 @@ def extract_players_stats(extractor: PlayerStatsExtractor) -> None:
     )
 
     players_stats_df = extractor.get_players_stats_df()
+    players_stats_filepath = PlayerStatsConstants.PLAYERS_STATS_FILEPATH
+    players_stats_df = extractor.validate_table(
+        table_df=players_stats_df, filepath=players_stats_filepath
+    )
+
+    if shard:
+        players_stats_filepath = shard.get_filepath(
+            filepath=players_stats_filepath
+        )
+    else:
+        players_stats_df = extractor.merge_table(
+            table_df=players_stats_df,
+            filepath=players_stats_filepath,
+        )
 
     extractor.save_table(
         table_df=players_stats_df,
-        filepath=PlayerStatsConstants.PLAYERS_STATS_FILEPATH,
+        filepath=players_stats_filepath,
     )
 
     logger.info(msg="Data extraction of players stats has been completed.")
 
 
+@metrics_recorder.track
 def upload_extracted_players_stats(upl: Uploader) -> None:
     """Upload extracted players stats data to an S3 bucket.
 
@@ -719,57 +900,1045 @@ def upload_extracted_players_stats(upl: Uploader) -> None:
     )
 
 
-if __name__ == "__main__":
-    init_logger(logger_name=LoggerConstants.SERVICE_LOGGER_NAME)
-    src_logger = logging.getLogger(name=LoggerConstants.SERVICE_LOGGER_NAME)
+@metrics_recorder.track
+def extract_players_career_stats(
+    extractor: PlayerCareerStatsExtractor,
+) -> None:
+    """Aggregate the players career stats from the teams stats and save
+    them to the appropriate filepath. If the years are specified, only
+    the careers of the players of these seasons are aggregated again.
+
+    :param extractor: An extractor that initiates the extraction
+        process.
+    :return: None.
+    """
+    init_logger(
+        logger_name=LoggerConstants.PLAYER_CAREER_STATS_EXTRACTOR_LOGGER_NAME
+    )
+    logger = logging.getLogger(
+        name=LoggerConstants.PLAYER_CAREER_STATS_EXTRACTOR_LOGGER_NAME
+    )
+
+    logger.info(
+        msg="Data extraction of players career stats has been started."
+    )
+
+    extractor.make_base_folder(
+        base_path=BaseConstants.PROCESSED_FOLDER,
+        folder=PlayerCareerStatsConstants.PLAYERS_CAREER_STATS_FOLDER,
+    )
+
+    players_career_stats_df = extractor.get_players_career_stats_df()
+    players_career_stats_filepath = (
+        PlayerCareerStatsConstants.PLAYERS_CAREER_STATS_FILEPATH
+    )
+
+    players_career_stats_df = extractor.merge_table(
+        table_df=players_career_stats_df,
+        filepath=players_career_stats_filepath,
+    )
+
+    extractor.save_table(
+        table_df=players_career_stats_df,
+        filepath=players_career_stats_filepath,
+    )
+
+    logger.info(
+        msg="Data extraction of players career stats has been completed."
+    )
+
+
+@metrics_recorder.track
+def upload_extracted_players_career_stats(upl: Uploader) -> None:
+    """Upload extracted players career stats data to an S3 bucket.
+
+    :param upl: An uploader that initiates the uploading
+        process.
+    :return: None.
+    """
+    init_logger(logger_name=LoggerConstants.UPLOADER_LOGGER_NAME)
+    logger = logging.getLogger(name=LoggerConstants.UPLOADER_LOGGER_NAME)
+
+    logger.info(
+        msg="Uploading extracted players career stats data to an S3 bucket "
+        "has been started."
+    )
+
+    base_folder = BaseConstants.PROCESSED_FOLDER.joinpath(
+        PlayerCareerStatsConstants.PLAYERS_CAREER_STATS_FOLDER
+    )
+
+    upl.upload_files_to_s3(
+        base_folder=base_folder,
+        extensions=(".parquet",),
+    )
+
+    logger.info(
+        msg="Uploading extracted players career stats data to an S3 bucket "
+        "has been completed."
+    )
+
+
+@metrics_recorder.track
+def extract_players_leaderboards(
+    extractor: PlayerLeaderboardExtractor,
+) -> None:
+    """Materialize the players leaderboards from the teams stats and
+    save them to the appropriate filepath. If the years are specified,
+    only the leaderboards of these seasons are materialized again.
+
+    :param extractor: An extractor that initiates the extraction
+        process.
+    :return: None.
+    """
+    init_logger(
+        logger_name=LoggerConstants.PLAYER_LEADERBOARD_EXTRACTOR_LOGGER_NAME
+    )
+    logger = logging.getLogger(
+        name=LoggerConstants.PLAYER_LEADERBOARD_EXTRACTOR_LOGGER_NAME
+    )
+
+    logger.info(
+        msg="Data extraction of players leaderboards has been started."
+    )
+
+    extractor.make_base_folder(
+        base_path=BaseConstants.PROCESSED_FOLDER,
+        folder=PlayerLeaderboardConstants.PLAYERS_LEADERBOARDS_FOLDER,
+    )
+
+    players_leaderboards_df = extractor.get_players_leaderboards_df()
+    players_leaderboards_filepath = (
+        PlayerLeaderboardConstants.PLAYERS_LEADERBOARDS_FILEPATH
+    )
+
+    players_leaderboards_df = extractor.merge_table(
+        table_df=players_leaderboards_df,
+        filepath=players_leaderboards_filepath,
+    ).sort_values(PlayerLeaderboardConstants.SORT_COLUMNS, ignore_index=True)
+
+    extractor.save_table(
+        table_df=players_leaderboards_df,
+        filepath=players_leaderboards_filepath,
+    )
+
+    logger.info(
+        msg="Data extraction of players leaderboards has been completed."
+    )
+
+
+@metrics_recorder.track
+def upload_extracted_players_leaderboards(upl: Uploader) -> None:
+    """Upload extracted players leaderboards data to an S3 bucket.
+
+    :param upl: An uploader that initiates the uploading
+        process.
+    :return: None.
+    """
+    init_logger(logger_name=LoggerConstants.UPLOADER_LOGGER_NAME)
+    logger = logging.getLogger(name=LoggerConstants.UPLOADER_LOGGER_NAME)
+
+    logger.info(
+        msg="Uploading extracted players leaderboards data to an S3 bucket "
+        "has been started."
+    )
+
+    base_folder = BaseConstants.PROCESSED_FOLDER.joinpath(
+        PlayerLeaderboardConstants.PLAYERS_LEADERBOARDS_FOLDER
+    )
+
+    upl.upload_files_to_s3(
+        base_folder=base_folder,
+        extensions=(".parquet",),
+    )
+
+    logger.info(
+        msg="Uploading extracted players leaderboards data to an S3 bucket "
+        "has been completed."
+    )
+
+
+@metrics_recorder.track
+def extract_players_seasons(extractor: PlayerSeasonExtractor) -> None:
+    """Build the fact table of the players seasons from the teams stats
+    and save it with a file per season. If the years are specified,
+    only the files of these seasons are built again.
+
+    :param extractor: An extractor that initiates the extraction
+        process.
+    :return: None.
+    """
+    init_logger(
+        logger_name=LoggerConstants.PLAYER_SEASON_EXTRACTOR_LOGGER_NAME
+    )
+    logger = logging.getLogger(
+        name=LoggerConstants.PLAYER_SEASON_EXTRACTOR_LOGGER_NAME
+    )
+
+    logger.info(msg="Data extraction of players seasons has been started.")
+
+    players_seasons_table = extractor.get_players_seasons_table()
+
+    extractor.save_partitions(players_seasons_table=players_seasons_table)
+
+    logger.info(msg="Data extraction of players seasons has been completed.")
+
+
+@metrics_recorder.track
+def upload_extracted_players_seasons(
+    upl: Uploader, extractor: PlayerSeasonExtractor
+) -> None:
+    """Upload extracted players seasons data to an S3 bucket, and
+    delete the files of the seasons that have no rows anymore from it.
+
+    :param upl: An uploader that initiates the uploading
+        process.
+    :param extractor: An extractor of the players seasons.
+    :return: None.
+    """
+    init_logger(logger_name=LoggerConstants.UPLOADER_LOGGER_NAME)
+    logger = logging.getLogger(name=LoggerConstants.UPLOADER_LOGGER_NAME)
+
+    logger.info(
+        msg="Uploading extracted players seasons data to an S3 bucket has "
+        "been started."
+    )
+
+    upl.upload_files_to_s3(
+        base_folder=PlayerSeasonConstants.PLAYERS_SEASONS_FOLDER_PATH,
+        extensions=(".parquet",),
+    )
+    upl.delete_files_from_s3(filepaths=extractor.deleted_filepaths)
+
+    logger.info(
+        msg="Uploading extracted players seasons data to an S3 bucket has "
+        "been completed."
+    )
+
+
+@metrics_recorder.track
+def build_players_index(index: PlayerIndex) -> None:
+    """Build the players index over the processed tables.
+
+    :param index: An index that initiates the building process.
+    :return: None.
+    """
+    init_logger(logger_name=LoggerConstants.PLAYER_INDEX_LOGGER_NAME)
+    logger = logging.getLogger(name=LoggerConstants.PLAYER_INDEX_LOGGER_NAME)
+
+    logger.info(msg="Building of the players index has been started.")
+
+    index.build()
+
+    logger.info(msg="Building of the players index has been completed.")
+
+
+@metrics_recorder.track
+def upload_players_index(upl: Uploader) -> None:
+    """Upload the players index to an S3 bucket.
+
+    :param upl: An uploader that initiates the uploading
+        process.
+    :return: None.
+    """
+    init_logger(logger_name=LoggerConstants.UPLOADER_LOGGER_NAME)
+    logger = logging.getLogger(name=LoggerConstants.UPLOADER_LOGGER_NAME)
+
+    logger.info(
+        msg="Uploading the players index to an S3 bucket has been started."
+    )
+
+    base_folder = BaseConstants.PROCESSED_FOLDER.joinpath(
+        PlayerIndexConstants.PLAYERS_INDEX_FOLDER
+    )
+
+    upl.upload_files_to_s3(
+        base_folder=base_folder,
+        extensions=(".arrow",),
+    )
+
+    logger.info(
+        msg="Uploading the players index to an S3 bucket has been "
+        "completed."
+    )
+
+
+@metrics_recorder.track
+def upload_crawl_state(upl: Uploader) -> None:
+    """Upload the state of the crawl to an S3 bucket, so the next run
+    continues from it.
+
+    :param upl: An uploader that initiates the uploading
+        process.
+    :return: None.
+    """
+    init_logger(logger_name=LoggerConstants.UPLOADER_LOGGER_NAME)
+    logger = logging.getLogger(name=LoggerConstants.UPLOADER_LOGGER_NAME)
+
+    logger.info(
+        msg="Uploading the crawl state to an S3 bucket has been started."
+    )
+
+    base_folder = BaseConstants.PROCESSED_FOLDER.joinpath(
+        CrawlFrontierConstants.STATE_FOLDER
+    )
+
+    upl.upload_files_to_s3(
+        base_folder=base_folder,
+        extensions=(".json",),
+    )
+
+    logger.info(
+        msg="Uploading the crawl state to an S3 bucket has been completed."
+    )
+
+
+@metrics_recorder.track
+def upload_reports(upl: Uploader, shard: Shard | None = None) -> None:
+    """Upload the reports of the run (e.g. the dead letters and the
+    validation report) to an S3 bucket.
+
+    :param upl: An uploader that initiates the uploading
+        process.
+    :param shard: A shard of the run. The reports of a shard are
+        uploaded with its suffix (e.g.
+        `dead-letters.shard-0-of-4.json`), so the shards don't
+        overwrite each other's reports.
+    :return: None.
+    """
+    init_logger(logger_name=LoggerConstants.UPLOADER_LOGGER_NAME)
+    logger = logging.getLogger(name=LoggerConstants.UPLOADER_LOGGER_NAME)
+
+    logger.info(msg="Uploading the reports to an S3 bucket has been started.")
+
+    if shard:
+        for filename in os.listdir(BaseConstants.REPORTS_FOLDER):
+            filepath = BaseConstants.REPORTS_FOLDER.joinpath(filename)
+
+            if not Shard.get_table_filepath(filepath=filepath):
+                os.replace(filepath, shard.get_filepath(filepath=filepath))
+
+    upl.upload_files_to_s3(
+        base_folder=BaseConstants.REPORTS_FOLDER,
+        extensions=(".json",),
+    )
 
-    uploader = Uploader()
-    season_collector = SeasonCollector(url=SeasonConstants.URL)
-    season_extractor = SeasonExtractor()
-    league_collector = LeagueCollector()
-    conference_extractor = ConferenceExtractor()
-    conferences_stats_extractor = ConferenceStatsExtractor()
-    team_extractor = TeamExtractor()
-    team_collector = TeamCollector()
-    team_stats_extractor = TeamStatsExtractor()
-    player_extractor = PlayerExtractor()
-    player_collector = PlayerCollector()
-    player_stats_extractor = PlayerStatsExtractor()
+    logger.info(
+        msg="Uploading the reports to an S3 bucket has been completed."
+    )
+
+
+@metrics_recorder.track
+def merge_shards(merger: ShardMerger) -> None:
+    """Merge the partial tables of the shards into the processed
+    tables.
+
+    :param merger: A merger that initiates the merging process.
+    :return: None.
+    """
+    init_logger(logger_name=LoggerConstants.SHARD_MERGER_LOGGER_NAME)
+    logger = logging.getLogger(name=LoggerConstants.SHARD_MERGER_LOGGER_NAME)
+
+    logger.info(msg="Merging of the shards has been started.")
+
+    merger.merge()
+
+    logger.info(msg="Merging of the shards has been completed.")
+
+
+@metrics_recorder.track
+def delete_merged_shards(upl: Uploader, merger: ShardMerger) -> None:
+    """Delete the merged partial tables of the shards from an S3
+    bucket once the processed tables are uploaded.
+
+    :param upl: An uploader that initiates the deleting process.
+    :param merger: A merger of the shards.
+    :return: None.
+    """
+    init_logger(logger_name=LoggerConstants.UPLOADER_LOGGER_NAME)
+    logger = logging.getLogger(name=LoggerConstants.UPLOADER_LOGGER_NAME)
+
+    logger.info(
+        msg="Deleting merged shards from an S3 bucket has been started."
+    )
+
+    upl.delete_files_from_s3(filepaths=merger.merged_filepaths)
+
+    logger.info(
+        msg="Deleting merged shards from an S3 bucket has been completed."
+    )
+
+
+def select_stages(
+    graph: StageGraph, *, names: set[str], skip_uploads: bool
+) -> StageGraph:
+    """Select the stages of the graph to run.
+
+    :param graph: A graph of the stages.
+    :param names: Names of the stages to select.
+    :param skip_uploads: Whether to skip the stages that use S3 (e.g.
+        for the local runs).
+    :return: A graph of the selected stages.
+    """
+    if skip_uploads:
+        names = {
+            name
+            for name in names
+            if PipelineConstants.UPLOAD not in graph.stages[name].resources
+        }
+
+    return graph.select(names=names)
+
+
+def get_missing_inputs(stages: list[str]) -> dict[str, list[str]]:
+    """Get the raw inputs of the selected stages that don't exist,
+    while the stages that produce them aren't selected. The raw data
+    isn't downloaded from S3, so such a run fails early instead of
+    midway (e.g. `collect_teams` without `extract_teams` in an ECS
+    task).
+
+    :param stages: Names of the selected stages.
+    :return: Paths of the missing inputs by the stages.
+    """
+    missing_inputs = {}
+
+    for stage in stages:
+        inputs = StageInputsConstants.RAW_INPUTS.get(stage, {})
+        paths = [
+            str(path)
+            for upstream_stage, path in inputs.items()
+            if upstream_stage not in stages
+            and not path.is_file()
+            and not (path.is_dir() and any(path.glob("*.html")))
+        ]
+
+        if paths:
+            missing_inputs[stage] = paths
+
+    return missing_inputs
+
+
+def get_stage_graph(
+    stages: list[str] | None = None,
+    years: set[int] | None = None,
+    shard: Shard | None = None,
+    skip_uploads: bool = False,
+) -> StageGraph:
+    """Get a graph of the stages of the pipeline. Each stage depends
+    only on the stages whose files it reads, so, for example, the
+    uploads and the extractions from the league pages run concurrently.
+
+    The processed tables are downloaded first, so only the rows of
+    the extracted pages are replaced, and the crawl continues from its
+    state. If the years are specified, only the pages of these seasons
+    are collected and extracted. A shard runs some of the years and
+    saves partial tables instead, which are merged by the graph of
+    `get_merge_stage_graph` once all shards are completed. The shards
+    run at the same time, so they don't keep the state of the crawl.
+
+    :param stages: Names of the stages to run (all stages if not
+        specified). The outputs of the other stages are expected to
+        exist already.
+    :param years: Season years to run the stages for (all years if
+        not specified).
+    :param shard: A shard of the run (the years are required).
+    :param skip_uploads: Whether to skip the stages that use S3.
+    :return: A graph of the stages.
+    """
+    if shard:
+        years = shard.get_years(years=years)
+
+    uploader = Lazy("uploader.uploader.Uploader")
+    # The collectors share the controller, so each of them starts at
+    # the rate the site tolerated for the previous one.
+    rate_controller = CrawlRateController()
+    # The collectors share the registry, so no page is fetched twice.
+    url_registry = UrlRegistry()
+    # The collectors share the time budget of the run.
+    crawl_deadline = (
+        time.monotonic() + CrawlFrontierConstants.BUDGET_SECONDS
+        if CrawlFrontierConstants.BUDGET_SECONDS is not None
+        else None
+    )
+    season_collector = Lazy(
+        "collectors.seasons.season_collector.SeasonCollector",
+        url=SeasonConstants.URL,
+        rate_controller=rate_controller,
+    )
+    season_extractor = Lazy(
+        "extractors.seasons.season_extractor.SeasonExtractor", years=years
+    )
+    league_collector = Lazy(
+        "collectors.leagues.league_collector.LeagueCollector",
+        rate_controller=rate_controller,
+        url_registry=url_registry,
+    )
+    conference_extractor = Lazy(
+        "extractors.conferences.conference_extractor.ConferenceExtractor",
+        years=years,
+    )
+    conferences_stats_extractor = Lazy(
+        "extractors.conferences.conference_stats_extractor."
+        "ConferenceStatsExtractor",
+        years=years,
+    )
+    team_extractor = Lazy(
+        "extractors.teams.team_extractor.TeamExtractor", years=years
+    )
+    team_collector = Lazy(
+        "collectors.teams.team_collector.TeamCollector",
+        rate_controller=rate_controller,
+        url_registry=url_registry,
+        deadline=crawl_deadline,
+    )
+    team_stats_extractor = Lazy(
+        "extractors.teams.team_stats_extractor.TeamStatsExtractor",
+        years=years,
+    )
+    player_extractor = Lazy(
+        "extractors.players.player_extractor.PlayerExtractor", years=years
+    )
+    player_collector = Lazy(
+        "collectors.players.player_collector.PlayerCollector",
+        rate_controller=rate_controller,
+        url_registry=url_registry,
+        deadline=crawl_deadline,
+    )
+    player_stats_extractor = Lazy(
+        "extractors.players.player_stats_extractor.PlayerStatsExtractor",
+        years=years,
+    )
+    player_career_stats_extractor = Lazy(
+        "extractors.players.player_career_stats_extractor."
+        "PlayerCareerStatsExtractor",
+        years=years,
+    )
+    player_leaderboard_extractor = Lazy(
+        "extractors.players.player_leaderboard_extractor."
+        "PlayerLeaderboardExtractor",
+        years=years,
+    )
+    player_season_extractor = Lazy(
+        "extractors.players.player_season_extractor.PlayerSeasonExtractor",
+        years=years,
+    )
+    player_index = Lazy("query.player_index.PlayerIndex")
+
+    cpu = {PipelineConstants.CPU: 1}
+    # The stages that process the files in the worker processes.
+    workers_cpu = {PipelineConstants.CPU: BaseConstants.MAX_WORKERS}
+    network = {PipelineConstants.NETWORK: 1}
+    upload = {PipelineConstants.UPLOAD: 1}
+
+    graph = StageGraph()
+
+    graph.add(create_base_folders, upl=uploader)
+
+    # The stages that merge their tables with the processed data or
+    # read the state of the crawl.
+    merge_dependencies = ()
+
+    if not shard:
+        graph.add(
+            download_processed_data,
+            dependencies=(create_base_folders,),
+            resources=upload,
+            upl=uploader,
+        )
+
+        merge_dependencies = (download_processed_data,)
+
+    graph.add(
+        collect_seasons,
+        dependencies=(create_base_folders,),
+        resources=network,
+        collector=season_collector,
+    )
+    graph.add(
+        upload_collected_seasons,
+        dependencies=(collect_seasons,),
+        resources=upload,
+        upl=uploader,
+    )
+
+    graph.add(
+        extract_seasons,
+        dependencies=(collect_seasons,),
+        resources=cpu,
+        extractor=season_extractor,
+        shard=shard,
+    )
+    graph.add(
+        upload_extracted_seasons,
+        dependencies=(extract_seasons,),
+        resources=upload,
+        upl=uploader,
+    )
+
+    graph.add(
+        collect_leagues,
+        dependencies=(extract_seasons,),
+        resources=network,
+        collector=league_collector,
+    )
+    graph.add(
+        upload_collected_leagues,
+        dependencies=(collect_leagues,),
+        resources=upload,
+        upl=uploader,
+    )
+
+    graph.add(
+        extract_conferences,
+        dependencies=(collect_leagues, *merge_dependencies),
+        resources=cpu,
+        extractor=conference_extractor,
+        shard=shard,
+    )
+    graph.add(
+        upload_extracted_conferences,
+        dependencies=(extract_conferences,),
+        resources=upload,
+        upl=uploader,
+    )
+
+    graph.add(
+        extract_conferences_stats,
+        dependencies=(collect_leagues, *merge_dependencies),
+        resources=cpu,
+        extractor=conferences_stats_extractor,
+        shard=shard,
+    )
+    graph.add(
+        upload_extracted_conferences_stats,
+        dependencies=(extract_conferences_stats,),
+        resources=upload,
+        upl=uploader,
+    )
+
+    graph.add(
+        extract_teams,
+        dependencies=(collect_leagues,),
+        resources=cpu,
+        extractor=team_extractor,
+    )
+    graph.add(
+        upload_extracted_teams,
+        dependencies=(extract_teams,),
+        resources=upload,
+        upl=uploader,
+    )
+
+    graph.add(
+        collect_teams,
+        dependencies=(extract_teams, *merge_dependencies),
+        resources=network,
+        collector=team_collector,
+    )
+    graph.add(
+        upload_collected_teams,
+        dependencies=(collect_teams,),
+        resources=upload,
+        upl=uploader,
+    )
+
+    graph.add(
+        extract_teams_stats,
+        dependencies=(collect_teams, *merge_dependencies),
+        resources=workers_cpu,
+        extractor=team_stats_extractor,
+        shard=shard,
+    )
+    graph.add(
+        upload_extracted_teams_stats,
+        dependencies=(extract_teams_stats,),
+        resources=upload,
+        upl=uploader,
+    )
+
+    graph.add(
+        extract_players,
+        dependencies=(collect_teams,),
+        resources=cpu,
+        extractor=player_extractor,
+    )
+    graph.add(
+        upload_extracted_players,
+        dependencies=(extract_players,),
+        resources=upload,
+        upl=uploader,
+    )
+
+    graph.add(
+        collect_players,
+        dependencies=(extract_players, *merge_dependencies),
+        resources=network,
+        collector=player_collector,
+    )
+    graph.add(
+        upload_collected_players,
+        dependencies=(collect_players,),
+        resources=upload,
+        upl=uploader,
+    )
+
+    graph.add(
+        extract_players_stats,
+        dependencies=(collect_players, *merge_dependencies),
+        resources=workers_cpu,
+        extractor=player_stats_extractor,
+        shard=shard,
+    )
+    graph.add(
+        upload_extracted_players_stats,
+        dependencies=(extract_players_stats,),
+        resources=upload,
+        upl=uploader,
+    )
+
+    graph.add(
+        extract_players_career_stats,
+        dependencies=(extract_teams_stats, *merge_dependencies),
+        resources=cpu,
+        extractor=player_career_stats_extractor,
+    )
+    graph.add(
+        upload_extracted_players_career_stats,
+        dependencies=(extract_players_career_stats,),
+        resources=upload,
+        upl=uploader,
+    )
+
+    graph.add(
+        extract_players_leaderboards,
+        dependencies=(extract_teams_stats, *merge_dependencies),
+        resources=cpu,
+        extractor=player_leaderboard_extractor,
+    )
+    graph.add(
+        upload_extracted_players_leaderboards,
+        dependencies=(extract_players_leaderboards,),
+        resources=upload,
+        upl=uploader,
+    )
+
+    graph.add(
+        extract_players_seasons,
+        dependencies=(extract_teams_stats, *merge_dependencies),
+        resources=cpu,
+        extractor=player_season_extractor,
+    )
+    graph.add(
+        upload_extracted_players_seasons,
+        dependencies=(extract_players_seasons,),
+        resources=upload,
+        upl=uploader,
+        extractor=player_season_extractor,
+    )
+
+    graph.add(
+        build_players_index,
+        dependencies=(
+            extract_teams_stats,
+            extract_players_stats,
+            extract_players_career_stats,
+            extract_players_leaderboards,
+        ),
+        resources=cpu,
+        index=player_index,
+    )
+    graph.add(
+        upload_players_index,
+        dependencies=(build_players_index,),
+        resources=upload,
+        upl=uploader,
+    )
+
+    if not shard:
+        graph.add(
+            upload_crawl_state,
+            dependencies=(collect_teams, collect_players),
+            resources=upload,
+            upl=uploader,
+        )
+
+    # The stages that write the reports of the run.
+    graph.add(
+        upload_reports,
+        dependencies=(
+            collect_seasons,
+            collect_leagues,
+            collect_teams,
+            collect_players,
+            extract_seasons,
+            extract_conferences,
+            extract_conferences_stats,
+            extract_teams_stats,
+            extract_players_stats,
+        ),
+        resources=upload,
+        upl=uploader,
+        shard=shard,
+    )
+
+    names = set(graph.stages)
+
+    if stages:
+        names = {
+            name for name in names if name not in PipelineConstants.STAGES
+        } | set(stages)
+
+    if shard:
+        names -= set(PipelineConstants.MERGE_STAGES)
+
+    graph = select_stages(graph, names=names, skip_uploads=skip_uploads)
 
+    return graph
+
+
+def get_merge_stage_graph(skip_uploads: bool = False) -> StageGraph:
+    """Get a graph of the stages that merge the partial tables of the
+    shards, upload the merged tables, derive the players career stats,
+    leaderboards, and seasons, and build the players index.
+
+    :param skip_uploads: Whether to skip the stages that use S3.
+    :return: A graph of the stages.
+    """
+    uploader = Lazy("uploader.uploader.Uploader")
+    shard_merger = Lazy("pipeline.shard_merger.ShardMerger")
+    # The careers, leaderboards, and players seasons are derived again
+    # from the merged teams stats.
+    player_career_stats_extractor = Lazy(
+        "extractors.players.player_career_stats_extractor."
+        "PlayerCareerStatsExtractor"
+    )
+    player_leaderboard_extractor = Lazy(
+        "extractors.players.player_leaderboard_extractor."
+        "PlayerLeaderboardExtractor"
+    )
+    player_season_extractor = Lazy(
+        "extractors.players.player_season_extractor.PlayerSeasonExtractor"
+    )
+    player_index = Lazy("query.player_index.PlayerIndex")
+
+    upload = {PipelineConstants.UPLOAD: 1}
+
+    graph = StageGraph()
+
+    graph.add(create_base_folders, upl=uploader)
+    graph.add(
+        download_processed_data,
+        dependencies=(create_base_folders,),
+        resources=upload,
+        upl=uploader,
+    )
+    graph.add(
+        merge_shards,
+        dependencies=(download_processed_data,),
+        resources={PipelineConstants.CPU: 1},
+        merger=shard_merger,
+    )
+
+    upload_stages = (
+        upload_extracted_seasons,
+        upload_extracted_conferences,
+        upload_extracted_conferences_stats,
+        upload_extracted_teams_stats,
+        upload_extracted_players_stats,
+    )
+
+    for upload_stage in upload_stages:
+        graph.add(
+            upload_stage,
+            dependencies=(merge_shards,),
+            resources=upload,
+            upl=uploader,
+        )
+
+    graph.add(
+        delete_merged_shards,
+        dependencies=upload_stages,
+        resources=upload,
+        upl=uploader,
+        merger=shard_merger,
+    )
+
+    graph.add(
+        extract_players_career_stats,
+        dependencies=(merge_shards,),
+        resources={PipelineConstants.CPU: 1},
+        extractor=player_career_stats_extractor,
+    )
+    graph.add(
+        upload_extracted_players_career_stats,
+        dependencies=(extract_players_career_stats,),
+        resources=upload,
+        upl=uploader,
+    )
+
+    graph.add(
+        extract_players_leaderboards,
+        dependencies=(merge_shards,),
+        resources={PipelineConstants.CPU: 1},
+        extractor=player_leaderboard_extractor,
+    )
+    graph.add(
+        upload_extracted_players_leaderboards,
+        dependencies=(extract_players_leaderboards,),
+        resources=upload,
+        upl=uploader,
+    )
+
+    graph.add(
+        extract_players_seasons,
+        dependencies=(merge_shards,),
+        resources={PipelineConstants.CPU: 1},
+        extractor=player_season_extractor,
+    )
+    graph.add(
+        upload_extracted_players_seasons,
+        dependencies=(extract_players_seasons,),
+        resources=upload,
+        upl=uploader,
+        extractor=player_season_extractor,
+    )
+
+    graph.add(
+        build_players_index,
+        dependencies=(
+            extract_players_career_stats,
+            extract_players_leaderboards,
+        ),
+        resources={PipelineConstants.CPU: 1},
+        index=player_index,
+    )
+    graph.add(
+        upload_players_index,
+        dependencies=(build_players_index,),
+        resources=upload,
+        upl=uploader,
+    )
+
+    graph = select_stages(
+        graph, names=set(graph.stages), skip_uploads=skip_uploads
+    )
+
+    return graph
+
+
+def parse_years(value: str) -> set[int]:
+    """Parse a season year (e.g. `2025`) or an inclusive range of
+    the season years (e.g. `2016-2025`).
+
+    :param value: A value to parse.
+    :raises argparse.ArgumentTypeError: If the value is invalid.
+    :return: Season years.
+    """
     try:
-        create_base_folders(upl=uploader)
+        first_year, _, last_year = value.partition("-")
+        years = set(range(int(first_year), int(last_year or first_year) + 1))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid years: `{value}`.")
 
-        collect_seasons(collector=season_collector)
-        upload_collected_seasons(upl=uploader)
+    if not years:
+        raise argparse.ArgumentTypeError(f"Invalid years: `{value}`.")
 
-        extract_seasons(extractor=season_extractor)
-        upload_extracted_seasons(upl=uploader)
+    return years
 
-        collect_leagues(collector=league_collector)
-        upload_collected_leagues(upl=uploader)
 
-        extract_conferences(extractor=conference_extractor)
-        upload_extracted_conferences(upl=uploader)
+def get_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Get command line arguments.
 
-        extract_conferences_stats(extractor=conferences_stats_extractor)
-        upload_extracted_conferences_stats(upl=uploader)
+    :param argv: Arguments to parse (`sys.argv` if not specified).
+    :return: Arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Collect, extract, and upload NBA statistics."
+    )
+    parser.add_argument(
+        "--stages",
+        nargs="+",
+        choices=PipelineConstants.STAGES,
+        metavar="STAGE",
+        help="Stages to run (e.g. `collect_teams extract_teams_stats`).",
+    )
+    parser.add_argument(
+        "--years",
+        type=parse_years,
+        nargs="+",
+        help="Season years to run the stages for (e.g. `2025` or "
+        "`2016-2025`).",
+    )
+    parser.add_argument(
+        "--shard",
+        type=Shard.parse,
+        help="A shard of the years to run, as `INDEX/COUNT` (e.g. `0/4`).",
+    )
+    parser.add_argument(
+        "--merge",
+        action="store_true",
+        help="Merge the partial tables of the completed shards.",
+    )
+    parser.add_argument(
+        "--skip-uploads",
+        action="store_true",
+        help="Skip the stages that use S3 (e.g. for the local runs).",
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.years:
+        args.years = set().union(*args.years)
+
+    if args.shard:
+        if not args.years:
+            parser.error("The years are required to run a shard.")
+
+        # A shard without years has nothing to extract.
+        if args.shard.count > len(args.years) or not args.shard.get_years(
+            years=args.years
+        ):
+            parser.error(
+                f"The shard {args.shard.index}/{args.shard.count} has no "
+                f"years, the number of the shards must not exceed the "
+                f"number of the years."
+            )
 
-        extract_teams(extractor=team_extractor)
-        upload_extracted_teams(upl=uploader)
+    if args.merge and (args.shard or args.stages or args.years):
+        parser.error("The shards are merged without other arguments.")
 
-        collect_teams(collector=team_collector)
-        upload_collected_teams(upl=uploader)
+    return args
 
-        extract_teams_stats(extractor=team_stats_extractor)
-        upload_extracted_teams_stats(upl=uploader)
 
-        extract_players(extractor=player_extractor)
-        upload_extracted_players(upl=uploader)
+if __name__ == "__main__":
+    init_logger(logger_name=LoggerConstants.SERVICE_LOGGER_NAME)
+    src_logger = logging.getLogger(name=LoggerConstants.SERVICE_LOGGER_NAME)
 
-        collect_players(collector=player_collector)
-        upload_collected_players(upl=uploader)
+    args = get_args()
 
-        extract_players_stats(extractor=player_stats_extractor)
-        upload_extracted_players_stats(upl=uploader)
+    try:
+        if args.merge:
+            stage_graph = get_merge_stage_graph(skip_uploads=args.skip_uploads)
+        else:
+            if args.stages:
+                missing_inputs = get_missing_inputs(stages=args.stages)
+
+                if missing_inputs:
+                    raise MissingInputsError(inputs=missing_inputs)
+
+            stage_graph = get_stage_graph(
+                stages=args.stages,
+                years=args.years,
+                shard=args.shard,
+                skip_uploads=args.skip_uploads,
+            )
+
+        stage_executor = StageExecutor(graph=stage_graph)
+        stage_executor.run()
     except Exception as e:
         src_logger.error(msg=e)
+
+        # The failed runs (e.g. of a shard) must fail their tasks.
+        sys.exit(1)
+    finally:
+        metrics_recorder.report()
@@ -1,9 +1,11 @@
 import logging
 import os
+import threading
 from pathlib import Path
 
 import boto3
 
+from common import metrics
 from common.constants import BaseConstants, LoggerConstants
 from common.logger import init_logger
 
@@ -14,6 +16,7 @@ logger = logging.getLogger(name=LoggerConstants.UPLOADER_LOGGER_NAME)
 class Uploader:
     def __init__(self) -> None:
         self._client_name = "s3"
+        self._local = threading.local()
 
     @staticmethod
     def make_base_folder(base_folder: Path) -> None:
@@ -25,11 +28,18 @@ class Uploader:
         os.makedirs(base_folder, exist_ok=True)
 
     def _get_s3_client(self) -> boto3.client:
-        """Initialize an S3 client.
+        """Get an S3 client of the current thread. Each thread creates
+        its client once, from its own session, as the default session
+        isn't thread-safe and the uploads may run concurrently, while
+        creating a client per file is slow.
 
         :return: S3 client.
         """
-        s3_client = boto3.client(self._client_name)
+        s3_client = getattr(self._local, "s3_client", None)
+
+        if s3_client is None:
+            s3_client = boto3.session.Session().client(self._client_name)
+            self._local.s3_client = s3_client
 
         return s3_client
 
@@ -68,7 +78,8 @@ class Uploader:
         """Get a list of filepaths to upload.
 
         :param base_folder: A base folder of the files.
-        :param extensions: Extensions of the files.
+        :param extensions: Extensions (or ends of the filenames, e.g.
+            `segments-index.json`) of the files.
         :return: Filepaths.
         """
         filepaths = [
@@ -95,7 +106,60 @@ class Uploader:
                 filepath=filepath, bucket=BaseConstants.S3_BUCKET
             )
 
+            metrics.increment("files_uploaded")
+            metrics.increment("bytes_uploaded", os.path.getsize(filepath))
+
             logger.info(
                 msg=f"`{filepath.name}` uploaded to "
                 f"`{BaseConstants.S3_BUCKET}` S3 bucket."
             )
+
+    def download_files_from_s3(self, base_folder: Path) -> None:
+        """Download the files of the base folder (e.g. `processed`)
+        from an S3 bucket, keeping the keys as the filepaths.
+
+        :param base_folder: A base folder of the files.
+        :return: None.
+        """
+        s3_client = self._get_s3_client()
+        paginator = s3_client.get_paginator("list_objects_v2")
+
+        for page in paginator.paginate(
+            Bucket=BaseConstants.S3_BUCKET, Prefix=f"{base_folder.name}/"
+        ):
+            for content in page.get("Contents", []):
+                file_key = content["Key"]
+                filepath = base_folder.parent.joinpath(file_key)
+
+                os.makedirs(filepath.parent, exist_ok=True)
+
+                s3_client.download_file(
+                    Bucket=BaseConstants.S3_BUCKET,
+                    Key=file_key,
+                    Filename=str(filepath),
+                )
+
+                logger.info(
+                    msg=f"`{file_key}` downloaded from "
+                    f"`{BaseConstants.S3_BUCKET}` S3 bucket."
+                )
+
+    def delete_files_from_s3(self, filepaths: list[Path]) -> None:
+        """Delete the specified files from an S3 bucket.
+
+        :param filepaths: Filepaths of the files to delete.
+        :return: None.
+        """
+        s3_client = self._get_s3_client()
+
+        for filepath in filepaths:
+            file_key = self.extract_file_key(filepath=filepath)
+
+            s3_client.delete_object(
+                Bucket=BaseConstants.S3_BUCKET, Key=file_key
+            )
+
+            logger.info(
+                msg=f"`{file_key}` deleted from "
+                f"`{BaseConstants.S3_BUCKET}` S3 bucket."
+            )
@@ -1,5 +1,6 @@
 import json
 import os
+import re
 import boto3
 import logging
 
@@ -8,6 +9,95 @@ logger.setLevel(logging.INFO)
 
 ecs_client = boto3.client("ecs")
 
+YEARS_PATTERN = r"^\d{4}(?:-\d{4})?$"
+
+
+def get_years(values: list[str]) -> set[int]:
+    """Get the season years of the event.
+
+    :param values: Years or ranges of years (e.g. `2025`, `2016-2025`).
+    :return: Season years.
+    """
+    years = set()
+
+    for value in values:
+        first_year, _, last_year = value.partition("-")
+        years.update(range(int(first_year), int(last_year or first_year) + 1))
+
+    return years
+
+
+def get_commands(event: dict) -> list[list[str] | None]:
+    """Get commands of the containers to run from the event, one
+    command per ECS task.
+
+    Examples:
+
+        - `{}` runs the whole pipeline in one task.
+        - `{"years": ["2025"]}` runs `python ./service.py --years
+          2025`.
+        - `{"stages": ["collect_seasons", "extract_seasons",
+          "collect_leagues", "extract_teams", "collect_teams",
+          "extract_teams_stats"], "years": ["2025"]}` runs some of the
+          stages. The task starts without the raw data, so the stages
+          that produce the raw inputs of the selected stages must be
+          selected too, starting from `collect_seasons`.
+        - `{"years": ["1950-2025"], "shards": 4}` runs 4 tasks, each
+          with consecutive years (`--shard 0/4`, ..., `--shard 3/4`).
+        - `{"merge": true}` merges the partial tables of the shards.
+
+    :param event: Lambda event data.
+    :raises ValueError: If the stages, years, or shards are invalid.
+    :return: Commands, or None to run the whole pipeline.
+    """
+    if event.get("merge"):
+        return [["python", "./service.py", "--merge"]]
+
+    stages = event.get("stages") or []
+    years = [str(value) for value in event.get("years") or []]
+    shards = event.get("shards", 1)
+
+    if not isinstance(stages, list) or not all(
+        isinstance(stage, str) for stage in stages
+    ):
+        raise ValueError(f"Invalid stages: `{stages}`.")
+
+    for value in years:
+        if not re.fullmatch(pattern=YEARS_PATTERN, string=value):
+            raise ValueError(f"Invalid years: `{value}`.")
+
+    if not isinstance(shards, int) or shards < 1:
+        raise ValueError(f"Invalid shards: `{shards}`.")
+
+    if shards > 1 and not years:
+        raise ValueError("The years are required to run the shards.")
+
+    # A shard without years has nothing to extract, so its task fails.
+    if shards > 1 and len(get_years(values=years)) < shards:
+        raise ValueError(
+            f"Some of the {shards} shards would have no years: `{years}`."
+        )
+
+    if not stages and not years:
+        return [None]
+
+    command = ["python", "./service.py"]
+
+    if stages:
+        command.extend(["--stages", *stages])
+
+    if years:
+        command.extend(["--years", *years])
+
+    if shards == 1:
+        return [command]
+
+    commands = [
+        [*command, "--shard", f"{idx}/{shards}"] for idx in range(shards)
+    ]
+
+    return commands
+
 
 def trigger_ecs_task_handler(event, context) -> dict:
     """Lambda function handler to trigger NBA data collection
@@ -25,6 +115,7 @@ def trigger_ecs_task_handler(event, context) -> dict:
     task_definition = os.environ.get("TASK_DEFINITION")
     subnet_id = os.environ.get("SUBNET_ID")
     security_group_id = os.environ.get("SECURITY_GROUP_ID")
+    container_name = os.environ.get("CONTAINER_NAME")
 
     params = {
         "cluster": cluster_name,
@@ -40,17 +131,35 @@ def trigger_ecs_task_handler(event, context) -> dict:
         },
     }
 
+    # The scheduled runs don't have stages or years, so the whole
+    # pipeline is run in one task.
+    commands = get_commands(event=event)
+
     try:
-        response = ecs_client.run_task(**params)
-        logger.info(
-            msg=f"ECS task started: {json.dumps(response, default=str)}"
-        )
+        task_arns = []
 
-        task_arn = (
-            response.get("tasks")[0].get("taskArn")
-            if response.get("tasks")
-            else None
-        )
+        # The overrides apply to all tasks of a call, so each shard is
+        # started by its own call.
+        for command in commands:
+            task_params = dict(params)
+
+            if command:
+                task_params["overrides"] = {
+                    "containerOverrides": [
+                        {"name": container_name, "command": command}
+                    ]
+                }
+
+            response = ecs_client.run_task(**task_params)
+            logger.info(
+                msg=f"ECS task started: {json.dumps(response, default=str)}"
+            )
+
+            task_arns.append(
+                response.get("tasks")[0].get("taskArn")
+                if response.get("tasks")
+                else None
+            )
 
         response = {
             "statusCode": 200,
@@ -58,7 +167,8 @@ def trigger_ecs_task_handler(event, context) -> dict:
                 {
                     "message": "NBA data collection & extraction task "
                     "started successfully",
-                    "taskArn": task_arn,
+                    "taskArn": task_arns[0],
+                    "taskArns": task_arns,
                 }
             ),
         }
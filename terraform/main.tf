@@ -133,6 +133,7 @@ resource "aws_iam_policy" "s3_access_policy" {
             "s3:PutObject",
             "s3:GetObject",
             "s3:ListObject",
+            "s3:ListBucket",
             "s3:DeleteObject",
           ]
           Resource = [
@@ -189,8 +190,9 @@ resource "aws_ecs_task_definition" "nba_data_task" {
         name      = "nba-data-container"
         image     = "${aws_ecr_repository.nba_data_repo.repository_url}:latest"
         essential = true
-        environemt = [
-          { name = "S3_BUCKET", value = var.data_bucket_name }
+        environment = [
+          { name = "S3_BUCKET", value = var.data_bucket_name },
+          { name = "METRICS_EMF_NAMESPACE", value = var.metrics_namespace }
         ]
 
         logConfiguration = {
@@ -222,6 +224,7 @@ resource "aws_lambda_function" "nba_data_trigger" {
       TASK_DEFINITION   = aws_ecs_task_definition.nba_data_task.arn
       SUBNET_ID         = var.subnet_id
       SECURITY_GROUP_ID = aws_security_group.ecs_tasks.id
+      CONTAINER_NAME    = "nba-data-container"
     }
   }
 }
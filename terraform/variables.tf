@@ -37,3 +37,9 @@ variable "task_memory" {
   type        = string
   default     = "8192" # 8 GB
 }
+
+variable "metrics_namespace" {
+  description = "CloudWatch namespace of the per-stage metrics (EMF)"
+  type        = string
+  default     = "NBAStats"
+}
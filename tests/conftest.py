@@ -1,3 +1,5 @@
+from pathlib import Path
+
 import pytest
 
 from collectors.base_collector import BaseCollector
@@ -14,6 +16,8 @@ from extractors.players.player_stats_extractor import PlayerStatsExtractor
 from extractors.seasons.season_extractor import SeasonExtractor
 from extractors.teams.team_extractor import TeamExtractor
 from extractors.teams.team_stats_extractor import TeamStatsExtractor
+from query.player_index import PlayerIndex
+from query.query_engine import QueryEngine
 
 
 @pytest.fixture
@@ -125,3 +129,25 @@ def team_stats_extractor() -> TeamStatsExtractor:
     :return: An instance of `TeamStatsExtractor`.
     """
     return TeamStatsExtractor()
+
+
+@pytest.fixture
+def query_engine(tmp_path: Path) -> QueryEngine:
+    """Create a fresh instance of `QueryEngine` over a temporary
+    processed folder before each test.
+
+    :param tmp_path: A temporary folder.
+    :return: An instance of `QueryEngine`.
+    """
+    return QueryEngine(base_folder=tmp_path)
+
+
+@pytest.fixture
+def player_index(tmp_path: Path) -> PlayerIndex:
+    """Create a fresh instance of `PlayerIndex` over a temporary
+    processed folder before each test.
+
+    :param tmp_path: A temporary folder.
+    :return: An instance of `PlayerIndex`.
+    """
+    return PlayerIndex(base_folder=tmp_path)
@@ -1,8 +1,17 @@
+import json
+import math
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from requests import Response
 
+from benchmarks.corpus import CorpusConfig, CorpusGenerator
+from benchmarks.mock_server import FaultConfig, MockServer
 from collectors.base_collector import BaseCollector
+from collectors.rate_controller import CrawlRateController
+from collectors.retry_policy import RetryPolicy
+from common.constants import RetryConstants
 
 
 def test_get_html_data(base_collector: BaseCollector) -> None:
@@ -26,10 +35,184 @@ def test_get_html_data(base_collector: BaseCollector) -> None:
 
         assert html_data == "<html><body><h1>NBA</h1></body></html>"
         mock_get.assert_called_once_with(
-            url="https://www.basketball-reference.com/leagues/NBA_2024.html"
+            url="https://www.basketball-reference.com/leagues/NBA_2024.html",
+            timeout=RetryConstants.TIMEOUT_SECONDS,
         )
 
 
+def get_response(status_code: int, headers: dict | None = None) -> Response:
+    """Get a response with the specified status code.
+
+    :param status_code: A status code of the response.
+    :param headers: Headers of the response.
+    :return: Response.
+    """
+    response = Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = b"<html></html>"
+
+    return response
+
+
+def test_get_html_data_with_retries(base_collector: BaseCollector) -> None:
+    """Test whether the rate limited requests and server errors are
+    retried, respecting `Retry-After`.
+
+    :param base_collector: An instance of the `BaseCollector`.
+    :return: None.
+    """
+    # The requests aren't paced, so the only delays are the retries.
+    base_collector.rate_controller = CrawlRateController(
+        initial_rate=math.inf, min_rate=math.inf
+    )
+    responses = [
+        get_response(status_code=429, headers={"Retry-After": "7"}),
+        get_response(status_code=503),
+        get_response(status_code=200),
+    ]
+
+    with (
+        patch(
+            "collectors.base_collector.requests.get", side_effect=responses
+        ) as mock_get,
+        patch("collectors.base_collector.time.sleep") as mock_sleep,
+    ):
+        html_data = base_collector.get_html_data(url="https://.../2024.html")
+
+    assert html_data == "<html></html>"
+    assert mock_get.call_count == 3
+    assert mock_sleep.call_args_list[0].args == (7.0,)
+    assert base_collector.dead_letters == []
+
+
+@pytest.mark.parametrize(
+    "status_codes, attempts",
+    [([404], 1), ([500, 500, 500, 500], 4)],
+)
+def test_get_html_data_with_dead_letter(
+    base_collector: BaseCollector,
+    tmp_path: Path,
+    status_codes: list[int],
+    attempts: int,
+) -> None:
+    """Test whether the URLs that fail after all attempts (or that
+    aren't retried) are saved as the dead letters.
+
+    :param base_collector: An instance of the `BaseCollector`.
+    :param tmp_path: A temporary folder.
+    :param status_codes: Status codes of the responses.
+    :param attempts: An expected number of attempts.
+    :return: None.
+    """
+    filepath = tmp_path.joinpath("dead-letters.json")
+    base_collector.rate_controller = CrawlRateController(
+        initial_rate=math.inf, min_rate=math.inf
+    )
+
+    with (
+        patch(
+            "collectors.base_collector.requests.get",
+            side_effect=[
+                get_response(status_code=status_code)
+                for status_code in status_codes
+            ],
+        ),
+        patch("collectors.base_collector.time.sleep"),
+        patch.object(RetryConstants, "DEAD_LETTERS_FILEPATH", filepath),
+    ):
+        html_data = base_collector.get_html_data(url="https://.../2024.html")
+
+        base_collector.save_dead_letters()
+
+    dead_letters = json.loads(filepath.read_text())
+
+    assert html_data is None
+    assert len(dead_letters) == 1
+    assert dead_letters[0]["status_code"] == status_codes[-1]
+    assert dead_letters[0]["attempts"] == attempts
+
+
+@pytest.mark.parametrize(
+    "value, retry_after",
+    [
+        (None, None),
+        ("120", 120.0),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0),
+        ("soon", None),
+    ],
+)
+def test_get_retry_after(value: str | None, retry_after: float | None) -> None:
+    """Test whether `Retry-After` is parsed as seconds or a date.
+
+    :param value: A value of the header.
+    :param retry_after: An expected delay.
+    :return: None.
+    """
+    response = get_response(
+        status_code=429, headers={"Retry-After": value} if value else None
+    )
+
+    assert BaseCollector.get_retry_after(response=response) == retry_after
+
+
+def test_get_delay() -> None:
+    """Test whether the backoff grows exponentially up to the maximum
+    delay and respects `Retry-After`.
+
+    :return: None.
+    """
+    policy = RetryPolicy(
+        max_attempts=5, base_delay_seconds=1.0, max_delay_seconds=5.0
+    )
+
+    with patch(
+        "collectors.retry_policy.random.uniform", side_effect=lambda a, b: b
+    ):
+        delays = [policy.get_delay(attempt=attempt) for attempt in range(1, 5)]
+        retry_after_delay = policy.get_delay(attempt=1, retry_after=30)
+
+    assert delays == [1.0, 2.0, 4.0, 5.0]
+    assert retry_after_delay == 30
+
+
+def test_get_html_data_from_mock_server(tmp_path: Path) -> None:
+    """Test whether all pages are collected from a server that rate
+    limits and fails some of the requests.
+
+    :param tmp_path: A temporary folder.
+    :return: None.
+    """
+    CorpusGenerator(
+        raw_folder=tmp_path,
+        config=CorpusConfig(seasons=1, teams=2, players_per_team=2),
+    ).generate()
+
+    policy = RetryPolicy(
+        max_attempts=10, base_delay_seconds=0.001, max_delay_seconds=0.01
+    )
+    collector = BaseCollector(
+        retry_policies=dict.fromkeys((429, 500, 502, 503, 504), policy),
+        rate_controller=CrawlRateController(
+            initial_rate=math.inf, min_rate=math.inf
+        ),
+    )
+    faults = FaultConfig(
+        rate_limit_rate=0.3, server_error_rate=0.2, retry_after_seconds=0
+    )
+
+    with MockServer(tmp_path, faults=faults) as server:
+        pages = [
+            collector.get_html_data(url=f"{server.url}/teams/BOS/2016.html")
+            for _ in range(20)
+        ]
+
+    assert all(pages)
+    assert collector.dead_letters == []
+    assert server.status_codes[200] == 20
+    assert server.status_codes[429] > 0
+
+
 @pytest.mark.parametrize(
     "season_year, is_true",
     [("2o24", False), ("193", False), ("aaaa", False), ("2024", True)],
@@ -1,9 +1,19 @@
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
-from common.constants import BaseConstants, LeagueConstants
+from common.constants import (
+    BaseConstants,
+    LeagueConstants,
+    ParquetConstants,
+    SchemaConstants,
+)
+from common.exceptions import MergeKeyError
+from common.metrics import MetricsRecorder
+from common.raw_segments import SegmentWriter
 from extractors.base_extractor import BaseExtractor
 
 
@@ -174,3 +184,372 @@ def test_remove_playoff_team_sign(
     :return: None.
     """
     assert base_extractor.remove_playoff_team_sign(df=df).equals(processed_df)
+
+
+@pytest.mark.parametrize(
+    "table_df, schema, dtypes",
+    [
+        (
+            pd.DataFrame(
+                {
+                    "team": ["BOS", "ATL"],
+                    "games": [82.0, None],
+                    "salary": ["$1,234,567", "$75,000"],
+                    "field_goal_percentage": [".512", ".488"],
+                }
+            ),
+            pa.schema(
+                [
+                    ("team", pa.dictionary(pa.int32(), pa.string())),
+                    ("games", pa.int16()),
+                    ("salary", pa.int32()),
+                    ("field_goal_percentage", pa.float32()),
+                ]
+            ),
+            ["category", "Int16", "Int32", "float32"],
+        ),
+        (
+            pd.DataFrame(
+                {"player": ["Walt Davis"], "is_playoff_team": [True]}
+            ),
+            pa.schema([("player", pa.string()), ("awards", pa.string())]),
+            ["string", "bool"],
+        ),
+    ],
+)
+def test_cast_table(
+    base_extractor: BaseExtractor,
+    table_df: pd.DataFrame,
+    schema: pa.Schema,
+    dtypes: list[str],
+) -> None:
+    """Test whether the columns of the table are cast to the schema.
+
+    :param base_extractor: An instance of the `BaseExtractor`.
+    :param table_df: A table to cast.
+    :param schema: Arrow schema of the table.
+    :param dtypes: Data types to compare with the data types of the
+        table returned from the method.
+    :return: None.
+    """
+    cast_df = base_extractor.cast_table(table_df=table_df, schema=schema)
+
+    assert [str(dtype) for dtype in cast_df.dtypes] == dtypes
+
+
+def test_cast_column_invalid_integers(base_extractor: BaseExtractor) -> None:
+    """Test whether the values that don't fit an integer type are
+    replaced with missing values instead of failing the cast.
+
+    :param base_extractor: An instance of the `BaseExtractor`.
+    :return: None.
+    """
+    column = base_extractor.cast_column(
+        pd.Series(["12", "1.5", "40000", None, "-3"]),
+        data_type=pa.int16(),
+    )
+
+    assert str(column.dtype) == "Int16"
+    assert column.tolist() == [12, pd.NA, pd.NA, pd.NA, -3]
+
+
+@pytest.mark.parametrize(
+    "href, player_slug",
+    [
+        ("/players/j/jokicni01.html", "jokicni01"),
+        (
+            "https://www.basketball-reference.com/players/t/tatumja01.html",
+            "tatumja01",
+        ),
+        ("/teams/BOS/2024.html", None),
+        (None, None),
+    ],
+)
+def test_extract_player_slug(
+    base_extractor: BaseExtractor, href: str | None, player_slug: str | None
+) -> None:
+    """Test whether a slug of the player is extracted correctly.
+
+    :param base_extractor: An instance of the `BaseExtractor`.
+    :param href: A href value from which to extract the slug.
+    :param player_slug: A value to compare with the value returned
+        from the method.
+    :return: None.
+    """
+    assert base_extractor.extract_player_slug(href=href) == player_slug
+
+
+def test_get_player_id(base_extractor: BaseExtractor) -> None:
+    """Test whether player IDs are stable and unique 64-bit integers.
+
+    :param base_extractor: An instance of the `BaseExtractor`.
+    :return: None.
+    """
+    player_id = base_extractor.get_player_id(player_slug="jokicni01")
+
+    assert player_id == base_extractor.get_player_id(player_slug="jokicni01")
+    assert player_id != base_extractor.get_player_id(player_slug="jokicni02")
+    assert -(2**63) <= player_id < 2**63
+    assert base_extractor.get_player_id(player_slug=None) is None
+
+
+def test_split_links(base_extractor: BaseExtractor) -> None:
+    """Test whether (text, link) tuples are split into texts and the
+    players slugs and IDs are added.
+
+    :param base_extractor: An instance of the `BaseExtractor`.
+    :return: None.
+    """
+    table_df = pd.DataFrame(
+        {
+            "rank": [("1", None), float("nan")],
+            "player": [
+                ("Jayson Tatum", "/players/t/tatumja01.html"),
+                "Team Totals",
+            ],
+            "awards": [("", None), float("nan")],
+        }
+    )
+
+    split_df = base_extractor.split_links(table_df=table_df)
+
+    assert split_df["player"].to_list() == ["Jayson Tatum", "Team Totals"]
+    assert split_df["rank"].iloc[0] == "1"
+    assert split_df["awards"].isnull().all()
+    assert split_df["player_slug"].to_list() == ["tatumja01", None]
+    assert split_df["player_id"].to_list() == [
+        base_extractor.get_player_id(player_slug="tatumja01"),
+        pd.NA,
+    ]
+
+
+@pytest.mark.parametrize(
+    "years, filenames",
+    [
+        (None, ["bos-2024.html", "bos-2025.html", "nba-2025.html"]),
+        ({2025}, ["bos-2025.html", "nba-2025.html"]),
+        ({2016, 2017}, []),
+    ],
+)
+def test_get_filepaths(
+    base_extractor: BaseExtractor,
+    tmp_path: Path,
+    years: set[int] | None,
+    filenames: list[str],
+) -> None:
+    """Test whether the files of the specified years are returned.
+
+    :param base_extractor: An instance of the `BaseExtractor`.
+    :param tmp_path: A temporary folder.
+    :param years: Season years of the files.
+    :param filenames: Expected filenames.
+    :return: None.
+    """
+    for filename in ["bos-2024.html", "bos-2025.html", "nba-2025.html"]:
+        tmp_path.joinpath(filename).touch()
+
+    filepaths = base_extractor.get_filepaths(base_folder=tmp_path, years=years)
+
+    assert sorted(filepath.name for filepath in filepaths) == filenames
+
+
+def test_merge_table(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test whether only the rows of the extracted pages are replaced
+    in the existing table, and the rows of the other pages are kept.
+
+    :param tmp_path: A temporary folder.
+    :param monkeypatch: A fixture to register the schema of the table.
+    :return: None.
+    """
+    filepath = tmp_path.joinpath("rosters.parquet")
+    schema = pa.schema([("team", pa.dictionary(pa.int32(), pa.string()))])
+    schema = schema.append(pa.field("year", pa.int16()))
+    schema = schema.append(pa.field("player", pa.string()))
+
+    monkeypatch.setitem(SchemaConstants.SCHEMAS, filepath, schema)
+    monkeypatch.setitem(SchemaConstants.MERGE_KEYS, filepath, ("team", "year"))
+
+    existing_df = pd.DataFrame(
+        {
+            "team": ["BOS", "BOS", "LAL"],
+            "year": [2024, 2025, 2025],
+            "player": ["A", "B", "C"],
+        }
+    )
+    existing_df.to_parquet(filepath, index=False)
+
+    # The page of BOS 2025 isn't extracted (e.g. it's deferred).
+    table_df = pd.DataFrame(
+        {"team": ["LAL", "LAL"], "year": [2025, 2025], "player": ["D", "E"]}
+    )
+
+    for years in ({2025}, None):
+        merged_df = BaseExtractor(years=years).merge_table(
+            table_df=table_df, filepath=filepath
+        )
+
+        assert merged_df.to_dict(orient="list") == {
+            "team": ["BOS", "BOS", "LAL", "LAL"],
+            "year": [2024, 2025, 2025, 2025],
+            "player": ["A", "B", "D", "E"],
+        }
+        assert str(merged_df["team"].dtype) == "category"
+
+    # A table of the stats that no page has keeps the existing rows.
+    assert len(
+        BaseExtractor(years={2025}).merge_table(
+            table_df=pd.DataFrame(), filepath=filepath
+        )
+    ) == len(existing_df)
+
+
+def test_merge_table_without_key(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test whether the extracted rows aren't merged with an existing
+    table without the key column, so the table isn't overwritten with
+    the extracted rows only.
+
+    :param tmp_path: A temporary folder.
+    :param monkeypatch: A fixture to register the schema of the table.
+    :return: None.
+    """
+    filepath = tmp_path.joinpath("players-stats.parquet")
+    schema = pa.schema([("player_id", pa.int64()), ("player", pa.string())])
+
+    monkeypatch.setitem(SchemaConstants.SCHEMAS, filepath, schema)
+    monkeypatch.setitem(SchemaConstants.MERGE_KEYS, filepath, ("player_id",))
+
+    pd.DataFrame({"player": ["A", "B"]}).to_parquet(filepath, index=False)
+
+    table_df = pd.DataFrame({"player_id": [2], "player": ["B"]})
+
+    with pytest.raises(MergeKeyError, match="Run all years"):
+        BaseExtractor(years={2025}).merge_table(
+            table_df=table_df, filepath=filepath
+        )
+
+    # All years are extracted, so the table is rebuilt.
+    assert (
+        BaseExtractor()
+        .merge_table(table_df=table_df, filepath=filepath)
+        .equals(table_df)
+    )
+
+
+def test_save_table(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test whether a table is saved with the configured options of
+    the Parquet writer, and whether the options can be overridden.
+
+    :param tmp_path: A temporary folder.
+    :param monkeypatch: A fixture to configure the options.
+    :return: None.
+    """
+    filepath = tmp_path.joinpath("rosters.parquet")
+    table_df = pd.DataFrame(
+        {"player": ["A", "B", "C"], "points": [10, 20, 30]}
+    )
+
+    monkeypatch.setattr(
+        ParquetConstants,
+        "OPTIONS",
+        {
+            **ParquetConstants.OPTIONS,
+            "compression": "zstd",
+            "row_group_size": 2,
+            "write_statistics": ["player"],
+        },
+    )
+
+    BaseExtractor.save_table(table_df, filepath=filepath)
+
+    metadata = pq.ParquetFile(filepath).metadata
+    player, points = (metadata.row_group(0).column(i) for i in range(2))
+
+    assert metadata.num_row_groups == 2
+    assert player.compression == "ZSTD"
+    assert (player.statistics.min, player.statistics.max) == ("A", "B")
+    assert points.statistics is None
+    assert pd.read_parquet(filepath).equals(table_df)
+
+    BaseExtractor.save_table(
+        table_df,
+        filepath=filepath,
+        options={"compression": "snappy", "use_dictionary": ["player"]},
+    )
+
+    player, points = (
+        pq.ParquetFile(filepath).metadata.row_group(0).column(i)
+        for i in range(2)
+    )
+
+    assert player.compression == "SNAPPY"
+    assert "RLE_DICTIONARY" in player.encodings
+    assert "RLE_DICTIONARY" not in points.encodings
+
+
+def test_process_files(tmp_path: Path) -> None:
+    """Test whether the files are processed by the worker processes and
+    whether their CPU time is added to the stage.
+
+    :param tmp_path: A temporary folder.
+    :return: None.
+    """
+    filepaths = []
+
+    for idx in range(3):
+        filepath = tmp_path.joinpath(f"table-{idx}.csv")
+        pd.DataFrame({"year": [2016 + idx] * 1000}).to_csv(filepath)
+        filepaths.append(filepath)
+
+    with MetricsRecorder().stage(name="extract_teams_stats") as stage_metrics:
+        table_df = BaseExtractor.process_files(
+            func=pd.read_csv, filepaths=filepaths
+        )
+
+    assert len(table_df) == 3000
+    # The rows are indexed by their files.
+    years = table_df.groupby(level=0, observed=True)["year"].agg(set)
+
+    assert table_df.index.name == "source"
+    assert years.to_dict() == {
+        f"{tmp_path.name}/table-{idx}.csv": {2016 + idx} for idx in range(3)
+    }
+    assert stage_metrics.counters.files_read == 3
+    assert stage_metrics.workers_cpu_seconds > 0
+    assert stage_metrics.cpu_seconds >= stage_metrics.workers_cpu_seconds
+    assert stage_metrics.children_peak_rss_bytes > 0
+
+
+def test_process_no_files() -> None:
+    """Test whether an empty list of files is an empty dataframe.
+
+    :return: None.
+    """
+    assert BaseExtractor.process_files(func=pd.read_csv, filepaths=[]).empty
+
+
+def test_map_html(tmp_path: Path) -> None:
+    """Test whether the pages saved as files and in the segments are
+    parsed from the mapped bytes like the decoded HTML data.
+
+    :param tmp_path: A temporary folder.
+    :return: None.
+    """
+    html_data = "<html><body><p>Nikola Jokić</p></body></html>"
+    filepath = tmp_path.joinpath("jokicni01.html")
+    filepath.write_text(html_data, encoding="utf-8")
+    empty_filepath = tmp_path.joinpath("empty.html")
+    empty_filepath.touch()
+
+    with SegmentWriter(tmp_path) as writer:
+        writer.write("tatumja01.html", data=html_data.encode("utf-8"))
+
+    for page_filepath in (filepath, tmp_path.joinpath("tatumja01.html")):
+        with BaseExtractor.map_html(filepath=page_filepath) as buffer:
+            soup = BaseExtractor.get_soup(html_data=buffer)
+
+        assert soup.p.text == "Nikola Jokić"
+
+    with BaseExtractor.map_html(filepath=empty_filepath) as buffer:
+        assert len(buffer) == 0
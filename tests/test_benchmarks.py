@@ -0,0 +1,106 @@
+from pathlib import Path
+
+import pytest
+
+from benchmarks.corpus import CorpusConfig, CorpusGenerator
+from benchmarks.run_benchmarks import check_budgets, compare_results, run
+
+
+@pytest.mark.parametrize(
+    "column, header_label",
+    [
+        ("2P", "2P"),
+        ("2P.1", "2P"),
+        ("Md..1", "Md."),
+        ("Attend.", "Attend."),
+        ("Unnamed: 1", ""),
+    ],
+)
+def test_get_header_label(column: str, header_label: str) -> None:
+    """Test whether the header labels are rendered as on the pages.
+
+    :param column: A column name as pandas reads it.
+    :param header_label: A value to compare with the value returned
+        from the method.
+    :return: None.
+    """
+    assert CorpusGenerator.get_header_label(column=column) == header_label
+
+
+def test_generate(tmp_path: Path) -> None:
+    """Test whether the corpus is laid out as the collectors save it
+    and whether the same config generates the same corpus.
+
+    :param tmp_path: A temporary folder.
+    :return: None.
+    """
+    config = CorpusConfig(seasons=2, teams=4, players_per_team=3)
+
+    stats = CorpusGenerator(
+        raw_folder=tmp_path.joinpath("first"), config=config
+    ).generate()
+    same_stats = CorpusGenerator(
+        raw_folder=tmp_path.joinpath("second"), config=config
+    ).generate()
+
+    assert stats == same_stats
+    assert stats.files["leagues"] == 2
+    assert stats.files["teams"] == 8
+    assert tmp_path.joinpath("first", "teams", "atl-2016.html").exists()
+    assert tmp_path.joinpath("first", "leagues", "nba-2017.html").exists()
+
+
+def test_run() -> None:
+    """Test whether every benchmark runs on a small corpus and whether
+    the results are compared with the baseline.
+
+    :return: None.
+    """
+    report = run(
+        CorpusConfig(seasons=1, teams=2, players_per_team=2),
+        groups=[
+            "extractors",
+            "process_files",
+            "parquet",
+            "compression",
+            "collectors",
+            "startup",
+        ],
+        repeats=1,
+        workers=[1],
+    )
+
+    results = {
+        f"{result['group']}/{result['name']}": result
+        for result in report["results"]
+    }
+
+    assert results["extractors/TeamStatsExtractor.get_rosters_df"]["rows"] == 4
+    assert results["process_files/workers=1"]["speedup"] == 1
+    assert results["parquet/TeamStatsExtractor.get_salaries_df"]["bytes"] > 0
+    assert results["compression/zstd-3/read"]["files"] == len(
+        results["compression/none/write"]["tables_bytes"]
+    )
+    assert results["compression/zstd-3/write"]["bytes"] > 0
+    # 1 seasons page, 1 league page, 2 team pages, and 4 player pages.
+    assert results["collectors/service"]["files"] == 8
+    assert results["collectors/collect_players"]["files"] == 4
+    # Only the stages import the heavy modules they use.
+    assert results["startup/import"]["modules"] == []
+    assert "pandas" not in results["startup/upload_stage"]["modules"]
+    assert "bs4" in results["startup/extract_stage"]["modules"]
+
+    baseline = {
+        "results": [
+            {**result, "seconds": {"median": result["seconds"]["median"] / 2}}
+            for result in report["results"]
+        ]
+    }
+
+    assert check_budgets(
+        {"results": [{**results["startup/import"], "budget_seconds": 0}]}
+    ) == ["startup/import"]
+    assert compare_results(report, report, threshold=0.1) == []
+    assert len(compare_results(report, baseline, threshold=0.1)) == len(
+        results
+    )
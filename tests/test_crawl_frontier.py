@@ -0,0 +1,132 @@
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from collectors.crawl_frontier import CrawlFrontier
+from common.constants import CrawlFrontierConstants
+
+DAY_SECONDS = 86400
+
+
+@pytest.fixture
+def state_filepath(tmp_path: Path) -> Path:
+    """Save a state of the crawl with a page that changed recently and
+    a page fetched long ago.
+
+    :param tmp_path: A temporary folder.
+    :return: A filepath of the state.
+    """
+    now = time.time()
+    state_filepath = tmp_path.joinpath("crawl-state.json")
+    state = {
+        "changed": {
+            "digest": "a",
+            "fetched_at": now - DAY_SECONDS,
+            "changed_at": now - DAY_SECONDS,
+        },
+        "historic": {
+            "digest": "b",
+            "fetched_at": now
+            - (CrawlFrontierConstants.HISTORIC_REVISIT_DAYS + 1) * DAY_SECONDS,
+        },
+        "fresh": {"digest": "c", "fetched_at": now - DAY_SECONDS},
+    }
+
+    state_filepath.write_text(json.dumps(state))
+
+    return state_filepath
+
+
+def test_order(tmp_path: Path, state_filepath: Path) -> None:
+    """Test whether the current season comes first, then the pages that
+    changed recently, the new pages, and the historic pages due for a
+    revisit, while the fresh historic pages are skipped.
+
+    :param tmp_path: A temporary folder.
+    :param state_filepath: A filepath of the state of the crawl.
+    :return: None.
+    """
+    frontier = CrawlFrontier(current_year=2025, state_filepath=state_filepath)
+    filepath = tmp_path.joinpath("page.html")
+    filepath.touch()
+
+    for url, year in [
+        ("historic", 2001),
+        ("fresh", 2002),
+        ("new-2010", 2010),
+        ("new-2020", 2020),
+        ("changed", 2003),
+        ("current", 2025),
+    ]:
+        frontier.add(url=url, year=year, filepath=filepath)
+
+    assert list(frontier) == [
+        "current",
+        "changed",
+        "new-2020",
+        "new-2010",
+        "historic",
+    ]
+
+    # The fresh page is fetched if it isn't saved.
+    frontier.add(
+        url="fresh", year=2002, filepath=tmp_path.joinpath("missing.html")
+    )
+
+    assert list(frontier) == ["fresh"]
+
+
+def test_deadline(tmp_path: Path) -> None:
+    """Test whether the URLs left after the deadline are deferred.
+
+    :param tmp_path: A temporary folder.
+    :return: None.
+    """
+    frontier = CrawlFrontier(
+        current_year=2025,
+        deadline=time.monotonic() + 60,
+        state_filepath=tmp_path.joinpath("crawl-state.json"),
+    )
+
+    for year in range(2020, 2026):
+        frontier.add(
+            url=str(year), year=year, filepath=tmp_path.joinpath("missing")
+        )
+
+    urls = []
+
+    for url in frontier:
+        urls.append(url)
+
+        if len(urls) == 2:
+            frontier.deadline = time.monotonic()
+
+    assert urls == ["2025", "2024"]
+    assert len(frontier) == 0
+
+
+def test_record(state_filepath: Path) -> None:
+    """Test whether the fetched pages are recorded, the changed ones
+    with the time of the change, and saved with the other pages.
+
+    :param state_filepath: A filepath of the state of the crawl.
+    :return: None.
+    """
+    frontier = CrawlFrontier(current_year=2025, state_filepath=state_filepath)
+
+    frontier.record(url="historic", html_data="<html></html>")
+    frontier.record(url="new", html_data="<html></html>")
+    frontier.save()
+
+    state = json.loads(state_filepath.read_text())
+
+    assert set(state) == {"changed", "historic", "fresh", "new"}
+    assert "changed_at" in state["historic"]
+    assert "changed_at" not in state["new"]
+    assert state["new"]["digest"] == state["historic"]["digest"]
+    assert (
+        frontier.get_priority(url="historic", year=2001)
+        == CrawlFrontierConstants.RECENTLY_CHANGED_PRIORITY
+    )
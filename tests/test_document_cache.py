@@ -0,0 +1,95 @@
+import os
+from pathlib import Path
+
+from extractors.base_extractor import BaseExtractor
+from extractors.document_cache import DocumentCache
+from extractors.teams.team_stats_extractor import TeamStatsExtractor
+
+
+def test_get(tmp_path: Path) -> None:
+    """Test whether the parsed pages are kept until they're evicted or
+    saved again.
+
+    :param tmp_path: A temporary folder.
+    :return: None.
+    """
+    cache = DocumentCache(max_documents=2)
+    parsed = []
+
+    def get(filepath: Path) -> object:
+        def parse() -> object:
+            parsed.append(filepath.name)
+
+            return object()
+
+        return cache.get(filepath=filepath, parse=parse)
+
+    filepaths = [tmp_path.joinpath(f"{team}-2025.html") for team in "abc"]
+
+    for filepath in filepaths:
+        filepath.write_text("<html></html>", encoding="utf-8")
+
+    soup = get(filepaths[0])
+
+    assert get(filepaths[0]) is soup
+
+    get(filepaths[1])
+    get(filepaths[0])
+    # The least recently used page is evicted.
+    get(filepaths[2])
+    get(filepaths[0])
+    get(filepaths[1])
+
+    # A page saved again is parsed again.
+    os.utime(filepaths[0], ns=(0, 0))
+    get(filepaths[0])
+
+    assert parsed == ["a-2025.html", "b-2025.html", "c-2025.html"] + [
+        "b-2025.html",
+        "a-2025.html",
+    ]
+    assert cache.get_counters() == {
+        "document_cache_hits": 3,
+        "document_cache_misses": 5,
+        "document_cache_evictions": 3,
+    }
+    assert len(cache) == 2
+
+
+def test_get_document(tmp_path: Path) -> None:
+    """Test whether the tables of a page are looked up in the page
+    parsed once, and whether the team pages are parsed without the
+    comment markers separately.
+
+    :param tmp_path: A temporary folder.
+    :return: None.
+    """
+    filepath = tmp_path.joinpath("bos-2025.html")
+    filepath.write_text(
+        '<html><table id="roster"><tr><th>Player</th></tr>'
+        "<tr><td>Jayson Tatum</td></tr></table>"
+        '<!--<table id="salaries2"><tr><th>Salary</th></tr>'
+        "<tr><td>$1</td></tr></table>--></html>",
+        encoding="utf-8",
+    )
+    base_extractor = BaseExtractor()
+    team_stats_extractor = TeamStatsExtractor()
+    misses = BaseExtractor.document_cache.misses
+
+    tables_dfs = [
+        extractor.get_table_df_by_id(
+            soup=extractor.get_document(filepath=filepath),
+            _id=_id,
+            header=0,
+        )
+        for extractor in (base_extractor, team_stats_extractor)
+        for _id in ("roster", "salaries2")
+    ]
+
+    assert [table_df.empty for table_df in tables_dfs] == [
+        False,
+        True,
+        False,
+        False,
+    ]
+    assert BaseExtractor.document_cache.misses - misses == 2
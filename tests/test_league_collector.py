@@ -1,4 +1,5 @@
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -39,3 +40,35 @@ def test_get_league_filepath(
         league_collector.get_league_filepath(season_url=season_url)
         == league_filepath
     )
+
+
+def test_get_leagues_html_data_with_failed_page(
+    league_collector: LeagueCollector,
+) -> None:
+    """Test whether the pages that can't be retrieved are skipped
+    instead of being saved.
+
+    :param league_collector: An instance of the `LeagueCollector`.
+    :return: None.
+    """
+    seasons_urls = {
+        "2022-23": "https://www.basketball-reference.com/leagues/NBA_2023.html",
+        "2023-24": "https://www.basketball-reference.com/leagues/NBA_2024.html",
+    }
+
+    with (
+        patch.object(league_collector, "read_json", return_value=seasons_urls),
+        patch.object(
+            league_collector, "get_html_data", side_effect=[None, "<html>"]
+        ),
+        patch.object(league_collector, "save_html") as mock_save_html,
+        patch.object(league_collector, "save_dead_letters"),
+    ):
+        league_collector.get_leagues_html_data()
+
+    mock_save_html.assert_called_once_with(
+        html_data="<html>",
+        filepath=BaseConstants.RAW_FOLDER.joinpath(
+            LeagueConstants.LEAGUES_FOLDER, "nba-2024.html"
+        ),
+    )
@@ -0,0 +1,156 @@
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from common import metrics
+from common.metrics import MetricsRecorder
+
+
+@pytest.fixture
+def metrics_recorder() -> MetricsRecorder:
+    """Create a fresh instance of `MetricsRecorder` before each test.
+
+    :return: An instance of `MetricsRecorder`.
+    """
+    return MetricsRecorder()
+
+
+def test_stage(metrics_recorder: MetricsRecorder) -> None:
+    """Test whether the counters are recorded for the running stage
+    only and whether the time is measured.
+
+    :param metrics_recorder: An instance of the `MetricsRecorder`.
+    :return: None.
+    """
+    metrics.increment("pages_fetched")
+
+    with metrics_recorder.stage(name="collect_seasons") as stage_metrics:
+        metrics.increment("pages_fetched")
+        metrics.increment("bytes_fetched", 1024)
+
+        sum(range(100_000))
+
+    metrics.increment("pages_fetched")
+
+    assert stage_metrics.status == "succeeded"
+    assert stage_metrics.counters.pages_fetched == 1
+    assert stage_metrics.counters.bytes_fetched == 1024
+    assert stage_metrics.wall_seconds > 0
+    assert stage_metrics.cpu_seconds >= 0
+    assert stage_metrics.peak_rss_bytes > 0
+
+
+def test_concurrent_stages(metrics_recorder: MetricsRecorder) -> None:
+    """Test whether the CPU time of the concurrent stages is measured
+    by their threads and whether the overlapping stages are marked.
+
+    :param metrics_recorder: An instance of the `MetricsRecorder`.
+    :return: None.
+    """
+    started = threading.Event()
+    completed = threading.Event()
+
+    def wait() -> None:
+        with metrics_recorder.stage(name="collect_teams"):
+            started.set()
+            completed.wait(timeout=10)
+
+    thread = threading.Thread(target=wait)
+    thread.start()
+    started.wait(timeout=10)
+
+    with metrics_recorder.stage(name="extract_teams") as stage_metrics:
+        sum(range(3_000_000))
+
+    completed.set()
+    thread.join()
+
+    with metrics_recorder.stage(name="extract_players"):
+        pass
+
+    stages = {
+        stage_metrics.stage: stage_metrics
+        for stage_metrics in metrics_recorder.stages
+    }
+
+    assert stages["collect_teams"].cpu_seconds < stage_metrics.cpu_seconds
+    assert stages["collect_teams"].overlapped
+    assert stages["extract_teams"].overlapped
+    assert not stages["extract_players"].overlapped
+    assert metrics_recorder.get_report()["scopes"]["cpu_seconds"]
+
+
+def test_track(metrics_recorder: MetricsRecorder) -> None:
+    """Test whether a failed stage is recorded and the error is raised.
+
+    :param metrics_recorder: An instance of the `MetricsRecorder`.
+    :return: None.
+    """
+
+    @metrics_recorder.track
+    def extract_seasons() -> None:
+        metrics.increment("rows", 10)
+
+        raise ValueError("Invalid season.")
+
+    with pytest.raises(ValueError):
+        extract_seasons()
+
+    report = metrics_recorder.get_report()
+
+    assert report["status"] == "failed"
+    assert report["totals"]["rows"] == 10
+    assert report["stages"][0]["stage"] == "extract_seasons"
+    assert report["stages"][0]["error"] == "ValueError('Invalid season.')"
+
+
+def test_report(
+    metrics_recorder: MetricsRecorder,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture,
+) -> None:
+    """Test whether the JSON report, Prometheus textfile, and EMF
+    events are written when configured.
+
+    :param metrics_recorder: An instance of the `MetricsRecorder`.
+    :param tmp_path: A temporary folder.
+    :param monkeypatch: A fixture to set the environment variables.
+    :param capsys: A fixture to capture the standard output.
+    :return: None.
+    """
+    report_filepath = tmp_path.joinpath("run-report.json")
+    prometheus_filepath = tmp_path.joinpath("nba-stats.prom")
+
+    monkeypatch.setenv("METRICS_REPORT_FILEPATH", str(report_filepath))
+    monkeypatch.setenv("METRICS_PROMETHEUS_TEXTFILE", str(prometheus_filepath))
+    monkeypatch.setenv("METRICS_EMF_NAMESPACE", "NBAStats")
+
+    with metrics_recorder.stage(name="upload_collected_seasons"):
+        metrics.increment("files_uploaded", 3)
+
+    metrics_recorder.report()
+
+    with open(report_filepath, mode="r", encoding="utf-8") as f:
+        report = json.load(f)
+
+    assert report["totals"]["files_uploaded"] == 3
+
+    assert (
+        'nba_stats_stage_files_uploaded{stage="upload_collected_seasons",'
+        'status="succeeded"} 3'
+    ) in prometheus_filepath.read_text()
+
+    events = [
+        json.loads(line)
+        for line in capsys.readouterr().out.splitlines()
+        if line.startswith("{")
+    ]
+
+    assert events[0]["Stage"] == "upload_collected_seasons"
+    assert events[0]["files_uploaded"] == 3
+    assert events[0]["_aws"]["CloudWatchMetrics"][0]["Namespace"] == (
+        "NBAStats"
+    )
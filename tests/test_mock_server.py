@@ -0,0 +1,91 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+import requests
+
+from benchmarks.corpus import CorpusConfig, CorpusGenerator
+from benchmarks.mock_server import FaultConfig, MockServer
+
+
+@pytest.fixture
+def corpus_folder(tmp_path: Path) -> Iterator[Path]:
+    """Generate a synthetic corpus of a single season.
+
+    :param tmp_path: A temporary folder.
+    :return: A folder of the corpus.
+    """
+    CorpusGenerator(
+        raw_folder=tmp_path,
+        config=CorpusConfig(seasons=1, teams=2, players_per_team=2),
+    ).generate()
+
+    yield tmp_path
+
+
+@pytest.mark.parametrize(
+    "path, filepath",
+    [
+        ("/leagues/", "seasons/seasons.html"),
+        ("/leagues/NBA_2016.html", "leagues/nba-2016.html"),
+        ("/teams/BOS/2016.html", "teams/bos-2016.html"),
+    ],
+)
+def test_get_page(corpus_folder: Path, path: str, filepath: str) -> None:
+    """Test whether the pages are served under the URLs of the site.
+
+    :param corpus_folder: A folder of the corpus.
+    :param path: A URL path of the page.
+    :param filepath: A corpus filepath of the page.
+    :return: None.
+    """
+    with MockServer(corpus_folder) as server:
+        response = requests.get(url=server.url + path)
+
+    assert response.status_code == 200
+    assert response.content == corpus_folder.joinpath(filepath).read_bytes()
+    assert server.status_codes == {200: 1}
+
+
+def test_get_missing_page(corpus_folder: Path) -> None:
+    """Test whether the unknown URLs are `404` Not Found.
+
+    :param corpus_folder: A folder of the corpus.
+    :return: None.
+    """
+    with MockServer(corpus_folder) as server:
+        response = requests.get(url=f"{server.url}/teams/XXX/1900.html")
+
+    assert response.status_code == 404
+
+
+def test_inject_faults(corpus_folder: Path) -> None:
+    """Test whether the rate limit and server errors are injected at
+    the configured rates.
+
+    :param corpus_folder: A folder of the corpus.
+    :return: None.
+    """
+    faults = FaultConfig(
+        rate_limit_rate=0.3, server_error_rate=0.2, retry_after_seconds=5
+    )
+
+    with MockServer(corpus_folder, faults=faults) as server:
+        responses = [
+            requests.get(url=f"{server.url}/teams/BOS/2016.html")
+            for _ in range(200)
+        ]
+
+    rate_limited = [
+        response for response in responses if response.status_code == 429
+    ]
+    server_errors = [
+        response for response in responses if response.status_code >= 500
+    ]
+
+    assert 40 <= len(rate_limited) <= 80
+    assert 20 <= len(server_errors) <= 60
+    assert all(
+        response.headers["Retry-After"] == "5" for response in rate_limited
+    )
+    assert sum(server.status_codes.values()) == 200
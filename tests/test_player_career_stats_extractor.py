@@ -0,0 +1,112 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from common.constants import PlayerCareerStatsConstants
+from extractors.players.player_career_stats_extractor import (
+    PlayerCareerStatsExtractor,
+)
+
+
+@pytest.fixture
+def stats_filepaths(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Save the per-season tables of a traded player, a player of an
+    earlier season, and the team totals.
+
+    :param tmp_path: A temporary folder.
+    :param monkeypatch: A fixture to patch the filepaths of the tables.
+    :return: None.
+    """
+    totals_df = pd.DataFrame(
+        {
+            "player_id": [1, 1, 1, 2, None],
+            "player": ["A", "A", "A", "B", "Team Totals"],
+            "player_slug": ["a01", "a01", "a01", "b01", None],
+            "team": ["BOS", "BOS", "LAL", "BOS", "BOS"],
+            "year": [2024, 2025, 2025, 2024, 2025],
+            **{
+                column: [10, 20, 30, 5, 100]
+                for column in PlayerCareerStatsConstants.TOTAL_COLUMNS
+            },
+        }
+    )
+    totals_df["field_goal_attempts"] = [20, 40, 0, 10, 200]
+    advanced_df = pd.DataFrame(
+        {
+            "player_id": [1, 1, 1, 2],
+            "minutes_played": [100, 300, 0, 50],
+            **{
+                column: [1.0, 2.0, 3.0, 4.0]
+                for column in (
+                    *PlayerCareerStatsConstants.ADVANCED_TOTAL_COLUMNS,
+                    *PlayerCareerStatsConstants.ADVANCED_RATE_COLUMNS,
+                )
+            },
+        }
+    )
+    advanced_df["player_efficiency_rating"] = [10.0, 20.0, np.nan, 5.0]
+
+    totals_filepaths = {}
+    advanced_filepaths = {}
+
+    for season_type in ("regular_season", "playoffs"):
+        totals_filepaths[season_type] = tmp_path.joinpath(
+            f"{season_type}-total-stats.parquet"
+        )
+        advanced_filepaths[season_type] = tmp_path.joinpath(
+            f"{season_type}-advanced-stats.parquet"
+        )
+
+    totals_df.to_parquet(totals_filepaths["regular_season"])
+    advanced_df.to_parquet(advanced_filepaths["regular_season"])
+
+    monkeypatch.setattr(
+        PlayerCareerStatsConstants, "TOTAL_STATS_FILEPATHS", totals_filepaths
+    )
+    monkeypatch.setattr(
+        PlayerCareerStatsConstants,
+        "ADVANCED_STATS_FILEPATHS",
+        advanced_filepaths,
+    )
+
+
+@pytest.mark.usefixtures("stats_filepaths")
+def test_get_players_career_stats_df() -> None:
+    """Test whether the seasons and teams of the players are summed
+    into their careers, and the rates are derived from the sums.
+
+    :return: None.
+    """
+    careers_df = PlayerCareerStatsExtractor().get_players_career_stats_df()
+    career = careers_df.set_index("player_id").loc[1]
+
+    assert careers_df["player_id"].tolist() == [1, 2]
+    assert careers_df["season_type"].astype(str).unique().tolist() == [
+        "regular_season"
+    ]
+    assert (career["seasons"], career["teams"]) == (2, 2)
+    assert (career["first_year"], career["last_year"]) == (2024, 2025)
+    assert (career["points"], career["games"]) == (60, 60)
+    assert career["field_goal_percentage"] == 1.0
+    assert career["points_per_game"] == 1.0
+    assert career["win_shares"] == 6.0
+    # The rates are weighted by the minutes played, skipping the
+    # missing values.
+    assert career["player_efficiency_rating"] == pytest.approx(17.5)
+
+
+@pytest.mark.usefixtures("stats_filepaths")
+def test_get_players_career_stats_df_years() -> None:
+    """Test whether only the careers of the players of the changed
+    seasons are aggregated again, over all of their seasons.
+
+    :return: None.
+    """
+    extractor = PlayerCareerStatsExtractor(years={2025})
+    careers_df = extractor.get_players_career_stats_df()
+
+    assert extractor.get_players_ids() == [1]
+    assert careers_df["player_id"].tolist() == [1]
+    assert careers_df["points"].tolist() == [60]
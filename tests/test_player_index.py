@@ -0,0 +1,76 @@
+import pandas as pd
+import pytest
+
+from common.constants import QueryConstants
+from query.player_index import PlayerIndex
+
+
+@pytest.mark.parametrize(
+    "player, normalized_player",
+    [
+        ("Nikola Jokić", "nikola jokic"),
+        ("Shaquille O'Neal", "shaquille oneal"),
+        ("  Gary Payton II ", "gary payton ii"),
+        ("Luka Dončić", "luka doncic"),
+    ],
+)
+def test_normalize_player(
+    player_index: PlayerIndex, player: str, normalized_player: str
+) -> None:
+    """Test whether a player name is normalized.
+
+    :param player_index: An instance of the `PlayerIndex`.
+    :param player: A player name to normalize.
+    :param normalized_player: A value to compare with the value
+        returned from the method.
+    :return: None.
+    """
+    assert player_index.normalize_player(player) == normalized_player
+
+
+def test_lookup(player_index: PlayerIndex) -> None:
+    """Test whether bio, roster history, and per-season stats of the
+    player are looked up from the built index.
+
+    :param player_index: An instance of the `PlayerIndex`.
+    :return: None.
+    """
+    tables = {
+        "players-stats": pd.DataFrame(
+            {"player": ["Nikola Jokić", "Jayson Tatum"]}
+        ),
+        "rosters": pd.DataFrame(
+            {
+                "player_id": [7, 9, 7],
+                "player": ["Nikola Jokić", "Jayson Tatum", "Nikola Jokić"],
+                "year": [2023, 2023, 2024],
+            }
+        ),
+        "regular-season-per-game-stats": pd.DataFrame(
+            {
+                "player": ["Jayson Tatum", "Nikola Jokić"],
+                "points": [30.1, 26.4],
+            }
+        ),
+    }
+
+    for table, table_df in tables.items():
+        filepath = player_index.base_folder.joinpath(
+            QueryConstants.TABLES[table]
+        )
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+
+        table_df.to_parquet(filepath, index=False)
+
+    player_index.build()
+
+    profile = player_index.lookup("nikola jokic")
+
+    assert profile.bio["player"].to_list() == ["Nikola Jokić"]
+    assert profile.rosters["year"].to_list() == [2023, 2024]
+    assert list(profile.stats) == ["regular-season-per-game-stats"]
+    assert profile.stats["regular-season-per-game-stats"][
+        "points"
+    ].to_list() == [26.4]
+    assert player_index.lookup(9).rosters["year"].to_list() == [2023]
+    assert player_index.lookup("Kobe Bryant").stats == {}
@@ -0,0 +1,148 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from common.constants import PlayerCareerStatsConstants
+from extractors.players.player_leaderboard_extractor import (
+    PlayerLeaderboardExtractor,
+)
+
+
+def test_get_top_rows() -> None:
+    """Test whether the top values of each group are the same as the
+    values of a full sort, skipping the missing values.
+
+    :return: None.
+    """
+    rng = np.random.default_rng(seed=0)
+    values = rng.integers(0, 20, size=500).astype("float64")
+    values[::7] = np.nan
+    codes = rng.integers(0, 6, size=500)
+
+    rows, ranks = PlayerLeaderboardExtractor.get_top_rows(
+        values, codes=codes, size=5
+    )
+
+    expected_df = pd.DataFrame({"code": codes, "value": values}).dropna()
+    # The equal values share a rank.
+    expected_df["rank"] = expected_df.groupby("code")["value"].rank(
+        method="min", ascending=False
+    )
+    expected_df = (
+        expected_df.sort_values(["code", "value"], ascending=[True, False])
+        .groupby("code")
+        .head(5)
+    )
+
+    assert codes[rows].tolist() == expected_df["code"].tolist()
+    assert values[rows].tolist() == expected_df["value"].tolist()
+    assert ranks.tolist() == expected_df["rank"].tolist()
+
+
+def test_get_top_rows_small_groups() -> None:
+    """Test whether the groups with fewer values than the size keep all
+    of their values.
+
+    :return: None.
+    """
+    rows, ranks = PlayerLeaderboardExtractor.get_top_rows(
+        np.array([3.0, 1.0, np.nan, 2.0, 2.0]),
+        codes=np.array([0, 0, 0, 1, 1]),
+        size=3,
+    )
+
+    assert rows.tolist() == [0, 1, 3, 4]
+    assert ranks.tolist() == [1, 2, 1, 1]
+
+
+def test_get_players_leaderboards_df(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test whether the stats of a traded player are summed over the
+    teams before ranking, and whether the players with few games
+    aren't ranked by the averages.
+
+    :param tmp_path: A temporary folder.
+    :param monkeypatch: A fixture to patch the filepaths of the tables.
+    :return: None.
+    """
+    totals_df = pd.DataFrame(
+        {
+            "player_id": [1, 1, 2, 3, None],
+            "player": ["A", "A", "B", "C", "Team Totals"],
+            "player_slug": ["a01", "a01", "b01", "c01", None],
+            "team": ["BOS", "LAL", "BOS", "BOS", "BOS"],
+            "year": [2025, 2025, 2025, 2025, 2025],
+            "games": [40, 40, 80, 2, 82],
+            "points": [800, 800, 1200, 100, 9000],
+        }
+    )
+    advanced_df = pd.DataFrame(
+        {
+            "player_id": [1, 1, 2, 3],
+            "year": [2025, 2025, 2025, 2025],
+            "win_shares": [2.0, 3.0, 4.0, 0.5],
+        }
+    )
+
+    for column in (
+        "total_rebounds",
+        "assists",
+        "steals",
+        "blocks",
+        "3_point_field_goals",
+        "minutes_played",
+    ):
+        totals_df[column] = 0
+
+    advanced_df["value_over_replacement_player"] = 0.0
+
+    totals_filepath = tmp_path.joinpath("regular-season-total-stats.parquet")
+    advanced_filepath = tmp_path.joinpath(
+        "regular-season-advanced-stats.parquet"
+    )
+    totals_df.to_parquet(totals_filepath)
+    advanced_df.to_parquet(advanced_filepath)
+
+    monkeypatch.setattr(
+        PlayerCareerStatsConstants,
+        "TOTAL_STATS_FILEPATHS",
+        {"regular_season": totals_filepath},
+    )
+    monkeypatch.setattr(
+        PlayerCareerStatsConstants,
+        "ADVANCED_STATS_FILEPATHS",
+        {"regular_season": advanced_filepath},
+    )
+
+    leaderboards_df = PlayerLeaderboardExtractor(
+        size=2
+    ).get_players_leaderboards_df()
+
+    def get_leaders(stat: str) -> list[tuple]:
+        leaderboard_df = leaderboards_df[leaderboards_df["stat"] == stat]
+
+        return list(
+            zip(
+                leaderboard_df["rank"],
+                leaderboard_df["player"],
+                leaderboard_df["team"],
+                leaderboard_df["value"],
+                strict=True,
+            )
+        )
+
+    assert get_leaders("points") == [
+        (1, "A", "2TM", 1600),
+        (2, "B", "BOS", 1200),
+    ]
+    assert get_leaders("points_per_game") == [
+        (1, "A", "2TM", 20),
+        (2, "B", "BOS", 15),
+    ]
+    assert get_leaders("win_shares") == [
+        (1, "A", "2TM", 5),
+        (2, "B", "BOS", 4),
+    ]
@@ -0,0 +1,151 @@
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from common.constants import PlayerSeasonConstants, SchemaConstants
+from extractors.players.player_season_extractor import PlayerSeasonExtractor
+
+
+@pytest.fixture
+def players_seasons_folder(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Path:
+    """Save the rosters and stats of the players of two seasons, whose
+    teams are encoded by different dictionaries in each table, and
+    patch the filepaths of the tables.
+
+    :param tmp_path: A temporary folder.
+    :param monkeypatch: A fixture to patch the filepaths of the tables.
+    :return: A folder of the fact table.
+    """
+    rows = {
+        "rosters": {
+            "player_id": [1, 1, 2],
+            "year": [2024, 2025, 2025],
+            "team": ["BOS", "LAL", "BOS"],
+            "player": ["A", "A", "B"],
+        },
+        "per-game-stats": {
+            "player_id": [1, 2, 1, None],
+            "year": [2025, 2025, 2024, 2025],
+            "team": ["LAL", "BOS", "BOS", "BOS"],
+            "points": [20.5, 10.0, 15.0, 110.0],
+        },
+        "advanced-stats": {
+            "player_id": [2, 1],
+            "year": [2025, 2025],
+            "team": ["BOS", "LAL"],
+            "win_shares": [1.5, 3.0],
+        },
+    }
+    columns_maps = {}
+
+    for table, columns in rows.items():
+        filepath = tmp_path.joinpath(f"{table}.parquet")
+        arrow_table = pa.table(columns)
+        arrow_table = arrow_table.set_column(
+            2, "team", arrow_table["team"].dictionary_encode()
+        )
+        pq.write_table(arrow_table, filepath)
+
+        columns_maps[filepath] = {
+            column: column if column != "points" else "points_per_game"
+            for column in list(columns)[3:]
+        }
+
+    monkeypatch.setattr(
+        PlayerSeasonConstants,
+        "ROSTERS_FILEPATH",
+        tmp_path.joinpath("rosters.parquet"),
+    )
+    monkeypatch.setattr(PlayerSeasonConstants, "COLUMNS_MAPS", columns_maps)
+    monkeypatch.setattr(
+        PlayerSeasonConstants,
+        "PLAYERS_SEASONS_FOLDER_PATH",
+        tmp_path.joinpath("players_seasons"),
+    )
+
+    return tmp_path.joinpath("players_seasons")
+
+
+def test_get_players_seasons_table(players_seasons_folder: Path) -> None:
+    """Test whether the stats are joined to the rosters by the players,
+    years, and teams, and whether each season is saved to its file.
+
+    :param players_seasons_folder: A folder of the fact table.
+    :return: None.
+    """
+    extractor = PlayerSeasonExtractor()
+    players_seasons_table = extractor.get_players_seasons_table()
+
+    assert players_seasons_table.schema == (
+        SchemaConstants.PLAYERS_SEASONS_SCHEMA
+    )
+    assert players_seasons_table.select(
+        ["player_id", "year", "points_per_game", "win_shares", "salary"]
+    ).to_pylist() == [
+        {
+            "player_id": 1,
+            "year": 2024,
+            "points_per_game": 15.0,
+            "win_shares": None,
+            "salary": None,
+        },
+        {
+            "player_id": 2,
+            "year": 2025,
+            "points_per_game": 10.0,
+            "win_shares": 1.5,
+            "salary": None,
+        },
+        {
+            "player_id": 1,
+            "year": 2025,
+            "points_per_game": 20.5,
+            "win_shares": 3.0,
+            "salary": None,
+        },
+    ]
+
+    players_seasons_folder.mkdir()
+    players_seasons_folder.joinpath("players-seasons-2023.parquet").touch()
+
+    extractor.save_partitions(players_seasons_table=players_seasons_table)
+
+    assert sorted(path.name for path in players_seasons_folder.iterdir()) == [
+        "players-seasons-2024.parquet",
+        "players-seasons-2025.parquet",
+    ]
+    assert extractor.deleted_filepaths == [
+        players_seasons_folder.joinpath("players-seasons-2023.parquet")
+    ]
+    assert pq.read_table(
+        players_seasons_folder.joinpath("players-seasons-2025.parquet")
+    )["team"].to_pylist() == ["BOS", "LAL"]
+
+
+def test_save_partitions_years(players_seasons_folder: Path) -> None:
+    """Test whether only the files of the specified seasons are built
+    again.
+
+    :param players_seasons_folder: A folder of the fact table.
+    :return: None.
+    """
+    extractor = PlayerSeasonExtractor()
+    extractor.save_partitions(
+        players_seasons_table=extractor.get_players_seasons_table()
+    )
+
+    filepath_2024 = players_seasons_folder.joinpath(
+        "players-seasons-2024.parquet"
+    )
+    filepath_2024.write_bytes(b"")
+
+    extractor = PlayerSeasonExtractor(years={2025})
+    players_seasons_table = extractor.get_players_seasons_table()
+    extractor.save_partitions(players_seasons_table=players_seasons_table)
+
+    assert players_seasons_table["year"].to_pylist() == [2025, 2025]
+    assert filepath_2024.read_bytes() == b""
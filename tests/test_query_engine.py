@@ -0,0 +1,138 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from common.constants import QueryConstants
+from query.query_engine import QueryEngine
+
+
+def save_table(
+    base_folder: Path, *, table: str, table_df: pd.DataFrame
+) -> None:
+    """Save a table to the processed folder of the query engine.
+
+    :param base_folder: A processed folder.
+    :param table: A name of the table.
+    :param table_df: A table to save.
+    :return: None.
+    """
+    filepath = base_folder.joinpath(QueryConstants.TABLES[table])
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+
+    table_df.to_parquet(filepath, index=False)
+
+
+@pytest.fixture
+def rosters_df() -> pd.DataFrame:
+    """Create a rosters table.
+
+    :return: Rosters table.
+    """
+    return pd.DataFrame(
+        {
+            "player_id": [1, 2, 3],
+            "player": ["Jayson Tatum", "Jaylen Brown", "Trae Young"],
+            "height": [80, 78, 73],
+            "team": pd.Categorical(["BOS", "BOS", "ATL"]),
+            "season": pd.Categorical(["2023-24", "2023-24", "2023-24"]),
+            "year": [2024, 2024, 2024],
+        }
+    )
+
+
+@pytest.fixture
+def salaries_df() -> pd.DataFrame:
+    """Create a salaries table.
+
+    :return: Salaries table.
+    """
+    return pd.DataFrame(
+        {
+            "player_id": [3, 1],
+            "player": ["Trae Young", "Jayson Tatum"],
+            "salary": [40064220, 32600060],
+            "team": pd.Categorical(["ATL", "BOS"]),
+            "season": pd.Categorical(["2023-24", "2023-24"]),
+            "year": [2024, 2024],
+        }
+    )
+
+
+def test_get_tables(
+    query_engine: QueryEngine, rosters_df: pd.DataFrame
+) -> None:
+    """Test whether only existing tables are returned.
+
+    :param query_engine: An instance of the `QueryEngine`.
+    :param rosters_df: A rosters table.
+    :return: None.
+    """
+    save_table(query_engine.base_folder, table="rosters", table_df=rosters_df)
+
+    assert query_engine.get_tables() == ["rosters"]
+
+
+@pytest.mark.parametrize(
+    "conditions, players",
+    [
+        ({"team": "BOS"}, ["Jayson Tatum", "Jaylen Brown"]),
+        ({"player": ["Trae Young", "Kobe Bryant"]}, ["Trae Young"]),
+        ({"team": "BOS", "height": 78}, ["Jaylen Brown"]),
+        ({"year": 1999}, []),
+    ],
+)
+def test_lookup(
+    query_engine: QueryEngine,
+    rosters_df: pd.DataFrame,
+    conditions: dict,
+    players: list[str],
+) -> None:
+    """Test whether only the rows that meet the conditions and the
+    requested columns are returned.
+
+    :param query_engine: An instance of the `QueryEngine`.
+    :param rosters_df: A rosters table.
+    :param conditions: Conditions to filter by.
+    :param players: Players to compare with the players returned from
+        the method.
+    :return: None.
+    """
+    save_table(query_engine.base_folder, table="rosters", table_df=rosters_df)
+
+    lookup_df = query_engine.lookup(
+        "rosters", columns=["player"], **conditions
+    )
+
+    assert list(lookup_df.columns) == ["player"]
+    assert lookup_df["player"].to_list() == players
+
+
+def test_join(
+    query_engine: QueryEngine,
+    rosters_df: pd.DataFrame,
+    salaries_df: pd.DataFrame,
+) -> None:
+    """Test whether the tables are joined by player ID, year, and team.
+
+    :param query_engine: An instance of the `QueryEngine`.
+    :param rosters_df: A rosters table.
+    :param salaries_df: A salaries table.
+    :return: None.
+    """
+    save_table(query_engine.base_folder, table="rosters", table_df=rosters_df)
+    save_table(
+        query_engine.base_folder, table="salaries", table_df=salaries_df
+    )
+
+    joined_df = query_engine.join(
+        "rosters",
+        "salaries",
+        left_columns=["player", "height"],
+        right_columns=["player", "salary"],
+        year=2024,
+    ).sort_values(by="player_id", ignore_index=True)
+
+    assert joined_df["player"].to_list() == ["Jayson Tatum", "Trae Young"]
+    assert joined_df["salary"].to_list() == [32600060, 40064220]
+    assert "player_right" in joined_df.columns
@@ -0,0 +1,184 @@
+import logging
+from collections.abc import Iterator
+
+import pytest
+
+from collectors.rate_controller import CrawlRateController
+from common.constants import CrawlRateConstants
+
+
+class FakeClock:
+    """A class to replace the monotonic clock and the sleep of the rate
+    controller, so the time only moves when the test advances it.
+    """
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeClock]:
+    """Patch the clock of the rate controller.
+
+    :param monkeypatch: A fixture to patch the clock.
+    :return: The fake clock.
+    """
+    clock = FakeClock()
+
+    monkeypatch.setattr("collectors.rate_controller.time", clock)
+
+    yield clock
+
+
+def test_wait(clock: FakeClock) -> None:
+    """Test whether the requests are started at the rate.
+
+    :param clock: The fake clock.
+    :return: None.
+    """
+    controller = CrawlRateController(initial_rate=2)
+
+    for _ in range(3):
+        controller.wait()
+
+    assert clock.sleeps == [0.5, 0.5]
+    assert controller.get_effective_rate() == 2
+
+
+def test_increase(clock: FakeClock) -> None:
+    """Test whether the rate and concurrency are raised additively
+    after the clean responses, up to the maximums.
+
+    :param clock: The fake clock.
+    :return: None.
+    """
+    controller = CrawlRateController(
+        initial_rate=1, max_rate=1.08, max_concurrency=2
+    )
+
+    for idx in range(3 * CrawlRateConstants.INCREASE_AFTER_RESPONSES):
+        controller.update(status_code=200, latency_seconds=0.1)
+
+        if idx == CrawlRateConstants.INCREASE_AFTER_RESPONSES - 2:
+            assert controller.rate == 1
+
+    assert controller.rate == 1.08
+    assert controller.concurrency == 2
+
+
+@pytest.mark.parametrize(
+    "status_code, latency_seconds",
+    [
+        (503, 0.1),
+        (None, 0.1),
+        (200, CrawlRateConstants.MAX_LATENCY_SECONDS + 1),
+    ],
+)
+def test_no_increase(
+    clock: FakeClock, status_code: int | None, latency_seconds: float
+) -> None:
+    """Test whether the server errors and slow responses break the run
+    of the clean responses.
+
+    :param clock: The fake clock.
+    :param status_code: A status code of the response.
+    :param latency_seconds: Latency of the response.
+    :return: None.
+    """
+    controller = CrawlRateController(initial_rate=1, max_rate=2)
+
+    for _ in range(CrawlRateConstants.INCREASE_AFTER_RESPONSES - 1):
+        controller.update(status_code=200, latency_seconds=0.1)
+
+    controller.update(status_code=status_code, latency_seconds=latency_seconds)
+    controller.update(status_code=200, latency_seconds=0.1)
+
+    assert controller.rate == 1
+
+
+def test_decrease(clock: FakeClock) -> None:
+    """Test whether the rate and concurrency are halved once per round
+    trip when the site throttles.
+
+    :param clock: The fake clock.
+    :return: None.
+    """
+    controller = CrawlRateController(
+        initial_rate=1, max_rate=1, max_concurrency=4
+    )
+    controller.concurrency = 4
+
+    controller.update(status_code=429, latency_seconds=1.0)
+
+    assert controller.rate == 0.5
+    assert controller.concurrency == 2
+
+    # The responses of the requests sent before the decrease.
+    clock.now += 0.5
+    controller.update(status_code=429, latency_seconds=1.0)
+
+    assert controller.rate == 0.5
+
+    clock.now += 1.0
+    controller.update(status_code=429, latency_seconds=1.0)
+
+    assert controller.rate == 0.25
+    assert controller.concurrency == 1
+
+
+def test_decrease_from_effective_rate(clock: FakeClock) -> None:
+    """Test whether an unlimited rate is halved from the effective one,
+    but not below the minimum rate.
+
+    :param clock: The fake clock.
+    :return: None.
+    """
+    controller = CrawlRateController(initial_rate=float("inf"), min_rate=0.5)
+
+    for _ in range(5):
+        controller.wait()
+        clock.now += 0.25
+
+    controller.update(status_code=429, latency_seconds=0.1)
+
+    assert controller.rate == 2
+
+    for _ in range(3):
+        clock.now += 1.0
+        controller.update(status_code=429, latency_seconds=0.1)
+
+    assert controller.rate == 0.5
+
+
+def test_log_rate(clock: FakeClock, caplog: pytest.LogCaptureFixture) -> None:
+    """Test whether the effective rate is logged once per the interval.
+
+    :param clock: The fake clock.
+    :param caplog: A fixture to capture the logs.
+    :return: None.
+    """
+    controller = CrawlRateController(initial_rate=1)
+
+    with caplog.at_level(logging.INFO):
+        for _ in range(3):
+            clock.now += CrawlRateConstants.LOG_INTERVAL_SECONDS / 2
+            controller.update(status_code=200, latency_seconds=0.1)
+
+    messages = [
+        record.getMessage()
+        for record in caplog.records
+        if record.getMessage().startswith("Crawl rate")
+    ]
+
+    assert messages == [
+        "Crawl rate: 0.07 requests/s (limit 1.00 requests/s, concurrency "
+        "1, 0 of 2 responses throttled, latency 0.10s)."
+    ]
@@ -0,0 +1,115 @@
+from pathlib import Path
+
+import pytest
+
+from collectors.base_collector import BaseCollector
+from common.constants import RawSegmentConstants
+from common.raw_segments import SegmentReader, SegmentWriter
+from extractors.base_extractor import BaseExtractor
+
+
+def test_write_read(tmp_path: Path) -> None:
+    """Test whether the pages are appended to new segments once the
+    current one is full, and whether the latest copy of a page written
+    again is read.
+
+    :param tmp_path: A temporary folder.
+    :return: None.
+    """
+    with SegmentWriter(tmp_path, max_segment_bytes=100) as writer:
+        writer.write("bos-2025.html", data=b"<html>BOS</html>" * 5)
+        writer.write("lal-2025.html", data=b"<html>LAL</html>")
+        writer.write("bos-2025.html", data=b"<html>BOS 2</html>")
+
+    reader = SegmentReader(tmp_path)
+
+    assert sorted(filepath.name for filepath in tmp_path.iterdir()) == [
+        "segment-00000.pages",
+        "segment-00001.pages",
+        RawSegmentConstants.INDEX_FILENAME,
+    ]
+    assert reader.get_filenames() == ["lal-2025.html", "bos-2025.html"]
+    assert reader.read(filename="bos-2025.html") == b"<html>BOS 2</html>"
+    assert list(reader) == [
+        ("lal-2025.html", b"<html>LAL</html>"),
+        ("bos-2025.html", b"<html>BOS 2</html>"),
+    ]
+
+    # The next run appends to a new segment and keeps the index.
+    with SegmentWriter(tmp_path) as writer:
+        writer.write("mia-2025.html", data=b"<html>MIA</html>")
+
+    assert SegmentReader.get(tmp_path).index["mia-2025.html"][0] == (
+        "segment-00002.pages"
+    )
+    assert SegmentReader.exists(tmp_path.joinpath("lal-2025.html"))
+    assert not SegmentReader.exists(tmp_path.joinpath("nyk-2025.html"))
+
+
+def test_flush(tmp_path: Path) -> None:
+    """Test whether the pages can be read once they're flushed, before
+    the segment is closed.
+
+    :param tmp_path: A temporary folder.
+    :return: None.
+    """
+    writer = SegmentWriter(tmp_path, flush_pages=2, fsync=True)
+
+    writer.write("bos-2025.html", data=b"<html>BOS</html>")
+
+    assert SegmentReader.get(tmp_path) is None
+
+    writer.write("lal-2025.html", data=b"<html>LAL</html>")
+
+    assert SegmentReader.get(tmp_path).get_filenames() == [
+        "bos-2025.html",
+        "lal-2025.html",
+    ]
+
+    writer.close()
+
+
+def test_collect_extract(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test whether the pages saved by a collector to the segments are
+    listed and read by the extractors like the files.
+
+    :param tmp_path: A temporary folder.
+    :param monkeypatch: A fixture to enable the segments.
+    :return: None.
+    """
+    monkeypatch.setattr(RawSegmentConstants, "ENABLED", True)
+
+    tmp_path.joinpath("nyk-2024.html").write_text("<html>NYK</html>")
+
+    collector = BaseCollector()
+
+    for team in ("bos", "lal"):
+        collector.save_html(
+            html_data=f"<html>{team} – Jokić</html>",
+            filepath=tmp_path.joinpath(f"{team}-2025.html"),
+        )
+
+    collector.close_segment_writers()
+
+    filepaths = BaseExtractor.get_filepaths(base_folder=tmp_path)
+
+    assert [filepath.name for filepath in filepaths] == [
+        "nyk-2024.html",
+        "bos-2025.html",
+        "lal-2025.html",
+    ]
+    assert [
+        filepath.name
+        for filepath in BaseExtractor.get_filepaths(
+            base_folder=tmp_path, years={2025}
+        )
+    ] == ["bos-2025.html", "lal-2025.html"]
+    assert [
+        BaseExtractor.read_html(filepath=filepath) for filepath in filepaths
+    ] == [
+        "<html>NYK</html>",
+        "<html>bos – Jokić</html>",
+        "<html>lal – Jokić</html>",
+    ]
@@ -0,0 +1,170 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from common.constants import (
+    BaseConstants,
+    PipelineConstants,
+    StageInputsConstants,
+)
+from pipeline.shard import Shard
+from service import (
+    get_args,
+    get_missing_inputs,
+    get_stage_graph,
+    upload_reports,
+)
+
+
+def test_get_args() -> None:
+    """Test whether the stages and the years are parsed.
+
+    :return: None.
+    """
+    args = get_args(
+        ["--stages", "collect_teams", "--years", "2016-2018", "2025"]
+    )
+
+    assert args.stages == ["collect_teams"]
+    assert args.years == {2016, 2017, 2018, 2025}
+
+    assert get_args([]).years is None
+
+    with pytest.raises(SystemExit):
+        get_args(["--years", "2025-2016"])
+
+    with pytest.raises(SystemExit):
+        get_args(["--stages", "collect_games"])
+
+
+def test_get_stage_graph() -> None:
+    """Test whether only the selected stages run after the base
+    folders are created, whether the processed data is downloaded
+    before the tables are extracted and the pages are collected, and
+    whether the reports are uploaded after them.
+
+    :return: None.
+    """
+    full_graph = get_stage_graph()
+
+    assert len(full_graph.stages) == 34
+    # The crawl continues from the downloaded state.
+    assert "download_processed_data" in (
+        full_graph.stages["collect_players"].dependencies
+    )
+
+    graph = get_stage_graph(
+        stages=["collect_teams", "extract_teams_stats"], years={2025}
+    )
+
+    assert graph.get_order() == [
+        "create_base_folders",
+        "download_processed_data",
+        "collect_teams",
+        "extract_teams_stats",
+        "upload_crawl_state",
+        "upload_reports",
+    ]
+    assert graph.stages["extract_teams_stats"].dependencies == (
+        "collect_teams",
+        "download_processed_data",
+    )
+    extractor = graph.stages["extract_teams_stats"].kwargs["extractor"]
+
+    assert extractor.get().years == {2025}
+
+
+def test_import() -> None:
+    """Test whether the service starts without importing the heavy
+    modules, which only the stages that use them import.
+
+    :return: None.
+    """
+    modules = json.loads(
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import json, sys, service; "
+                "print(json.dumps(sorted(sys.modules)))",
+            ],
+            capture_output=True,
+            check=True,
+            cwd=BaseConstants.BASE_FOLDER,
+            text=True,
+        ).stdout
+    )
+
+    assert not set(modules) & set(PipelineConstants.LAZY_MODULES)
+
+
+def test_get_missing_inputs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test whether the raw inputs of the selected stages are required
+    only if the stages that produce them aren't selected.
+
+    :param tmp_path: A temporary raw folder.
+    :param monkeypatch: A fixture to patch the raw inputs.
+    :return: None.
+    """
+    teams_filepath = tmp_path.joinpath("teams", "teams.json")
+
+    monkeypatch.setattr(
+        StageInputsConstants,
+        "RAW_INPUTS",
+        {
+            "collect_teams": {"extract_teams": teams_filepath},
+            "extract_teams_stats": {"collect_teams": teams_filepath.parent},
+        },
+    )
+
+    assert get_missing_inputs(
+        stages=["collect_teams", "extract_teams_stats"]
+    ) == {"collect_teams": [str(teams_filepath)]}
+    assert get_missing_inputs(stages=["extract_teams_stats"]) == {
+        "extract_teams_stats": [str(teams_filepath.parent)]
+    }
+    assert get_missing_inputs(stages=["extract_teams", "collect_teams"]) == {}
+
+    teams_filepath.parent.mkdir()
+    teams_filepath.write_text("{}")
+
+    # The folder of the pages needs the pages, not only the URLs.
+    assert get_missing_inputs(stages=["extract_teams_stats"]) == {
+        "extract_teams_stats": [str(teams_filepath.parent)]
+    }
+
+    teams_filepath.with_name("bos-2025.html").write_text("<html></html>")
+
+    assert get_missing_inputs(stages=["extract_teams_stats"]) == {}
+
+
+def test_upload_reports(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test whether the reports of a shard are uploaded with its
+    suffix, so the shards don't overwrite each other's reports.
+
+    :param tmp_path: A temporary reports folder.
+    :param monkeypatch: A fixture to patch the reports folder.
+    :return: None.
+    """
+    monkeypatch.setattr(BaseConstants, "REPORTS_FOLDER", tmp_path)
+
+    tmp_path.joinpath("dead-letters.json").write_text("[]")
+
+    upl = MagicMock()
+
+    upload_reports(upl=upl, shard=Shard(index=1, count=2))
+
+    assert [filepath.name for filepath in tmp_path.iterdir()] == [
+        "dead-letters.shard-1-of-2.json"
+    ]
+    upl.upload_files_to_s3.assert_called_once_with(
+        base_folder=tmp_path, extensions=(".json",)
+    )
@@ -0,0 +1,197 @@
+import os
+import subprocess
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from benchmarks.corpus import CorpusConfig, CorpusGenerator
+from benchmarks.mock_server import MockServer
+from common.constants import BaseConstants, PlayerStatsConstants
+from pipeline.shard import Shard
+from pipeline.shard_merger import ShardMerger
+from service import get_args
+
+SERVICE_FILEPATH = Path(__file__).parents[1].joinpath("src", "service.py")
+
+
+@pytest.fixture
+def corpus_url(tmp_path: Path) -> Iterator[str]:
+    """Serve a synthetic corpus of 2 seasons on a local HTTP server.
+
+    :param tmp_path: A temporary folder.
+    :return: A URL of the server.
+    """
+    corpus_folder = tmp_path.joinpath("corpus")
+
+    CorpusGenerator(
+        raw_folder=corpus_folder,
+        config=CorpusConfig(seasons=2, teams=2, players_per_team=3),
+    ).generate()
+
+    with MockServer(corpus_folder) as server:
+        yield server.url
+
+
+def test_get_years() -> None:
+    """Test whether the years are split between the shards.
+
+    :return: None.
+    """
+    assert [
+        Shard(index=idx, count=3).get_years(years=set(range(2016, 2021)))
+        for idx in range(3)
+    ] == [{2016, 2017}, {2018, 2019}, {2020}]
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--years", "2024-2025", "--shard", "2/3"],
+        ["--years", "2016", "--shard", "0/2"],
+    ],
+)
+def test_get_args_empty_shard(argv: list[str]) -> None:
+    """Test whether the shards without years are rejected.
+
+    :param argv: Command line arguments.
+    :return: None.
+    """
+    with pytest.raises(SystemExit):
+        get_args(argv)
+
+
+def test_get_shards_filepaths(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test whether the partial tables are in the order of the shards,
+    not of their names.
+
+    :param tmp_path: A temporary folder.
+    :param monkeypatch: A fixture to patch the processed folder.
+    :return: None.
+    """
+    monkeypatch.setattr(BaseConstants, "PROCESSED_FOLDER", tmp_path)
+
+    tmp_path.joinpath("teams_stats").mkdir()
+
+    for idx in (10, 2, 1):
+        tmp_path.joinpath(
+            "teams_stats", f"rosters.shard-{idx}-of-12.parquet"
+        ).touch()
+
+    assert {
+        table_filepath.name: [filepath.name for filepath in filepaths]
+        for table_filepath, filepaths in (
+            ShardMerger.get_shards_filepaths().items()
+        )
+    } == {
+        "rosters.parquet": [
+            "rosters.shard-1-of-12.parquet",
+            "rosters.shard-2-of-12.parquet",
+            "rosters.shard-10-of-12.parquet",
+        ]
+    }
+
+
+def test_merge_shards(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test whether the rows of a key that several shards extracted are
+    kept once, from the last of the shards, even if their values
+    differ.
+
+    :param tmp_path: A temporary folder.
+    :param monkeypatch: A fixture to skip the existing table.
+    :return: None.
+    """
+    monkeypatch.setattr(
+        "pipeline.shard_merger.os.path.exists", lambda filepath: False
+    )
+
+    filepaths = [
+        tmp_path.joinpath(f"players-stats.shard-{idx}-of-2.parquet")
+        for idx in range(2)
+    ]
+
+    pd.DataFrame({"player_id": [1, 2], "player": ["A", "B"]}).to_parquet(
+        filepaths[0]
+    )
+    pd.DataFrame({"player_id": [2, 3], "player": ["B.", "C"]}).to_parquet(
+        filepaths[1]
+    )
+
+    table_df = ShardMerger().merge_shards(
+        table_filepath=PlayerStatsConstants.PLAYERS_STATS_FILEPATH,
+        filepaths=filepaths,
+    )
+
+    assert table_df.to_dict(orient="list") == {
+        "player_id": [1, 2, 3],
+        "player": ["A", "B.", "C"],
+    }
+
+
+def test_run_shards(corpus_url: str, tmp_path: Path) -> None:
+    """Test whether the shards run as separate processes against a
+    local server and whether their partial tables are merged.
+
+    :param corpus_url: A URL of the local server.
+    :param tmp_path: A temporary folder.
+    :return: None.
+    """
+    processed_folder = tmp_path.joinpath("processed")
+
+    def run(*args: str, raw_folder: Path) -> subprocess.Popen:
+        env = {
+            **os.environ,
+            "NBA_STATS_URL": corpus_url,
+            "NBA_STATS_RAW_FOLDER": str(raw_folder),
+            "NBA_STATS_PROCESSED_FOLDER": str(processed_folder),
+            "NBA_STATS_TIME_SLEEP_SECONDS": "0",
+            "METRICS_REPORT_FILEPATH": str(raw_folder.joinpath("report.json")),
+        }
+
+        return subprocess.Popen(
+            [sys.executable, str(SERVICE_FILEPATH), *args, "--skip-uploads"],
+            env=env,
+        )
+
+    # Each shard has its own raw folder, like each ECS task does.
+    shards = [
+        run(
+            "--years",
+            "2016-2017",
+            "--shard",
+            f"{idx}/2",
+            raw_folder=tmp_path.joinpath(f"raw-{idx}"),
+        )
+        for idx in range(2)
+    ]
+
+    for shard in shards:
+        assert shard.wait(timeout=300) == 0
+
+    rosters_folder = processed_folder.joinpath("teams_stats")
+
+    assert sorted(
+        filepath.name for filepath in rosters_folder.glob("rosters.*")
+    ) == ["rosters.shard-0-of-2.parquet", "rosters.shard-1-of-2.parquet"]
+
+    merge = run("--merge", raw_folder=tmp_path.joinpath("raw-merge"))
+
+    assert merge.wait(timeout=300) == 0
+
+    rosters_df = pd.read_parquet(rosters_folder.joinpath("rosters.parquet"))
+    players_stats_df = pd.read_parquet(
+        processed_folder.joinpath("players_stats", "players-stats.parquet")
+    )
+
+    assert not list(processed_folder.glob("*/*.shard-*"))
+    assert sorted(rosters_df["year"].unique()) == [2016, 2017]
+    assert len(rosters_df) == 2 * 2 * 3
+    assert players_stats_df["player_id"].is_unique
+    assert set(rosters_df["player_id"]) == set(players_stats_df["player_id"])
+    assert processed_folder.joinpath(
+        "players_index", "players-index.arrow"
+    ).exists()
@@ -0,0 +1,135 @@
+import threading
+import time
+
+import pytest
+
+from common.exceptions import StageError
+from pipeline.stage_executor import StageExecutor
+from pipeline.stage_graph import StageGraph
+
+
+class StageRecorder:
+    """A class to record the stages running at the same time."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.running: set[str] = set()
+        self.max_running = 0
+        self.completed: list[str] = []
+
+    def run(self, name: str, *, seconds: float = 0.05) -> None:
+        with self.lock:
+            self.running.add(name)
+            self.max_running = max(self.max_running, len(self.running))
+
+        time.sleep(seconds)
+
+        with self.lock:
+            self.running.remove(name)
+            self.completed.append(name)
+
+
+def get_stage_graph(recorder: StageRecorder) -> StageGraph:
+    """Create a graph of a collection stage followed by three
+    independent upload stages.
+
+    :param recorder: A recorder of the running stages.
+    :return: An instance of `StageGraph`.
+    """
+
+    def collect_leagues() -> None:
+        recorder.run("collect_leagues")
+
+    def upload_collected_leagues() -> None:
+        recorder.run("upload_collected_leagues")
+
+    def upload_extracted_conferences() -> None:
+        recorder.run("upload_extracted_conferences")
+
+    def upload_extracted_teams() -> None:
+        recorder.run("upload_extracted_teams")
+
+    graph = StageGraph()
+
+    graph.add(collect_leagues, resources={"network": 1})
+
+    for func in (
+        upload_collected_leagues,
+        upload_extracted_conferences,
+        upload_extracted_teams,
+    ):
+        graph.add(
+            func, dependencies=(collect_leagues,), resources={"upload": 1}
+        )
+
+    return graph
+
+
+@pytest.mark.parametrize(
+    "upload_budget, expected_max_running",
+    [
+        (1, 1),
+        (2, 2),
+        (3, 3),
+    ],
+)
+def test_run(upload_budget: int, expected_max_running: int) -> None:
+    """Test whether the independent stages run concurrently within the
+    budget and after their dependencies.
+
+    :param upload_budget: A number of the uploads at the same time.
+    :param expected_max_running: An expected number of the stages
+        running at the same time.
+    :return: None.
+    """
+    recorder = StageRecorder()
+    executor = StageExecutor(
+        graph=get_stage_graph(recorder=recorder),
+        budgets={"network": 1, "upload": upload_budget},
+    )
+
+    executor.run()
+
+    assert recorder.completed[0] == "collect_leagues"
+    assert len(recorder.completed) == 4
+    assert recorder.max_running == expected_max_running
+    assert set(executor.durations) == set(recorder.completed)
+
+
+def test_run_failure() -> None:
+    """Test whether the dependents of a failed stage aren't started and
+    the error is raised.
+
+    :return: None.
+    """
+    completed = []
+
+    def collect_teams() -> None:
+        raise ConnectionError("Too many requests.")
+
+    def extract_teams_stats() -> None:
+        completed.append("extract_teams_stats")
+
+    graph = StageGraph()
+    graph.add(collect_teams)
+    graph.add(extract_teams_stats, dependencies=(collect_teams,))
+
+    with pytest.raises(StageError, match="`collect_teams` stage failed"):
+        StageExecutor(graph=graph, budgets={"cpu": 1}).run()
+
+    assert not completed
+
+
+def test_get_budgets(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test whether the budgets are overridden by the environment
+    variables.
+
+    :param monkeypatch: A fixture to set the environment variables.
+    :return: None.
+    """
+    monkeypatch.setenv("PIPELINE_NETWORK_BUDGET", "3")
+
+    budgets = StageExecutor.get_budgets()
+
+    assert budgets["network"] == 3
+    assert budgets["upload"] == 2
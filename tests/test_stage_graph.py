@@ -0,0 +1,140 @@
+from dataclasses import replace
+
+import pytest
+
+from common.exceptions import StageGraphError
+from common.url_registry import UrlRegistry
+from pipeline.lazy import Lazy
+from pipeline.stage_graph import StageGraph
+
+
+def collect_leagues() -> None:
+    pass
+
+
+def extract_conferences() -> None:
+    pass
+
+
+def extract_teams() -> None:
+    pass
+
+
+def collect_teams() -> None:
+    pass
+
+
+@pytest.fixture
+def stage_graph() -> StageGraph:
+    """Create a graph of the stages that extract data from the league
+    pages.
+
+    :return: An instance of `StageGraph`.
+    """
+    graph = StageGraph()
+
+    graph.add(collect_leagues)
+    graph.add(extract_conferences, dependencies=(collect_leagues,))
+    graph.add(extract_teams, dependencies=(collect_leagues,))
+    graph.add(collect_teams, dependencies=(extract_teams,))
+
+    return graph
+
+
+def test_get_order(stage_graph: StageGraph) -> None:
+    """Test whether each stage comes after its dependencies.
+
+    :param stage_graph: An instance of the `StageGraph`.
+    :return: None.
+    """
+    assert stage_graph.get_order() == [
+        "collect_leagues",
+        "extract_conferences",
+        "extract_teams",
+        "collect_teams",
+    ]
+
+
+def test_get_order_errors(stage_graph: StageGraph) -> None:
+    """Test whether the invalid graphs are rejected.
+
+    :param stage_graph: An instance of the `StageGraph`.
+    :return: None.
+    """
+    with pytest.raises(StageGraphError, match="already in the graph"):
+        stage_graph.add(collect_leagues)
+
+    graph = StageGraph()
+    graph.add(collect_teams, dependencies=(extract_teams,))
+
+    with pytest.raises(StageGraphError, match="unknown `extract_teams`"):
+        graph.get_order()
+
+    graph.add(extract_teams, dependencies=(collect_teams,))
+
+    with pytest.raises(StageGraphError, match="cycle"):
+        graph.get_order()
+
+
+def test_get_critical_path(stage_graph: StageGraph) -> None:
+    """Test whether the longest chain of the stages is found.
+
+    :param stage_graph: An instance of the `StageGraph`.
+    :return: None.
+    """
+    path, seconds = stage_graph.get_critical_path(
+        durations={
+            "collect_leagues": 10.0,
+            "extract_conferences": 5.0,
+            "extract_teams": 1.0,
+            "collect_teams": 30.0,
+        }
+    )
+
+    assert path == ["collect_leagues", "extract_teams", "collect_teams"]
+    assert seconds == 41.0
+
+
+def test_select(stage_graph: StageGraph) -> None:
+    """Test whether the selected stages keep their order through the
+    stages that aren't selected.
+
+    :param stage_graph: An instance of the `StageGraph`.
+    :return: None.
+    """
+    graph = stage_graph.select(names={"collect_leagues", "collect_teams"})
+
+    assert graph.get_order() == ["collect_leagues", "collect_teams"]
+    assert graph.stages["collect_teams"].dependencies == ("collect_leagues",)
+
+    with pytest.raises(StageGraphError, match="Unknown stages"):
+        stage_graph.select(names={"collect_players"})
+
+
+def test_run_lazy() -> None:
+    """Test whether the lazy arguments of the stages are created when
+    a stage is run, once for all stages they're passed to.
+
+    :return: None.
+    """
+    registry = Lazy("common.url_registry.UrlRegistry")
+    registries = []
+
+    def record(url_registry: UrlRegistry) -> None:
+        registries.append(url_registry)
+
+    graph = StageGraph()
+
+    graph.add(collect_leagues)
+    graph.add(extract_teams)
+
+    for name in ("collect_leagues", "extract_teams"):
+        graph.stages[name] = replace(
+            graph.stages[name],
+            func=record,
+            kwargs={"url_registry": registry},
+        )
+        graph.stages[name].run()
+
+    assert registries[0] is registries[1] is registry.get()
+    assert isinstance(registries[0], UrlRegistry)
@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from common.constants import TableCacheConstants
+from extractors.base_extractor import BaseExtractor
+from extractors.table_cache import TableCache
+from extractors.teams.team_stats_extractor import TeamStatsExtractor
+
+
+def test_encode_decode() -> None:
+    """Test whether an extracted table is the same after it's stored
+    in an Arrow table.
+
+    :return: None.
+    """
+    table_df = pd.DataFrame(
+        {
+            "Player": [
+                ("Jayson Tatum", "/players/t/tatumja01.html"),
+                ("Team Totals", None),
+            ],
+            "Rk": [1.0, None],
+            "G": [72, 82],
+        }
+    )
+    table_df.columns = ["Player", "Rk", "Rk"]
+
+    decoded_df = TableCache.decode(table=TableCache.encode(table_df=table_df))
+
+    pd.testing.assert_frame_equal(decoded_df, table_df)
+
+
+def test_get_table_df(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test whether the tables are read from the cache until the page
+    or the parser version changes.
+
+    :param tmp_path: A temporary folder.
+    :param monkeypatch: A fixture to patch the cache and the parser
+        version.
+    :return: None.
+    """
+    table_cache = TableCache(tmp_path.joinpath("cache"), enabled=True)
+    filepath = tmp_path.joinpath("bos-2025.html")
+    filepath.write_text(
+        '<html><!--<table id="roster"><tr><th>Player</th></tr>'
+        '<tr><td><a href="/players/t/tatumja01.html">Jayson Tatum</a>'
+        "</td></tr></table>--></html>",
+        encoding="utf-8",
+    )
+    extractor = TeamStatsExtractor()
+
+    monkeypatch.setattr(BaseExtractor, "table_cache", table_cache)
+
+    def get_table_df() -> pd.DataFrame:
+        return extractor.get_table_df(
+            filepath=filepath, _id="roster", header=0, extract_links="body"
+        )
+
+    table_df = get_table_df()
+
+    assert table_df["Player"].tolist() == [
+        ("Jayson Tatum", "/players/t/tatumja01.html")
+    ]
+
+    pd.testing.assert_frame_equal(get_table_df(), table_df)
+
+    monkeypatch.setattr(TableCacheConstants, "PARSER_VERSION", 2)
+
+    get_table_df()
+
+    assert table_cache.get_counters() == {
+        "table_cache_hits": 1,
+        "table_cache_misses": 2,
+    }
@@ -0,0 +1,203 @@
+import json
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from common.constants import BaseConstants, SchemaConstants, SeasonConstants
+from extractors.base_extractor import BaseExtractor
+from extractors.table_validator import TableValidator
+
+
+@pytest.fixture
+def table_df(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> pd.DataFrame:
+    """Save the pages of a table and the seasons, and get the table
+    indexed by the pages as `process_files` does.
+
+    :param tmp_path: A temporary folder.
+    :param monkeypatch: A fixture to patch the folders.
+    :return: A table with a page of an out of range age and a page
+        without the players.
+    """
+    raw_folder = tmp_path.joinpath("raw")
+    sources = [
+        "teams/bos-2025.html",
+        "teams/lal-2025.html",
+        "teams/nyk-2025.html",
+    ]
+
+    for source in sources:
+        raw_folder.joinpath(source).parent.mkdir(parents=True, exist_ok=True)
+        raw_folder.joinpath(source).touch()
+
+    seasons_filepath = tmp_path.joinpath("seasons.parquet")
+    pd.DataFrame({"season": ["2023-24", "2024-25"]}).to_parquet(
+        seasons_filepath
+    )
+
+    monkeypatch.setattr(BaseConstants, "RAW_FOLDER", raw_folder)
+    monkeypatch.setattr(
+        SeasonConstants, "PROCESSED_FILEPATH", seasons_filepath
+    )
+
+    table_df = pd.DataFrame(
+        {
+            "player": ["A", "B", "C", None, None],
+            "team": ["BOS", "BOS", "LAL", "NYK", "NYK"],
+            "age": [25, 31, 200, 22, 23],
+            "year": [2025] * 5,
+        },
+        index=pd.CategoricalIndex(
+            [sources[0], sources[0], sources[1], sources[2], sources[2]],
+            name="source",
+        ),
+    )
+
+    return table_df
+
+
+def test_validate(tmp_path: Path, table_df: pd.DataFrame) -> None:
+    """Test whether the pages that fail the checks are quarantined and
+    their rows are dropped, and whether the checks are reported.
+
+    :param tmp_path: A temporary folder.
+    :param table_df: A table indexed by the pages.
+    :return: None.
+    """
+    validator = TableValidator(
+        tmp_path.joinpath("quarantine"),
+        report_filepath=tmp_path.joinpath("report.json"),
+    )
+    schema = pa.schema(
+        [("player", pa.string()), ("age", pa.int8()), ("year", pa.int16())]
+    )
+
+    validated_df = validator.validate(
+        table_df, name="rosters", schema=schema, years={2024, 2025}
+    )
+
+    assert validated_df["player"].tolist() == ["A", "B"]
+    assert not tmp_path.joinpath("raw", "teams", "lal-2025.html").exists()
+    assert tmp_path.joinpath("quarantine", "teams", "nyk-2025.html").exists()
+    assert json.loads(tmp_path.joinpath("report.json").read_text()) == {
+        "rosters": {
+            "rows": 5,
+            "mismatched_columns": {
+                "player": "null",
+                "age": "int64",
+                "year": "int64",
+            },
+            "out_of_range": {"age": 1},
+            "max_null_ratios": {"player": 1.0},
+            "missing_years": [2024],
+            "failed_sources": ["teams/lal-2025.html", "teams/nyk-2025.html"],
+            "quarantined_rows": 3,
+        }
+    }
+
+
+def test_validate_keeps_stored_rows(
+    tmp_path: Path, table_df: pd.DataFrame, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test whether the stored rows of the quarantined pages are kept
+    when the validated table is merged with the existing table.
+
+    :param tmp_path: A temporary folder.
+    :param table_df: A table indexed by the pages.
+    :param monkeypatch: A fixture to register the schema of the table.
+    :return: None.
+    """
+    filepath = tmp_path.joinpath("rosters.parquet")
+    schema = pa.schema(
+        [("player", pa.string()), ("team", pa.string()), ("year", pa.int16())]
+    )
+
+    monkeypatch.setitem(SchemaConstants.SCHEMAS, filepath, schema)
+    monkeypatch.setitem(SchemaConstants.MERGE_KEYS, filepath, ("team", "year"))
+
+    pd.DataFrame(
+        {
+            "player": ["X", "Y", "Z"],
+            "team": ["BOS", "LAL", "NYK"],
+            "year": 2025,
+        }
+    ).to_parquet(filepath, index=False)
+
+    validated_df = TableValidator(
+        tmp_path.joinpath("quarantine"),
+        report_filepath=tmp_path.joinpath("report.json"),
+    ).validate(table_df, name="rosters", schema=schema)
+
+    for years in ({2025}, None):
+        merged_df = BaseExtractor(years=years).merge_table(
+            table_df=validated_df[schema.names], filepath=filepath
+        )
+
+        assert merged_df.to_dict(orient="list") == {
+            "player": ["Y", "Z", "A", "B"],
+            "team": ["LAL", "NYK", "BOS", "BOS"],
+            "year": [2025] * 4,
+        }
+
+
+def test_validate_without_quarantine(
+    tmp_path: Path, table_df: pd.DataFrame
+) -> None:
+    """Test whether the checks are only reported if the quarantine is
+    disabled.
+
+    :param tmp_path: A temporary folder.
+    :param table_df: A table indexed by the pages.
+    :return: None.
+    """
+    validator = TableValidator(
+        tmp_path.joinpath("quarantine"),
+        report_filepath=tmp_path.joinpath("report.json"),
+        quarantine=False,
+    )
+
+    validated_df = validator.validate(
+        table_df, name="rosters", schema=pa.schema([])
+    )
+
+    assert validated_df.equals(table_df)
+    assert tmp_path.joinpath("raw", "teams", "lal-2025.html").exists()
+    assert validator.reports["rosters"]["failed_sources"] == [
+        "teams/lal-2025.html",
+        "teams/nyk-2025.html",
+    ]
+
+
+def test_check_seasons(table_df: pd.DataFrame) -> None:
+    """Test whether the seasons with much fewer rows per team than the
+    others are incomplete.
+
+    :param table_df: A table indexed by the pages.
+    :return: None.
+    """
+    seasons_df = pd.concat(
+        [
+            # 10 rows of 3 teams, and 2 rows of 2 teams.
+            table_df.assign(year=2024),
+            table_df.assign(year=2024),
+            table_df.iloc[[0, 2]].assign(year=2025),
+        ]
+    )
+
+    assert TableValidator().check_seasons(seasons_df, years=None) == {
+        "missing_years": [],
+        "incomplete_years": [2025],
+    }
+
+
+@pytest.mark.usefixtures("table_df")
+def test_check_seasons_empty_table() -> None:
+    """Test whether all seasons are missing from an empty table.
+
+    :return: None.
+    """
+    assert TableValidator().check_seasons(pd.DataFrame(), years=None) == {
+        "missing_years": [2024, 2025],
+        "incomplete_years": [],
+    }
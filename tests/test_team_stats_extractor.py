@@ -1,5 +1,9 @@
+import datetime
+
+import pandas as pd
 import pytest
 
+from common.constants import SchemaConstants
 from extractors.teams.team_stats_extractor import TeamStatsExtractor
 
 
@@ -27,3 +31,56 @@ def test_extract_team_year(
     assert (
         team_stats_extractor.extract_team_year(filename=filename) == team_year
     )
+
+
+def test_parse_heights(team_stats_extractor: TeamStatsExtractor) -> None:
+    """Test whether heights are parsed to inches, keeping the heights
+    in inches already.
+
+    :param team_stats_extractor: An instance of the
+        `TeamStatsExtractor`.
+    :return: None.
+    """
+    heights = team_stats_extractor.parse_heights(
+        pd.Series(["6-11", "7-0", None, "", "78"], dtype="object")
+    )
+
+    assert heights.tolist() == [83, 84, pd.NA, pd.NA, 78]
+
+
+def test_cast_table_rosters(team_stats_extractor: TeamStatsExtractor) -> None:
+    """Test whether heights, weights, and birth dates of the rosters are
+    cast once, also after the rosters are merged with the rosters read
+    back from a file.
+
+    :param team_stats_extractor: An instance of the
+        `TeamStatsExtractor`.
+    :return: None.
+    """
+    rosters_df = pd.DataFrame(
+        {
+            "height": ["6-11", "6-2"],
+            "weight": ["250", ""],
+            "birth_date": ["March 2, 1995", "December 30, 1984"],
+        }
+    )
+
+    rosters_df = team_stats_extractor.cast_table(
+        table_df=rosters_df, schema=SchemaConstants.ROSTERS_SCHEMA
+    )
+    merged_df = team_stats_extractor.cast_table(
+        table_df=pd.concat(
+            [rosters_df.astype("object"), rosters_df], ignore_index=True
+        ),
+        schema=SchemaConstants.ROSTERS_SCHEMA,
+    )
+
+    assert rosters_df["height"].tolist() == [83, 74]
+    assert rosters_df["weight"].tolist() == [250, pd.NA]
+    assert rosters_df["birth_date"].tolist() == [
+        datetime.date(1995, 3, 2),
+        datetime.date(1984, 12, 30),
+    ]
+    pd.testing.assert_frame_equal(
+        merged_df, pd.concat([rosters_df, rosters_df], ignore_index=True)
+    )
@@ -0,0 +1,58 @@
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+from common.constants import RawSegmentConstants
+from uploader.uploader import Uploader
+
+
+def test_get_s3_client() -> None:
+    """Test whether each thread creates its S3 client once.
+
+    :return: None.
+    """
+    uploader = Uploader()
+    s3_clients = []
+
+    with patch("uploader.uploader.boto3.session.Session") as mock_session:
+        mock_session.return_value.client.side_effect = lambda name: object()
+
+        s3_clients.append(uploader._get_s3_client())
+        s3_clients.append(uploader._get_s3_client())
+
+        thread = threading.Thread(
+            target=lambda: s3_clients.append(uploader._get_s3_client())
+        )
+        thread.start()
+        thread.join()
+
+    assert s3_clients[0] is s3_clients[1]
+    assert s3_clients[2] is not s3_clients[0]
+    assert mock_session.call_count == 2
+
+
+def test_get_filepaths(tmp_path: Path) -> None:
+    """Test whether the segments of the pages and their index are
+    uploaded with the pages, but not the other files.
+
+    :param tmp_path: A temporary folder of the pages.
+    :return: None.
+    """
+    for filename in [
+        "bos-2025.html",
+        "segment-00000.pages",
+        "segments-index.json",
+        "teams.json",
+    ]:
+        tmp_path.joinpath(filename).touch()
+
+    filepaths = Uploader.get_filepaths(
+        base_folder=tmp_path,
+        extensions=(".html", *RawSegmentConstants.UPLOAD_SUFFIXES),
+    )
+
+    assert sorted(filepath.name for filepath in filepaths) == [
+        "bos-2025.html",
+        "segment-00000.pages",
+        "segments-index.json",
+    ]
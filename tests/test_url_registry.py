@@ -0,0 +1,88 @@
+from unittest.mock import patch
+
+import pytest
+
+from collectors.base_collector import BaseCollector
+from collectors.rate_controller import CrawlRateController
+from common.url_registry import UrlRegistry
+
+
+@pytest.mark.parametrize(
+    "url, canonical_url",
+    [
+        (
+            "http://WWW.Basketball-Reference.com:80/teams/LAL/1998.html",
+            "https://www.basketball-reference.com/teams/lal/1998.html",
+        ),
+        (
+            "https://www.basketball-reference.com//leagues/NBA_2025.html#x",
+            "https://www.basketball-reference.com/leagues/nba_2025.html",
+        ),
+        (
+            "https://www.basketball-reference.com/leagues/",
+            "https://www.basketball-reference.com/leagues",
+        ),
+        (
+            "http://127.0.0.1:8000/teams/BOS/2016.html?lang=en",
+            "https://127.0.0.1:8000/teams/bos/2016.html",
+        ),
+    ],
+)
+def test_canonicalize(url: str, canonical_url: str) -> None:
+    """Test whether the URLs of the same page have the same canonical
+    form.
+
+    :param url: A URL to canonicalize.
+    :param canonical_url: An expected canonical URL.
+    :return: None.
+    """
+    assert UrlRegistry.canonicalize(url=url) == canonical_url
+
+
+def test_get_html_data_by_urls() -> None:
+    """Test whether the pages fetched already by any collector of the
+    run aren't fetched again.
+
+    :return: None.
+    """
+    url_registry = UrlRegistry()
+    rate_controller = CrawlRateController(
+        initial_rate=float("inf"), min_rate=float("inf")
+    )
+    collectors = [
+        BaseCollector(
+            rate_controller=rate_controller, url_registry=url_registry
+        )
+        for _ in range(2)
+    ]
+
+    with patch.object(
+        BaseCollector, "get_html_data", return_value="<html></html>"
+    ) as mock_get_html_data:
+        first_urls = [
+            url
+            for url, _ in collectors[0].get_html_data_by_urls(
+                urls=[
+                    "https://site.com/teams/BOS/2016.html",
+                    "https://site.com/teams/bos/2016.html",
+                    "https://site.com/teams/LAL/2016.html",
+                ]
+            )
+        ]
+        second_urls = [
+            url
+            for url, _ in collectors[1].get_html_data_by_urls(
+                urls=[
+                    "http://site.com/teams/LAL/2016.html#roster",
+                    "https://site.com/teams/MIA/2016.html",
+                ]
+            )
+        ]
+
+    assert sorted(first_urls) == [
+        "https://site.com/teams/BOS/2016.html",
+        "https://site.com/teams/LAL/2016.html",
+    ]
+    assert second_urls == ["https://site.com/teams/MIA/2016.html"]
+    assert mock_get_html_data.call_count == 3
+    assert len(url_registry) == 3